@@ -0,0 +1,122 @@
+"""Benchmark GraphQL parse and validation cost with and without the document cache."""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+from pathlib import Path
+from statistics import median
+import sys
+from time import perf_counter
+from typing import Callable
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+sys.path.insert(0, str(PROJECT_ROOT))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.test_settings")
+
+import django
+from graphql import GraphQLSchema, build_schema, parse, validate
+
+from general_manager.api.graphql_documents import GraphQLDocumentCache
+
+POSITIVE_INTEGER_ERROR_MESSAGE = "must be a positive integer"
+
+
+def positive_integer(value: str) -> int:
+    """Parse an integer command-line value greater than zero."""
+    try:
+        parsed = int(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(POSITIVE_INTEGER_ERROR_MESSAGE) from error
+    if parsed <= 0:
+        raise argparse.ArgumentTypeError(POSITIVE_INTEGER_ERROR_MESSAGE)
+    return parsed
+
+
+def build_manager_schema(managers: int, fields: int) -> GraphQLSchema:
+    """Build a schema shaped like one generated for many managers."""
+    types = []
+    roots = []
+    for index in range(managers):
+        scalar_fields = "\n".join(f"  field{field}: String" for field in range(fields))
+        related = f"Manager{(index + 1) % managers}"
+        types.append(
+            f"type Manager{index} {{\n  id: ID!\n{scalar_fields}\n"
+            f"  related(page: Int, pageSize: Int): [{related}!]!\n}}"
+        )
+        roots.append(
+            f"  manager{index}List(page: Int, pageSize: Int): [Manager{index}!]!"
+        )
+    return build_schema(
+        "\n\n".join(types) + "\n\ntype Query {\n" + "\n".join(roots) + "\n}"
+    )
+
+
+def build_dashboard_query(managers: int, fields: int) -> str:
+    """Build a realistic multi-root query with nested selections."""
+    selected = " ".join(f"field{field}" for field in range(min(fields, 8)))
+    roots = " ".join(
+        f"manager{index}List(pageSize: 25) {{ id {selected} "
+        f"related(pageSize: 5) {{ id {selected} }} }}"
+        for index in range(0, managers, max(1, managers // 10))
+    )
+    return f"query Dashboard {{ {roots} }}"
+
+
+def measure(callback: Callable[[], None], repeats: int) -> float:
+    """Return the median runtime in seconds for repeated callback runs."""
+    samples: list[float] = []
+    for _ in range(repeats):
+        gc.collect()
+        gc.disable()
+        started = perf_counter()
+        try:
+            callback()
+        finally:
+            samples.append(perf_counter() - started)
+            gc.enable()
+    return median(samples)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse benchmark workload sizes."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=positive_integer, default=5)
+    parser.add_argument("--requests", type=positive_integer, default=200)
+    parser.add_argument("--managers", type=positive_integer, default=300)
+    parser.add_argument("--fields", type=positive_integer, default=20)
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Compare per-request parse and validation cost for a hot query."""
+    args = parse_args()
+    django.setup()
+    schema = build_manager_schema(args.managers, args.fields)
+    query = build_dashboard_query(args.managers, args.fields)
+    cache = GraphQLDocumentCache()
+
+    def uncached() -> None:
+        for _ in range(args.requests):
+            assert not validate(schema, parse(query))
+
+    def cached() -> None:
+        for _ in range(args.requests):
+            document = cache.parse(query)
+            assert not cache.validate(schema, query, document)
+
+    cached()
+    uncached_ms = measure(uncached, args.repeats) / args.requests * 1000
+    cached_ms = measure(cached, args.repeats) / args.requests * 1000
+
+    print(f"{'workload':<20}{'uncached_ms':>14}{'cached_ms':>12}{'saved_ms':>11}")
+    print(
+        f"{'parse+validate':<20}{uncached_ms:>14.4f}{cached_ms:>12.4f}"
+        f"{uncached_ms - cached_ms:>11.4f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,7 @@ __all__ = [
     "ObjectVersion",
     "ProxyUploadSink",
     "PublicGraphQLError",
+    "RangedDownloadAdapter",
     "RemoteInvalidationClient",
     "StoredFile",
     "StoredFileStatus",
@@ -92,6 +93,7 @@ from general_manager.api.graphql import MeasurementType
 from general_manager.uploads.types import ObjectVersion
 from general_manager.uploads.adapters import ProxyUploadSink
 from general_manager.api.graphql_errors import PublicGraphQLError
+from general_manager.uploads.adapters import RangedDownloadAdapter
 from general_manager.api.remote_invalidation_client import RemoteInvalidationClient
 from general_manager.uploads.graphql_types import StoredFile
 from general_manager.uploads.types import StoredFileStatus
@@ -109,6 +109,7 @@ from general_manager.api.graphql_resolvers import (
     apply_grouping as _apply_grouping_fn,
     check_read_permission as _check_read_permission_fn,
     can_read_instance_for_user as _can_read_instance_for_user_fn,
+    check_read_permission_for_user as _check_read_permission_for_user_fn,
     create_measurement_resolver as _create_measurement_resolver_fn,
     create_normal_resolver as _create_normal_resolver_fn,
     create_list_resolver as _create_list_resolver_fn,
@@ -139,6 +140,7 @@ from general_manager.api.graphql_subscriptions import (
     class_group_name as _class_group_name_fn,
     refresh_group_name as _refresh_group_name_fn,
     dispatch_subscription_event as _dispatch_subscription_event_fn,
+    background_subscription_sender as _background_subscription_sender,
     channel_listener as _channel_listener_fn,
     channel_message_listener as _channel_message_listener_fn,
     prime_graphql_properties as _prime_graphql_properties_fn,
@@ -146,6 +148,11 @@ from general_manager.api.graphql_subscriptions import (
     subscription_property_names as _subscription_property_names_fn,
     resolve_subscription_dependencies as _resolve_subscription_dependencies_fn,
     instantiate_manager as _instantiate_manager_fn,
+    hydration_key as _hydration_key_fn,
+    new_event_id as _new_event_id_fn,
+    shared_subscription_hydration as _shared_subscription_hydration,
+    selected_leaf_field_names as _selected_leaf_field_names_fn,
+    selection_fingerprint as _selection_fingerprint_fn,
 )
 from general_manager.api.registry import GraphQLRegistry
 
@@ -156,6 +163,8 @@ if TYPE_CHECKING:
 logger = get_logger("api.graphql")
 
 IntCoercible: TypeAlias = str | bytes | bytearray | SupportsInt | SupportsIndex
+SUBSCRIPTION_FILTERABLE_ACTIONS = frozenset({"create", "update", "refresh"})
+"""Actions suppressed when the subscriber's selected values did not change."""
 SUBSCRIPTION_HYDRATION_ERRORS: tuple[type[Exception], ...] = (
     *HANDLED_MANAGER_ERRORS,
     ObjectDoesNotExist,
@@ -1736,6 +1745,36 @@ class GraphQL:
             property_names=property_names,
         )
 
+    @classmethod
+    async def _hydrate_subscription_item(
+        cls,
+        manager_class: type[GeneralManager],
+        identification: GraphQLIdentification,
+        event_id: object,
+        property_names: Iterable[str] | None = None,
+    ) -> GeneralManager:
+        """
+        Instantiate the manager for a subscription event off the event loop.
+
+        Events stamped with a string ``event_id`` are hydrated once per
+        process through ``shared_subscription_hydration`` so every subscriber
+        woken by the same event receives the same instance. Unstamped events
+        are hydrated per subscriber. Hydration errors propagate.
+        """
+
+        def load() -> GeneralManager:
+            item, _ = cls._instantiate_manager(
+                manager_class,
+                identification,
+                property_names=property_names,
+            )
+            return item
+
+        if not isinstance(event_id, str):
+            return await asyncio.to_thread(load)
+        key = _hydration_key_fn(manager_class, identification, property_names, event_id)
+        return await _shared_subscription_hydration.hydrate(key, load)
+
     @classmethod
     def _instantiate_readable_manager(
         cls,
@@ -1748,6 +1787,16 @@ class GraphQL:
             item, _ = cls._instantiate_manager(manager_class, identification)
         except SUBSCRIPTION_HYDRATION_ERRORS:
             return None
+        return cls._readable_manager_or_none(item, manager_class, user, action)
+
+    @staticmethod
+    def _readable_manager_or_none(
+        item: GeneralManager,
+        manager_class: type[GeneralManager],
+        user: object,
+        action: str,
+    ) -> GeneralManager | None:
+        """Return ``item`` when ``user`` may read it, otherwise ``None``."""
         try:
             readable = _can_read_instance_for_user_fn(item, user)
         except Exception as exc:  # noqa: BLE001, RUF100
@@ -1829,6 +1878,24 @@ class GraphQL:
             """
             identification_copy = deepcopy(identification)
             property_names = cls._subscription_property_names(info, generalManagerClass)
+            fingerprint_fields = (
+                _selected_leaf_field_names_fn(info, cls._normalize_graphql_name)
+                if get_setting("GRAPHQL_SUBSCRIPTION_SKIP_UNCHANGED", False)
+                else None
+            )
+            subscription_user = getattr(info.context, "user", None)
+
+            def fingerprint(item: GeneralManager) -> str | None:
+                if fingerprint_fields is None:
+                    return None
+                return _selection_fingerprint_fn(
+                    item,
+                    fingerprint_fields,
+                    lambda instance, field_name: _check_read_permission_for_user_fn(
+                        instance, subscription_user, field_name
+                    ),
+                )
+
             try:
                 instance, dependency_records = await asyncio.to_thread(
                     cls._instantiate_manager,
@@ -1876,14 +1943,14 @@ class GraphQL:
                     When the iterator is closed or exits, the background listener task is cancelled and the subscription's channel group memberships are discarded.
                 """
                 channel_name = cast(str, await channel_layer.new_channel())
-                queue: asyncio.Queue[str] = asyncio.Queue[str]()
+                queue: asyncio.Queue[GraphQLFieldMap] = asyncio.Queue()
                 joined_groups = await _join_subscription_groups(
                     channel_layer,
                     channel_name,
                     group_names,
                 )
                 listener_task = asyncio.create_task(
-                    cls._channel_listener(channel_layer, channel_name, queue)
+                    cls._channel_message_listener(channel_layer, channel_name, queue)
                 )
                 async with _subscription_cleanup_scope(
                     channel_layer,
@@ -1891,19 +1958,38 @@ class GraphQL:
                     joined_groups,
                     listener_task,
                 ):
+                    last_fingerprint = None
+                    if fingerprint_fields is not None:
+                        last_fingerprint = await asyncio.to_thread(
+                            fingerprint, instance
+                        )
                     clear_capability_context(info)
                     yield SubscriptionEvent(item=instance, action="snapshot")
                     while True:
-                        action = await queue.get()
+                        message = await queue.get()
+                        action = cast(str, message["action"])
                         try:
-                            item, _ = await asyncio.to_thread(
-                                cls._instantiate_manager,
+                            item = await cls._hydrate_subscription_item(
                                 generalManagerClass,
                                 identification_copy,
-                                property_names=property_names,
+                                message.get("event_id"),
+                                property_names,
                             )
                         except SUBSCRIPTION_HYDRATION_ERRORS:
                             item = None
+                        if fingerprint_fields is not None:
+                            current_fingerprint = (
+                                None
+                                if item is None
+                                else await asyncio.to_thread(fingerprint, item)
+                            )
+                            if (
+                                action in SUBSCRIPTION_FILTERABLE_ACTIONS
+                                and current_fingerprint is not None
+                                and current_fingerprint == last_fingerprint
+                            ):
+                                continue
+                            last_fingerprint = current_fingerprint
                         clear_capability_context(info)
                         yield SubscriptionEvent(item=item, action=action)
 
@@ -1984,10 +2070,18 @@ class GraphQL:
                         if not isinstance(identification, dict):
                             continue
                         identification_copy = deepcopy(identification)
+                        try:
+                            hydrated = await cls._hydrate_subscription_item(
+                                generalManagerClass,
+                                identification_copy,
+                                message.get("event_id"),
+                            )
+                        except SUBSCRIPTION_HYDRATION_ERRORS:
+                            continue
                         item = await asyncio.to_thread(
-                            cls._instantiate_readable_manager,
+                            cls._readable_manager_or_none,
+                            hydrated,
                             generalManagerClass,
-                            identification_copy,
                             subscription_user,
                             action,
                         )
@@ -2134,7 +2228,13 @@ class GraphQL:
         action: str,
         identification: GraphQLIdentification,
     ) -> None:
-        """Publish a committed subscription event to its row and class groups."""
+        """
+        Publish a committed subscription event to its row and class groups.
+
+        With ``GRAPHQL_SUBSCRIPTION_BACKGROUND_DISPATCH`` enabled the event is
+        handed to the background sender and this call returns without waiting
+        for the channel layer.
+        """
         channel_layer = cls._get_channel_layer()
         if channel_layer is None:
             logger.warning(
@@ -2153,6 +2253,7 @@ class GraphQL:
             "action": action,
             "manager": manager_class.__name__,
             "identification": identification,
+            "event_id": _new_event_id_fn(),
         }
         refresh_group_name = cls._refresh_group_name(manager_class)
         if _queue_notification(
@@ -2163,11 +2264,17 @@ class GraphQL:
                 "type": "gm.subscription.event",
                 "action": "refresh",
                 "manager": manager_class.__name__,
+                "event_id": _new_event_id_fn(),
             },
         ):
             return
 
         target_groups = (group_name, class_group_name)
+        if get_setting("GRAPHQL_SUBSCRIPTION_BACKGROUND_DISPATCH", False):
+            _background_subscription_sender.submit(
+                channel_layer, target_groups, message
+            )
+            return
         try:
             dispatched = async_to_sync(_dispatch_subscription_event_fn)(
                 channel_layer,
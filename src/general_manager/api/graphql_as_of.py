@@ -17,13 +17,13 @@ from graphql import (
     VariablesInAllowedPositionRule,
     VariableDefinitionNode,
     get_operation_ast,
-    parse,
     validate,
 )
 from graphql.execution.values import get_directive_values, get_variable_values
 from graphql.pyutils import Undefined
 from graphql.utilities import value_from_ast_untyped
 
+from general_manager.api.graphql_documents import parse_graphql_document
 from general_manager.api.graphql_errors import PublicGraphQLError
 from general_manager.as_of import InvalidSearchDateError, normalize_search_date
 
@@ -50,7 +50,7 @@ def extract_as_of_search_date(
     if not isinstance(query, str):
         return None
 
-    document = parse(query)
+    document = parse_graphql_document(query)
     operation = get_operation_ast(document, operation_name)
     if operation is None:
         return None
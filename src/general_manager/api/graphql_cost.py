@@ -0,0 +1,409 @@
+"""Pre-execution cost estimation for GraphQL operations."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import cast
+
+from django.core.cache import cache as django_cache
+from django.utils.module_loading import import_string
+from graphene.utils.str_converters import to_snake_case
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLField,
+    GraphQLInterfaceType,
+    GraphQLNamedType,
+    GraphQLObjectType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    SelectionSetNode,
+    get_named_type,
+    get_nullable_type,
+    get_operation_ast,
+    is_list_type,
+)
+from graphql.utilities import value_from_ast_untyped
+
+from general_manager.api.graphql_errors import PublicGraphQLError
+from general_manager.conf import get_setting
+from general_manager.logging import get_logger
+
+logger = get_logger("api.graphql_cost")
+
+DEFAULT_LIST_SIZE = 100
+DEFAULT_PAGE_SIZE = 10
+DEFAULT_ROW_COUNT_TIMEOUT_SECONDS = 300
+ROW_COUNT_CACHE_PREFIX = "general_manager:graphql:row_count"
+_PAGINATION_ARGUMENTS = frozenset({"page", "pageSize"})
+_SINGLE_ROW_LOOKUPS = frozenset({"id", "id__exact"})
+
+type RowCountEstimator = Callable[[str], int | None]
+
+
+@dataclass(frozen=True)
+class QueryCost:
+    """Estimated resolver invocations of one operation and the configured limit."""
+
+    cost: int
+    limit: int
+
+    @property
+    def exceeded(self) -> bool:
+        """Return whether the estimate is above the limit."""
+        return self.cost > self.limit
+
+    def as_extension(self) -> dict[str, int]:
+        """Return the ``extensions.cost`` payload reported to clients."""
+        return {"requested": self.cost, "maximum": self.limit}
+
+
+def get_graphql_query_cost_limit() -> int | None:
+    """Return the positive cost budget, or ``None`` when analysis is disabled."""
+    value = get_setting("GRAPHQL_QUERY_COST_LIMIT")
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        return None
+    return value
+
+
+def get_default_list_size() -> int:
+    """Return the fan-out assumed for unpaginated lists without row statistics."""
+    value = get_setting("GRAPHQL_QUERY_COST_DEFAULT_LIST_SIZE", DEFAULT_LIST_SIZE)
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        return DEFAULT_LIST_SIZE
+    return value
+
+
+def get_row_count_estimator() -> RowCountEstimator | None:
+    """Return the configured ``GRAPHQL_QUERY_COST_ROW_COUNTS`` callable, if any."""
+    configured = get_setting("GRAPHQL_QUERY_COST_ROW_COUNTS")
+    if not configured:
+        return None
+    return cast(
+        RowCountEstimator,
+        import_string(configured) if isinstance(configured, str) else configured,
+    )
+
+
+def cached_manager_row_count(type_name: str) -> int | None:
+    """
+    Return a cached row count for the database-backed manager named ``type_name``.
+
+    Counts come from ``Manager.all().count()`` and are cached in Django's cache
+    for ``GRAPHQL_QUERY_COST_ROW_COUNT_TIMEOUT`` seconds, so statistics cost at
+    most one ``COUNT`` query per manager per timeout. Managers that are not
+    backed by a database bucket return ``None`` because counting them may
+    require evaluating every combination.
+    """
+    from general_manager.api.graphql import GraphQL
+    from general_manager.bucket.database_bucket import DatabaseBucket
+
+    manager_class = GraphQL.manager_registry.get(type_name)
+    if manager_class is None:
+        return None
+    key = f"{ROW_COUNT_CACHE_PREFIX}:{type_name}"
+    cached = django_cache.get(key)
+    if isinstance(cached, int):
+        return cached
+    bucket = manager_class.all()
+    if not isinstance(bucket, DatabaseBucket):
+        return None
+    count = bucket.count()
+    timeout = get_setting(
+        "GRAPHQL_QUERY_COST_ROW_COUNT_TIMEOUT", DEFAULT_ROW_COUNT_TIMEOUT_SECONDS
+    )
+    django_cache.set(
+        key,
+        count,
+        timeout if isinstance(timeout, int) else DEFAULT_ROW_COUNT_TIMEOUT_SECONDS,
+    )
+    return count
+
+
+class QueryCostAnalyzer:
+    """
+    Estimate how many resolver invocations an operation will cause.
+
+    Every selected field costs one invocation per parent object. Fields that
+    accept ``page`` or ``pageSize`` multiply the cost of their sub-selection by
+    the estimated number of returned objects: the requested ``pageSize`` (or
+    the resolver default of ten when only ``page`` is given), an ``id`` or
+    ``id__in`` filter, and the optional row-count estimate for the listed type
+    each bound the fan-out, and the smallest bound wins. Unbounded lists
+    without statistics assume ``default_list_size`` objects. Fragments are
+    expanded once per selection set and their cost is computed once per
+    parent type and fan-out, every inline-fragment branch is counted, and
+    introspection fields are free.
+    """
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        variables: Mapping[str, object] | None = None,
+        *,
+        default_list_size: int = DEFAULT_LIST_SIZE,
+        row_count: RowCountEstimator | None = None,
+    ) -> None:
+        self.schema = schema
+        self.document = document
+        self.variables = dict(variables or {})
+        self.default_list_size = default_list_size
+        self.row_count = row_count
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        self._fragment_costs: dict[
+            tuple[str, str, int | None], tuple[int, frozenset[str]]
+        ] = {}
+
+    def operation_cost(self, operation_name: str | None) -> int | None:
+        """Return the estimated cost, or ``None`` when no operation is selected."""
+        operation = get_operation_ast(self.document, operation_name)
+        if operation is None:
+            return None
+        root_type = self.schema.get_root_type(operation.operation)
+        if root_type is None:
+            return None
+        return self._selection_cost(root_type, operation.selection_set, 1, None, ())
+
+    def _selection_cost(
+        self,
+        parent_type: GraphQLNamedType,
+        selection_set: SelectionSetNode,
+        multiplier: int,
+        page_fanout: int | None,
+        fragment_path: tuple[str, ...],
+        visited: set[str] | None = None,
+    ) -> int:
+        """
+        Return the cost of one selection set resolved for ``multiplier`` parents.
+
+        Like graphql-core's field collection, a fragment is expanded at most
+        once per selection set; ``visited`` carries the names already expanded
+        through nested inline fragments and spreads of the same set.
+        """
+        if visited is None:
+            visited = set()
+        total = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                total += self._field_cost(
+                    parent_type, selection, multiplier, page_fanout, fragment_path
+                )
+            elif isinstance(selection, InlineFragmentNode):
+                type_condition = selection.type_condition
+                condition = (
+                    parent_type
+                    if type_condition is None
+                    else self.schema.get_type(type_condition.name.value)
+                )
+                if condition is not None:
+                    total += self._selection_cost(
+                        condition,
+                        selection.selection_set,
+                        multiplier,
+                        page_fanout,
+                        fragment_path,
+                        visited,
+                    )
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                if fragment is None or name in visited or name in fragment_path:
+                    continue
+                visited.add(name)
+                fragment_type = self.schema.get_type(fragment.type_condition.name.value)
+                if fragment_type is not None:
+                    total += multiplier * self._fragment_cost(
+                        fragment, fragment_type, page_fanout, fragment_path, visited
+                    )
+        return total
+
+    def _fragment_cost(
+        self,
+        fragment: FragmentDefinitionNode,
+        fragment_type: GraphQLNamedType,
+        page_fanout: int | None,
+        fragment_path: tuple[str, ...],
+        visited: set[str],
+    ) -> int:
+        """
+        Return the cost of ``fragment`` resolved once, memoized per type and fan-out.
+
+        Costs scale linearly with the number of parents, so a fragment spread
+        many times, or nested fragments that spread each other repeatedly, are
+        analyzed once instead of once per occurrence. The names the fragment
+        expands join ``visited``.
+        """
+        key = (fragment.name.value, fragment_type.name, page_fanout)
+        cached = self._fragment_costs.get(key)
+        if cached is None:
+            expanded = {fragment.name.value}
+            cost = self._selection_cost(
+                fragment_type,
+                fragment.selection_set,
+                1,
+                page_fanout,
+                (*fragment_path, fragment.name.value),
+                expanded,
+            )
+            cached = (cost, frozenset(expanded))
+            self._fragment_costs[key] = cached
+        visited.update(cached[1])
+        return cached[0]
+
+    def _field_cost(
+        self,
+        parent_type: GraphQLNamedType,
+        node: FieldNode,
+        multiplier: int,
+        page_fanout: int | None,
+        fragment_path: tuple[str, ...],
+    ) -> int:
+        """
+        Return the cost of ``node`` resolved once for each of ``multiplier`` parents.
+
+        A paginated field's estimated size applies to the first list below it,
+        which is the ``items`` list of generated page types, or to the field
+        itself when it returns a list directly.
+        """
+        name = node.name.value
+        if name.startswith("__") or not isinstance(
+            parent_type, (GraphQLObjectType, GraphQLInterfaceType)
+        ):
+            return 0
+        field = parent_type.fields.get(name)
+        if field is None:
+            return 0
+        if node.selection_set is None:
+            return multiplier
+        own_fanout = (
+            self._fanout(node) if _PAGINATION_ARGUMENTS & field.args.keys() else None
+        )
+        fanout = own_fanout if own_fanout is not None else page_fanout
+        if is_list_type(get_nullable_type(field.type)):
+            child_multiplier = multiplier * self._list_size(field, fanout)
+            child_page_fanout = None
+        else:
+            child_multiplier = multiplier
+            child_page_fanout = own_fanout
+        return multiplier + self._selection_cost(
+            get_named_type(field.type),
+            node.selection_set,
+            child_multiplier,
+            child_page_fanout,
+            fragment_path,
+        )
+
+    def _argument_values(self, node: FieldNode) -> dict[str, object]:
+        return {
+            argument.name.value: value_from_ast_untyped(argument.value, self.variables)
+            for argument in node.arguments
+        }
+
+    def _fanout(self, node: FieldNode) -> int | None:
+        """Return the size bound from pagination and filter arguments, if any."""
+        arguments = self._argument_values(node)
+        bounds: list[int] = []
+        page_size = arguments.get("pageSize")
+        if isinstance(page_size, int) and not isinstance(page_size, bool):
+            bounds.append(page_size if page_size > 0 else DEFAULT_PAGE_SIZE)
+        elif arguments.get("page") is not None:
+            bounds.append(DEFAULT_PAGE_SIZE)
+        filtered = _filtered_size(arguments.get("filter"))
+        if filtered is not None:
+            bounds.append(filtered)
+        return max(1, min(bounds)) if bounds else None
+
+    def _list_size(self, field: GraphQLField, bound: int | None) -> int:
+        """Return the estimated list length, capped by row statistics."""
+        rows = self._estimated_rows(field)
+        if rows is None:
+            return self.default_list_size if bound is None else bound
+        return max(1, rows if bound is None else min(bound, rows))
+
+    def _estimated_rows(self, field: GraphQLField) -> int | None:
+        if self.row_count is None:
+            return None
+        type_name = _listed_type_name(field)
+        try:
+            rows = self.row_count(type_name)
+        except Exception as exc:  # noqa: BLE001 - estimators are project code
+            logger.warning(
+                "graphql row count estimate failed",
+                context={"type": type_name},
+                exc_info=exc,
+            )
+            return None
+        if isinstance(rows, bool) or not isinstance(rows, int) or rows < 0:
+            return None
+        return rows
+
+
+def _listed_type_name(field: GraphQLField) -> str:
+    """Return the item type of a page type (``ProjectPage.items``) or the type."""
+    named = get_named_type(field.type)
+    if isinstance(named, GraphQLObjectType) and "items" in named.fields:
+        named = get_named_type(named.fields["items"].type)
+    return named.name
+
+
+def _filtered_size(filter_value: object) -> int | None:
+    """Return the row bound implied by ``id`` or ``id__in`` filters, if any."""
+    if not isinstance(filter_value, Mapping):
+        return None
+    bounds: list[int] = []
+    for key, value in cast(Mapping[str, object], filter_value).items():
+        lookup = to_snake_case(key)
+        if lookup in _SINGLE_ROW_LOOKUPS and value is not None:
+            bounds.append(1)
+        elif lookup == "id__in" and isinstance(value, list):
+            bounds.append(len(cast(list[object], value)))
+    return min(bounds) if bounds else None
+
+
+def analyze_query_cost(
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    operation_name: str | None,
+    variables: object,
+) -> QueryCost | None:
+    """
+    Estimate the selected operation against ``GRAPHQL_QUERY_COST_LIMIT``.
+
+    Returns ``None`` when no limit is configured or no operation is selected.
+    Row-count estimator failures are logged and that list is estimated
+    without statistics.
+    """
+    limit = get_graphql_query_cost_limit()
+    if limit is None:
+        return None
+    analyzer_variables = (
+        cast(Mapping[str, object], variables)
+        if isinstance(variables, Mapping)
+        else None
+    )
+    cost = QueryCostAnalyzer(
+        schema,
+        document,
+        analyzer_variables,
+        default_list_size=get_default_list_size(),
+        row_count=get_row_count_estimator(),
+    ).operation_cost(operation_name)
+    return None if cost is None else QueryCost(cost=cost, limit=limit)
+
+
+def query_cost_error(query_cost: QueryCost) -> PublicGraphQLError:
+    """Return the public error for an operation above its cost budget."""
+    error = PublicGraphQLError(
+        f"Query cost {query_cost.cost} exceeds the maximum of {query_cost.limit}.",
+        code="QUERY_COST_EXCEEDED",
+    )
+    error.extensions = {**(error.extensions or {}), "cost": query_cost.as_extension()}
+    return error
@@ -0,0 +1,134 @@
+"""In-process cache of parsed and validated GraphQL documents."""
+
+from __future__ import annotations
+
+import itertools
+import threading
+from collections import OrderedDict
+from collections.abc import Collection
+from weakref import WeakKeyDictionary
+
+from graphql import DocumentNode, GraphQLError, GraphQLSchema, parse, validate
+from graphql.validation import ASTValidationRule
+
+from general_manager.conf import get_setting
+
+DEFAULT_DOCUMENT_CACHE_SIZE = 512
+
+type ValidationKey = tuple[
+    str,
+    int,
+    tuple[type[ASTValidationRule], ...] | None,
+    int | None,
+]
+
+
+def get_graphql_document_cache_size() -> int:
+    """Return the configured entry limit; ``0`` disables document caching."""
+    value = get_setting("GRAPHQL_DOCUMENT_CACHE_SIZE", DEFAULT_DOCUMENT_CACHE_SIZE)
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        return DEFAULT_DOCUMENT_CACHE_SIZE
+    return value
+
+
+class GraphQLDocumentCache:
+    """
+    Bounded LRU of parsed documents and successful validations.
+
+    Documents are keyed by their query text. Validation results are keyed by
+    query text, schema version, validation rules, and error limit; only
+    documents that validated without errors are remembered, so failing
+    documents are always revalidated and never share error instances between
+    requests. Each schema object gets its own version number, which means a
+    rebuilt schema never reuses validations from its predecessor.
+    """
+
+    def __init__(self) -> None:
+        self._documents: OrderedDict[str, DocumentNode] = OrderedDict()
+        self._validated: OrderedDict[ValidationKey, None] = OrderedDict()
+        self._schema_versions: WeakKeyDictionary[GraphQLSchema, int] = (
+            WeakKeyDictionary()
+        )
+        self._next_version = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def parse(self, query: str) -> DocumentNode:
+        """Return the parsed document for ``query``, raising like ``parse()``."""
+        limit = get_graphql_document_cache_size()
+        if limit == 0:
+            return parse(query)
+        with self._lock:
+            document = self._documents.get(query)
+            if document is not None:
+                self._documents.move_to_end(query)
+                return document
+        document = parse(query)
+        with self._lock:
+            self._documents[query] = document
+            self._documents.move_to_end(query)
+            while len(self._documents) > limit:
+                self._documents.popitem(last=False)
+        return document
+
+    def validate(
+        self,
+        schema: GraphQLSchema,
+        query: str,
+        document: DocumentNode,
+        rules: Collection[type[ASTValidationRule]] | None = None,
+        max_errors: int | None = None,
+    ) -> list[GraphQLError]:
+        """Validate ``document`` unless the same query already passed validation."""
+        limit = get_graphql_document_cache_size()
+        if limit == 0:
+            return validate(schema, document, rules, max_errors)
+        with self._lock:
+            key: ValidationKey = (
+                query,
+                self._schema_version(schema),
+                None if rules is None else tuple(rules),
+                max_errors,
+            )
+            if key in self._validated:
+                self._validated.move_to_end(key)
+                return []
+        errors = validate(schema, document, rules, max_errors)
+        if errors:
+            return errors
+        with self._lock:
+            self._validated[key] = None
+            while len(self._validated) > limit:
+                self._validated.popitem(last=False)
+        return errors
+
+    def clear(self) -> None:
+        """Drop every cached document and validation result."""
+        with self._lock:
+            self._documents.clear()
+            self._validated.clear()
+
+    def _schema_version(self, schema: GraphQLSchema) -> int:
+        version = self._schema_versions.get(schema)
+        if version is None:
+            version = next(self._next_version)
+            self._schema_versions[schema] = version
+        return version
+
+
+graphql_document_cache = GraphQLDocumentCache()
+
+
+def parse_graphql_document(query: str) -> DocumentNode:
+    """Parse ``query`` through the shared document cache."""
+    return graphql_document_cache.parse(query)
+
+
+def validate_graphql_document(
+    schema: GraphQLSchema,
+    query: str,
+    document: DocumentNode,
+    rules: Collection[type[ASTValidationRule]] | None = None,
+    max_errors: int | None = None,
+) -> list[GraphQLError]:
+    """Validate ``document`` through the shared document cache."""
+    return graphql_document_cache.validate(schema, query, document, rules, max_errors)
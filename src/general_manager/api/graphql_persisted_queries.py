@@ -0,0 +1,142 @@
+"""Persisted and automatic persisted GraphQL queries addressed by SHA-256 hash."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping
+from typing import cast
+
+from django.core.cache import cache as django_cache
+from django.utils.module_loading import import_string
+
+from general_manager.api.graphql_errors import PublicGraphQLError
+from general_manager.conf import get_setting
+
+PERSISTED_QUERY_PREFIX = "general_manager:graphql:persisted"
+DEFAULT_PERSISTED_QUERY_TIMEOUT_SECONDS = 86_400
+PERSISTED_QUERY_VERSION = 1
+
+_NOT_FOUND_MESSAGE = "PersistedQueryNotFound"
+_NOT_SUPPORTED_MESSAGE = "PersistedQueryNotSupported"
+_HASH_MISMATCH_MESSAGE = "provided sha does not match query"
+_INVALID_EXTENSION_MESSAGE = "Invalid persistedQuery extension."
+
+
+def persisted_queries_enabled() -> bool:
+    """Return whether clients may send queries by hash."""
+    return bool(get_setting("GRAPHQL_PERSISTED_QUERIES_ENABLED", False))
+
+
+def get_persisted_query_timeout() -> int | None:
+    """Return the lifetime of registered queries; ``None`` keeps them forever."""
+    value = get_setting(
+        "GRAPHQL_PERSISTED_QUERY_TIMEOUT", DEFAULT_PERSISTED_QUERY_TIMEOUT_SECONDS
+    )
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        return DEFAULT_PERSISTED_QUERY_TIMEOUT_SECONDS
+    return value
+
+
+def persisted_query_hash(query: str) -> str:
+    """Return the lowercase hex SHA-256 digest clients use to address ``query``."""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def _persisted_query_key(query_hash: str) -> str:
+    return f"{PERSISTED_QUERY_PREFIX}:{query_hash}"
+
+
+def _configured_query_map() -> Mapping[str, str]:
+    """Return the build-time ``GRAPHQL_PERSISTED_QUERY_MAP`` manifest, if any."""
+    configured = get_setting("GRAPHQL_PERSISTED_QUERY_MAP")
+    if isinstance(configured, str):
+        configured = import_string(configured)
+    if isinstance(configured, Mapping):
+        return cast(Mapping[str, str], configured)
+    return {}
+
+
+def graphql_request_extensions(request: object, data: object) -> object:
+    """
+    Return the GraphQL ``extensions`` request parameter.
+
+    POST bodies carry it as an object and GET requests as a JSON string in the
+    query string, mirroring how Graphene-Django reads ``variables``.
+    """
+    query_params = getattr(request, "GET", None)
+    extensions = query_params.get("extensions") if query_params is not None else None
+    if not extensions and isinstance(data, Mapping):
+        extensions = cast(Mapping[str, object], data).get("extensions")
+    if isinstance(extensions, str):
+        try:
+            return json.loads(extensions)
+        except ValueError as error:
+            raise PublicGraphQLError(
+                _INVALID_EXTENSION_MESSAGE, code="BAD_USER_INPUT"
+            ) from error
+    return extensions
+
+
+def _requested_hash(extensions: object) -> str | None:
+    if not isinstance(extensions, Mapping):
+        return None
+    persisted = cast(Mapping[str, object], extensions).get("persistedQuery")
+    if persisted is None:
+        return None
+    if not isinstance(persisted, Mapping):
+        raise PublicGraphQLError(_INVALID_EXTENSION_MESSAGE, code="BAD_USER_INPUT")
+    persisted = cast(Mapping[str, object], persisted)
+    query_hash = persisted.get("sha256Hash")
+    if (
+        persisted.get("version") != PERSISTED_QUERY_VERSION
+        or not isinstance(query_hash, str)
+        or not query_hash
+    ):
+        raise PublicGraphQLError(_INVALID_EXTENSION_MESSAGE, code="BAD_USER_INPUT")
+    return query_hash.lower()
+
+
+def resolve_persisted_query(query: str | None, extensions: object) -> str | None:
+    """
+    Return the query text to execute for a request that may reference a hash.
+
+    Requests without a ``persistedQuery`` extension are returned unchanged.
+    A hash-only request is resolved from ``GRAPHQL_PERSISTED_QUERY_MAP`` and
+    then from queries previously registered in the Django cache; unknown
+    hashes raise ``PERSISTED_QUERY_NOT_FOUND`` so Apollo-compatible clients
+    retry with the full text. A request carrying both text and hash registers
+    the text after checking that the hash matches it.
+
+    Raises:
+        PublicGraphQLError: If the extension is malformed, the hash does not
+            match the query, the hash is unknown, or persisted queries are
+            disabled (``PERSISTED_QUERY_NOT_SUPPORTED``).
+    """
+    query_hash = _requested_hash(extensions)
+    if query_hash is None:
+        return query
+    if not persisted_queries_enabled():
+        if query:
+            return query
+        raise PublicGraphQLError(
+            _NOT_SUPPORTED_MESSAGE, code="PERSISTED_QUERY_NOT_SUPPORTED"
+        )
+    if query:
+        if persisted_query_hash(query) != query_hash:
+            raise PublicGraphQLError(_HASH_MISMATCH_MESSAGE, code="BAD_USER_INPUT")
+        if query_hash not in _configured_query_map():
+            django_cache.set(
+                _persisted_query_key(query_hash),
+                query,
+                get_persisted_query_timeout(),
+            )
+        return query
+    stored = _configured_query_map().get(query_hash)
+    if stored is None:
+        stored = django_cache.get(_persisted_query_key(query_hash))
+    if not isinstance(stored, str):
+        raise PublicGraphQLError(_NOT_FOUND_MESSAGE, code="PERSISTED_QUERY_NOT_FOUND")
+    return stored
@@ -90,8 +90,29 @@ def collect_selected_graphql_property_names(
     available_properties = set(_get_graphql_properties(manager_class).keys())
     if not available_properties:
         return set()
+    return available_properties & collect_selected_graphql_field_names(
+        info,
+        root_field=root_field,
+        normalize_name=normalize_name,
+    )
 
-    property_names: set[str] = set()
+
+def collect_selected_graphql_field_names(
+    info: GraphQLResolveInfo,
+    *,
+    root_field: str,
+    normalize_name: Callable[[str], str] = normalize_graphql_name,
+) -> set[str]:
+    """Return the Python names of fields selected directly under ``root_field``.
+
+    Traversal follows the rules of
+    :func:`collect_selected_graphql_property_names`: fragments are expanded
+    with a visited set, AST names rather than aliases are compared, directives
+    and type conditions are not evaluated, and nested selections below the
+    direct fields are ignored. Introspection fields such as ``__typename`` are
+    omitted.
+    """
+    field_names: set[str] = set()
 
     def collect_direct_fields(
         selection_set: SelectionSetNode | None,
@@ -101,9 +122,8 @@ def collect_selected_graphql_property_names(
             return
         for selection in selection_set.selections:
             if isinstance(selection, FieldNode):
-                normalized = normalize_name(selection.name.value)
-                if normalized in available_properties:
-                    property_names.add(normalized)
+                if not selection.name.value.startswith("__"):
+                    field_names.add(normalize_name(selection.name.value))
             elif isinstance(selection, InlineFragmentNode):
                 collect_direct_fields(selection.selection_set, visited)
             elif isinstance(selection, FragmentSpreadNode):
@@ -144,7 +164,7 @@ def collect_selected_graphql_property_names(
 
     for field_node in getattr(info, "field_nodes", ()):
         inspect_for_root(field_node.selection_set, frozenset())
-    return property_names
+    return field_names
 
 
 @dataclass(frozen=True, slots=True)
@@ -0,0 +1,300 @@
+"""Opt-in whole-response cache for GraphQL query operations."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections.abc import Callable
+from typing import Protocol, TypeVar, cast
+
+from django.core.cache import cache as django_cache
+from django.utils.module_loading import import_string
+from graphql import ExecutionResult, GraphQLError, parse, print_ast
+
+from general_manager.cache.cache_tracker import DependencyTracker
+from general_manager.cache.dependency_cache import (
+    DependencyCacheHit,
+    read_dependency_cache_hit,
+    replay_dependency_cache_hit,
+)
+from general_manager.cache.dependency_index import (
+    get_dependency_generation,
+    serialize_dependency_identifier,
+)
+from general_manager.cache.dependency_publish import (
+    CachePublishAborted,
+    publish_dependency_cache_entry,
+)
+from general_manager.conf import get_setting
+from general_manager.logging import get_logger
+
+logger = get_logger("api.graphql_query_cache")
+
+QUERY_CACHE_PREFIX = "general_manager:graphql:query"
+PERMISSION_GENERATION_PREFIX = "general_manager:graphql:query-permissions"
+DEFAULT_QUERY_CACHE_TIMEOUT_SECONDS = 300
+_MISS = object()
+
+
+class _ExecutionResult(Protocol):
+    """GraphQL execution result attributes read by the query cache."""
+
+    @property
+    def data(self) -> object: ...
+
+    @property
+    def errors(self) -> object: ...
+
+
+ResultT = TypeVar("ResultT", bound=_ExecutionResult)
+
+
+def graphql_query_cache_enabled() -> bool:
+    """Return whether complete GraphQL query responses should be cached."""
+    return bool(get_setting("GRAPHQL_QUERY_CACHE_ENABLED", False))
+
+
+def get_graphql_query_cache_timeout() -> int:
+    """Return the positive response-entry lifetime, falling back to the default."""
+    value = get_setting(
+        "GRAPHQL_QUERY_CACHE_TIMEOUT", DEFAULT_QUERY_CACHE_TIMEOUT_SECONDS
+    )
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        return DEFAULT_QUERY_CACHE_TIMEOUT_SECONDS
+    return value
+
+
+def default_permission_fingerprint(request: object) -> str | None:
+    """
+    Return a per-user fingerprint for ``request``.
+
+    Authenticated users get ``"user:<pk>"`` and everyone else shares
+    ``"anonymous"``. Projects whose permission rules depend only on coarser
+    traits (groups, roles) can configure ``GRAPHQL_QUERY_CACHE_FINGERPRINT``
+    to share entries across users with identical permissions.
+    """
+    user = getattr(request, "user", None)
+    if user is None or not getattr(user, "is_authenticated", False):
+        return "anonymous"
+    return f"user:{getattr(user, 'pk', None)}"
+
+
+def get_permission_fingerprint(request: object) -> str | None:
+    """
+    Return the permission fingerprint that scopes cached responses.
+
+    ``GRAPHQL_QUERY_CACHE_FINGERPRINT`` may name a callable (or dotted import
+    path) taking the request and returning a string, or ``None`` to bypass the
+    cache for that request. Without it, :func:`default_permission_fingerprint`
+    is used.
+    """
+    configured = get_setting("GRAPHQL_QUERY_CACHE_FINGERPRINT")
+    if not configured:
+        return default_permission_fingerprint(request)
+    fingerprint = cast(
+        Callable[[object], object],
+        import_string(configured) if isinstance(configured, str) else configured,
+    )(request)
+    return fingerprint if isinstance(fingerprint, str) else None
+
+
+def _permission_generation_key(user_pk: object | None) -> str:
+    scope = "all" if user_pk is None else f"user:{user_pk}"
+    return f"{PERMISSION_GENERATION_PREFIX}:{scope}"
+
+
+def invalidate_graphql_query_cache_permissions(user: object | None = None) -> None:
+    """
+    Make cached responses unreachable after a permission change.
+
+    Pass the user whose roles, groups, or permission-relevant attributes
+    changed to drop only that user's entries, or ``None`` to drop every
+    user's entries, for example after changing permission rules shared by a
+    group. Entries are not deleted; a generation counter folded into the
+    permission scope of every key is bumped, so later requests miss.
+    """
+    key = _permission_generation_key(
+        None if user is None else getattr(user, "pk", user)
+    )
+    try:
+        if not django_cache.add(key, 1, None):
+            django_cache.incr(key)
+    except ValueError:
+        # The key was evicted between add and incr; start a new generation.
+        django_cache.set(key, 1, None)
+
+
+def _permission_scope(request: object, fingerprint: str) -> str:
+    """Fold the global and per-user permission generations into ``fingerprint``."""
+    user = getattr(request, "user", None)
+    user_pk = (
+        getattr(user, "pk", None)
+        if user is not None and getattr(user, "is_authenticated", False)
+        else None
+    )
+    keys = [_permission_generation_key(None)]
+    if user_pk is not None:
+        keys.append(_permission_generation_key(user_pk))
+    stored = django_cache.get_many(keys)
+    generations = [stored.get(key, 0) for key in keys]
+    if not any(generations):
+        return fingerprint
+    return f"{fingerprint}#{':'.join(str(generation) for generation in generations)}"
+
+
+def graphql_query_cache_key(
+    query: str | None,
+    operation_name: str | None,
+    variables: object,
+    fingerprint: str,
+) -> str | None:
+    """
+    Build the cache key for one query request, or ``None`` when it cannot be cached.
+
+    The document is normalized by parsing and re-printing it, so whitespace,
+    comments and formatting do not split entries. Variables are serialized
+    with ``serialize_dependency_identifier()`` so mapping order is irrelevant.
+    """
+    if not isinstance(query, str):
+        return None
+    try:
+        document = print_ast(parse(query))
+    except GraphQLError:
+        return None
+    raw = json.dumps(
+        [
+            document,
+            operation_name,
+            serialize_dependency_identifier(variables),
+            fingerprint,
+        ]
+    )
+    digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    return f"{QUERY_CACHE_PREFIX}:{digest}"
+
+
+def _record_cache_outcome(
+    operation_name: str | None, outcome: str, duration: float
+) -> None:
+    """Forward one cache outcome to the configured metrics backend, if it can."""
+    try:
+        from general_manager.metrics.graphql import (
+            get_graphql_metrics_backend,
+            graphql_metrics_enabled,
+            normalize_operation_name,
+        )
+
+        if not graphql_metrics_enabled():
+            return
+        record = getattr(get_graphql_metrics_backend(), "record_query_cache", None)
+        if callable(record):
+            record(
+                operation_name=normalize_operation_name(operation_name),
+                outcome=outcome,
+                duration=duration,
+            )
+    except Exception as exc:  # noqa: BLE001 - metrics must not fail queries
+        logger.debug(
+            "graphql query cache metrics failed",
+            context={"outcome": outcome, "error": type(exc).__name__},
+        )
+
+
+def execute_with_query_cache(
+    *,
+    request: object,
+    query: str | None,
+    variables: object,
+    operation_name: str | None,
+    execute: Callable[[], tuple[ResultT | None, bool]],
+) -> ResultT | ExecutionResult | None:
+    """
+    Return a cached response for an identical query or execute and cache it.
+
+    Entries are keyed by normalized document, operation name, variables and
+    permission fingerprint, and are stored through the dependency cache: the
+    dependencies captured by ``DependencyTracker`` while executing are
+    recorded in the dependency index, so the same data changes that
+    invalidate ``@cached`` functions delete the entry. Only error-free results
+    that ``execute`` reports as cacheable are stored together with their
+    ``extensions``, and publication is skipped when a data change started
+    during execution. Permission changes are not observed automatically;
+    call :func:`invalidate_graphql_query_cache_permissions` after them, or
+    entries stay valid until they expire. Cache lookup or publication failures
+    are logged and the request is served uncached.
+    """
+    started = time.perf_counter()
+    try:
+        fingerprint = get_permission_fingerprint(request)
+        key = (
+            None
+            if fingerprint is None
+            else graphql_query_cache_key(
+                query,
+                operation_name,
+                variables,
+                _permission_scope(request, fingerprint),
+            )
+        )
+        hit = (
+            _MISS
+            if key is None
+            else read_dependency_cache_hit(django_cache, key, sentinel=_MISS)
+        )
+    except Exception as exc:  # noqa: BLE001 - cache backends are extensible
+        logger.warning(
+            "graphql query cache lookup failed",
+            context={"operation": operation_name},
+            exc_info=exc,
+        )
+        key, hit = None, _MISS
+
+    if key is None:
+        result, _cacheable = execute()
+        _record_cache_outcome(operation_name, "bypass", time.perf_counter() - started)
+        return result
+
+    if isinstance(hit, DependencyCacheHit):
+        replay_dependency_cache_hit(hit)
+        _record_cache_outcome(operation_name, "hit", time.perf_counter() - started)
+        entry = cast(dict[str, object], hit.value)
+        return ExecutionResult(
+            data=cast(dict[str, object], entry["data"]),
+            extensions=cast(dict[str, object] | None, entry.get("extensions")),
+        )
+
+    started_generation = get_dependency_generation()
+    with DependencyTracker() as dependencies:
+        result, cacheable = execute()
+    if (
+        cacheable
+        and result is not None
+        and not result.errors
+        and isinstance(result.data, dict)
+    ):
+        try:
+            publish_dependency_cache_entry(
+                cache_key=key,
+                result={
+                    "data": result.data,
+                    "extensions": getattr(result, "extensions", None),
+                },
+                dependencies=dependencies,
+                cache_backend=django_cache,
+                timeout=get_graphql_query_cache_timeout(),
+                started_generation=started_generation,
+            )
+        except CachePublishAborted:
+            logger.debug(
+                "graphql query cache publish aborted",
+                context={"operation": operation_name},
+            )
+        except Exception as exc:  # noqa: BLE001 - serve the fresh result
+            logger.warning(
+                "graphql query cache publish failed",
+                context={"operation": operation_name},
+                exc_info=exc,
+            )
+    _record_cache_outcome(operation_name, "miss", time.perf_counter() - started)
+    return result
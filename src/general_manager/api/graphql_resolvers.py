@@ -28,6 +28,7 @@ import graphene
 from graphql import OperationType
 from graphql.language.ast import FieldNode, FragmentSpreadNode, InlineFragmentNode
 
+from general_manager.conf import get_setting
 from general_manager.logging import get_logger
 from general_manager.bucket.base_bucket import Bucket
 from general_manager.bucket.group_bucket import GroupBucket
@@ -39,6 +40,7 @@ from general_manager.api.graphql_relations import (
     resolve_general_manager_type,
 )
 from general_manager.api.graphql_prefetch import (
+    collect_selected_graphql_field_names,
     collect_selected_graphql_property_names,
     plan_dependency_cache_prefetches,
     prefetch_dependency_cache_hits,
@@ -47,6 +49,7 @@ from general_manager.permission.graphql_capabilities import (
     get_capability_context,
     get_graphql_capabilities,
 )
+from general_manager.permission.request_cache import PermissionRequestCache
 from general_manager.utils.filter_parser import UnknownInputFieldError
 from general_manager.utils.type_checks import safe_issubclass
 
@@ -497,7 +500,8 @@ def filter_queryset_by_read_permission(
     class, the original queryset is returned without eagerly computing counts.
     Otherwise each candidate is checked with ``can_read_instance()`` and the
     originating bucket reconstructs the exact authorized instance subset using
-    its backend-native representation.
+    its backend-native representation. Query requests prime the distinct
+    ``__based_on__`` targets of all candidates in one batch first.
     """
     if not requires_instance_check:
         return ReadAuthorizationResult(
@@ -526,9 +530,27 @@ def filter_queryset_by_read_permission(
 
     authorized_instances: list[GeneralManagerT] = []
     candidate_count = 0
-    for instance in queryset:
+    permission_cache = get_request_permission_cache(info)
+    candidates: Iterable[GeneralManagerT] = queryset
+    if permission_cache is not None:
+        candidates = list(queryset)
+        permission_cache.prime_based_on_targets(PermissionClass, candidates)
+    for instance in candidates:
         candidate_count += 1
-        if PermissionClass(instance, info.context.user).can_read_instance():
+        if permission_cache is None:
+            readable = PermissionClass(instance, info.context.user).can_read_instance()
+        else:
+            static_decision = permission_cache.static_read_decision(
+                PermissionClass, instance, info.context.user
+            )
+            if static_decision is not None:
+                readable = static_decision
+            else:
+                with permission_cache.activate():
+                    readable = PermissionClass(
+                        instance, info.context.user
+                    ).can_read_instance()
+        if readable:
             authorized_instances.append(instance)
 
     authorized_queryset = queryset.with_instances(authorized_instances)
@@ -671,6 +693,53 @@ def apply_pagination(
     return queryset
 
 
+def graphql_field_projection_enabled() -> bool:
+    """Return whether list resolvers load only the columns a query selects."""
+    return bool(get_setting("GRAPHQL_FIELD_PROJECTION_ENABLED", False))
+
+
+def read_permissions_use_row_data(
+    manager_class: type[GeneralManager],
+    info: GraphQLResolveInfo,
+) -> bool:
+    """
+    Return whether read checks for *manager_class* may read item columns.
+
+    Permission callbacks run against every listed item and can touch any
+    attribute, so only plans decided without an instance and Permission
+    classes without attribute-level rules leave the selected columns as the
+    complete set a page reads.
+    """
+    permission_class = getattr(manager_class, "Permission", None)
+    if permission_class is None:
+        return False
+    if get_read_permission_filter(manager_class, info).decision != "allow_all":
+        return True
+    return any(
+        isinstance(rules, dict) and "read" in rules
+        for name, rules in vars(permission_class).items()
+        if not name.startswith("__")
+    )
+
+
+def selected_item_fields(
+    info: GraphQLResolveInfo,
+    manager_class: type[GeneralManager],
+) -> set[str]:
+    """
+    Return the attributes a list page reads from each item.
+
+    These are the fields selected directly under ``items`` plus the
+    permission's ``__based_on__`` attribute, which read checks resolve for
+    every row.
+    """
+    fields = collect_selected_graphql_field_names(info, root_field="items")
+    based_on = getattr(getattr(manager_class, "Permission", None), "__based_on__", None)
+    if isinstance(based_on, str):
+        fields.add(based_on)
+    return fields
+
+
 def apply_grouping(
     queryset: Bucket[GeneralManager],
     group_by: list[str] | None,
@@ -697,20 +766,60 @@ def apply_grouping(
 # ---------------------------------------------------------------------------
 
 
+_PERMISSION_CACHE_CONTEXT_ATTRIBUTE = "_general_manager_permission_cache"
+
+
+def get_request_permission_cache(
+    info: GraphQLResolveInfo,
+) -> PermissionRequestCache | None:
+    """
+    Return the permission cache shared by every resolver of one query request.
+
+    The cache is stored on ``info.context`` the first time a query resolver
+    asks for it. Mutations and subscriptions return ``None``: mutations change
+    the data being checked mid-request, and subscription contexts outlive one
+    event. Contexts that reject attribute assignment also return ``None`` so
+    callers fall back to uncached evaluation.
+    """
+    operation = getattr(getattr(info, "operation", None), "operation", None)
+    if operation is not OperationType.QUERY:
+        return None
+    context = getattr(info, "context", None)
+    if context is None:
+        return None
+    cache = getattr(context, _PERMISSION_CACHE_CONTEXT_ATTRIBUTE, None)
+    if isinstance(cache, PermissionRequestCache):
+        return cache
+    cache = PermissionRequestCache()
+    try:
+        setattr(context, _PERMISSION_CACHE_CONTEXT_ATTRIBUTE, cache)
+    except (AttributeError, TypeError):
+        return None
+    return cache
+
+
 def check_read_permission_for_user(
     instance: GeneralManager,
     user: object,
     field_name: str,
+    *,
+    permission_cache: PermissionRequestCache | None = None,
 ) -> bool:
     """
     Return ``True`` if *user* may read *field_name* on *instance*.
 
     When the manager defines a Permission class, this calls
     ``Permission(instance, user).check_permission("read", field_name)``.
-    Managers without a Permission class default to allowing the field read.
+    With ``permission_cache``, the evaluator for ``instance``/``user`` is built
+    once and reused for every field. Managers without a Permission class
+    default to allowing the field read.
     """
     PermissionClass: type[BasePermission] | None = getattr(instance, "Permission", None)
     if PermissionClass:
+        if permission_cache is not None:
+            return permission_cache.check_permission(
+                PermissionClass, instance, user, "read", field_name
+            )
         return PermissionClass(instance, user).check_permission("read", field_name)
     return True
 
@@ -724,10 +833,16 @@ def check_read_permission(
     Return ``True`` if the request user may read *field_name* on *instance*.
 
     When the manager defines a Permission class, this calls
-    ``Permission(instance, user).check_permission("read", field_name)``.
-    Managers without a Permission class default to allowing the field read.
+    ``Permission(instance, user).check_permission("read", field_name)``,
+    reusing the request's evaluator for *instance* during queries. Managers
+    without a Permission class default to allowing the field read.
     """
-    return check_read_permission_for_user(instance, info.context.user, field_name)
+    return check_read_permission_for_user(
+        instance,
+        info.context.user,
+        field_name,
+        permission_cache=get_request_permission_cache(info),
+    )
 
 
 def resolve_with_read_permission(
@@ -744,7 +859,12 @@ def resolve_with_read_permission(
     user = info.context.user
     operation = getattr(getattr(info, "operation", None), "operation", None)
     if operation is not OperationType.SUBSCRIPTION:
-        if not check_read_permission_for_user(instance, user, field_name):
+        if not check_read_permission_for_user(
+            instance,
+            user,
+            field_name,
+            permission_cache=get_request_permission_cache(info),
+        ):
             return None
         return value_factory()
 
@@ -783,7 +903,16 @@ def can_read_instance(
     instance: GeneralManager,
     info: GraphQLResolveInfo,
 ) -> bool:
-    """Return whether the request user may see that *instance* exists."""
+    """Return whether the request user may see that *instance* exists.
+
+    During queries the request's cached evaluator for *instance* is reused.
+    """
+    permission_cache = get_request_permission_cache(info)
+    PermissionClass: type[BasePermission] | None = getattr(instance, "Permission", None)
+    if PermissionClass and permission_cache is not None:
+        return permission_cache.can_read_instance(
+            PermissionClass, instance, info.context.user
+        )
     return can_read_instance_for_user(instance, info.context.user)
 
 
@@ -901,8 +1030,12 @@ def create_list_resolver(
     remain after those predicate phases. Sorting therefore applies to records
     when grouping is omitted and to grouped manager objects when grouping is
     active. It computes ``total_count`` after grouping and sorting and before
-    pagination. Non-grouped page items are
-    materialized to a list; grouped results remain a
+    pagination. Ungrouped buckets then load only the columns needed by the
+    fields selected under ``items`` when ``GRAPHQL_FIELD_PROJECTION_ENABLED``
+    is true and read checks cannot touch other columns. Non-grouped page items are
+    materialized to a list, and on query requests their distinct
+    ``__based_on__`` permission targets are hydrated in one batch; grouped
+    results remain a
     ``GroupBucket`` and are returned as the Python-side ``items`` value. When
     grouping is active, pagination slices the group bucket before it is returned.
     Dependency-cache prefetch runs only for materialized item lists when the
@@ -999,6 +1132,14 @@ def create_list_resolver(
         qs_sorted = apply_sorting(qs_grouped, sort_by, reverse)
 
         total_count = len(qs_sorted)
+        if (
+            not isinstance(qs_sorted, GroupBucket)
+            and graphql_field_projection_enabled()
+            and not read_permissions_use_row_data(manager_class, info)
+        ):
+            qs_sorted = qs_sorted.with_loaded_fields(
+                selected_item_fields(info, manager_class)
+            )
 
         qs_paginated = apply_pagination(qs_sorted, page, page_size)
         items: object
@@ -1007,6 +1148,10 @@ def create_list_resolver(
         else:
             items = list(cast(Iterable[GeneralManager], qs_paginated))
         if isinstance(items, list):
+            permission_class = getattr(manager_class, "Permission", None)
+            permission_cache = get_request_permission_cache(info)
+            if permission_cache is not None and permission_class is not None:
+                permission_cache.prime_based_on_targets(permission_class, items)
             selected_property_names = collect_selected_graphql_property_names(
                 info,
                 manager_class,
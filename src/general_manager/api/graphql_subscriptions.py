@@ -11,10 +11,22 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
 from copy import deepcopy
+from datetime import date, time
+from decimal import Decimal
 from typing import Callable, Iterable, TYPE_CHECKING, cast
+from uuid import uuid4
 
 from channels.layers import BaseChannelLayer, get_channel_layer
+from graphql.language.ast import (
+    FieldNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    SelectionSetNode,
+)
 
 from general_manager.cache.cache_tracker import DependencyTracker
 from general_manager.cache.dependency_index import (
@@ -40,6 +52,23 @@ type Identification = dict[str, object]
 type SubscriptionMessage = dict[str, object]
 """Channel-layer subscription event payload."""
 
+SUBSCRIPTION_DISPATCH_CONCURRENCY = 16
+"""Maximum concurrent ``group_send`` calls for one subscription event."""
+
+SHARED_HYDRATION_MAX_ENTRIES = 512
+"""Completed per-event hydrations retained for late subscribers."""
+
+_FINGERPRINT_SCALARS: tuple[type, ...] = (
+    str,
+    int,
+    float,
+    bool,
+    Decimal,
+    date,
+    time,
+    type(None),
+)
+
 
 # ---------------------------------------------------------------------------
 # Channel-layer helpers
@@ -127,37 +156,122 @@ async def dispatch_subscription_event(
     channel_layer: BaseChannelLayer,
     group_names: Iterable[str],
     message: SubscriptionMessage,
+    *,
+    max_concurrency: int = SUBSCRIPTION_DISPATCH_CONCURRENCY,
 ) -> int:
     """
-    Send one subscription event sequentially to each requested group.
+    Send one subscription event to every requested group concurrently.
 
-    Ordinary dispatch failures are logged for their target and do not prevent
-    later sends. ``MemoryError`` propagates immediately because continuing
-    dispatch during memory exhaustion is unsafe.
+    At most ``max_concurrency`` ``group_send`` calls are in flight at once, so
+    a write touching many groups pays roughly the slowest round-trip instead
+    of their sum. Ordinary dispatch failures are logged for their target and
+    do not affect the other sends. ``MemoryError`` propagates immediately and
+    cancels the sends still in flight, because continuing dispatch during
+    memory exhaustion is unsafe.
 
     Returns:
         The number of groups that accepted the event successfully.
     """
-    dispatched = 0
-    for target_group_name in group_names:
-        try:
-            await channel_layer.group_send(target_group_name, message)
-        except MemoryError:
-            raise
-        except Exception as exc:  # noqa: BLE001
-            logger.warning(
-                "failed to dispatch subscription event",
-                context={
-                    "group": target_group_name,
-                    "event_type": message.get("type"),
-                    "action": message.get("action"),
-                    "manager": message.get("manager"),
-                },
-                exc_info=exc,
-            )
-        else:
-            dispatched += 1
-    return dispatched
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def send(target_group_name: str) -> bool:
+        async with semaphore:
+            try:
+                await channel_layer.group_send(target_group_name, message)
+            except MemoryError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "failed to dispatch subscription event",
+                    context={
+                        "group": target_group_name,
+                        "event_type": message.get("type"),
+                        "action": message.get("action"),
+                        "manager": message.get("manager"),
+                    },
+                    exc_info=exc,
+                )
+                return False
+            return True
+
+    tasks = [asyncio.ensure_future(send(name)) for name in group_names]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return sum(results)
+
+
+class BackgroundSubscriptionSender:
+    """
+    Publish subscription events from a dedicated event-loop thread.
+
+    ``submit()`` returns immediately so a committing request does not wait for
+    channel-layer round-trips. Events are dispatched one after another in
+    submission order, each with concurrent per-group fan-out, so subscribers
+    still observe events in commit order. The worker thread starts lazily on
+    the first submission and is a daemon; events still queued when the
+    process exits are lost.
+    """
+
+    def __init__(self) -> None:
+        """Create an idle sender; the worker thread starts on first use."""
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._drain_task: asyncio.Task[None] | None = None
+        self._queue: asyncio.Queue[
+            tuple[BaseChannelLayer, tuple[str, ...], SubscriptionMessage]
+        ] = asyncio.Queue()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._drain_task = loop.create_task(self._drain())
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="general-manager-subscription-sender",
+                    daemon=True,
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    async def _drain(self) -> None:
+        while True:
+            channel_layer, group_names, message = await self._queue.get()
+            try:
+                await dispatch_subscription_event(channel_layer, group_names, message)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "failed to dispatch subscription event",
+                    context={
+                        "event_type": message.get("type"),
+                        "action": message.get("action"),
+                        "manager": message.get("manager"),
+                        "target_groups": list(group_names),
+                    },
+                    exc_info=exc,
+                )
+
+    def submit(
+        self,
+        channel_layer: BaseChannelLayer,
+        group_names: Iterable[str],
+        message: SubscriptionMessage,
+    ) -> None:
+        """Queue ``message`` for delivery to ``group_names`` and return."""
+        loop = self._ensure_started()
+        loop.call_soon_threadsafe(
+            self._queue.put_nowait,
+            (channel_layer, tuple(group_names), message),
+        )
+
+
+background_subscription_sender = BackgroundSubscriptionSender()
+"""Process-wide sender used when background subscription dispatch is enabled."""
 
 
 async def channel_listener(
@@ -435,6 +549,203 @@ def subscription_property_names(
     )
 
 
+def selected_leaf_field_names(
+    info: GraphQLResolveInfo,
+    normalize_graphql_name: Callable[[str], str],
+) -> frozenset[str] | None:
+    """
+    Return the leaf field names selected directly under ``item``.
+
+    Inline fragments and fragment spreads are followed; ``__typename`` is
+    ignored. Names are normalized with ``normalize_graphql_name``. ``None`` is
+    returned when ``item`` is not selected, selects nothing, or selects any
+    field with its own selection set (relations, measurements, files), since
+    those values cannot be compared by reading a single attribute.
+    """
+    names: set[str] = set()
+    found_item = False
+
+    def collect(
+        selection_set: SelectionSetNode | None,
+        visited: frozenset[str],
+    ) -> bool:
+        if selection_set is None:
+            return True
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                if selection.name.value == "__typename":
+                    continue
+                if selection.selection_set is not None:
+                    return False
+                names.add(normalize_graphql_name(selection.name.value))
+            elif isinstance(selection, InlineFragmentNode):
+                if not collect(selection.selection_set, visited):
+                    return False
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment_name = selection.name.value
+                fragment = info.fragments.get(fragment_name)
+                if fragment_name in visited or fragment is None:
+                    continue
+                if not collect(
+                    fragment.selection_set, visited | frozenset((fragment_name,))
+                ):
+                    return False
+        return True
+
+    def find_item(
+        selection_set: SelectionSetNode | None,
+        visited: frozenset[str],
+    ) -> bool:
+        nonlocal found_item
+        if selection_set is None:
+            return True
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                if selection.name.value == "item":
+                    found_item = True
+                    if not collect(selection.selection_set, visited):
+                        return False
+            elif isinstance(selection, InlineFragmentNode):
+                if not find_item(selection.selection_set, visited):
+                    return False
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment_name = selection.name.value
+                fragment = info.fragments.get(fragment_name)
+                if fragment_name in visited or fragment is None:
+                    continue
+                if not find_item(
+                    fragment.selection_set, visited | frozenset((fragment_name,))
+                ):
+                    return False
+        return True
+
+    for field_node in getattr(info, "field_nodes", ()):
+        if not find_item(field_node.selection_set, frozenset()):
+            return None
+    if not found_item or not names:
+        return None
+    return frozenset(names)
+
+
+def _is_fingerprintable(value: object) -> bool:
+    if isinstance(value, (list, tuple)):
+        return all(isinstance(member, _FINGERPRINT_SCALARS) for member in value)
+    return isinstance(value, _FINGERPRINT_SCALARS)
+
+
+def selection_fingerprint(
+    instance: GeneralManager,
+    field_names: Iterable[str],
+    can_read_field: Callable[[GeneralManager, str], bool],
+) -> str | None:
+    """
+    Fingerprint the values a subscriber would receive for ``field_names``.
+
+    Each field contributes its value when ``can_read_field`` allows it and a
+    hidden marker otherwise, so a permission change alters the fingerprint
+    even when the value does not. ``None`` is returned when a value is not a
+    plain scalar (or list of scalars), or when reading it raises; callers then
+    deliver the event unconditionally.
+    """
+    payload: dict[str, object] = {}
+    for name in sorted(field_names):
+        try:
+            if not can_read_field(instance, name):
+                payload[name] = {"__hidden__": True}
+                continue
+            value = getattr(instance, name)
+        except Exception:  # noqa: BLE001
+            return None
+        if not _is_fingerprintable(value):
+            return None
+        payload[name] = (
+            [repr(member) for member in value]
+            if isinstance(value, (list, tuple))
+            else repr(value)
+        )
+    return hashlib.sha256(
+        serialize_dependency_identifier(payload).encode("utf-8")
+    ).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Shared per-event hydration
+# ---------------------------------------------------------------------------
+
+
+def new_event_id() -> str:
+    """Return a unique identifier stamped on each published subscription event."""
+    return uuid4().hex
+
+
+def hydration_key(
+    manager_class: type[GeneralManager],
+    identification: Identification,
+    property_names: Iterable[str] | None,
+    event_id: str,
+) -> Hashable:
+    """
+    Build the shared-hydration key for one manager instance, selection and event.
+
+    Identification is normalized with ``serialize_dependency_identifier()`` so
+    that subscribers holding equal but distinct identification mappings share
+    an entry. ``property_names`` of ``None`` (prime every property) is kept
+    distinct from an empty selection.
+    """
+    return (
+        manager_class,
+        serialize_dependency_identifier(identification),
+        None if property_names is None else frozenset(property_names),
+        event_id,
+    )
+
+
+class SharedSubscriptionHydration:
+    """
+    Hydrate each (manager, identification, selection, event) once per process.
+
+    Every subscriber woken by the same channel-layer event asks for the same
+    key. The first request starts the load in a worker thread; concurrent and
+    later requests await that task instead of constructing another manager.
+    Cancelling one subscriber does not cancel the shared load. Load errors are
+    re-raised to every subscriber of that key. Tasks are bound to the event
+    loop that created them, so a key created on another loop is reloaded.
+
+    Only the most recent ``max_entries`` keys are retained; event identifiers
+    are unique, so evicted keys are never requested by new events.
+    """
+
+    def __init__(self, max_entries: int = SHARED_HYDRATION_MAX_ENTRIES) -> None:
+        """Create an empty hydration table holding at most ``max_entries`` keys."""
+        self._max_entries = max_entries
+        self._tasks: OrderedDict[Hashable, asyncio.Task[GeneralManager]] = OrderedDict()
+
+    async def hydrate(
+        self,
+        key: Hashable,
+        load: Callable[[], GeneralManager],
+    ) -> GeneralManager:
+        """Return the manager for ``key``, running ``load`` at most once."""
+        loop = asyncio.get_running_loop()
+        task = self._tasks.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(asyncio.to_thread(load))
+            self._tasks[key] = task
+            while len(self._tasks) > self._max_entries:
+                self._tasks.popitem(last=False)
+        else:
+            self._tasks.move_to_end(key)
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        """Forget every retained hydration."""
+        self._tasks.clear()
+
+
+shared_subscription_hydration = SharedSubscriptionHydration()
+"""Process-wide hydration table shared by all subscription streams."""
+
+
 # ---------------------------------------------------------------------------
 # Manager instantiation helper
 # ---------------------------------------------------------------------------
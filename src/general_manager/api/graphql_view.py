@@ -6,19 +6,20 @@ import time
 import inspect
 from collections.abc import Collection, Iterable, Mapping, Sequence
 from contextlib import nullcontext
-from typing import TYPE_CHECKING, Protocol, cast
+from typing import TYPE_CHECKING, Any, Protocol, cast
 
 from asgiref.sync import async_to_sync
 from django.db import connection, transaction
+from django.http import HttpResponseBadRequest, HttpResponseNotAllowed
 from graphql import (
     ExecutionResult,
     FragmentDefinitionNode,
     GraphQLError,
     GraphQLSchema,
     OperationType,
+    execute,
     get_operation_ast,
-    parse,
-    validate,
+    validate_schema,
 )
 from graphql.execution.collect_fields import collect_fields
 from graphql.execution.values import get_variable_values
@@ -38,16 +39,24 @@ if TYPE_CHECKING:
     class _GrapheneSchema(Protocol):
         graphql_schema: GraphQLSchema
 
+    class HttpError(Exception):
+        def __init__(self, response: object, message: str | None = None) -> None: ...
+
     class GraphQLView:
         batch: bool
         schema: _GrapheneSchema
         validation_rules: Collection[type[ASTValidationRule]] | None
+        execution_context_class: type[object] | None
 
         @classmethod
         def as_view(cls, **initkwargs: object) -> object: ...
 
         def get_middleware(self, request: object) -> list[object] | None: ...
 
+        def get_root_value(self, request: object) -> object: ...
+
+        def get_context(self, request: object) -> object: ...
+
         def get_graphql_params(
             self,
             request: object,
@@ -77,7 +86,7 @@ if TYPE_CHECKING:
 else:
     from graphene_django.constants import MUTATION_ERRORS_FLAG
     from graphene_django.utils.utils import set_rollback
-    from graphene_django.views import GraphQLView
+    from graphene_django.views import GraphQLView, HttpError
     from graphene_django.settings import graphene_settings
 
 from general_manager.cache.run_context import ensure_calculation_run_context
@@ -87,6 +96,24 @@ from general_manager.api.graphql_errors import (
     PublicGraphQLError,
     historical_graphql_error,
 )
+from general_manager.api.graphql_cost import (
+    QueryCost,
+    analyze_query_cost,
+    get_graphql_query_cost_limit,
+    query_cost_error,
+)
+from general_manager.api.graphql_documents import (
+    parse_graphql_document,
+    validate_graphql_document,
+)
+from general_manager.api.graphql_persisted_queries import (
+    graphql_request_extensions,
+    resolve_persisted_query,
+)
+from general_manager.api.graphql_query_cache import (
+    execute_with_query_cache,
+    graphql_query_cache_enabled,
+)
 from general_manager.metrics.graphql import (
     GraphQLRequestStatus,
     GraphQLResolverTimingMiddleware,
@@ -171,7 +198,7 @@ def _has_declared_async_mutation_resolver(
     ):
         return False
     try:
-        document = parse(query)
+        document = parse_graphql_document(query)
     except GraphQLError:
         return False
     operation = get_operation_ast(document, operation_name)
@@ -182,8 +209,9 @@ def _has_declared_async_mutation_resolver(
         or mutation_type is None
     ):
         return False
-    if validate(
+    if validate_graphql_document(
         schema,
+        query,
         document,
         validation_rules,
         max_validation_errors,
@@ -288,6 +316,11 @@ class GeneralManagerGraphQLView(GraphQLView):
             are enabled. Metrics are recorded for GraphiQL requests when
             Graphene returns an execution result.
 
+        When `GRAPHQL_QUERY_COST_LIMIT` is configured, the selected operation
+        is costed before execution. Operations over the limit fail with
+        `QUERY_COST_EXCEEDED` before any resolver runs, and every costed
+        response reports the estimate under `extensions.cost`.
+
         Partial GraphQL errors count as metrics status `error`; executions
         without errors count as `success`. Metrics backend failures, label
         normalization failures, and error-code extraction failures are swallowed
@@ -301,7 +334,11 @@ class GeneralManagerGraphQLView(GraphQLView):
 
         start = time.perf_counter()
         execution_result: _GraphQLExecutionResult | None
+        query_cost: QueryCost | None = None
         try:
+            query = resolve_persisted_query(
+                query, graphql_request_extensions(request, data)
+            )
             search_date = extract_as_of_search_date(
                 query=query,
                 variables=variables,
@@ -325,8 +362,14 @@ class GeneralManagerGraphQLView(GraphQLView):
             execution_context = (
                 nullcontext() if search_date is None else as_of(search_date)
             )
+            query_cost = self._analyze_query_cost(query, variables, operation_name)
             try:
-                if _has_declared_async_mutation_resolver(
+                if query_cost is not None and query_cost.exceeded:
+                    execution_result = ExecutionResult(
+                        data=None, errors=[query_cost_error(query_cost)]
+                    )
+                    self._record_query_cost_rejection(operation_name)
+                elif _has_declared_async_mutation_resolver(
                     self.schema.graphql_schema,
                     query,
                     operation_name,
@@ -343,6 +386,25 @@ class GeneralManagerGraphQLView(GraphQLView):
                             )
                         ],
                     )
+                elif (
+                    graphql_query_cache_enabled()
+                    and resolve_operation_type(query, operation_name) == "query"
+                ):
+                    with execution_context, ensure_calculation_run_context():
+                        execution_result = execute_with_query_cache(
+                            request=request,
+                            query=query,
+                            variables=variables,
+                            operation_name=operation_name,
+                            execute=lambda: self._execute_query_for_cache(
+                                request,
+                                data,
+                                query,
+                                variables,
+                                operation_name,
+                                show_graphiql,
+                            ),
+                        )
                 else:
                     with execution_context, ensure_calculation_run_context():
                         execution_result = self._execute_and_complete(
@@ -384,6 +446,9 @@ class GeneralManagerGraphQLView(GraphQLView):
             else:
                 response["data"] = execution_result.data
 
+            if query_cost is not None:
+                response["extensions"] = {"cost": query_cost.as_extension()}
+
             if self.batch:
                 response["id"] = request_id
                 response["status"] = status_code
@@ -402,6 +467,136 @@ class GeneralManagerGraphQLView(GraphQLView):
 
         return result, status_code
 
+    def execute_graphql_request(
+        self,
+        request: object,
+        data: object,
+        query: str | None,
+        variables: object,
+        operation_name: str | None,
+        show_graphiql: bool = False,
+    ) -> _GraphQLExecutionResult | None:
+        """
+        Execute one GraphQL request with cached parsing and validation.
+
+        This mirrors Graphene-Django's implementation, including GET-method
+        restrictions, atomic mutations, and exception-to-result conversion,
+        but parses and validates through the shared document cache so repeated
+        query texts skip both steps.
+        """
+        if not query:
+            if show_graphiql:
+                return None
+            raise HttpError(HttpResponseBadRequest("Must provide query string."))
+
+        schema = self.schema.graphql_schema
+        schema_validation_errors = validate_schema(schema)
+        if schema_validation_errors:
+            return ExecutionResult(data=None, errors=schema_validation_errors)
+
+        try:
+            document = parse_graphql_document(query)
+        except Exception as error:  # noqa: BLE001 - Graphene-compatible result
+            return ExecutionResult(errors=[error])  # type: ignore[list-item]
+
+        operation_ast = get_operation_ast(document, operation_name)
+        if (
+            getattr(request, "method", "").lower() == "get"
+            and operation_ast is not None
+            and operation_ast.operation != OperationType.QUERY
+        ):
+            if show_graphiql:
+                return None
+            raise HttpError(
+                HttpResponseNotAllowed(
+                    ["POST"],
+                    "Can only perform a {} operation from a POST request.".format(
+                        operation_ast.operation.value
+                    ),
+                )
+            )
+
+        validation_errors = validate_graphql_document(
+            schema,
+            query,
+            document,
+            self.validation_rules,
+            graphene_settings.MAX_VALIDATION_ERRORS,
+        )
+        if validation_errors:
+            return ExecutionResult(data=None, errors=validation_errors)
+
+        try:
+            execute_options: dict[str, Any] = {
+                "root_value": self.get_root_value(request),
+                "context_value": self.get_context(request),
+                "variable_values": variables,
+                "operation_name": operation_name,
+                "middleware": self.get_middleware(request),
+            }
+            if self.execution_context_class:
+                execute_options["execution_context_class"] = (
+                    self.execution_context_class
+                )
+
+            if (
+                operation_ast is not None
+                and operation_ast.operation == OperationType.MUTATION
+                and (
+                    graphene_settings.ATOMIC_MUTATIONS is True
+                    or connection.settings_dict.get("ATOMIC_MUTATIONS", False) is True
+                )
+            ):
+                with transaction.atomic():
+                    result = execute(schema, document, **execute_options)
+                    if getattr(request, MUTATION_ERRORS_FLAG, False) is True:
+                        transaction.set_rollback(True)
+                return cast(_GraphQLExecutionResult | None, result)
+
+            return cast(
+                _GraphQLExecutionResult | None,
+                execute(schema, document, **execute_options),
+            )
+        except Exception as error:  # noqa: BLE001 - Graphene-compatible result
+            return ExecutionResult(errors=[error])  # type: ignore[list-item]
+
+    def _analyze_query_cost(
+        self,
+        query: str | None,
+        variables: object,
+        operation_name: str | None,
+    ) -> QueryCost | None:
+        """Estimate the operation cost when ``GRAPHQL_QUERY_COST_LIMIT`` is set."""
+        if not isinstance(query, str) or get_graphql_query_cost_limit() is None:
+            return None
+        try:
+            document = parse_graphql_document(query)
+        except GraphQLError:
+            return None
+        return analyze_query_cost(
+            self.schema.graphql_schema,
+            document,
+            operation_name,
+            variables,
+        )
+
+    @staticmethod
+    def _record_query_cost_rejection(operation_name: str | None) -> None:
+        """Report one cost rejection without affecting the response."""
+        if not graphql_metrics_enabled():
+            return
+        try:
+            record = getattr(
+                get_graphql_metrics_backend(), "record_query_cost_rejection", None
+            )
+            if callable(record):
+                record(operation_name=normalize_operation_name(operation_name))
+        except Exception as exc:  # noqa: BLE001 - metrics must not fail requests
+            logger.debug(
+                "graphql query cost metrics failed",
+                context={"error": type(exc).__name__, "message": str(exc)},
+            )
+
     @staticmethod
     def _complete_execution_result(
         execution_result: object,
@@ -428,6 +623,38 @@ class GeneralManagerGraphQLView(GraphQLView):
             async_to_sync(_await_execution_result)(execution_result),
         )
 
+    def _execute_query_for_cache(
+        self,
+        request: object,
+        data: object,
+        query: str | None,
+        variables: object,
+        operation_name: str | None,
+        show_graphiql: bool,
+    ) -> tuple[_GraphQLExecutionResult | None, bool]:
+        """
+        Execute a query and report whether its result may be cached.
+
+        Results completed through an event loop are not cacheable because
+        their resolvers run outside the thread whose ``DependencyTracker``
+        records the dependencies.
+        """
+        result = self.execute_graphql_request(
+            request,
+            data,
+            query,
+            variables,
+            operation_name,
+            show_graphiql,
+        )
+        cacheable = not inspect.isawaitable(result)
+        completed = self._complete_execution_result(
+            result,
+            query=query,
+            operation_name=operation_name,
+        )
+        return completed, cacheable
+
     def _execute_and_complete(
         self,
         request: object,
@@ -44,6 +44,7 @@ from general_manager.workflow.signal_bridge import (
 )
 from general_manager.workflow.tasks import (
     configure_workflow_beat_schedule_from_settings,
+    configure_workflow_retention_beat_schedule_from_settings,
 )
 from general_manager.api.graphql_warmup_tasks import (
     configure_graphql_warmup_beat_schedule_from_settings,
@@ -191,6 +192,7 @@ class GeneralmanagerConfig(AppConfig):
         configure_event_registry_from_settings(settings)
         configure_workflow_signal_bridge_from_settings(settings)
         configure_workflow_beat_schedule_from_settings(settings)
+        configure_workflow_retention_beat_schedule_from_settings(settings)
         configure_search_reconcile_beat_schedule_from_settings(settings)
         configure_graphql_warmup_beat_schedule_from_settings(settings)
         from general_manager.conf import get_setting
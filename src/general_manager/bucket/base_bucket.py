@@ -274,6 +274,17 @@ class Bucket(ABC, Generic[GeneralManagerType]):
         """Materialize requested manager attributes in bucket iteration order."""
         return tuple(tuple(getattr(row, field) for field in fields) for row in self)
 
+    def with_loaded_fields(
+        self,
+        fields: Iterable[str],
+    ) -> Bucket[GeneralManagerType]:
+        """Return a bucket whose items only need ``fields`` loaded up front.
+
+        GraphQL list resolvers use this to skip columns a query never reads.
+        Buckets that cannot narrow what they load return themselves unchanged.
+        """
+        return self
+
     def values(self, *fields: str) -> tuple[dict[str, object], ...]:
         """Return detached dictionaries for the requested public fields."""
         normalized_fields = validate_projection_fields(
@@ -260,6 +260,7 @@ class DatabaseBucket(Bucket[GeneralManagerType]):
         sort_keys: tuple[str, ...] | None = None,
         sort_reverse: bool = False,
         run_scoped_cacheable: bool = True,
+        trust_deferred_rows: bool = False,
     ) -> None:
         """
         Instantiate a database-backed bucket with optional filter state.
@@ -278,6 +279,7 @@ class DatabaseBucket(Bucket[GeneralManagerType]):
             sort_keys (tuple[str, ...] | None): Property names used by a previous bucket sort operation.
             sort_reverse (bool): Whether sorted keys should be interpreted in descending order for dependency tracking.
             run_scoped_cacheable (bool): Whether terminal results from this bucket are safe to reuse inside the active calculation run.
+            trust_deferred_rows (bool): Whether live rows with deferred columns may hydrate managers directly; set by `with_loaded_fields()`.
 
         Returns:
             None
@@ -294,6 +296,7 @@ class DatabaseBucket(Bucket[GeneralManagerType]):
         self._sort_keys = sort_keys
         self._sort_reverse = sort_reverse
         self._run_scoped_cacheable = run_scoped_cacheable
+        self._trust_deferred_rows = trust_deferred_rows
         self._query_signature_cache: tuple[Hashable, ...] | None | object = (
             _QUERY_SIGNATURE_NOT_COMPUTED
         )
@@ -335,6 +338,7 @@ class DatabaseBucket(Bucket[GeneralManagerType]):
             sort_keys=self._sort_keys,
             sort_reverse=self._sort_reverse,
             run_scoped_cacheable=self._run_scoped_cacheable,
+            trust_deferred_rows=self._trust_deferred_rows,
         )
         bucket._set_trusted_query_signature(self._trusted_query_signature)
         return bucket
@@ -430,7 +434,13 @@ class DatabaseBucket(Bucket[GeneralManagerType]):
             if not isinstance(instance, interface_model):
                 return False
         get_deferred_fields = getattr(instance, "get_deferred_fields", None)
-        if callable(get_deferred_fields) and get_deferred_fields():
+        if (
+            (self._search_date is not None or not self._trust_deferred_rows)
+            and callable(get_deferred_fields)
+            and get_deferred_fields()
+        ):
+            # Only rows projected by `with_loaded_fields()` may load deferred
+            # columns on access; historical rows need their complete snapshot.
             return False
         if self._search_date is not None and not (
             hasattr(instance, "_history") or hasattr(instance, "history_date")
@@ -975,6 +985,119 @@ class DatabaseBucket(Bucket[GeneralManagerType]):
             )
         return tuple(plan), tuple(selected_columns), identification_index
 
+    def _loaded_model_fields(self, fields: Iterable[str]) -> tuple[str, ...] | None:
+        """
+        Return the model fields needed to read public ``fields`` from live rows.
+
+        Direct ORM attributes map to their column, measurements to their value
+        and unit columns, and direct relations to their foreign key. Collection
+        and reverse one-to-one relations are read through the primary key and
+        need no column. Any other attribute, GraphQL property, historical
+        bucket, or foreign queryset model returns ``None`` because what it
+        reads from the row is unknown.
+        """
+        if self._search_date is not None:
+            return None
+        model = self._data.model
+        interface = self._manager_class.Interface
+        if model is not getattr(interface, "_model", None):
+            return None
+        graph_ql_properties = interface.get_graph_ql_properties()
+        try:
+            attributes = interface.get_attributes()
+        except (AttributeError, NotImplementedError):
+            return None
+        if not isinstance(attributes, Mapping):
+            return None
+        try:
+            attribute_types = interface.get_attribute_types()
+        except (AttributeError, NotImplementedError):
+            attribute_types = {}
+
+        loaded: list[str] = []
+        for field_name in fields:
+            if field_name in graph_ql_properties or field_name not in attributes:
+                return None
+            field_info = attribute_types.get(field_name)
+            relation_kind = (
+                field_info.get("relation_kind")
+                if isinstance(field_info, Mapping)
+                else None
+            )
+            if relation_kind == "collection":
+                continue
+            if relation_kind == "direct":
+                filter_lookup = cast(Mapping[str, object], field_info).get(
+                    "filter_lookup"
+                )
+                try:
+                    relation_field = model._meta.get_field(
+                        filter_lookup if isinstance(filter_lookup, str) else field_name
+                    )
+                except FieldDoesNotExist:
+                    return None
+                if not (relation_field.one_to_one or relation_field.many_to_one):
+                    return None
+                if relation_field.concrete:
+                    loaded.append(relation_field.name)
+                continue
+            if not self._is_direct_model_accessor(
+                attributes.get(field_name), field_name
+            ):
+                return None
+            try:
+                field = model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                return None
+            if isinstance(field, MeasurementField):
+                value_attr = getattr(field, "value_attr", None)
+                unit_attr = getattr(field, "unit_attr", None)
+                if not isinstance(value_attr, str) or not isinstance(unit_attr, str):
+                    return None
+                loaded.extend((value_attr, unit_attr))
+                continue
+            if not getattr(field, "concrete", False) or field.many_to_many:
+                return None
+            loaded.append(field.name)
+        return tuple(dict.fromkeys(loaded))
+
+    def with_loaded_fields(
+        self,
+        fields: Iterable[str],
+    ) -> DatabaseBucket[GeneralManagerType]:
+        """
+        Return a bucket that selects only the columns needed for ``fields``.
+
+        The primary key is always selected. Managers hydrate from the deferred
+        rows and Django loads any other column on first access, so callers
+        that read more than ``fields`` stay correct at the cost of one query
+        per touched column and row. Buckets derived from the result keep this
+        trust; querysets deferred by the caller still load managers by primary
+        key. The bucket is returned unchanged when the
+        fields cannot be mapped to columns or the queryset already defers
+        columns, follows ``select_related``, or combines queries.
+        """
+        self._ensure_as_of_compatible()
+        query = self._data.query
+        if query.select_related or query.combinator or query.deferred_loading[0]:
+            return self
+        loaded = self._loaded_model_fields(fields)
+        if loaded is None:
+            return self
+        primary_key = self._data.model._meta.pk
+        assert primary_key is not None
+        return self.__class__(
+            self._data.only(primary_key.name, *loaded),
+            self._manager_class,
+            self.filters,
+            self.excludes,
+            search_date=self._search_date,
+            sort_keys=self._sort_keys,
+            sort_reverse=self._sort_reverse,
+            run_scoped_cacheable=self._run_scoped_cacheable,
+            trust_deferred_rows=True,
+        )
+
     def _project_rows(self, fields: tuple[str, ...]) -> ProjectionRows:
         """Project safe ORM fields without constructing manager instances."""
         self._ensure_as_of_compatible()
@@ -1020,9 +1143,9 @@ class DatabaseBucket(Bucket[GeneralManagerType]):
         Safe run-scoped row snapshots are reused when present. Otherwise cached
         primary-key snapshots are reused when available, and the queryset is
         iterated as trusted ORM rows when possible. Rows are trusted only when
-        they match the interface model, are not deferred, and historical buckets
-        expose history state. Untrusted rows fall back to primary-key manager
-        construction. `search_date` is passed through when managers are built
+        they match the interface model, are not deferred unless the bucket came
+        from `with_loaded_fields()`, and historical buckets expose history
+        state. Untrusted rows fall back to primary-key manager construction. `search_date` is passed through when managers are built
         from primary keys or trusted rows.
 
         Yields:
@@ -1100,6 +1223,8 @@ class DatabaseBucket(Bucket[GeneralManagerType]):
             sort_keys=self._sort_keys,
             sort_reverse=self._sort_reverse,
             run_scoped_cacheable=False,
+            trust_deferred_rows=self._trust_deferred_rows
+            and other._trust_deferred_rows,
         )
 
     def __merge_filter_definitions(
@@ -1265,6 +1390,7 @@ class DatabaseBucket(Bucket[GeneralManagerType]):
             sort_keys=self._sort_keys,
             sort_reverse=self._sort_reverse,
             run_scoped_cacheable=self._run_scoped_cacheable,
+            trust_deferred_rows=self._trust_deferred_rows,
         )
         if not annotations and not python_filters:
             bucket._set_trusted_query_signature(
@@ -1344,6 +1470,7 @@ class DatabaseBucket(Bucket[GeneralManagerType]):
             sort_keys=self._sort_keys,
             sort_reverse=self._sort_reverse,
             run_scoped_cacheable=self._run_scoped_cacheable,
+            trust_deferred_rows=self._trust_deferred_rows,
         )
         if not annotations and not python_filters:
             bucket._set_trusted_query_signature(
@@ -1462,6 +1589,7 @@ class DatabaseBucket(Bucket[GeneralManagerType]):
             sort_keys=self._sort_keys,
             sort_reverse=self._sort_reverse,
             run_scoped_cacheable=self._run_scoped_cacheable,
+            trust_deferred_rows=self._trust_deferred_rows,
         )
         bucket._set_trusted_query_signature(self._trusted_query_signature)
         return bucket
@@ -1538,6 +1666,7 @@ class DatabaseBucket(Bucket[GeneralManagerType]):
                 sort_keys=self._sort_keys,
                 sort_reverse=self._sort_reverse,
                 run_scoped_cacheable=self._run_scoped_cacheable,
+                trust_deferred_rows=self._trust_deferred_rows,
             )
         self._track_effective_dependencies()
         rows = self._peek_run_scoped_rows()
@@ -1782,6 +1911,7 @@ class DatabaseBucket(Bucket[GeneralManagerType]):
             sort_keys=key,
             sort_reverse=reverse,
             run_scoped_cacheable=self._run_scoped_cacheable,
+            trust_deferred_rows=self._trust_deferred_rows,
         )
         if not annotations and not python_keys:
             bucket._set_trusted_query_signature(self._trusted_query_signature)
@@ -9,12 +9,16 @@ from django.core.management.base import BaseCommand
 
 from general_manager.logging import get_logger
 from general_manager.search.backend_registry import get_search_backend
-from general_manager.search.indexer import SearchIndexer
+from general_manager.search.indexer import SearchIndexer, ensure_search_index
 from general_manager.search.registry import (
-    collect_index_settings,
     get_index_names,
     iter_searchable_managers,
 )
+from general_manager.search.reindex import (
+    SearchReindexOutcome,
+    enqueue_manager_reindex,
+    reindex_managers,
+)
 
 logger = get_logger("search.command")
 
@@ -39,6 +43,10 @@ class Command(BaseCommand):
                 --index: repeatable; specify one or more index names to create or update.
                 --reindex: store-true flag that triggers reindexing of configured managers.
                 --manager: repeatable; specify one or more manager class names to reindex.
+                --workers: number of managers rebuilt concurrently on worker threads.
+                --max-concurrent-writes: bound on concurrent backend writes across workers.
+                --celery: split the rebuild into identity batches for search workers.
+                --chunk-size: identities per batch when --celery is set.
         """
         parser.add_argument(
             "--index",
@@ -58,6 +66,32 @@ class Command(BaseCommand):
             dest="managers",
             help="Manager class name to reindex. Repeatable.",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Managers to reindex concurrently. Defaults to 1.",
+        )
+        parser.add_argument(
+            "--max-concurrent-writes",
+            type=int,
+            default=None,
+            dest="max_concurrent_writes",
+            help="Concurrent backend writes across workers. Defaults to --workers.",
+        )
+        parser.add_argument(
+            "--celery",
+            action="store_true",
+            dest="celery",
+            help="Queue identity batches for search workers instead of rebuilding here.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            dest="chunk_size",
+            help="Identities per queued batch with --celery. Defaults to 500.",
+        )
 
     def handle(self, *_args: object, **options: object) -> None:
         """
@@ -67,18 +101,27 @@ class Command(BaseCommand):
         - `indexes`: iterable of index names to create or update; if omitted, all known indexes are targeted. Unknown names are reported to stderr and ignored; if none remain, the command exits early.
         - `reindex`: truthy value to trigger reindexing of searchable managers after ensuring indexes.
         - `managers`: iterable of manager class names to restrict which managers are reindexed when `reindex` is set.
+        - `workers`, `max_concurrent_writes`: bounds for `reindex_managers()`; one worker rebuilds managers in order.
+        - `celery`, `chunk_size`: enqueue identity batches via `enqueue_manager_reindex()` instead.
 
         Side effects:
         - Ensures each target index exists and has its searchable, filterable, sortable fields and field boosts configured on the search backend.
-        - When `reindex` is true, reindexes each searchable manager (filtered by `managers` when provided) and logs completion per manager.
+        - When `reindex` is true, reindexes each searchable manager (filtered by `managers` when provided), writes one progress line per finished manager, and logs completion per manager.
 
         Raises:
-            InvalidSearchIndexCommandOptionError: If `indexes` or `managers` are provided as non-string values.
-            Exception: Backend configuration, index setup, manager discovery, and reindexing errors propagate.
+            InvalidSearchIndexCommandOptionError: If `indexes` or `managers` are provided as non-string values, or a bound is not a positive integer.
+            SearchReindexFailedError: After every manager ran, if any reindex failed.
+            Exception: Backend configuration, index setup, and manager discovery errors propagate.
         """
         index_names = _string_options(options.get("indexes"))
         reindex = _bool_option(options.get("reindex", False))
         manager_filters = set(_string_options(options.get("managers")))
+        workers = _positive_int_option(options.get("workers", 1))
+        max_concurrent_writes = _optional_positive_int_option(
+            options.get("max_concurrent_writes")
+        )
+        use_celery = _bool_option(options.get("celery", False))
+        chunk_size = _positive_int_option(options.get("chunk_size", 500))
 
         backend = get_search_backend()
         indexer = SearchIndexer(backend)
@@ -99,30 +142,64 @@ class Command(BaseCommand):
             target_indexes = get_index_names()
 
         for index_name in sorted(target_indexes):
-            settings_payload = collect_index_settings(index_name)
-            backend.ensure_index(
-                index_name,
-                {
-                    "searchable_fields": settings_payload.searchable_fields,
-                    "filterable_fields": settings_payload.filterable_fields,
-                    "sortable_fields": settings_payload.sortable_fields,
-                    "field_boosts": settings_payload.field_boosts,
-                },
-            )
+            ensure_search_index(backend, index_name, force=True)
             logger.info(
                 "search index ensured",
                 context={"index": index_name},
             )
 
-        if reindex:
-            for manager_class in iter_searchable_managers():
-                if manager_filters and manager_class.__name__ not in manager_filters:
-                    continue
-                indexer.reindex_manager(manager_class)
-                logger.info(
-                    "search reindex complete",
-                    context={"manager": manager_class.__name__},
-                )
+        if not reindex:
+            return
+        manager_classes = [
+            manager_class
+            for manager_class in iter_searchable_managers()
+            if not manager_filters or manager_class.__name__ in manager_filters
+        ]
+        if use_celery:
+            enqueue_manager_reindex(
+                manager_classes,
+                chunk_size=chunk_size,
+                on_progress=self._report_progress,
+            )
+            return
+        reindex_managers(
+            manager_classes,
+            backend=backend,
+            workers=workers,
+            max_concurrent_writes=max_concurrent_writes,
+            indexer_factory=lambda target_backend: (
+                indexer if target_backend is backend else SearchIndexer(target_backend)
+            ),
+            on_progress=self._report_progress,
+        )
+
+    def _report_progress(
+        self,
+        outcome: SearchReindexOutcome,
+        completed: int,
+        total: int,
+    ) -> None:
+        """Write one progress line and log the finished manager."""
+        name = outcome.manager_class.__name__
+        if outcome.error is not None:
+            self.stderr.write(
+                f"[{completed}/{total}] {name} failed after "
+                f"{outcome.seconds:.2f}s: {outcome.error}"
+            )
+            logger.warning(
+                "search reindex failed",
+                context={"manager": name},
+                exc_info=outcome.error,
+            )
+            return
+        detail = f"{outcome.batches} batches queued" if outcome.batches else "reindexed"
+        self.stdout.write(
+            f"[{completed}/{total}] {name} {detail} in {outcome.seconds:.2f}s"
+        )
+        logger.info(
+            "search reindex complete",
+            context={"manager": name},
+        )
 
 
 def _string_options(value: object) -> tuple[str, ...]:
@@ -138,6 +215,20 @@ def _string_options(value: object) -> tuple[str, ...]:
     raise InvalidSearchIndexCommandOptionError()
 
 
+def _positive_int_option(value: object) -> int:
+    """Validate a positive integer Django command option."""
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        raise InvalidSearchIndexCommandOptionError()
+    return value
+
+
+def _optional_positive_int_option(value: object) -> int | None:
+    """Validate an optional positive integer Django command option."""
+    if value is None:
+        return None
+    return _positive_int_option(value)
+
+
 def _bool_option(value: object) -> bool:
     """Validate a boolean Django command option."""
     if not isinstance(value, bool):
@@ -0,0 +1,37 @@
+"""Run the long-lived workflow outbox dispatcher loop."""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from general_manager.workflow.dispatcher import OutboxDispatcher
+
+
+class Command(BaseCommand):
+    """Drain the workflow outbox continuously until interrupted.
+
+    The command runs `OutboxDispatcher.run()` against the selected database
+    alias. It stops cleanly on `KeyboardInterrupt` and prints a styled line
+    when it does; other exceptions are not wrapped.
+    """
+
+    help = "Continuously drain workflow outbox records as they are committed."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register the `--database` option."""
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database alias to listen on and poll.",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Run the dispatcher until interrupted."""
+        del args
+        dispatcher = OutboxDispatcher(using=str(options["database"]))
+        self.stdout.write("Workflow outbox dispatcher started.")
+        try:
+            dispatcher.run()
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS("Workflow outbox dispatcher stopped."))
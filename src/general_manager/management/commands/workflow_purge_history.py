@@ -0,0 +1,71 @@
+"""Delete finished workflow outbox history past its retention period."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from general_manager.workflow.retention import (
+    InvalidWorkflowRetentionOptionError,
+    purge_workflow_history,
+)
+
+
+class Command(BaseCommand):
+    """Run one bounded workflow retention sweep.
+
+    `--batch-size` and `--max-batches` override `WORKFLOW_RETENTION_BATCH_SIZE`
+    and `WORKFLOW_RETENTION_MAX_BATCHES`; non-positive values raise
+    `CommandError`. `--until-complete` repeats sweeps until no eligible rows
+    remain. The command prints the removed row counts.
+    """
+
+    help = "Delete processed and dead-lettered workflow events past retention."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register the sweep bounds and the `--database` option."""
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument("--max-batches", type=int, default=None)
+        parser.add_argument(
+            "--until-complete",
+            action="store_true",
+            help="Repeat sweeps until no eligible rows remain.",
+        )
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database alias to purge.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the sweep and print `events=<n> outbox_rows=<n> ...`."""
+        del args
+        totals = {"events": 0, "outbox_rows": 0, "delivery_attempts": 0}
+        batches = 0
+        while True:
+            try:
+                result = purge_workflow_history(
+                    batch_size=options.get("batch_size"),
+                    max_batches=options.get("max_batches"),
+                    using=str(options["database"]),
+                )
+            except InvalidWorkflowRetentionOptionError as exc:
+                raise CommandError(str(exc)) from exc
+            totals["events"] += result.events
+            totals["outbox_rows"] += result.outbox_rows
+            totals["delivery_attempts"] += result.delivery_attempts
+            batches += result.batches
+            if result.complete or options.get("until_complete") is not True:
+                break
+        self.stdout.write(
+            " ".join(
+                (
+                    f"events={totals['events']}",
+                    f"outbox_rows={totals['outbox_rows']}",
+                    f"delivery_attempts={totals['delivery_attempts']}",
+                    f"batches={batches}",
+                    f"complete={result.complete}",
+                )
+            )
+        )
@@ -18,10 +18,11 @@ from typing import (
     cast,
 )
 
-from graphql import get_operation_ast, parse
+from graphql import get_operation_ast
 from graphql.error import GraphQLError
 from text_unidecode import unidecode
 
+from general_manager.api.graphql_documents import parse_graphql_document
 from general_manager.logging import get_logger
 
 logger = get_logger("metrics.graphql")
@@ -110,13 +111,37 @@ class NoopGraphQLMetricsBackend:
         """Drop one resolver error metric."""
         return None
 
+    def record_search_cache(
+        self,
+        *,
+        index_name: str,
+        outcome: str,
+        saved_seconds: float,
+    ) -> None:
+        """Drop one search result cache metric."""
+        return None
+
+    def record_query_cache(
+        self,
+        *,
+        operation_name: str,
+        outcome: str,
+        duration: float,
+    ) -> None:
+        """Drop one GraphQL query cache metric."""
+        return None
+
+    def record_query_cost_rejection(self, *, operation_name: str) -> None:
+        """Drop one GraphQL query cost rejection metric."""
+        return None
+
 
 class _PrometheusMetric(Protocol):
     """Subset of the Prometheus metric API used by this module."""
 
     def labels(self, **label_values: str) -> _PrometheusMetric: ...
 
-    def inc(self) -> None: ...
+    def inc(self, amount: float = 1) -> None: ...
 
     def observe(self, value: float) -> None: ...
 
@@ -156,6 +181,11 @@ class PrometheusGraphQLMetricsBackend:
     _error_counter: ClassVar[_PrometheusMetric]
     _resolver_duration: ClassVar[_PrometheusMetric]
     _resolver_error: ClassVar[_PrometheusMetric]
+    _search_cache_counter: ClassVar[_PrometheusMetric]
+    _search_cache_saved: ClassVar[_PrometheusMetric]
+    _query_cache_counter: ClassVar[_PrometheusMetric]
+    _query_cache_duration: ClassVar[_PrometheusMetric]
+    _query_cost_rejections: ClassVar[_PrometheusMetric]
 
     def __init__(self) -> None:
         self._ensure_metrics()
@@ -213,6 +243,36 @@ class PrometheusGraphQLMetricsBackend:
             "Total GraphQL resolver errors.",
             ["field_name"],
         )
+        cls._search_cache_counter = _get_or_create(
+            cast(_PrometheusCollectorFactory, Counter),
+            "search_result_cache_requests_total",
+            "Total search result cache lookups.",
+            ["index_name", "outcome"],
+        )
+        cls._search_cache_saved = _get_or_create(
+            cast(_PrometheusCollectorFactory, Counter),
+            "search_result_cache_saved_seconds_total",
+            "Backend search seconds avoided by result cache hits.",
+            ["index_name"],
+        )
+        cls._query_cache_counter = _get_or_create(
+            cast(_PrometheusCollectorFactory, Counter),
+            "graphql_query_cache_requests_total",
+            "Total GraphQL query cache lookups.",
+            ["operation_name", "outcome"],
+        )
+        cls._query_cache_duration = _get_or_create(
+            cast(_PrometheusCollectorFactory, Histogram),
+            "graphql_query_cache_duration_seconds",
+            "GraphQL query duration in seconds by cache outcome.",
+            ["operation_name", "outcome"],
+        )
+        cls._query_cost_rejections = _get_or_create(
+            cast(_PrometheusCollectorFactory, Counter),
+            "graphql_query_cost_rejections_total",
+            "Total GraphQL operations rejected for exceeding the cost limit.",
+            ["operation_name"],
+        )
         cls._initialized = True
 
     def record_request(
@@ -248,6 +308,44 @@ class PrometheusGraphQLMetricsBackend:
         """Increment the resolver error counter for a normalized field label."""
         self._resolver_error.labels(field_name=field_name).inc()
 
+    def record_search_cache(
+        self,
+        *,
+        index_name: str,
+        outcome: str,
+        saved_seconds: float,
+    ) -> None:
+        """Count one search cache outcome and the backend time a hit avoided."""
+        self._search_cache_counter.labels(
+            index_name=index_name,
+            outcome=outcome,
+        ).inc()
+        if outcome == "hit":
+            self._search_cache_saved.labels(index_name=index_name).inc(
+                _safe_duration(saved_seconds)
+            )
+
+    def record_query_cache(
+        self,
+        *,
+        operation_name: str,
+        outcome: str,
+        duration: float,
+    ) -> None:
+        """Count one query cache outcome and observe the request duration."""
+        self._query_cache_counter.labels(
+            operation_name=operation_name,
+            outcome=outcome,
+        ).inc()
+        self._query_cache_duration.labels(
+            operation_name=operation_name,
+            outcome=outcome,
+        ).observe(_safe_duration(duration))
+
+    def record_query_cost_rejection(self, *, operation_name: str) -> None:
+        """Increment the cost rejection counter for a normalized operation label."""
+        self._query_cost_rejections.labels(operation_name=operation_name).inc()
+
 
 _metrics_backend: GraphQLMetricsBackend | None = None
 
@@ -463,7 +561,7 @@ def resolve_operation_type(
     if not query:
         return UNKNOWN_LABEL
     try:
-        document = parse(query)
+        document = parse_graphql_document(query)
         operation_ast = get_operation_ast(document, operation_name)
     except (GraphQLError, TypeError, ValueError):
         return UNKNOWN_LABEL
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.10 on 2026-10-18 00:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("general_manager", "0011_search_index_state_dirty_generation"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="workflowoutbox",
+            index=models.Index(
+                fields=["status", "updated_at"],
+                name="general_man_status_e94dcb_idx",
+            ),
+        ),
+    ]
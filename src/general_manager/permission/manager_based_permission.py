@@ -4,17 +4,23 @@ from __future__ import annotations
 
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import TYPE_CHECKING, ClassVar, Literal, cast
 
 from general_manager.permission.base_permission import (
     BasePermission,
     PermissionConstraint,
+    _InvalidPermissionFilterResultError,
     ReadPermissionDecision,
     ReadPermissionPlan,
     ReadPermissionReason,
     UserLike,
 )
 from general_manager.permission.permission_checks import PermissionFilterDecision
+from general_manager.permission.request_cache import (
+    get_active_permission_request_cache,
+)
+from general_manager.permission.utils import PermissionNotFoundError
 
 if TYPE_CHECKING:
     from general_manager.permission.permission_data_manager import (
@@ -34,6 +40,42 @@ class _ReadPermissionFragment:
     requires_instance_check: bool = False
 
 
+@dataclass(frozen=True, slots=True)
+class ReadFieldMask:
+    """Compiled read outcomes for one permission class and request user.
+
+    ``True`` and ``False`` are final decisions that depend only on the user;
+    ``None`` means the field still needs per-instance evaluation. Fields
+    without their own read rule use ``default``, which is also the
+    ``can_read_instance()`` outcome.
+    """
+
+    default: bool | None
+    fields: Mapping[str, bool | None]
+
+    def decision_for(self, attribute: str) -> bool | None:
+        """Return the compiled decision for ``attribute``."""
+        return self.fields.get(attribute, self.default)
+
+    def describe(self, attribute: str) -> str:
+        """Return a diagnostic label such as ``"read_mask:allow"``."""
+        decision = self.decision_for(attribute)
+        if decision is None:
+            return "read_mask:instance"
+        return "read_mask:allow" if decision else "read_mask:deny"
+
+
+def _and_read_decisions(decisions: Iterable[bool | None]) -> bool | None:
+    """Combine three-valued decisions where ``None`` means row-dependent."""
+    outcome: bool | None = True
+    for decision in decisions:
+        if decision is False:
+            return False
+        if decision is None:
+            outcome = None
+    return outcome
+
+
 _DEFAULT_PERMISSIONS_KEY = "DEFAULT_PERMISSIONS"
 _PERMISSION_ACTIONS: tuple[permission_type, ...] = (
     "read",
@@ -208,6 +250,7 @@ class _ConfiguredManagerPermission(BasePermission):
             "delete": None,
         }
         self._read_instance_result = None
+        self.__read_field_mask: ReadFieldMask | None = None
 
     def __get_based_on_permission(self) -> BasePermission | None:
         from general_manager.manager.general_manager import GeneralManager
@@ -219,7 +262,14 @@ class _ConfiguredManagerPermission(BasePermission):
         if __based_on__ is None:
             return None
 
-        basis_object = getattr(self.instance, __based_on__, notExistent)
+        request_cache = get_active_permission_request_cache()
+        basis_object: object = notExistent
+        if request_cache is not None:
+            basis_object = request_cache.primed_based_on_target(
+                self.instance, __based_on__, notExistent
+            )
+        if basis_object is notExistent:
+            basis_object = getattr(self.instance, __based_on__, notExistent)
         if (
             basis_object is not None
             and basis_object is not notExistent
@@ -262,6 +312,10 @@ class _ConfiguredManagerPermission(BasePermission):
         if Permission is None or not issubclass(Permission, BasePermission):
             return None
 
+        if request_cache is not None:
+            return request_cache.delegated_permission(
+                Permission, basis_object, self.request_user
+            )
         return cast(
             BasePermission,
             Permission(
@@ -749,11 +803,125 @@ class _ConfiguredManagerPermission(BasePermission):
             )
         return self._and_read_permission_plans(delegated_plan, local_plan)
 
+    @classmethod
+    def _supports_read_field_mask(cls) -> bool:
+        """Return whether read evaluation uses the stock expression semantics."""
+        evaluators = (
+            AdditiveManagerPermission._evaluate_local_permission,
+            OverrideManagerPermission._evaluate_local_permission,
+        )
+        return (
+            cls.__based_on__ is None
+            and cls._evaluate_local_permission in evaluators
+            and all(
+                getattr(cls, name) is getattr(_ConfiguredManagerPermission, name)
+                for name in (
+                    "check_permission",
+                    "can_read_instance",
+                    "_check_permission_list",
+                    "_get_base_permissions",
+                    "_get_attribute_permission_expressions",
+                    "validate_permission_string",
+                    "_is_superuser",
+                )
+            )
+        )
+
+    def _classify_read_fragment(self, fragment: str) -> bool | None:
+        """Return a fragment's user-only decision, or ``None`` if row-dependent."""
+        request_cache = get_active_permission_request_cache()
+        user_decisions = (
+            request_cache.user_decisions(self.request_user)
+            if request_cache is not None
+            else None
+        )
+        if user_decisions is not None and fragment in user_decisions:
+            return user_decisions[fragment]
+        decision: bool | None = None
+        try:
+            result = self._get_permission_filter_result(fragment)
+        except (PermissionNotFoundError, _InvalidPermissionFilterResultError):
+            # Leave the error to the per-instance evaluation that raises it.
+            result = None
+        if isinstance(result, PermissionFilterDecision):
+            decision = result is PermissionFilterDecision.ALLOW_ALL
+        if user_decisions is not None:
+            user_decisions[fragment] = decision
+        return decision
+
+    def _classify_read_expressions(self, expressions: list[str]) -> bool | None:
+        """Classify alternative expressions made of ``&``-joined fragments."""
+        if not expressions:
+            return True
+        outcome: bool | None = False
+        for expression in expressions:
+            decision = _and_read_decisions(
+                self._classify_read_fragment(fragment)
+                for fragment in expression.split("&")
+            )
+            if decision is True:
+                return True
+            if decision is None:
+                outcome = None
+        return outcome
+
+    def _compile_local_read_decision(
+        self,
+        *,
+        base_decision: bool | None,
+        attribute_decision: bool | None,
+        has_attribute_permissions: bool,
+    ) -> bool | None:
+        raise NotImplementedError
+
+    def get_read_field_mask(self) -> ReadFieldMask | None:
+        """Compile per-field read decisions that depend only on the request user.
+
+        Fragments whose registered ``permission_filter`` returns a
+        ``PermissionFilterDecision`` are decided once; every other fragment
+        leaves its field instance-dependent. Returns ``None`` when the class
+        delegates through ``__based_on__`` or overrides read evaluation, since
+        the outcome may then depend on the instance in ways the mask cannot see.
+        """
+        if not self._supports_read_field_mask():
+            return None
+        if self.__read_field_mask is not None:
+            return self.__read_field_mask
+        if self._is_superuser():
+            self.__read_field_mask = ReadFieldMask(default=True, fields={})
+            return self.__read_field_mask
+
+        base_decision = self._classify_read_expressions(self._read_permissions)
+        fields: dict[str, bool | None] = {}
+        for attribute in self.__attribute_permissions:
+            attribute_permissions, has_attribute_permissions = (
+                self._get_attribute_permission_expressions("read", attribute)
+            )
+            if not has_attribute_permissions:
+                continue
+            fields[attribute] = self._compile_local_read_decision(
+                base_decision=base_decision,
+                attribute_decision=self._classify_read_expressions(
+                    attribute_permissions
+                ),
+                has_attribute_permissions=True,
+            )
+        self.__read_field_mask = ReadFieldMask(
+            default=self._compile_local_read_decision(
+                base_decision=base_decision,
+                attribute_decision=None,
+                has_attribute_permissions=False,
+            ),
+            fields=MappingProxyType(fields),
+        )
+        return self.__read_field_mask
+
     def describe_permissions(
         self,
         action: permission_type,
         attribute: str,
     ) -> tuple[str, ...]:
+        """Return declared expressions; read checks also label the compiled mask."""
         base_permissions = self._get_base_permissions(action)
         attribute_permissions, has_attribute_permissions = (
             self._get_attribute_permission_expressions(action, attribute)
@@ -769,6 +937,10 @@ class _ConfiguredManagerPermission(BasePermission):
             combined += self.__based_on_permission.describe_permissions(
                 action, attribute
             )
+        if action == "read":
+            read_field_mask = self.get_read_field_mask()
+            if read_field_mask is not None:
+                combined += (read_field_mask.describe(attribute),)
         return combined
 
     def describe_operation_permissions(
@@ -814,6 +986,17 @@ class AdditiveManagerPermission(_ConfiguredManagerPermission):
         del action, attribute, has_attribute_permissions
         return tuple(base_permissions) + tuple(attribute_permissions)
 
+    def _compile_local_read_decision(
+        self,
+        *,
+        base_decision: bool | None,
+        attribute_decision: bool | None,
+        has_attribute_permissions: bool,
+    ) -> bool | None:
+        if not has_attribute_permissions:
+            return base_decision
+        return _and_read_decisions((base_decision, attribute_decision))
+
 
 class OverrideManagerPermission(_ConfiguredManagerPermission):
     """Manager-based permissions where attribute rules replace the CRUD base rule."""
@@ -846,6 +1029,17 @@ class OverrideManagerPermission(_ConfiguredManagerPermission):
             return tuple(attribute_permissions)
         return tuple(base_permissions)
 
+    def _compile_local_read_decision(
+        self,
+        *,
+        base_decision: bool | None,
+        attribute_decision: bool | None,
+        has_attribute_permissions: bool,
+    ) -> bool | None:
+        if has_attribute_permissions:
+            return attribute_decision
+        return base_decision
+
 
 class ManagerBasedPermission(AdditiveManagerPermission):
     """Deprecated compatibility alias for `AdditiveManagerPermission`."""
@@ -857,5 +1051,6 @@ __all__ = [
     "InvalidBasedOnTypeError",
     "ManagerBasedPermission",
     "OverrideManagerPermission",
+    "ReadFieldMask",
     "UnknownPermissionActionError",
 ]
@@ -0,0 +1,306 @@
+"""Request-scoped reuse of permission evaluators and user-only decisions."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from general_manager.permission.base_permission import BasePermission
+    from general_manager.permission.manager_based_permission import ReadFieldMask
+
+type permission_action = Literal["create", "read", "update", "delete"]
+
+_active_permission_request_cache: ContextVar[PermissionRequestCache | None] = (
+    ContextVar("general_manager_permission_request_cache", default=None)
+)
+
+
+class PermissionRequestCache:
+    """
+    Memoize permission work for the lifetime of one read-only request.
+
+    Evaluators are keyed by the identity of the checked instance and request
+    user, so every field resolved on the same manager object reuses one
+    ``Permission`` instance together with its per-action memo and resolved
+    ``__based_on__`` delegate. While the cache is active, permission fragments
+    whose registered filter returns a ``PermissionFilterDecision`` are treated
+    as user-only: the decision is computed once per user and fragment and
+    reused for every instance. Fragments whose filter returns a constraint or
+    ``None`` are row-dependent and keep calling their permission method.
+
+    Read checks first consult a compiled ``ReadFieldMask`` built once per
+    manager class, permission class, and user from the first evaluator that
+    supports one. Fields whose mask decision depends only on the user are
+    answered without building a per-instance evaluator; the remaining fields
+    fall through to the cached evaluator unchanged.
+
+    Permissions that delegate through ``__based_on__`` share one evaluator per
+    distinct target manager and user. List resolvers call
+    ``prime_based_on_targets`` so that the distinct foreign-key targets of a
+    page are hydrated in one bulk query instead of once per row.
+
+    Referenced instances and users are retained until the cache is dropped,
+    which keeps identity keys stable. Callers must only share a cache across
+    work that does not mutate the checked data or the user's grants.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty cache."""
+        self._evaluators: dict[
+            tuple[int, int], tuple[object, object, BasePermission]
+        ] = {}
+        self._user_decisions: dict[int, tuple[object, dict[str, bool | None]]] = {}
+        self._read_masks: dict[
+            tuple[type, type[BasePermission], int],
+            tuple[object, ReadFieldMask | None],
+        ] = {}
+        self._delegates: dict[
+            tuple[Hashable, int], tuple[object, object, BasePermission]
+        ] = {}
+        self._based_on_targets: dict[tuple[int, str], tuple[object, object]] = {}
+
+    def get_permission(
+        self,
+        permission_class: type[BasePermission],
+        instance: object,
+        user: object,
+    ) -> BasePermission:
+        """Return the cached evaluator for ``instance``/``user``, building it once."""
+        key = (id(instance), id(user))
+        entry = self._evaluators.get(key)
+        if (
+            entry is not None
+            and entry[0] is instance
+            and entry[1] is user
+            and type(entry[2]) is permission_class
+        ):
+            return entry[2]
+        with self.activate():
+            permission = permission_class(instance, user)  # type: ignore[arg-type]
+        self._evaluators[key] = (instance, user, permission)
+        return permission
+
+    def check_permission(
+        self,
+        permission_class: type[BasePermission],
+        instance: object,
+        user: object,
+        action: permission_action,
+        attribute: str,
+    ) -> bool:
+        """Evaluate ``check_permission``, answering user-only reads from the mask."""
+        if action == "read":
+            decision = self.static_read_decision(
+                permission_class, instance, user, attribute
+            )
+            if decision is not None:
+                return decision
+        permission = self.get_permission(permission_class, instance, user)
+        with self.activate():
+            return permission.check_permission(action, attribute)
+
+    def can_read_instance(
+        self,
+        permission_class: type[BasePermission],
+        instance: object,
+        user: object,
+    ) -> bool:
+        """Evaluate ``can_read_instance``, answering user-only rules from the mask."""
+        decision = self.static_read_decision(permission_class, instance, user)
+        if decision is not None:
+            return decision
+        permission = self.get_permission(permission_class, instance, user)
+        with self.activate():
+            return permission.can_read_instance()
+
+    def static_read_decision(
+        self,
+        permission_class: type[BasePermission],
+        instance: object,
+        user: object,
+        attribute: str | None = None,
+    ) -> bool | None:
+        """
+        Return the compiled user-only read decision, or ``None`` if row-dependent.
+
+        ``attribute=None`` asks for the ``can_read_instance()`` outcome. The mask
+        is compiled from ``instance``'s evaluator the first time a manager
+        class, permission class, and user are seen.
+        """
+        key = (type(instance), permission_class, id(user))
+        entry = self._read_masks.get(key)
+        if entry is None or entry[0] is not user:
+            permission = self.get_permission(permission_class, instance, user)
+            compile_mask = getattr(permission, "get_read_field_mask", None)
+            mask: ReadFieldMask | None = None
+            if callable(compile_mask):
+                with self.activate():
+                    mask = compile_mask()
+            entry = (user, mask)
+            self._read_masks[key] = entry
+        mask = entry[1]
+        if mask is None:
+            return None
+        if attribute is None:
+            return mask.default
+        return mask.decision_for(attribute)
+
+    def delegated_permission(
+        self,
+        permission_class: type[BasePermission],
+        basis: object,
+        user: object,
+    ) -> BasePermission:
+        """
+        Return the shared ``__based_on__`` evaluator for ``basis`` and ``user``.
+
+        Targets are keyed by manager class, identification, and effective search
+        date, so rows pointing at the same parent reuse one evaluator even when
+        they hold distinct manager objects. Targets without a hashable identity
+        get a fresh evaluator.
+        """
+        target_key = _target_identity(basis)
+        if target_key is None:
+            return permission_class(instance=basis, request_user=user)  # type: ignore[arg-type]
+        key = (target_key, id(user))
+        entry = self._delegates.get(key)
+        if (
+            entry is not None
+            and entry[1] is user
+            and type(entry[2]) is (permission_class)
+        ):
+            return entry[2]
+        with self.activate():
+            permission = permission_class(instance=basis, request_user=user)  # type: ignore[arg-type]
+        self._delegates[key] = (basis, user, permission)
+        return permission
+
+    def prime_based_on_targets(
+        self,
+        permission_class: type[BasePermission],
+        instances: Iterable[object],
+    ) -> None:
+        """
+        Hydrate the distinct ``__based_on__`` targets of ``instances`` in bulk.
+
+        Only foreign-key relations that expose a raw ``<based_on>_id`` attribute
+        on current (non-historical) managers are primed. Targets missing from
+        the bulk result, for example inactive rows, are left to the regular
+        attribute lookup so that behaviour is unchanged.
+        """
+        based_on = getattr(permission_class, "__based_on__", None)
+        if not isinstance(based_on, str):
+            return
+        raw_id_name = f"{based_on}_id"
+        pending: dict[type, list[tuple[object, object]]] = {}
+        target_classes: dict[type, type | None] = {}
+        for instance in instances:
+            if (id(instance), based_on) in self._based_on_targets:
+                continue
+            if getattr(instance, "_effective_search_date", None) is not None:
+                continue
+            manager_class = type(instance)
+            if manager_class not in target_classes:
+                target_classes[manager_class] = _based_on_target_class(
+                    manager_class, based_on, raw_id_name
+                )
+            if target_classes[manager_class] is None:
+                continue
+            raw_id = getattr(instance, raw_id_name, None)
+            if raw_id is None:
+                continue
+            pending.setdefault(manager_class, []).append((instance, raw_id))
+
+        for manager_class, entries in pending.items():
+            target_class = target_classes[manager_class]
+            distinct_ids = list(dict.fromkeys(raw_id for _, raw_id in entries))
+            targets = {
+                target.identification.get("id"): target
+                for target in target_class.filter(  # type: ignore[union-attr]
+                    id__in=distinct_ids
+                )
+            }
+            for instance, raw_id in entries:
+                target = targets.get(raw_id)
+                if target is not None:
+                    self._based_on_targets[(id(instance), based_on)] = (
+                        instance,
+                        target,
+                    )
+
+    def primed_based_on_target(
+        self,
+        instance: object,
+        based_on: str,
+        default: object,
+    ) -> object:
+        """Return the primed ``__based_on__`` target of ``instance`` or ``default``."""
+        entry = self._based_on_targets.get((id(instance), based_on))
+        if entry is None or entry[0] is not instance:
+            return default
+        return entry[1]
+
+    def user_decisions(self, user: object) -> dict[str, bool | None]:
+        """Return the mutable fragment-decision memo for one resolved user."""
+        entry = self._user_decisions.get(id(user))
+        if entry is not None and entry[0] is user:
+            return entry[1]
+        decisions: dict[str, bool | None] = {}
+        self._user_decisions[id(user)] = (user, decisions)
+        return decisions
+
+    @contextmanager
+    def activate(self) -> Iterator[PermissionRequestCache]:
+        """Make this cache visible to permission-string evaluation."""
+        token = _active_permission_request_cache.set(self)
+        try:
+            yield self
+        finally:
+            _active_permission_request_cache.reset(token)
+
+
+def _target_identity(basis: object) -> Hashable | None:
+    """Return a hashable identity for a delegated manager, or ``None``."""
+    identification = getattr(basis, "identification", None)
+    if isinstance(basis, type) or not isinstance(identification, dict):
+        return None
+    key = (
+        type(basis),
+        tuple(sorted(identification.items())),
+        getattr(basis, "_effective_search_date", None),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _based_on_target_class(
+    manager_class: type,
+    based_on: str,
+    raw_id_name: str,
+) -> type | None:
+    """Return the manager class behind a raw-id ``__based_on__`` relation."""
+    from general_manager.manager.general_manager import GeneralManager
+
+    interface = getattr(manager_class, "Interface", None)
+    if interface is None:
+        return None
+    try:
+        if raw_id_name not in interface.get_attribute_types():
+            return None
+        field_type = interface.get_field_type(based_on)
+    except (AttributeError, KeyError, TypeError):
+        return None
+    if isinstance(field_type, type) and issubclass(field_type, GeneralManager):
+        return field_type
+    return None
+
+
+def get_active_permission_request_cache() -> PermissionRequestCache | None:
+    """Return the cache activated for the current context, if any."""
+    return _active_permission_request_cache.get()
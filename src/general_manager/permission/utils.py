@@ -3,9 +3,13 @@
 from django.contrib.auth.models import AbstractBaseUser, AnonymousUser
 
 from general_manager.permission.permission_checks import (
+    PermissionFilterDecision,
     PermissionSubject,
     permission_functions,
 )
+from general_manager.permission.request_cache import (
+    get_active_permission_request_cache,
+)
 
 
 class PermissionNotFoundError(ValueError):
@@ -45,6 +49,11 @@ def validate_permission_string(
     to return ``bool`` and their result is normalized through ``bool(...)``.
     They are called without exception wrapping.
 
+    While a ``PermissionRequestCache`` is active, each fragment's registered
+    filter is consulted once per user: a ``PermissionFilterDecision`` result is
+    reused as the fragment outcome for every later instance, skipping the
+    permission method.
+
     Args:
         permission: Permission expression to evaluate.
         data: Manager instance, manager class, or permission data wrapper passed
@@ -60,6 +69,13 @@ def validate_permission_string(
             unregistered permission name.
     """
 
+    request_cache = get_active_permission_request_cache()
+    user_decisions = (
+        request_cache.user_decisions(request_user)
+        if request_cache is not None
+        else None
+    )
+
     def _validate_single_permission(
         permission: str,
     ) -> bool:
@@ -67,11 +83,19 @@ def validate_permission_string(
         if permission_function not in permission_functions:
             raise PermissionNotFoundError(permission)
 
-        return bool(
-            permission_functions[permission_function]["permission_method"](
-                data, request_user, config
-            )
-        )
+        registered = permission_functions[permission_function]
+        if user_decisions is not None:
+            if permission not in user_decisions:
+                static_result = registered["permission_filter"](request_user, config)
+                user_decisions[permission] = (
+                    static_result is PermissionFilterDecision.ALLOW_ALL
+                    if isinstance(static_result, PermissionFilterDecision)
+                    else None
+                )
+            decision = user_decisions[permission]
+            if decision is not None:
+                return decision
+        return bool(registered["permission_method"](data, request_user, config))
 
     return all(
         _validate_single_permission(sub_permission)
@@ -170,6 +170,10 @@ API_EXPORTS: LazyExportMap = {
         "general_manager.uploads.adapters",
         "ExactPublicDownloadAdapter",
     ),
+    "RangedDownloadAdapter": (
+        "general_manager.uploads.adapters",
+        "RangedDownloadAdapter",
+    ),
     "ProxyUploadSink": (
         "general_manager.uploads.adapters",
         "ProxyUploadSink",
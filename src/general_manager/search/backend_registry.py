@@ -13,6 +13,10 @@ from general_manager.search.backend import (
     SearchBackendNotConfiguredError,
 )
 from general_manager.search.backends.dev import DevSearchBackend
+from general_manager.search.result_cache import (
+    CachedSearchBackend,
+    search_result_cache_enabled,
+)
 
 _SETTINGS_KEY = "GENERAL_MANAGER"
 _SEARCH_BACKEND_KEY = "SEARCH_BACKEND"
@@ -86,6 +90,17 @@ def _resolve_backend(value: object) -> SearchBackend | None:
     return resolved if isinstance(resolved, SearchBackend) else None
 
 
+def _with_result_cache(backend: SearchBackend | None) -> SearchBackend | None:
+    """Wrap a settings-resolved backend when the result cache is enabled."""
+    if (
+        backend is None
+        or isinstance(backend, CachedSearchBackend)
+        or not search_result_cache_enabled()
+    ):
+        return backend
+    return CachedSearchBackend(backend)
+
+
 def configure_search_backend_from_settings(django_settings: object) -> None:
     """
     Configure the active search backend using values from Django settings.
@@ -101,6 +116,9 @@ def configure_search_backend_from_settings(django_settings: object) -> None:
     - A mapping with `{"class": <path-or-callable>, "options": {...}}`; options
       are passed as keyword arguments when constructing/calling the reference.
 
+    When `SEARCH_RESULT_CACHE_ENABLED` is true, the resolved backend is wrapped
+    in `CachedSearchBackend`.
+
     Import, factory, and constructor exceptions propagate. Resolved objects that
     do not satisfy `SearchBackend` raise `SearchBackendNotConfiguredError`.
 
@@ -128,7 +146,7 @@ def configure_search_backend_from_settings(django_settings: object) -> None:
     backend_instance = _resolve_backend(backend_setting)
     if backend_setting is not None and backend_instance is None:
         raise SearchBackendNotConfiguredError.from_setting(backend_setting)
-    configure_search_backend(backend_instance)
+    configure_search_backend(_with_result_cache(backend_instance))
 
 
 def get_search_backend() -> SearchBackend:
@@ -137,9 +155,9 @@ def get_search_backend() -> SearchBackend:
 
     If no backend has been configured, this function calls
     `configure_search_backend_from_settings(django.conf.settings)`. If settings
-    still leave the backend unset, it creates one `DevSearchBackend`, stores it
-    as the process-local active backend, and returns that same fallback instance
-    on later calls.
+    still leave the backend unset, it creates one `DevSearchBackend` (wrapped in
+    the result cache when enabled), stores it as the process-local active
+    backend, and returns that same fallback instance on later calls.
 
     Returns:
         The configured or development fallback search backend.
@@ -154,7 +172,7 @@ def get_search_backend() -> SearchBackend:
 
     configure_search_backend_from_settings(settings)
     if _backend is None:
-        _backend = DevSearchBackend()
+        _backend = _with_result_cache(DevSearchBackend())
     if _backend is None:
         raise SearchBackendNotConfiguredError()
     return _backend
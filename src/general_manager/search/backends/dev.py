@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+import uuid
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 
@@ -25,6 +26,17 @@ class DevSearchBackend:
         Initialize the backend with an empty registry that maps index names (str) to _IndexStore instances.
         """
         self._indexes: dict[str, _IndexStore] = {}
+        self._cache_namespace = f"dev:{uuid.uuid4().hex}"
+
+    @property
+    def settings_cache_namespace(self) -> str:
+        """
+        Return a namespace unique to this instance.
+
+        Documents only live in this instance, so cache entries keyed by it are
+        exact for every caller that can see them.
+        """
+        return self._cache_namespace
 
     def ensure_index(self, index_name: str, settings: Mapping[str, object]) -> None:
         """
@@ -4,11 +4,15 @@ from __future__ import annotations
 
 import hashlib
 import re
+import threading
 import time
+from collections import deque
 from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from importlib import import_module
 from typing import Mapping, Protocol, Sequence, cast
 
+from general_manager.logging import get_logger
 from general_manager.search.backend import (
     SearchBackendClientMissingError,
     SearchBackendError,
@@ -17,6 +21,8 @@ from general_manager.search.backend import (
     SearchResult,
 )
 
+logger = get_logger("search.meilisearch")
+
 
 def _load_meilisearch_api_error() -> type[Exception] | None:
     """Return the optional Meilisearch API error class when installed."""
@@ -81,6 +87,39 @@ class _MeilisearchClientWithGetTask(_MeilisearchClient, Protocol):
     def get_task(self, task_uid: object) -> object: ...
 
 
+class _MeilisearchClientWithGetTasks(_MeilisearchClient, Protocol):
+    """Client variant exposing bulk task lookup by UID."""
+
+    def get_tasks(self, parameters: Mapping[str, object]) -> object: ...
+
+
+@dataclass(frozen=True)
+class MeilisearchPendingTask:
+    """Submitted Meilisearch write task tracked in pipelined mode.
+
+    `index_name` is the backend index the task writes to and `types` holds the
+    document type labels touched by an upsert. Settings and delete tasks carry
+    an empty `types` tuple, meaning every manager sharing the index.
+    """
+
+    task_uid: object
+    index_name: str
+    types: tuple[str, ...] = ()
+
+
+FailedTaskHandler = Callable[[Sequence[MeilisearchPendingTask]], object]
+TaskCompletionListener = Callable[[Sequence[MeilisearchPendingTask]], object]
+
+
+def _mark_failed_tasks_dirty(failed_tasks: Sequence[MeilisearchPendingTask]) -> int:
+    """Mark pairs written by failed tasks dirty in the shared state store."""
+    from general_manager.search.reconciliation import (
+        mark_failed_search_backend_tasks,
+    )
+
+    return mark_failed_search_backend_tasks(failed_tasks)
+
+
 class MeilisearchBackend:
     """
     Meilisearch implementation of the SearchBackend protocol.
@@ -93,15 +132,33 @@ class MeilisearchBackend:
     the mapping is stable and collision-resistant but not reversible. It accepts
     a preconfigured client for tests or advanced deployments, otherwise imports
     ``meilisearch.Client`` at runtime.
+
+    With ``wait_for_tasks=False`` the adapter runs in pipelined mode: settings,
+    upsert, and delete tasks are submitted without waiting and their UIDs are
+    tracked per process. Tracked tasks are checked in bulk by later writes and
+    by ``drain_pending_tasks()``; failures are handed to ``failed_task_handler``
+    as soon as any check observes them, which by default marks the affected
+    manager/index pairs dirty for the next reconciliation sweep.
+    ``wait_for_pending_tasks()`` blocks until every tracked task finished for
+    callers that need read-your-writes consistency, and listeners added with
+    ``add_task_completion_listener()`` hear about every task once any check
+    observes it finished.
     """
 
     _ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,511}$")
+    _TERMINAL_TASK_STATUSES = frozenset({"succeeded", "failed", "canceled"})
+    _TASK_LOOKUP_CHUNK_SIZE = 100
 
     def __init__(
         self,
         url: str = "http://127.0.0.1:7700",
         api_key: str | None = None,
         client: _MeilisearchClient | None = None,
+        wait_for_tasks: bool = True,
+        max_pending_tasks: int = 1000,
+        pending_task_check_seconds: float = 30.0,
+        failed_task_handler: FailedTaskHandler | None = _mark_failed_tasks_dirty,
+        cache_namespace: str | None = None,
     ) -> None:
         """
         Initialize the backend with a provided Meilisearch client or a new one.
@@ -115,11 +172,31 @@ class MeilisearchBackend:
                 `meilisearch` package and instantiates a client with `url` and
                 `api_key`; if the package is not available, raises
                 SearchBackendClientMissingError("Meilisearch").
+            wait_for_tasks: When true (the default), every write waits for its
+                Meilisearch task. When false, write tasks are tracked and
+                checked later through `drain_pending_tasks()`.
+            max_pending_tasks: Number of tracked tasks after which a write
+                triggers an opportunistic bulk status check so the pending
+                list stays bounded in long-lived processes. It also bounds the
+                failures kept for `drain_pending_tasks()`.
+            pending_task_check_seconds: Age of the last status check after
+                which a write triggers the same bulk check, so processes that
+                write rarely still observe their failures.
+            failed_task_handler: Called with every batch of failed or canceled
+                tasks as soon as a status check observes them. The default
+                marks the affected manager/index pairs dirty through
+                `mark_failed_search_backend_tasks()`. Failures are kept for
+                `drain_pending_tasks()` when the handler is `None` or raises.
+            cache_namespace: Stable name of the Meilisearch server, shared by
+                every process using it. Defaults to the URL when the backend
+                builds its own client; injected clients have no namespace
+                unless one is given.
 
         Raises:
             SearchBackendClientMissingError: The `meilisearch` package is not
                 installed and no client was provided.
         """
+        self._settings_cache_namespace = cache_namespace
         if client is None:
             try:
                 meilisearch_module = import_module("meilisearch")
@@ -127,7 +204,38 @@ class MeilisearchBackend:
                 raise SearchBackendClientMissingError("Meilisearch") from exc
             client_factory = cast(_MeilisearchModule, meilisearch_module).Client
             client = client_factory(url, api_key)
+            if cache_namespace is None:
+                self._settings_cache_namespace = f"meilisearch:{url.rstrip('/')}"
         self._client = client
+        self._wait_for_tasks = wait_for_tasks
+        self._max_pending_tasks = max(1, max_pending_tasks)
+        self._pending_task_check_seconds = pending_task_check_seconds
+        self._failed_task_handler = failed_task_handler
+        self._task_completion_listeners: list[TaskCompletionListener] = []
+        self._pending_tasks: list[MeilisearchPendingTask] = []
+        self._failed_tasks: deque[MeilisearchPendingTask] = deque(
+            maxlen=self._max_pending_tasks
+        )
+        self._last_task_check = time.monotonic()
+        self._task_lock = threading.Lock()
+
+    @property
+    def settings_cache_namespace(self) -> str | None:
+        """
+        Return the namespace used to share index state via Django's cache.
+
+        Backends built from a URL or given `cache_namespace` share remembered
+        settings fingerprints and search result generations with every process
+        talking to the same server. Injected clients without a namespace have
+        no known server identity: they only use the process-local settings memo
+        and are not result-cached.
+        """
+        return self._settings_cache_namespace
+
+    @property
+    def pipelined(self) -> bool:
+        """Return whether write tasks are submitted without waiting."""
+        return not self._wait_for_tasks
 
     def ensure_index(self, index_name: str, settings: Mapping[str, object]) -> None:
         """
@@ -144,6 +252,9 @@ class MeilisearchBackend:
         values such as lists, tuples, and sets are converted to strings. This
         method creates the index with primary key ``id`` if it does not exist
         and waits for each settings update task to complete before returning.
+        In pipelined mode the settings tasks are tracked instead; Meilisearch
+        processes tasks of one index in order, so later document writes still
+        observe the new settings.
 
         Raises:
             MeilisearchTaskFailedError: A create-index or settings task fails,
@@ -158,15 +269,15 @@ class MeilisearchBackend:
             task = index.update_settings(
                 {"searchableAttributes": list(searchable_fields)}
             )
-            self._wait_for_task(task)
+            self._complete_task(task, index_name)
         if filterable_fields is not None:
             task = index.update_settings(
                 {"filterableAttributes": list(filterable_fields)}
             )
-            self._wait_for_task(task)
+            self._complete_task(task, index_name)
         if sortable_fields is not None:
             task = index.update_settings({"sortableAttributes": list(sortable_fields)})
-            self._wait_for_task(task)
+            self._complete_task(task, index_name)
 
     def upsert(self, index_name: str, documents: Sequence[SearchDocument]) -> None:
         """
@@ -186,7 +297,11 @@ class MeilisearchBackend:
         payload = [self._document_payload(doc) for doc in documents]
         if payload:
             task = index.add_documents(payload)
-            self._wait_for_task(task)
+            self._complete_task(
+                task,
+                index_name,
+                tuple(dict.fromkeys(doc.type for doc in documents)),
+            )
 
     def delete(self, index_name: str, ids: Sequence[str]) -> None:
         """
@@ -209,7 +324,7 @@ class MeilisearchBackend:
         index = self._get_or_create_index(index_name)
         normalized_ids = [self._normalize_document_id(doc_id) for doc_id in ids]
         task = index.delete_documents(normalized_ids)
-        self._wait_for_task(task)
+        self._complete_task(task, index_name)
 
     def list_document_ids(
         self,
@@ -349,6 +464,187 @@ class MeilisearchBackend:
             raw=response,
         )
 
+    def add_task_completion_listener(self, listener: TaskCompletionListener) -> None:
+        """
+        Call `listener` with every batch of tracked tasks observed as finished.
+
+        Listeners run once tasks have left the pending list, for succeeded,
+        failed, and canceled tasks alike, so their writes are visible to
+        searches. Listener errors are logged and never reach the caller.
+        """
+        with self._task_lock:
+            self._task_completion_listeners.append(listener)
+
+    def pending_tasks(self) -> tuple[MeilisearchPendingTask, ...]:
+        """Return tracked write tasks that have not been observed as finished."""
+        with self._task_lock:
+            return tuple(self._pending_tasks)
+
+    def drain_pending_tasks(self) -> tuple[MeilisearchPendingTask, ...]:
+        """
+        Check tracked tasks in bulk and return the ones that failed.
+
+        Finished tasks are removed from the pending list; tasks that are still
+        enqueued or processing stay tracked for the next drain. Failures the
+        `failed_task_handler` could not take, including ones found by earlier
+        checks, are returned once and then forgotten; at most
+        `max_pending_tasks` of them are kept. The call never waits for
+        Meilisearch to finish indexing.
+        """
+        self._poll_pending_tasks()
+        with self._task_lock:
+            failed = tuple(self._failed_tasks)
+            self._failed_tasks.clear()
+        return failed
+
+    def wait_for_pending_tasks(self) -> None:
+        """
+        Block until every tracked task finished.
+
+        Use this when the caller needs read-your-writes consistency, for
+        example in tests or after a rebuild. Every tracked task is awaited even
+        when an earlier one failed; failures are handed to the
+        `failed_task_handler` like those found by bulk checks.
+
+        Raises:
+            MeilisearchTaskFailedError: At least one awaited task failed, was
+                canceled, or timed out while polling.
+        """
+        with self._task_lock:
+            pending = list(self._pending_tasks)
+            self._pending_tasks.clear()
+        first_error: MeilisearchTaskFailedError | None = None
+        failed: list[MeilisearchPendingTask] = []
+        for pending_task in pending:
+            try:
+                self._wait_for_task({"taskUid": pending_task.task_uid})
+            except MeilisearchTaskFailedError as exc:
+                failed.append(pending_task)
+                if first_error is None:
+                    first_error = exc
+        self._notify_task_completion(pending)
+        self._report_failed_tasks(failed)
+        if first_error is not None:
+            raise first_error
+
+    def _complete_task(
+        self,
+        task: object,
+        index_name: str,
+        types: tuple[str, ...] = (),
+    ) -> None:
+        """Wait for a write task or track it when running in pipelined mode."""
+        if self._wait_for_tasks:
+            self._wait_for_task(task)
+            return
+        task_uid = self._extract_task_uid(task)
+        if task_uid is None:
+            return
+        with self._task_lock:
+            self._pending_tasks.append(
+                MeilisearchPendingTask(task_uid, index_name, types)
+            )
+            should_poll = (
+                len(self._pending_tasks) >= self._max_pending_tasks
+                or time.monotonic() - self._last_task_check
+                >= self._pending_task_check_seconds
+            )
+        if should_poll:
+            self._poll_pending_tasks()
+
+    def _poll_pending_tasks(self) -> None:
+        """Move finished tracked tasks out of the pending list in one lookup."""
+        with self._task_lock:
+            pending = list(self._pending_tasks)
+            self._last_task_check = time.monotonic()
+        if not pending:
+            return
+        statuses = self._fetch_task_statuses([task.task_uid for task in pending])
+        finished: list[MeilisearchPendingTask] = []
+        failed: list[MeilisearchPendingTask] = []
+        for pending_task in pending:
+            status = statuses.get(str(pending_task.task_uid))
+            if status not in self._TERMINAL_TASK_STATUSES:
+                continue
+            finished.append(pending_task)
+            if status != "succeeded":
+                failed.append(pending_task)
+        finished_ids = {id(task) for task in finished}
+        with self._task_lock:
+            self._pending_tasks = [
+                task for task in self._pending_tasks if id(task) not in finished_ids
+            ]
+        self._notify_task_completion(finished)
+        self._report_failed_tasks(failed)
+
+    def _notify_task_completion(
+        self, finished: Sequence[MeilisearchPendingTask]
+    ) -> None:
+        """Hand finished tasks to every completion listener."""
+        if not finished:
+            return
+        with self._task_lock:
+            listeners = tuple(self._task_completion_listeners)
+        for listener in listeners:
+            try:
+                listener(tuple(finished))
+            except Exception:  # noqa: BLE001 - listeners must not fail writes
+                logger.warning(
+                    "search task completion listener raised",
+                    context={"finished_tasks": len(finished)},
+                    exc_info=True,
+                )
+
+    def _report_failed_tasks(self, failed: Sequence[MeilisearchPendingTask]) -> None:
+        """Hand observed failures to the handler, keeping them if it cannot."""
+        if not failed:
+            return
+        if self._failed_task_handler is not None:
+            try:
+                self._failed_task_handler(tuple(failed))
+            except Exception:  # noqa: BLE001 - keep failures for the next drain
+                logger.warning(
+                    "failed search task handler raised; keeping failures",
+                    context={"failed_tasks": len(failed)},
+                    exc_info=True,
+                )
+            else:
+                return
+        with self._task_lock:
+            self._failed_tasks.extend(failed)
+
+    def _fetch_task_statuses(self, task_uids: Sequence[object]) -> dict[str, str]:
+        """
+        Return normalized statuses keyed by stringified task UID.
+
+        Clients exposing `get_tasks()` are queried with a UID filter in chunks
+        of `_TASK_LOOKUP_CHUNK_SIZE`, each with a matching `limit` because
+        `/tasks` returns only 20 results by default. Clients with only
+        `get_task()` are queried per task. Unknown tasks are omitted and
+        therefore stay pending.
+        """
+        statuses: dict[str, str] = {}
+        if hasattr(self._client, "get_tasks"):
+            bulk_client = cast(_MeilisearchClientWithGetTasks, self._client)
+            uids = [str(uid) for uid in task_uids]
+            for start in range(0, len(uids), self._TASK_LOOKUP_CHUNK_SIZE):
+                chunk = uids[start : start + self._TASK_LOOKUP_CHUNK_SIZE]
+                response = bulk_client.get_tasks({"uids": chunk, "limit": len(chunk)})
+                for result in self._extract_documents_results(response):
+                    uid = self._extract_task_uid(result)
+                    status = self._extract_task_status(result)
+                    if uid is not None and status is not None:
+                        statuses[str(uid)] = status
+            return statuses
+        if hasattr(self._client, "get_task"):
+            polling_client = cast(_MeilisearchClientWithGetTask, self._client)
+            for uid in task_uids:
+                status = self._extract_task_status(polling_client.get_task(uid))
+                if status is not None:
+                    statuses[str(uid)] = status
+            return statuses
+        return {str(uid): "succeeded" for uid in task_uids}
+
     def _get_or_create_index(self, index_name: str) -> _MeilisearchIndex:
         """
         Ensure a Meilisearch index with the given name exists and return it.
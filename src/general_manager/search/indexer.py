@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
+import threading
 from dataclasses import dataclass
 from typing import Mapping, Sequence
+from weakref import WeakKeyDictionary
+
+from django.core.cache import cache as django_cache
 
 from general_manager.interface.orm_interface import OrmInterfaceBase
 from general_manager.manager.general_manager import GeneralManager
@@ -15,6 +20,7 @@ from general_manager.search.registry import (
     get_index_config,
     get_search_config,
     get_type_label,
+    iter_index_configs,
 )
 from general_manager.search.utils import (
     build_document_id,
@@ -179,15 +185,132 @@ def _collect_documents_for_instance(instance: GeneralManager) -> Sequence[IndexP
     return payloads
 
 
-def _ensure_index(backend: SearchBackend, index_name: str) -> None:
+INDEX_SETTINGS_CACHE_PREFIX = "general_manager:search:index_settings"
+INDEX_SETTINGS_CACHE_TIMEOUT_SECONDS = 24 * 60 * 60
+
+_applied_index_settings: WeakKeyDictionary[object, dict[str, str]] = WeakKeyDictionary()
+_applied_index_settings_lock = threading.Lock()
+
+
+def build_index_settings_fingerprint(index_name: str) -> str:
+    """
+    Fingerprint the combined search schema of every manager sharing an index.
+
+    Combines `build_search_schema_fingerprint()` of each manager/index pair
+    declaring `index_name` in searchable-manager order, so any field, filter,
+    sort, or boost change on one contributor produces a new value.
+    """
+    from general_manager.search.reconciliation import (
+        build_search_schema_fingerprint,
+    )
+
+    digest = hashlib.sha256(index_name.encode())
+    for manager_class, index_config in iter_index_configs(index_name):
+        digest.update(
+            build_search_schema_fingerprint(manager_class, index_config).encode()
+        )
+    return digest.hexdigest()
+
+
+def _settings_cache_key(backend: SearchBackend, index_name: str) -> str | None:
+    """Return the shared cache key for backends that expose a stable namespace."""
+    namespace = getattr(backend, "settings_cache_namespace", None)
+    if not isinstance(namespace, str) or not namespace:
+        return None
+    return f"{INDEX_SETTINGS_CACHE_PREFIX}:{namespace}:{index_name}"
+
+
+def _applied_fingerprint(backend: SearchBackend, index_name: str) -> str | None:
+    """Return the settings fingerprint last applied to one backend index."""
+    try:
+        with _applied_index_settings_lock:
+            local = _applied_index_settings.get(backend, {}).get(index_name)
+    except TypeError:
+        local = None
+    if local is not None:
+        return local
+    cache_key = _settings_cache_key(backend, index_name)
+    if cache_key is None:
+        return None
+    shared = django_cache.get(cache_key)
+    if not isinstance(shared, str):
+        return None
+    _remember_local_fingerprint(backend, index_name, shared)
+    return shared
+
+
+def _remember_local_fingerprint(
+    backend: SearchBackend,
+    index_name: str,
+    fingerprint: str,
+) -> None:
+    """Store a settings fingerprint in the process-local memo when possible."""
+    try:
+        with _applied_index_settings_lock:
+            _applied_index_settings.setdefault(backend, {})[index_name] = fingerprint
+    except TypeError:
+        return
+
+
+def _remember_applied_fingerprint(
+    backend: SearchBackend,
+    index_name: str,
+    fingerprint: str,
+) -> None:
+    """Record applied settings per process and, when possible, in the cache."""
+    _remember_local_fingerprint(backend, index_name, fingerprint)
+    cache_key = _settings_cache_key(backend, index_name)
+    if cache_key is not None:
+        django_cache.set(
+            cache_key,
+            fingerprint,
+            timeout=INDEX_SETTINGS_CACHE_TIMEOUT_SECONDS,
+        )
+
+
+def clear_applied_index_settings(backend: SearchBackend | None = None) -> None:
+    """
+    Forget remembered index settings so the next write re-applies them.
+
+    Clears the process-local memo for `backend`, or for every backend when
+    omitted. Shared cache entries are left alone; they expire after
+    `INDEX_SETTINGS_CACHE_TIMEOUT_SECONDS` or are replaced by the next forced
+    ensure.
+    """
+    with _applied_index_settings_lock:
+        if backend is None:
+            _applied_index_settings.clear()
+            return
+        try:
+            _applied_index_settings.pop(backend, None)
+        except TypeError:
+            return
+
+
+def _ensure_index(
+    backend: SearchBackend,
+    index_name: str,
+    *,
+    force: bool = False,
+) -> bool:
     """
     Ensure the search index exists in the backend with the appropriate settings.
 
     Collects index settings for the given index name and instructs the backend to create or update the index's searchable fields, filterable fields, sortable fields, and field boosts.
+    The settings are skipped when the index settings fingerprint matches the
+    one last applied to this backend in this process or, for backends with a
+    `settings_cache_namespace`, in the shared Django cache.
 
     Parameters:
         index_name (str): Name of the index to ensure exists and be configured.
+        force (bool): Re-apply the settings even when they are remembered.
+
+    Returns:
+        bool: `True` when settings were sent to the backend.
     """
+    fingerprint = build_index_settings_fingerprint(index_name)
+    if not force and _applied_fingerprint(backend, index_name) == fingerprint:
+        return False
     settings_payload = collect_index_settings(index_name)
     backend.ensure_index(
         index_name,
@@ -198,6 +321,33 @@ def _ensure_index(backend: SearchBackend, index_name: str) -> None:
             "field_boosts": settings_payload.field_boosts,
         },
     )
+    _remember_applied_fingerprint(backend, index_name, fingerprint)
+    return True
+
+
+def ensure_search_index(
+    backend: SearchBackend,
+    index_name: str,
+    *,
+    force: bool = False,
+) -> bool:
+    """
+    Apply aggregated settings for one index unless they are remembered.
+
+    Write paths do this implicitly and only send settings when the index
+    settings fingerprint changed since it was last applied to `backend`. Pass
+    `force=True` to re-apply them regardless, for example from the
+    `search_index` command or after the backend index was recreated out of
+    band. Returns whether settings were sent to the backend.
+    """
+    return _ensure_index(backend, index_name, force=force)
+
+
+def _wait_for_backend_tasks(backend: SearchBackend) -> None:
+    """Wait for pipelined backend writes when the backend tracks them."""
+    wait_for_pending_tasks = getattr(backend, "wait_for_pending_tasks", None)
+    if callable(wait_for_pending_tasks):
+        wait_for_pending_tasks()
 
 
 class SearchIndexer:
@@ -398,7 +548,8 @@ class SearchIndexer:
         no delete operation is issued. Upsert calls follow the first occurrence
         order of configured index names. Duplicate index names collapse into one
         backend upsert call for that name, but serialization still produces one
-        document per duplicate config and instance.
+        document per duplicate config and instance. Backends that pipeline
+        writes are waited on before returning so rebuilds stay consistent.
 
         Parameters:
             manager_class (type[GeneralManager]): The manager class whose instances will be reindexed.
@@ -411,7 +562,7 @@ class SearchIndexer:
         if config is None:
             return
         for index_config in config.indexes:
-            _ensure_index(self.backend, index_config.name)
+            _ensure_index(self.backend, index_config.name, force=True)
 
         documents_by_index: dict[str, list[SearchDocument]] = {
             index.name: [] for index in config.indexes
@@ -423,6 +574,7 @@ class SearchIndexer:
         for index_name, documents in documents_by_index.items():
             if documents:
                 self.backend.upsert(index_name, documents)
+        _wait_for_backend_tasks(self.backend)
 
     def reindex_manager_index(
         self,
@@ -437,7 +589,8 @@ class SearchIndexer:
         document for every instance returned by `manager_class.all()`, upserts
         current documents when present, lists existing backend document ids using
         `backend.list_document_ids(index_name, types=[get_type_label(manager_class)])`,
-        deletes stale ids for that type after successful upsert, and returns the
+        deletes stale ids for that type after successful upsert, waits for
+        pipelined backend writes when the backend tracks them, and returns the
         number of current documents serialized. The backend's type filter and
         GeneralManager type-label/document-id convention define the id namespace
         that protects other manager classes.
@@ -460,7 +613,7 @@ class SearchIndexer:
         if index_config is None:
             raise MissingIndexConfigurationError(manager_class.__name__, index_name)
 
-        _ensure_index(self.backend, index_config.name)
+        _ensure_index(self.backend, index_config.name, force=True)
         documents: list[SearchDocument] = []
         for instance in manager_class.all():
             document = _serialize_document(
@@ -480,4 +633,5 @@ class SearchIndexer:
         stale_ids = sorted(existing_ids - current_ids)
         if stale_ids:
             self.backend.delete(index_config.name, stale_ids)
+        _wait_for_backend_tasks(self.backend)
         return len(documents)
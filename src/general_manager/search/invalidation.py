@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from collections.abc import Callable, Iterable, Mapping
 from copy import deepcopy
 from dataclasses import dataclass, field
@@ -144,6 +145,7 @@ class _SearchUpsertGroup:
     index_name: str
     database_alias: str
     identifications: tuple[dict[str, object], ...]
+    identity_keys: tuple[str, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -686,7 +688,7 @@ def _prepare_scheduled_work(
     ] = {}
     upsert_seen: dict[
         tuple[type[GeneralManager], str, str, str],
-        set[str],
+        dict[str, None],
     ] = {}
     for upsert_target in work.upserts.targets:
         pair_key = (upsert_target.owner_class, upsert_target.index_name)
@@ -700,10 +702,10 @@ def _prepare_scheduled_work(
         )
         copied_identification = dict(upsert_target.identification)
         canonical_identification = upsert_target.canonical_key[1]
-        seen = upsert_seen.setdefault(upsert_group_key, set())
-        if canonical_identification in seen:
+        upsert_keys = upsert_seen.setdefault(upsert_group_key, {})
+        if canonical_identification in upsert_keys:
             continue
-        seen.add(canonical_identification)
+        upsert_keys[canonical_identification] = None
         upsert_payloads.setdefault(upsert_group_key, []).append(copied_identification)
 
     delete_payloads: dict[
@@ -742,6 +744,9 @@ def _prepare_scheduled_work(
                 index_name=index_name,
                 database_alias=database_alias,
                 identifications=tuple(identifications),
+                identity_keys=tuple(
+                    upsert_seen[(owner_class, owner_path, index_name, database_alias)]
+                ),
             )
             for (
                 owner_class,
@@ -828,14 +833,167 @@ def _prepared_pairs(
     )
 
 
+def _merge_prepared_work(
+    works: tuple[_PreparedSearchWork, ...],
+) -> tuple[_PreparedSearchWork, ...]:
+    """Coalesce committed event work into ordered, deduplicated segments.
+
+    Identities are deduplicated per exact owner/index/source-alias lane and
+    document IDs per manager/index lane across all events. A segment closes
+    when an upsert follows a delete for the same pair so a recreated document
+    is never removed by an earlier event's delete.
+    """
+    fallbacks = _dedupe_pairs([pair for work in works for pair in work.fallbacks])
+    fallback_keys = {(pair.owner_class, pair.index_name) for pair in fallbacks}
+    segments: list[_PreparedSearchWork] = []
+    upserts: dict[
+        tuple[type[GeneralManager], str, str, str],
+        dict[str, dict[str, object]],
+    ] = {}
+    deletes: dict[
+        tuple[type[GeneralManager], str, str],
+        dict[str, dict[str, str]],
+    ] = {}
+    deleted_pairs: set[tuple[type[GeneralManager], str]] = set()
+
+    def close_segment() -> None:
+        if not upserts and not deletes:
+            return
+        segments.append(
+            _PreparedSearchWork(
+                upserts=tuple(
+                    _SearchUpsertGroup(
+                        owner_class=owner_class,
+                        owner_path=owner_path,
+                        index_name=index_name,
+                        database_alias=database_alias,
+                        identifications=tuple(payloads.values()),
+                        identity_keys=tuple(payloads),
+                    )
+                    for (
+                        owner_class,
+                        owner_path,
+                        index_name,
+                        database_alias,
+                    ), payloads in upserts.items()
+                ),
+                deletes=tuple(
+                    _SearchDeleteGroup(
+                        manager_class=manager_class,
+                        manager_path=manager_path,
+                        index_name=index_name,
+                        targets=tuple(targets.values()),
+                    )
+                    for (
+                        manager_class,
+                        manager_path,
+                        index_name,
+                    ), targets in deletes.items()
+                ),
+            )
+        )
+        upserts.clear()
+        deletes.clear()
+        deleted_pairs.clear()
+
+    for work in works:
+        if any(
+            (group.owner_class, group.index_name) in deleted_pairs
+            for group in work.upserts
+        ):
+            close_segment()
+        for upsert_group in work.upserts:
+            if (upsert_group.owner_class, upsert_group.index_name) in fallback_keys:
+                continue
+            payloads = upserts.setdefault(
+                (
+                    upsert_group.owner_class,
+                    upsert_group.owner_path,
+                    upsert_group.index_name,
+                    upsert_group.database_alias,
+                ),
+                {},
+            )
+            identity_keys = upsert_group.identity_keys or tuple(
+                normalize_identification(identification)
+                for identification in upsert_group.identifications
+            )
+            for identity_key, identification in zip(
+                identity_keys,
+                upsert_group.identifications,
+                strict=True,
+            ):
+                payloads.setdefault(identity_key, identification)
+        for delete_group in work.deletes:
+            pair_key = (delete_group.manager_class, delete_group.index_name)
+            if pair_key in fallback_keys:
+                continue
+            deleted_pairs.add(pair_key)
+            targets = deletes.setdefault(
+                (
+                    delete_group.manager_class,
+                    delete_group.manager_path,
+                    delete_group.index_name,
+                ),
+                {},
+            )
+            for target in delete_group.targets:
+                targets.setdefault(target["document_id"], target)
+    close_segment()
+    if not segments:
+        return (_PreparedSearchWork(fallbacks=fallbacks),)
+    segments[-1] = _PreparedSearchWork(
+        upserts=segments[-1].upserts,
+        deletes=segments[-1].deletes,
+        fallbacks=fallbacks,
+    )
+    return tuple(segments)
+
+
 def _dispatch_prepared_work(
-    work: _PreparedSearchWork,
+    works: tuple[_PreparedSearchWork, ...],
     token_pairs: tuple[tuple[SearchInvalidationPair, DirtySearchIndex], ...],
     *,
     batch_size: int,
 ) -> None:
-    """Run every unit and acknowledge only fully accepted exact pairs."""
+    """Run every unit in order and acknowledge only fully accepted exact pairs."""
     pair_success: dict[tuple[type[GeneralManager], str], bool] = {}
+    token_map = {
+        (pair.owner_class, pair.index_name): token for pair, token in token_pairs
+    }
+    for work in works:
+        _dispatch_prepared_units(
+            work,
+            token_map,
+            pair_success,
+            batch_size=batch_size,
+        )
+
+    for pair, token in token_pairs:
+        key = (pair.owner_class, pair.index_name)
+        if not pair_success.get(key, False):
+            continue
+        try:
+            acknowledge_search_index_dirty(token)
+        except Exception as exc:  # noqa: BLE001 - control-plane DB errors are open
+            logger.warning(
+                "search dirty acknowledgement failed",
+                context={
+                    "manager": pair.owner_class.__name__,
+                    "index": pair.index_name,
+                },
+                exc_info=exc,
+            )
+
+
+def _dispatch_prepared_units(
+    work: _PreparedSearchWork,
+    token_map: Mapping[tuple[type[GeneralManager], str], DirtySearchIndex],
+    pair_success: dict[tuple[type[GeneralManager], str], bool],
+    *,
+    batch_size: int,
+) -> None:
+    """Dispatch one segment's chunked upserts, then its fenced deletes."""
     for upsert_group in work.upserts:
         key = (upsert_group.owner_class, upsert_group.index_name)
         pair_success.setdefault(key, True)
@@ -858,9 +1016,6 @@ def _dispatch_prepared_work(
                     exc_info=exc,
                 )
 
-    token_map = {
-        (pair.owner_class, pair.index_name): token for pair, token in token_pairs
-    }
     for delete_group in work.deletes:
         key = (delete_group.manager_class, delete_group.index_name)
         pair_success.setdefault(key, True)
@@ -896,21 +1051,143 @@ def _dispatch_prepared_work(
                     action="delete_recovery",
                 )
 
-    for pair, token in token_pairs:
-        key = (pair.owner_class, pair.index_name)
-        if not pair_success.get(key, False):
-            continue
-        try:
-            acknowledge_search_index_dirty(token)
-        except Exception as exc:  # noqa: BLE001 - control-plane DB errors are open
-            logger.warning(
-                "search dirty acknowledgement failed",
-                context={
-                    "manager": pair.owner_class.__name__,
-                    "index": pair.index_name,
-                },
-                exc_info=exc,
-            )
+
+@dataclass(eq=False)
+class _CoalescedSearchWork:
+    """One event's prepared work awaiting its own source-commit callback."""
+
+    sequence: int
+    prepared: _PreparedSearchWork
+    affected_pairs: tuple[SearchInvalidationPair, ...]
+    batch_size: int
+    tokens: tuple[tuple[SearchInvalidationPair, DirtySearchIndex], ...] = ()
+    savepoints: frozenset[str] = frozenset()
+    confirmed: bool = False
+
+
+class _SearchDispatchCollector:
+    """Coalesce commit-confirmed event work for one thread and source alias.
+
+    Every event keeps its own ``on_commit`` callback, so Django still discards
+    work registered inside a rolled-back savepoint. Callbacks run in
+    registration order; a callback flushes everything confirmed so far as one
+    merged dispatch unless a later pending event is known to survive the
+    commit. A later event survives when all savepoints it was registered in
+    also enclose a confirmed event; events under other savepoints may have
+    been discarded, so they never hold back the flush.
+    """
+
+    def __init__(self, database_alias: str) -> None:
+        """Start an empty collector for one source database alias."""
+        self.database_alias = database_alias
+        self._works: dict[int, _CoalescedSearchWork] = {}
+        self._next_sequence = 0
+
+    def add(
+        self,
+        prepared: _PreparedSearchWork,
+        affected_pairs: tuple[SearchInvalidationPair, ...],
+        *,
+        batch_size: int,
+        tokens: tuple[tuple[SearchInvalidationPair, DirtySearchIndex], ...] = (),
+        savepoints: frozenset[str] = frozenset(),
+    ) -> _CoalescedSearchWork:
+        """Retain one event's work until its source commit confirms it."""
+        self._next_sequence += 1
+        work = _CoalescedSearchWork(
+            sequence=self._next_sequence,
+            prepared=prepared,
+            affected_pairs=affected_pairs,
+            batch_size=batch_size,
+            tokens=tokens,
+            savepoints=savepoints,
+        )
+        self._works[work.sequence] = work
+        return work
+
+    def confirm(self, work: _CoalescedSearchWork) -> None:
+        """Record one committed event and flush once no later event is pending."""
+        if self._works.get(work.sequence) is not work:
+            # A nested commit inside another commit hook already swept this
+            # event as stale; it is still committed, so dispatch it alone.
+            work.confirmed = True
+            _dispatch_coalesced_work((work,), database_alias=self.database_alias)
+            return
+        work.confirmed = True
+        later_pending: list[_CoalescedSearchWork] = []
+        for sequence, retained in tuple(self._works.items()):
+            if retained.confirmed:
+                continue
+            if sequence < work.sequence:
+                # Earlier callbacks always run first, so this event was
+                # discarded by a savepoint or transaction rollback.
+                del self._works[sequence]
+            else:
+                later_pending.append(retained)
+        confirmed = tuple(
+            retained for retained in self._works.values() if retained.confirmed
+        )
+        released = frozenset().union(*(retained.savepoints for retained in confirmed))
+        if any(pending.savepoints <= released for pending in later_pending):
+            # That callback is still queued and will flush this work with it.
+            return
+        for retained in confirmed:
+            del self._works[retained.sequence]
+        _dispatch_coalesced_work(confirmed, database_alias=self.database_alias)
+
+
+_collectors = threading.local()
+
+
+def _search_dispatch_collector(database_alias: str) -> _SearchDispatchCollector:
+    """Return this thread's collector for a source alias, creating it lazily."""
+    collectors: dict[str, _SearchDispatchCollector] | None = getattr(
+        _collectors, "by_alias", None
+    )
+    if collectors is None:
+        collectors = {}
+        _collectors.by_alias = collectors
+    collector = collectors.get(database_alias)
+    if collector is None:
+        collector = _SearchDispatchCollector(database_alias)
+        collectors[database_alias] = collector
+    return collector
+
+
+def _dispatch_coalesced_work(
+    works: tuple[_CoalescedSearchWork, ...],
+    *,
+    database_alias: str,
+) -> None:
+    """Merge committed events, fence them once, and dispatch chunked batches."""
+    if not works:
+        return
+    merged = _merge_prepared_work(tuple(work.prepared for work in works))
+    if database_alias == DEFAULT_DB_ALIAS:
+        latest_tokens = {
+            (pair.owner_class, pair.index_name): (pair, token)
+            for work in works
+            for pair, token in work.tokens
+        }
+        tokens = tuple(latest_tokens.values())
+    else:
+        # This cannot be atomic with the source commit. A crash before this
+        # callback is the documented cross-database handoff gap.
+        tokens = _mark_pairs(
+            _dedupe_pairs([pair for work in works for pair in work.affected_pairs]),
+            action="change",
+        )
+    _dispatch_prepared_work(
+        merged,
+        tokens,
+        batch_size=min(work.batch_size for work in works),
+    )
+
+
+def _active_savepoints(database_alias: str) -> frozenset[str]:
+    """Return the savepoints a callback registered now would be discarded with."""
+    savepoint_ids = transaction.get_connection(database_alias).savepoint_ids
+    return frozenset(sid for sid in savepoint_ids if sid is not None)
 
 
 def _run_scheduled_callback_safely(callback: Callable[[], None]) -> None:
@@ -965,35 +1242,19 @@ def schedule_search_invalidation_work(
     if not affected_pairs:
         return
 
-    effective_batch_size = batch_size or 1
-
-    def dispatch_after_marking(
-        tokens: tuple[tuple[SearchInvalidationPair, DirtySearchIndex], ...],
-    ) -> None:
-        _dispatch_prepared_work(
-            prepared,
-            tokens,
-            batch_size=effective_batch_size,
-        )
-
+    tokens: tuple[tuple[SearchInvalidationPair, DirtySearchIndex], ...] = ()
     if source_database_alias == DEFAULT_DB_ALIAS:
         tokens = _mark_pairs(affected_pairs, action="change")
-        transaction.on_commit(
-            lambda: _run_scheduled_callback_safely(
-                lambda: dispatch_after_marking(tokens)
-            ),
-            using=source_database_alias,
-        )
-        return
-
-    def after_non_default_commit() -> None:
-        # This cannot be atomic with the source commit. A crash before this
-        # callback is the documented cross-database handoff gap.
-        tokens = _mark_pairs(affected_pairs, action="change")
-        dispatch_after_marking(tokens)
-
+    collector = _search_dispatch_collector(source_database_alias)
+    coalesced = collector.add(
+        prepared,
+        affected_pairs,
+        batch_size=batch_size or 1,
+        tokens=tokens,
+        savepoints=_active_savepoints(source_database_alias),
+    )
     transaction.on_commit(
-        lambda: _run_scheduled_callback_safely(after_non_default_commit),
+        lambda: _run_scheduled_callback_safely(lambda: collector.confirm(coalesced)),
         using=source_database_alias,
     )
 
@@ -7,7 +7,7 @@ import json
 import uuid
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable, Sequence
 
 from django.db import transaction
 from django.db.models import F, Q
@@ -26,6 +26,9 @@ from general_manager.search.models import (
 )
 from general_manager.search.registry import get_search_config, iter_searchable_managers
 
+if TYPE_CHECKING:
+    from general_manager.search.backend import SearchBackend
+
 logger = get_logger("search.reconciliation")
 
 
@@ -503,6 +506,69 @@ def _release_claim_with_error(
     )
 
 
+def drain_search_backend_tasks(backend: SearchBackend | None = None) -> int:
+    """
+    Check pipelined backend writes and mark pairs with failed tasks dirty.
+
+    Backends that submit writes without waiting expose
+    `drain_pending_tasks()`, returning failed tasks with `index_name` and
+    `types` attributes; they are passed to `mark_failed_search_backend_tasks()`.
+    Backends without task tracking return `0` without any work. Returns the
+    number of pairs marked.
+    """
+    if backend is None:
+        from general_manager.search.backend_registry import get_search_backend
+
+        backend = get_search_backend()
+    drain_pending_tasks = getattr(backend, "drain_pending_tasks", None)
+    if not callable(drain_pending_tasks):
+        return 0
+    return mark_failed_search_backend_tasks(tuple(drain_pending_tasks()))
+
+
+def mark_failed_search_backend_tasks(failed_tasks: Sequence[object]) -> int:
+    """
+    Mark the manager/index pairs written by failed backend tasks dirty.
+
+    Every configured manager/index pair on a failed task's `index_name` is
+    marked dirty; when the task reports document type labels in `types`, only
+    managers with one of those labels are marked. Pipelined backends call this
+    from whichever process observes the failure, so the durable dirty marker
+    reaches the reconciliation sweep even when the task was submitted by
+    another process. Returns the number of pairs marked; database errors
+    propagate.
+    """
+    if not failed_tasks:
+        return 0
+
+    from general_manager.search.registry import get_type_label
+
+    failed_pairs: dict[tuple[str, str], SearchIndexTarget] = {}
+    targets = tuple(iter_search_index_targets())
+    for failed_task in failed_tasks:
+        index_name = str(getattr(failed_task, "index_name", ""))
+        types = set(getattr(failed_task, "types", ()) or ())
+        for target in targets:
+            if target.index_name != index_name:
+                continue
+            if types and get_type_label(target.manager_class) not in types:
+                continue
+            failed_pairs[(target.manager_path, target.index_name)] = target
+    for target in failed_pairs.values():
+        mark_search_index_dirty(target.manager_class, target.index_name)
+    logger.warning(
+        "search backend tasks failed; indexes marked dirty",
+        context={
+            "failed_tasks": len(failed_tasks),
+            "indexes": sorted(
+                f"{manager_path}:{index_name}"
+                for manager_path, index_name in failed_pairs
+            ),
+        },
+    )
+    return len(failed_pairs)
+
+
 def reconcile_search_indexes(
     *,
     force: bool = False,
@@ -530,9 +596,14 @@ def reconcile_search_indexes(
     Per-state import, validation, backend, and serialization failures are caught:
     the state claim is released, `last_error` is stored, and `failed` is
     incremented. Database errors while ensuring, claiming, releasing, or clearing
-    states propagate.
+    states propagate. Failed pipelined backend tasks are drained first through
+    `drain_search_backend_tasks()` so their pairs are rebuilt in the same sweep.
     """
     ensure_result = ensure_search_index_states(force=force)
+    try:
+        drain_search_backend_tasks()
+    except Exception:
+        logger.exception("search backend task drain failed")
     claimed_states = _claim_dirty_states(max_states=max_states)
 
     if not claimed_states:
@@ -0,0 +1,277 @@
+"""Bounded parallel rebuilds of search-enabled managers."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from itertools import islice
+
+from django.db import connections
+
+from general_manager.manager.general_manager import GeneralManager
+from general_manager.search.backend import (
+    SearchBackend,
+    SearchDocument,
+    SearchResult,
+)
+from general_manager.search.indexer import SearchIndexer
+from general_manager.search.registry import get_search_config
+
+
+class InvalidSearchReindexOptionError(ValueError):
+    """Raised when a parallel reindex bound is not a positive integer."""
+
+    def __init__(self, name: str) -> None:
+        """Build the stable option validation message."""
+        super().__init__(f"{name} must be a positive integer.")
+
+
+class SearchReindexFailedError(RuntimeError):
+    """Raised after every target ran when one or more manager rebuilds failed."""
+
+    def __init__(self, outcomes: Sequence[SearchReindexOutcome]) -> None:
+        """Summarize failed managers while retaining every outcome."""
+        self.outcomes = tuple(outcomes)
+        failed = [outcome for outcome in self.outcomes if outcome.error is not None]
+        names = ", ".join(outcome.manager_class.__name__ for outcome in failed)
+        super().__init__(
+            f"Search reindex failed for {len(failed)} of "
+            f"{len(self.outcomes)} managers: {names}"
+        )
+
+
+@dataclass(frozen=True)
+class SearchReindexOutcome:
+    """Result of rebuilding or enqueueing one manager's search documents."""
+
+    manager_class: type[GeneralManager]
+    seconds: float
+    error: Exception | None = None
+    batches: int = 0
+
+    @property
+    def succeeded(self) -> bool:
+        """Return whether the manager finished without an error."""
+        return self.error is None
+
+
+type SearchReindexProgress = Callable[[SearchReindexOutcome, int, int], None]
+
+
+class _WriteThrottledBackend:
+    """Backend proxy allowing at most ``limit`` concurrent backend writes."""
+
+    def __init__(self, backend: SearchBackend, limit: int) -> None:
+        """Wrap ``backend`` with a shared write semaphore."""
+        self.backend = backend
+        self._writes = threading.BoundedSemaphore(limit)
+
+    def __getattr__(self, name: str) -> object:
+        """Delegate optional adapter capabilities unchanged."""
+        if name == "backend":
+            raise AttributeError(name)
+        return getattr(self.backend, name)
+
+    def ensure_index(self, index_name: str, settings: Mapping[str, object]) -> None:
+        """Apply index settings inside the shared write bound."""
+        with self._writes:
+            self.backend.ensure_index(index_name, settings)
+
+    def upsert(self, index_name: str, documents: Sequence[SearchDocument]) -> None:
+        """Upsert documents inside the shared write bound."""
+        with self._writes:
+            self.backend.upsert(index_name, documents)
+
+    def delete(self, index_name: str, ids: Sequence[str]) -> None:
+        """Delete documents inside the shared write bound."""
+        with self._writes:
+            self.backend.delete(index_name, ids)
+
+    def list_document_ids(
+        self,
+        index_name: str,
+        *,
+        types: Sequence[str] | None = None,
+    ) -> set[str]:
+        """Return stored document IDs from the wrapped backend without a bound."""
+        return self.backend.list_document_ids(index_name, types=types)
+
+    def search(
+        self,
+        index_name: str,
+        query: str,
+        *,
+        filters: Mapping[str, object] | Sequence[Mapping[str, object]] | None = None,
+        filter_expression: str | None = None,
+        sort_by: str | None = None,
+        sort_desc: bool = False,
+        limit: int = 10,
+        offset: int = 0,
+        types: Sequence[str] | None = None,
+    ) -> SearchResult:
+        """Search the wrapped backend without a bound."""
+        return self.backend.search(
+            index_name,
+            query,
+            filters=filters,
+            filter_expression=filter_expression,
+            sort_by=sort_by,
+            sort_desc=sort_desc,
+            limit=limit,
+            offset=offset,
+            types=types,
+        )
+
+
+def _positive(value: int | None, name: str) -> None:
+    if value is None:
+        return
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        raise InvalidSearchReindexOptionError(name)
+
+
+def reindex_managers(
+    manager_classes: Iterable[type[GeneralManager]],
+    *,
+    backend: SearchBackend,
+    workers: int = 1,
+    max_concurrent_writes: int | None = None,
+    indexer_factory: Callable[[SearchBackend], SearchIndexer] = SearchIndexer,
+    on_progress: SearchReindexProgress | None = None,
+) -> tuple[SearchReindexOutcome, ...]:
+    """
+    Rebuild every manager with ``SearchIndexer.reindex_manager`` on a thread pool.
+
+    ``workers`` bounds how many managers rebuild at once; ``1`` runs them in
+    order on the calling thread. ``max_concurrent_writes`` bounds concurrent
+    backend ``ensure_index``/``upsert``/``delete`` calls across all workers and
+    defaults to ``workers``. Each worker thread closes its database connections
+    when it finishes. ``on_progress`` receives each outcome with the completed
+    and total counts as managers finish. A failing manager does not stop the
+    others; after all ran, ``SearchReindexFailedError`` is raised with every
+    outcome, chained to the first failure.
+
+    Raises:
+        InvalidSearchReindexOptionError: If a bound is not a positive integer.
+        SearchReindexFailedError: If any manager rebuild failed.
+    """
+    _positive(workers, "workers")
+    _positive(max_concurrent_writes, "max_concurrent_writes")
+    targets = tuple(manager_classes)
+    write_limit = max_concurrent_writes or workers
+    throttled: SearchBackend = (
+        _WriteThrottledBackend(backend, write_limit)
+        if workers > 1 or max_concurrent_writes is not None
+        else backend
+    )
+
+    def rebuild(manager_class: type[GeneralManager]) -> SearchReindexOutcome:
+        started = time.perf_counter()
+        try:
+            indexer_factory(throttled).reindex_manager(manager_class)
+        except Exception as exc:  # noqa: BLE001 - aggregated for the caller
+            return SearchReindexOutcome(
+                manager_class, time.perf_counter() - started, exc
+            )
+        finally:
+            if workers > 1:
+                connections.close_all()
+        return SearchReindexOutcome(manager_class, time.perf_counter() - started)
+
+    outcomes: list[SearchReindexOutcome] = []
+
+    def record(outcome: SearchReindexOutcome) -> None:
+        outcomes.append(outcome)
+        if on_progress is not None:
+            on_progress(outcome, len(outcomes), len(targets))
+
+    if workers == 1:
+        for manager_class in targets:
+            record(rebuild(manager_class))
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(workers, len(targets)) or 1,
+            thread_name_prefix="search-reindex",
+        ) as executor:
+            futures = [executor.submit(rebuild, target) for target in targets]
+            for future in as_completed(futures):
+                record(future.result())
+
+    _raise_for_failures(outcomes)
+    return tuple(outcomes)
+
+
+def enqueue_manager_reindex(
+    manager_classes: Iterable[type[GeneralManager]],
+    *,
+    chunk_size: int = 500,
+    on_progress: SearchReindexProgress | None = None,
+) -> tuple[SearchReindexOutcome, ...]:
+    """
+    Split each manager/index rebuild into identity batches for search workers.
+
+    Every configured index of every manager is dispatched as
+    ``chunk_size``-sized ``dispatch_index_manager_batch`` calls, which queue
+    ``index_manager_index_batch_task`` when async search indexing and Celery
+    are available and run inline otherwise. Unlike ``reindex_managers``, stale
+    backend documents are not deleted. Failures are aggregated like
+    ``reindex_managers``.
+
+    Raises:
+        InvalidSearchReindexOptionError: If ``chunk_size`` is not positive.
+        SearchReindexFailedError: If enqueueing any manager failed.
+    """
+    from general_manager.search.async_tasks import dispatch_index_manager_batch
+
+    _positive(chunk_size, "chunk_size")
+    targets = tuple(manager_classes)
+    outcomes: list[SearchReindexOutcome] = []
+    for manager_class in targets:
+        started = time.perf_counter()
+        batches = 0
+        error: Exception | None = None
+        try:
+            config = get_search_config(manager_class)
+            index_names = (
+                tuple(dict.fromkeys(index.name for index in config.indexes))
+                if config is not None
+                else ()
+            )
+            if index_names:
+                manager_path = f"{manager_class.__module__}.{manager_class.__name__}"
+                identifications = [
+                    dict(instance.identification) for instance in manager_class.all()
+                ]
+                for index_name in index_names:
+                    iterator = iter(identifications)
+                    while chunk := tuple(islice(iterator, chunk_size)):
+                        dispatch_index_manager_batch(manager_path, index_name, chunk)
+                        batches += 1
+        except Exception as exc:  # noqa: BLE001 - aggregated for the caller
+            error = exc
+        outcomes.append(
+            SearchReindexOutcome(
+                manager_class,
+                time.perf_counter() - started,
+                error,
+                batches,
+            )
+        )
+        if on_progress is not None:
+            on_progress(outcomes[-1], len(outcomes), len(targets))
+
+    _raise_for_failures(outcomes)
+    return tuple(outcomes)
+
+
+def _raise_for_failures(outcomes: Sequence[SearchReindexOutcome]) -> None:
+    """Raise one aggregated error chained to the first failed outcome."""
+    first_error = next(
+        (outcome.error for outcome in outcomes if outcome.error is not None),
+        None,
+    )
+    if first_error is not None:
+        raise SearchReindexFailedError(outcomes) from first_error
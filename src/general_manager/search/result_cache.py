@@ -0,0 +1,349 @@
+"""Generation-invalidated cache for normalized search backend responses."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections.abc import Mapping, Sequence
+from typing import Any, cast
+
+from django.core.cache import cache as django_cache
+
+from general_manager.conf import get_setting
+from general_manager.logging import get_logger
+from general_manager.search.backend import (
+    SearchBackend,
+    SearchDocument,
+    SearchHit,
+    SearchResult,
+)
+
+logger = get_logger("search.result_cache")
+
+RESULT_CACHE_PREFIX = "general_manager:search:results"
+GENERATION_CACHE_PREFIX = "general_manager:search:generation"
+DEFAULT_RESULT_CACHE_TIMEOUT_SECONDS = 60
+_GENERATION_TIMEOUT_SECONDS = None
+
+
+def search_result_cache_enabled() -> bool:
+    """Return whether configured search backends should cache query results."""
+    return bool(get_setting("SEARCH_RESULT_CACHE_ENABLED", False))
+
+
+def get_search_result_cache_timeout() -> int:
+    """Return the positive result-entry lifetime, falling back to the default."""
+    value = get_setting(
+        "SEARCH_RESULT_CACHE_TIMEOUT", DEFAULT_RESULT_CACHE_TIMEOUT_SECONDS
+    )
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        return DEFAULT_RESULT_CACHE_TIMEOUT_SECONDS
+    return value
+
+
+def _record_cache_outcome(index_name: str, outcome: str, saved_seconds: float) -> None:
+    """Forward one cache outcome to the configured metrics backend, if it can."""
+    try:
+        from general_manager.metrics.graphql import get_graphql_metrics_backend
+
+        record = getattr(get_graphql_metrics_backend(), "record_search_cache", None)
+        if callable(record):
+            record(
+                index_name=index_name,
+                outcome=outcome,
+                saved_seconds=saved_seconds,
+            )
+    except Exception as exc:  # noqa: BLE001 - metrics must not fail searches
+        logger.warning(
+            "search result cache metrics failed",
+            context={"index": index_name, "outcome": outcome},
+            exc_info=exc,
+        )
+
+
+class CachedSearchBackend:
+    """
+    Search backend wrapper that caches normalized query responses.
+
+    Cache entries store hit identity, score, index, and data together with the
+    total and the backend latency that produced them; backend ``raw`` payloads
+    are not retained. Every entry key embeds a per-index generation counter kept
+    in Django's cache and bumped after each upsert, delete, or settings change,
+    so a write makes every earlier entry for that index unreachable without
+    scanning. Adapters that submit writes asynchronously bump again when they
+    report the tasks finished through ``add_task_completion_listener()``, and
+    searches of an index with tasks still pending in this process bypass the
+    cache. Pipelined adapters without that listener are not cached. Permission filtering is not applied here;
+    callers filter the returned hits per user exactly as for an uncached
+    backend. Other attributes are delegated to the wrapped backend.
+
+    Generations are only shared between processes through the backend's
+    ``settings_cache_namespace``. Backends without one cannot tell which
+    processes write to the same data, so the wrapper passes their searches
+    through uncached instead of keeping generations that other processes'
+    writes would never bump.
+    """
+
+    def __init__(
+        self,
+        backend: SearchBackend,
+        *,
+        timeout: int | None = None,
+    ) -> None:
+        """Wrap ``backend`` with a result cache using ``timeout`` seconds."""
+        self.backend = backend
+        self._timeout = timeout
+        namespace = getattr(backend, "settings_cache_namespace", None)
+        self._namespace: str | None = (
+            namespace if isinstance(namespace, str) and namespace else None
+        )
+        if self._namespace is None:
+            logger.warning(
+                "search result cache disabled for backend without a namespace",
+                context={"backend": type(backend).__qualname__},
+            )
+        elif getattr(backend, "pipelined", False):
+            add_listener = getattr(backend, "add_task_completion_listener", None)
+            if callable(add_listener):
+                add_listener(self._tasks_completed)
+            else:
+                self._namespace = None
+                logger.warning(
+                    "search result cache disabled for pipelined backend "
+                    "without task completion reporting",
+                    context={"backend": type(backend).__qualname__},
+                )
+
+    def __getattr__(self, name: str) -> object:
+        """Delegate optional adapter capabilities to the wrapped backend."""
+        if name == "backend":
+            raise AttributeError(name)
+        return getattr(self.backend, name)
+
+    @property
+    def caching(self) -> bool:
+        """Return whether searches are cached for the wrapped backend."""
+        return self._namespace is not None
+
+    @property
+    def timeout(self) -> int:
+        """Return the result-entry lifetime in seconds."""
+        if self._timeout is not None:
+            return self._timeout
+        return get_search_result_cache_timeout()
+
+    def ensure_index(self, index_name: str, settings: Mapping[str, object]) -> None:
+        """Apply index settings and invalidate cached results for the index."""
+        self.backend.ensure_index(index_name, settings)
+        self._written(index_name)
+
+    def upsert(self, index_name: str, documents: Sequence[SearchDocument]) -> None:
+        """Upsert documents and invalidate cached results for the index."""
+        self.backend.upsert(index_name, documents)
+        self._written(index_name)
+
+    def delete(self, index_name: str, ids: Sequence[str]) -> None:
+        """Delete documents and invalidate cached results for the index."""
+        self.backend.delete(index_name, ids)
+        self._written(index_name)
+
+    def list_document_ids(
+        self,
+        index_name: str,
+        *,
+        types: Sequence[str] | None = None,
+    ) -> set[str]:
+        """Return stored document IDs from the wrapped backend without caching."""
+        return self.backend.list_document_ids(index_name, types=types)
+
+    def search(
+        self,
+        index_name: str,
+        query: str,
+        *,
+        filters: Mapping[str, object] | Sequence[Mapping[str, object]] | None = None,
+        filter_expression: str | None = None,
+        sort_by: str | None = None,
+        sort_desc: bool = False,
+        limit: int = 10,
+        offset: int = 0,
+        types: Sequence[str] | None = None,
+    ) -> SearchResult:
+        """Return a cached response for an identical request or query the backend."""
+
+        def run_backend_search() -> SearchResult:
+            return self.backend.search(
+                index_name,
+                query,
+                filters=filters,
+                filter_expression=filter_expression,
+                sort_by=sort_by,
+                sort_desc=sort_desc,
+                limit=limit,
+                offset=offset,
+                types=types,
+            )
+
+        if not self.caching:
+            return run_backend_search()
+        if self._has_pending_writes(index_name):
+            _record_cache_outcome(index_name, "bypass", 0.0)
+            return run_backend_search()
+        try:
+            key = self._result_key(
+                index_name,
+                {
+                    "query": query,
+                    "filters": filters,
+                    "filter_expression": filter_expression,
+                    "sort_by": sort_by,
+                    "sort_desc": sort_desc,
+                    "limit": limit,
+                    "offset": offset,
+                    "types": list(types) if types is not None else None,
+                },
+            )
+            cached = django_cache.get(key)
+        except Exception as exc:  # noqa: BLE001 - cache backends are extensible
+            logger.warning(
+                "search result cache lookup failed",
+                context={"index": index_name},
+                exc_info=exc,
+            )
+            _record_cache_outcome(index_name, "bypass", 0.0)
+            return run_backend_search()
+
+        if isinstance(cached, Mapping):
+            result = _result_from_entry(cached)
+            _record_cache_outcome(
+                index_name,
+                "hit",
+                float(cached.get("backend_seconds", 0.0)),
+            )
+            return result
+
+        started = time.perf_counter()
+        result = run_backend_search()
+        backend_seconds = time.perf_counter() - started
+        _record_cache_outcome(index_name, "miss", 0.0)
+        try:
+            django_cache.set(
+                key,
+                _entry_from_result(result, backend_seconds),
+                self.timeout,
+            )
+        except Exception as exc:  # noqa: BLE001 - cache backends are extensible
+            logger.warning(
+                "search result cache store failed",
+                context={"index": index_name},
+                exc_info=exc,
+            )
+        return result
+
+    def index_generation(self, index_name: str) -> int:
+        """Return the current cache generation for one index."""
+        generation = django_cache.get(self._generation_key(index_name))
+        return generation if isinstance(generation, int) else 0
+
+    def invalidate_index(self, index_name: str) -> None:
+        """Bump one index generation so earlier cached responses are ignored."""
+        if not self.caching:
+            return
+        key = self._generation_key(index_name)
+        try:
+            if not django_cache.add(key, 1, _GENERATION_TIMEOUT_SECONDS):
+                django_cache.incr(key)
+        except ValueError:
+            # The key expired between add and incr; start a new generation.
+            django_cache.set(key, 1, _GENERATION_TIMEOUT_SECONDS)
+
+    def _written(self, index_name: str) -> None:
+        """Invalidate cached results after a write to ``index_name``."""
+        self._safe_invalidate(index_name)
+
+    def _tasks_completed(self, tasks: Sequence[object]) -> None:
+        """Invalidate indexes whose pipelined writes are now visible to searches."""
+        index_names = {getattr(task, "index_name", None) for task in tasks}
+        for index_name in index_names:
+            if isinstance(index_name, str):
+                self._safe_invalidate(index_name)
+
+    def _has_pending_writes(self, index_name: str) -> bool:
+        """Return whether this process still waits for writes to ``index_name``."""
+        pending_tasks = getattr(self.backend, "pending_tasks", None)
+        if not callable(pending_tasks):
+            return False
+        return any(
+            getattr(task, "index_name", None) == index_name for task in pending_tasks()
+        )
+
+    def _safe_invalidate(self, index_name: str) -> None:
+        """Bump a generation without surfacing cache errors to index writers."""
+        try:
+            self.invalidate_index(index_name)
+        except Exception as exc:  # noqa: BLE001 - cache backends are extensible
+            logger.warning(
+                "search result cache invalidation failed",
+                context={"index": index_name},
+                exc_info=exc,
+            )
+
+    def _generation_key(self, index_name: str) -> str:
+        return f"{GENERATION_CACHE_PREFIX}:{self._namespace}:{index_name}"
+
+    def _result_key(self, index_name: str, request: Mapping[str, object]) -> str:
+        """Build the generation-scoped key for one normalized request."""
+        payload = json.dumps(request, sort_keys=True, default=str)
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        generation = self.index_generation(index_name)
+        return (
+            f"{RESULT_CACHE_PREFIX}:{self._namespace}:{index_name}:"
+            f"{generation}:{digest}"
+        )
+
+
+def _entry_from_result(
+    result: SearchResult,
+    backend_seconds: float,
+) -> dict[str, object]:
+    """Serialize the cacheable parts of a backend response."""
+    return {
+        "hits": [
+            {
+                "id": hit.id,
+                "type": hit.type,
+                "identification": dict(hit.identification),
+                "score": hit.score,
+                "index": hit.index,
+                "data": dict(hit.data) if hit.data is not None else None,
+            }
+            for hit in result.hits
+        ],
+        "total": result.total,
+        "took_ms": result.took_ms,
+        "backend_seconds": backend_seconds,
+    }
+
+
+def _result_from_entry(entry: Mapping[str, object]) -> SearchResult:
+    """Rebuild fresh result objects from one cache entry."""
+    raw_hits = cast(list[Mapping[str, Any]], entry.get("hits") or [])
+    hits = [
+        SearchHit(
+            id=hit["id"],
+            type=hit["type"],
+            identification=dict(hit["identification"]),
+            score=hit.get("score"),
+            index=hit.get("index"),
+            data=dict(hit["data"]) if hit.get("data") is not None else None,
+        )
+        for hit in raw_hits
+    ]
+    total = entry.get("total")
+    took_ms = entry.get("took_ms")
+    return SearchResult(
+        hits=hits,
+        total=total if isinstance(total, int) else len(hits),
+        took_ms=took_ms if isinstance(took_ms, int) else None,
+    )
@@ -288,6 +288,22 @@ class ExactPublicDownloadAdapter(Protocol):
         ...
 
 
+@runtime_checkable
+class RangedDownloadAdapter(Protocol):
+    """Optional adapter capability for reading byte ranges of retained downloads."""
+
+    def open_download_range(
+        self,
+        key: str,
+        version: ObjectVersion,
+        *,
+        start: int,
+        end: int,
+    ) -> IO[bytes]:
+        """Open bytes ``start`` through ``end`` (inclusive) of exactly ``version``."""
+        ...
+
+
 @runtime_checkable
 class ProxyUploadSink(UploadAdapter, Protocol):
     """Upload adapter that can accept a proxy stream through Django storage."""
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import base64
+from collections import deque
 from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
 from dataclasses import dataclass
 import hashlib
 import importlib.util
@@ -23,6 +26,7 @@ from general_manager.uploads.adapters import (
 )
 from general_manager.uploads.errors import (
     UploadBackendUnsupportedError,
+    UploadChecksumMismatchError,
     UploadObjectMissingError,
     UploadStorageChangedError,
     UploadError,
@@ -35,6 +39,9 @@ from general_manager.uploads.types import ObjectVersion, UploadTransport
 _ExceptionT = TypeVar("_ExceptionT", bound=Exception)
 _ResultT = TypeVar("_ResultT")
 _MAX_SINGLE_PUT_BYTES = 5 * 1024**3
+_MAX_MULTIPART_PARTS = 10_000
+_HEX_SHA256 = re.compile(r"[0-9a-f]{64}")
+_COMPOSITE_CHECKSUM = re.compile(r"[A-Za-z0-9+/]{43}=-[1-9][0-9]*")
 _MAX_SIGV4_EXPIRY_SECONDS = 604_800
 
 
@@ -86,6 +93,16 @@ class _S3ClientProtocol(Protocol):
 
     def put_object(self, **kwargs: object) -> Mapping[str, object]: ...
 
+    def create_multipart_upload(self, **kwargs: object) -> Mapping[str, object]: ...
+
+    def upload_part(self, **kwargs: object) -> Mapping[str, object]: ...
+
+    def upload_part_copy(self, **kwargs: object) -> Mapping[str, object]: ...
+
+    def complete_multipart_upload(self, **kwargs: object) -> Mapping[str, object]: ...
+
+    def abort_multipart_upload(self, **kwargs: object) -> object: ...
+
     def copy_object(self, **kwargs: object) -> Mapping[str, object]: ...
 
     def delete_object(self, **kwargs: object) -> object: ...
@@ -104,6 +121,9 @@ class S3ProxyUploadAdapter:
     adapter_id: ClassVar[str] = "s3-proxy"
     adapter_version: ClassVar[int] = 1
     _spool_memory_limit = 1024 * 1024
+    _multipart_part_bytes = 8 * 1024 * 1024
+    _multipart_concurrency = 4
+    _copy_part_bytes = 512 * 1024 * 1024
 
     def __init__(self, storage: Storage) -> None:
         client, bucket, object_options = _validate_proxy_support(storage)
@@ -111,6 +131,10 @@ class S3ProxyUploadAdapter:
         self._client = client
         self._bucket = bucket
         self._object_options = object_options
+        self._multipart_supported = _supports_operation_member(
+            client, "CompleteMultipartUpload", "IfNoneMatch"
+        )
+        self._copy_supported = _supports_conditional_copy(client)
 
     @property
     def supports_public_urls(self) -> bool:
@@ -151,6 +175,20 @@ class S3ProxyUploadAdapter:
         checksum_sha256: str | None = None,
         size: int | None = None,
     ) -> ObjectVersion:
+        if (
+            self._multipart_supported
+            and checksum_sha256 is not None
+            and _HEX_SHA256.fullmatch(checksum_sha256) is not None
+            and size is not None
+            and size > self._multipart_part_bytes
+        ):
+            return self._save_stage_multipart(
+                stage_key,
+                chunks,
+                content_type=content_type,
+                checksum_sha256=checksum_sha256,
+                size=size,
+            )
         with SpooledTemporaryFile(
             max_size=self._spool_memory_limit,
             mode="w+b",
@@ -163,8 +201,6 @@ class S3ProxyUploadAdapter:
                 byte_count += len(chunk)
             actual_checksum = digest.hexdigest()
             if checksum_sha256 is not None and checksum_sha256 != actual_checksum:
-                from general_manager.uploads.errors import UploadChecksumMismatchError
-
                 raise UploadChecksumMismatchError
             if size is not None and size != byte_count:
                 raise _exception(
@@ -189,29 +225,238 @@ class S3ProxyUploadAdapter:
                 )
             except UploadError:
                 raise
-            except Exception as exc:
-                existing = self._head_optional(stage_key)
-                if existing is not None and _matches_proxy_stage(
-                    existing,
+            except Exception as exc:  # noqa: BLE001 - recovery re-raises as UploadError
+                return self._recover_stage_write(
+                    stage_key,
+                    exc,
                     checksum=actual_checksum,
                     size=byte_count,
                     identity=identity,
-                ):
-                    return _proxy_object_version(existing)
-                if _is_precondition_error(exc) or existing is not None:
-                    raise _exception(
-                        UploadTransferConflictError,
-                        "The reserved staging S3 key is already occupied.",
-                    ) from exc
-                raise _exception(
-                    UploadStorageError,
-                    "S3 could not persist the proxied upload.",
-                ) from exc
+                )
+        return self._stored_stage(
+            stage_key,
+            checksum=actual_checksum,
+            size=byte_count,
+            identity=identity,
+        )
+
+    def _save_stage_multipart(
+        self,
+        stage_key: str,
+        chunks: Iterable[bytes],
+        *,
+        content_type: str | None,
+        checksum_sha256: str,
+        size: int,
+    ) -> ObjectVersion:
+        """
+        Stream a large proxy upload to S3 as a conditional multipart upload.
+
+        The declared SHA-256 is written as stage identity metadata up front,
+        because a multipart object only carries a composite checksum of its
+        parts. Parts upload concurrently while the full digest is computed from
+        the same chunks; the upload only completes, with ``IfNoneMatch: *``,
+        once that digest and the byte count match the declaration. Any failure
+        aborts the multipart upload so no parts are left behind.
+        """
+        checksum = checksum_sha256
+        identity = {
+            "gm-stage-state": "completed",
+            "gm-checksum-sha256": checksum,
+        }
+        created = _sdk_call(
+            lambda: self._client.create_multipart_upload(
+                Bucket=self._bucket,
+                Key=stage_key,
+                ContentType=content_type or "application/octet-stream",
+                ChecksumAlgorithm="SHA256",
+                Metadata=identity,
+                **self._object_options.staging_put_arguments,
+            ),
+            "S3 could not start the proxied multipart upload.",
+        )
+        upload_id = created.get("UploadId")
+        if not isinstance(upload_id, str) or not upload_id:
+            raise _exception(
+                UploadStorageError,
+                "S3 did not return a multipart upload id.",
+            )
+        # Stay within S3's part-count limit for very large declared sizes.
+        part_bytes = max(self._multipart_part_bytes, -(-size // _MAX_MULTIPART_PARTS))
+        try:
+            parts, byte_count, actual_checksum = self._upload_parts(
+                stage_key,
+                upload_id,
+                chunks,
+                part_bytes=part_bytes,
+            )
+        except BaseException:
+            self._abort_multipart_upload(stage_key, upload_id)
+            raise
+        if actual_checksum != checksum or byte_count != size:
+            self._abort_multipart_upload(stage_key, upload_id)
+            if actual_checksum != checksum:
+                raise UploadChecksumMismatchError
+            raise _exception(
+                UploadStorageError,
+                "The staged upload size did not match.",
+            )
+        try:
+            self._client.complete_multipart_upload(
+                Bucket=self._bucket,
+                Key=stage_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+                IfNoneMatch="*",
+            )
+        except Exception as exc:
+            # Aborting an upload that did complete fails harmlessly; recovery
+            # below then finds the matching stage.
+            self._abort_multipart_upload(stage_key, upload_id)
+            if isinstance(exc, UploadError):
+                raise
+            return self._recover_stage_write(
+                stage_key,
+                exc,
+                checksum=checksum,
+                size=size,
+                identity=identity,
+            )
+        return self._stored_stage(
+            stage_key,
+            checksum=checksum,
+            size=size,
+            identity=identity,
+        )
+
+    def _upload_parts(
+        self,
+        stage_key: str,
+        upload_id: str,
+        chunks: Iterable[bytes],
+        *,
+        part_bytes: int,
+    ) -> tuple[list[dict[str, object]], int, str]:
+        """Upload ``chunks`` as parts and return them with the size and digest.
+
+        At most ``_multipart_concurrency`` parts are in flight, so memory stays
+        bounded by roughly one more part than that regardless of upload size.
+        """
+        digest = hashlib.sha256()
+        byte_count = 0
+        buffer = bytearray()
+        parts: list[dict[str, object]] = []
+        in_flight: deque[Future[dict[str, object]]] = deque()
+        part_number = 0
+        executor = ThreadPoolExecutor(
+            max_workers=self._multipart_concurrency,
+            thread_name_prefix="gm-s3-upload",
+        )
+
+        def submit(payload: bytes) -> None:
+            nonlocal part_number
+            while len(in_flight) >= self._multipart_concurrency:
+                parts.append(in_flight.popleft().result())
+            part_number += 1
+            in_flight.append(
+                executor.submit(
+                    self._upload_part, stage_key, upload_id, part_number, payload
+                )
+            )
+
+        try:
+            for chunk in chunks:
+                digest.update(chunk)
+                byte_count += len(chunk)
+                buffer += chunk
+                while len(buffer) >= part_bytes:
+                    submit(bytes(buffer[:part_bytes]))
+                    del buffer[:part_bytes]
+            if buffer or part_number == 0:
+                submit(bytes(buffer))
+            while in_flight:
+                parts.append(in_flight.popleft().result())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return parts, byte_count, digest.hexdigest()
+
+    def _upload_part(
+        self,
+        stage_key: str,
+        upload_id: str,
+        part_number: int,
+        payload: bytes,
+    ) -> dict[str, object]:
+        checksum = base64.b64encode(hashlib.sha256(payload).digest()).decode("ascii")
+        response = _sdk_call(
+            lambda: self._client.upload_part(
+                Bucket=self._bucket,
+                Key=stage_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=payload,
+                ChecksumSHA256=checksum,
+            ),
+            "S3 could not store a proxied upload part.",
+        )
+        etag = response.get("ETag")
+        if not isinstance(etag, str) or not etag:
+            raise _exception(
+                UploadStorageError,
+                "S3 returned an upload part without an ETag.",
+            )
+        return {"PartNumber": part_number, "ETag": etag, "ChecksumSHA256": checksum}
+
+    def _abort_multipart_upload(self, stage_key: str, upload_id: str) -> None:
+        # A failed abort only leaves unreferenced parts behind; the bucket's
+        # incomplete-multipart lifecycle rule reclaims them.
+        with suppress(Exception):
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket,
+                Key=stage_key,
+                UploadId=upload_id,
+            )
+
+    def _recover_stage_write(
+        self,
+        stage_key: str,
+        exc: Exception,
+        *,
+        checksum: str,
+        size: int,
+        identity: Mapping[str, str],
+    ) -> ObjectVersion:
+        existing = self._head_optional(stage_key)
+        if existing is not None and _matches_proxy_stage(
+            existing,
+            checksum=checksum,
+            size=size,
+            identity=identity,
+        ):
+            return _proxy_object_version(existing)
+        if _is_precondition_error(exc) or existing is not None:
+            raise _exception(
+                UploadTransferConflictError,
+                "The reserved staging S3 key is already occupied.",
+            ) from exc
+        raise _exception(
+            UploadStorageError,
+            "S3 could not persist the proxied upload.",
+        ) from exc
+
+    def _stored_stage(
+        self,
+        stage_key: str,
+        *,
+        checksum: str,
+        size: int,
+        identity: Mapping[str, str],
+    ) -> ObjectVersion:
         stored = self._head_required(stage_key)
         if not _matches_proxy_stage(
             stored,
-            checksum=actual_checksum,
-            size=byte_count,
+            checksum=checksum,
+            size=size,
             identity=identity,
         ):
             raise UploadStorageChangedError
@@ -247,17 +492,22 @@ class S3ProxyUploadAdapter:
                 "The reserved final S3 key is already occupied.",
             )
         try:
-            with self.open_stage(stage_key, version) as source:
-                self._client.put_object(
-                    Bucket=self._bucket,
-                    Key=final_key,
-                    Body=source,
-                    IfNoneMatch="*",
-                    ContentType=version.content_type or "application/octet-stream",
-                    ChecksumSHA256=_hex_checksum_to_base64(version.checksum_sha256),
-                    Metadata=identity,
-                    **self._object_options.final_copy_arguments,
-                )
+            if self._copy_supported and version.size <= _MAX_SINGLE_PUT_BYTES:
+                self._copy_stage(stage_key, version, final_key, identity)
+            elif self._multipart_supported:
+                self._copy_stage_parts(stage_key, version, final_key, identity)
+            else:
+                with self.open_stage(stage_key, version) as source:
+                    self._client.put_object(
+                        Bucket=self._bucket,
+                        Key=final_key,
+                        Body=source,
+                        IfNoneMatch="*",
+                        ContentType=version.content_type or "application/octet-stream",
+                        ChecksumSHA256=_hex_checksum_to_base64(version.checksum_sha256),
+                        Metadata=identity,
+                        **self._object_options.final_copy_arguments,
+                    )
         except UploadError:
             raise
         except Exception as exc:
@@ -274,6 +524,10 @@ class S3ProxyUploadAdapter:
                     "The reserved final S3 key is already occupied.",
                 ) from exc
             if _is_precondition_error(exc):
+                # Server-side copies also fail their precondition when the
+                # source ETag no longer matches the validated stage.
+                if not self._stage_unchanged(stage_key, version):
+                    raise UploadStorageChangedError from None
                 raise UploadTransferConflictError from None
             raise _exception(
                 UploadStorageError,
@@ -284,6 +538,126 @@ class S3ProxyUploadAdapter:
             raise UploadStorageChangedError
         return final_key
 
+    def _copy_source(self, stage_key: str, version: ObjectVersion) -> dict[str, str]:
+        source = {"Bucket": self._bucket, "Key": stage_key}
+        if version.version_id:
+            source["VersionId"] = version.version_id
+        return source
+
+    def _copy_stage(
+        self,
+        stage_key: str,
+        version: ObjectVersion,
+        final_key: str,
+        identity: Mapping[str, str],
+    ) -> None:
+        """Create ``final_key`` with one conditional server-side ``CopyObject``."""
+        self._client.copy_object(
+            Bucket=self._bucket,
+            Key=final_key,
+            CopySource=self._copy_source(stage_key, version),
+            CopySourceIfMatch=version.etag,
+            IfNoneMatch="*",
+            Metadata=dict(identity),
+            MetadataDirective="REPLACE",
+            ContentType=version.content_type or "application/octet-stream",
+            ChecksumAlgorithm="SHA256",
+            **self._object_options.final_copy_arguments,
+        )
+
+    def _copy_stage_parts(
+        self,
+        stage_key: str,
+        version: ObjectVersion,
+        final_key: str,
+        identity: Mapping[str, str],
+    ) -> None:
+        """
+        Create ``final_key`` from ``UploadPartCopy`` ranges of the exact stage.
+
+        Used above the single-copy size limit, or when ``CopyObject`` lacks
+        ``IfNoneMatch``. Every part copy is conditional on the stage ETag and
+        the upload completes with ``IfNoneMatch: *``; any failure aborts it.
+        """
+        created = self._client.create_multipart_upload(
+            Bucket=self._bucket,
+            Key=final_key,
+            ContentType=version.content_type or "application/octet-stream",
+            ChecksumAlgorithm="SHA256",
+            Metadata=dict(identity),
+            **self._object_options.final_copy_arguments,
+        )
+        upload_id = created.get("UploadId")
+        if not isinstance(upload_id, str) or not upload_id:
+            raise _exception(
+                UploadStorageError,
+                "S3 did not return a multipart upload id.",
+            )
+        part_bytes = max(
+            self._copy_part_bytes,
+            -(-version.size // _MAX_MULTIPART_PARTS),
+        )
+        ranges = [
+            (start, min(start + part_bytes, version.size) - 1)
+            for start in range(0, max(version.size, 1), part_bytes)
+        ]
+        source = self._copy_source(stage_key, version)
+
+        def copy_part(part: tuple[int, tuple[int, int]]) -> dict[str, object]:
+            part_number, (start, end) = part
+            parameters: dict[str, object] = {
+                "Bucket": self._bucket,
+                "Key": final_key,
+                "UploadId": upload_id,
+                "PartNumber": part_number,
+                "CopySource": source,
+                "CopySourceIfMatch": version.etag,
+            }
+            if version.size:
+                parameters["CopySourceRange"] = f"bytes={start}-{end}"
+            response = self._client.upload_part_copy(**parameters)
+            result = response.get("CopyPartResult")
+            etag = result.get("ETag") if isinstance(result, Mapping) else None
+            checksum = (
+                result.get("ChecksumSHA256") if isinstance(result, Mapping) else None
+            )
+            if not isinstance(etag, str) or not etag or not isinstance(checksum, str):
+                raise _exception(
+                    UploadStorageError,
+                    "S3 returned a copied part without an ETag and SHA-256.",
+                )
+            return {
+                "PartNumber": part_number,
+                "ETag": etag,
+                "ChecksumSHA256": checksum,
+            }
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self._multipart_concurrency,
+                thread_name_prefix="gm-s3-copy",
+            ) as executor:
+                parts = list(executor.map(copy_part, enumerate(ranges, start=1)))
+            self._client.complete_multipart_upload(
+                Bucket=self._bucket,
+                Key=final_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+                IfNoneMatch="*",
+            )
+        except BaseException:
+            self._abort_multipart_upload(final_key, upload_id)
+            raise
+
+    def _stage_unchanged(self, stage_key: str, version: ObjectVersion) -> bool:
+        current = self._head_optional(stage_key, version_id=version.version_id)
+        if current is None:
+            return False
+        try:
+            return _same_proxy_object(_proxy_object_version(current), version)
+        except UploadError:
+            return False
+
     def open_stage(self, stage_key: str, version: ObjectVersion) -> IO[bytes]:
         if not version.etag:
             raise UploadBackendUnsupportedError
@@ -447,6 +821,34 @@ class S3ProxyUploadAdapter:
     def open_download(self, key: str, version: ObjectVersion) -> IO[bytes]:
         return self.open_stage(key, version)
 
+    def open_download_range(
+        self,
+        key: str,
+        version: ObjectVersion,
+        *,
+        start: int,
+        end: int,
+    ) -> IO[bytes]:
+        if not version.etag:
+            raise UploadBackendUnsupportedError
+        parameters: dict[str, object] = {
+            "Bucket": self._bucket,
+            "Key": key,
+            "IfMatch": version.etag,
+            "Range": _byte_range(version, start, end),
+        }
+        if version.version_id:
+            parameters["VersionId"] = version.version_id
+        try:
+            response = self._client.get_object(**parameters)
+        except Exception as exc:
+            if _is_missing_error(exc):
+                raise UploadObjectMissingError from exc
+            if _is_precondition_error(exc):
+                raise UploadStorageChangedError from None
+            raise UploadStorageError from exc
+        return _ranged_body(response, version, start, end)
+
     def public_url(self, key: str) -> str:
         if not self.supports_public_urls:
             raise PublicUploadUrlUnsupportedError
@@ -933,6 +1335,33 @@ class S3UploadAdapter:
     ) -> IO[bytes]:
         return self.open_stage(key, version)
 
+    def open_download_range(
+        self,
+        key: str,
+        version: ObjectVersion,
+        *,
+        start: int,
+        end: int,
+    ) -> IO[bytes]:
+        if not version.version_id:
+            raise _exception(
+                UploadBackendUnsupportedError,
+                "S3 retained downloads require an immutable VersionId.",
+            )
+        parameters: dict[str, object] = {
+            "Bucket": self._bucket,
+            "Key": key,
+            "VersionId": version.version_id,
+            "Range": _byte_range(version, start, end),
+        }
+        if version.etag:
+            parameters["IfMatch"] = version.etag
+        response = _sdk_call(
+            lambda: self._client.get_object(**parameters),
+            "S3 could not open the retained download range.",
+        )
+        return _ranged_body(response, version, start, end)
+
     def public_url(self, key: str) -> str:
         if not self.supports_public_urls:
             raise _exception(
@@ -1389,7 +1818,7 @@ def _object_version(response: Mapping[str, object]) -> ObjectVersion:
 def _proxy_object_version(response: Mapping[str, object]) -> ObjectVersion:
     version_id = response.get("VersionId")
     etag = response.get("ETag")
-    checksum = response.get("ChecksumSHA256")
+    checksum = _proxy_checksum(response)
     size = response.get("ContentLength")
     content_type = response.get("ContentType")
     if (
@@ -1411,6 +1840,23 @@ def _proxy_object_version(response: Mapping[str, object]) -> ObjectVersion:
     )
 
 
+def _proxy_checksum(response: Mapping[str, object]) -> object:
+    """Return the full-object SHA-256 reported for a proxy object.
+
+    Multipart stages only report a composite checksum of their part checksums.
+    Their full SHA-256 is the ``gm-checksum-sha256`` identity written when the
+    upload was created; the upload only completes once the streamed bytes
+    match it, and every exact read verifies it again.
+    """
+    checksum = response.get("ChecksumSHA256")
+    if not isinstance(checksum, str) or not _COMPOSITE_CHECKSUM.fullmatch(checksum):
+        return checksum
+    metadata = response.get("Metadata")
+    if not isinstance(metadata, Mapping):
+        return None
+    return metadata.get("gm-checksum-sha256")
+
+
 def _same_proxy_object(
     current: ObjectVersion,
     expected: ObjectVersion,
@@ -1479,6 +1925,41 @@ def _verified_body(
         _close_body(body)
 
 
+def _byte_range(version: ObjectVersion, start: int, end: int) -> str:
+    if not 0 <= start <= end < version.size:
+        raise _exception(
+            UploadStorageError,
+            "The requested range is outside the retained object version.",
+        )
+    return f"bytes={start}-{end}"
+
+
+def _ranged_body(
+    response: Mapping[str, object],
+    version: ObjectVersion,
+    start: int,
+    end: int,
+) -> IO[bytes]:
+    """Return the streaming body after checking S3 served exactly the range.
+
+    Ranged reads cannot be hashed against the full-object checksum, so the
+    conditional ``IfMatch``/``VersionId`` request plus the total size in
+    ``Content-Range`` pin the bytes to the retained version instead.
+    """
+    body = response.get("Body")
+    if body is None or not hasattr(body, "read"):
+        if body is not None:
+            _close_body(body)
+        raise UploadStorageError
+    if (
+        response.get("ContentRange") != f"bytes {start}-{end}/{version.size}"
+        or response.get("ContentLength") != end - start + 1
+    ):
+        _close_body(body)
+        raise UploadStorageChangedError
+    return cast(IO[bytes], body)
+
+
 def _matches_materialization(
     response: Mapping[str, object],
     version: ObjectVersion,
@@ -1491,6 +1972,10 @@ def _matches_materialization(
         return False
     if any(metadata.get(key) != value for key, value in identity.items()):
         return False
+    if isinstance(checksum, str) and _COMPOSITE_CHECKSUM.fullmatch(checksum):
+        # Part copies only report a composite checksum; the copied identity
+        # carries the full SHA-256 verified when the stage was written.
+        return metadata.get("gm-checksum-sha256") == version.checksum_sha256
     return isinstance(checksum, str) and (
         _base64_checksum_to_hex(checksum) == version.checksum_sha256
     )
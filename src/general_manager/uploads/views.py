@@ -11,25 +11,39 @@ import posixpath
 import re
 import secrets
 import time
-from collections.abc import Mapping
-from typing import Any, Iterator, Never, cast
+from collections.abc import Callable, Mapping
+from functools import partial
+from typing import IO, Any, Iterator, Never, cast
 from urllib.parse import quote
 from uuid import UUID
 
 from django.core.cache import cache, caches
 from django.core.cache.backends.base import BaseCache
 from django.db import DEFAULT_DB_ALIAS, OperationalError, models
-from django.http import FileResponse, HttpRequest, HttpResponse, JsonResponse
+from django.http import (
+    FileResponse,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseNotModified,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.utils import timezone
+from django.utils.http import parse_etags
 from django.views.decorators.csrf import csrf_exempt
 
-from general_manager.uploads.adapters import ProxyUploadSink
+from general_manager.uploads.adapters import (
+    ProxyUploadSink,
+    RangedDownloadAdapter,
+    UploadAdapter,
+)
 from general_manager.uploads.config import FileUploadSettings, get_file_upload_settings
 from general_manager.uploads.graphql_types import (
     _final_object_version,
     _key_digest,
     decode_local_download_capability,
 )
+from general_manager.uploads.errors import UploadStorageChangedError
 from general_manager.uploads.models import UploadIntent
 from general_manager.uploads.metrics import (
     observe_upload_duration,
@@ -143,6 +157,9 @@ _DOWNLOAD_NOT_FOUND_ERROR = _TransferError(
 _SAFE_DOWNLOAD_MEDIA_TYPE = re.compile(
     r"^[a-z0-9][a-z0-9!#$&^_.+-]*/[a-z0-9][a-z0-9!#$&^_.+-]*$"
 )
+_BYTE_RANGE_SPEC = re.compile(r"(?P<first>[0-9]{0,19})\s*-\s*(?P<last>[0-9]{0,19})")
+_MAX_DOWNLOAD_RANGE_SPECS = 64
+_MAX_DOWNLOAD_RANGES = 16
 
 
 class _DownloadUnavailable(Exception):
@@ -870,7 +887,7 @@ def _private_download(request: HttpRequest, capability: str) -> HttpResponse:
     storage = model_field.storage
     retained_intent: UploadIntent | None = None
     retained_version: ObjectVersion | None = None
-    opened: object | None = None
+    adapter: UploadAdapter | None = None
     if typed_intent_id is not None:
         try:
             retained_intent = UploadIntent.objects.using(
@@ -889,14 +906,6 @@ def _private_download(request: HttpRequest, capability: str) -> HttpResponse:
         retained_version = _final_object_version(retained_intent)
         if retained_version is None:
             raise _DownloadUnavailable
-        try:
-            opened = adapter.open_download(current_key, retained_version)
-        except Exception as exc:
-            raise _DownloadUnavailable from exc
-        if not callable(getattr(opened, "read", None)) or not callable(
-            getattr(opened, "close", None)
-        ):
-            raise _DownloadUnavailable
     else:
         # Existing files without retained upload metadata use current-key
         # behavior. Once a consumed intent owns this binding, an unbound legacy
@@ -934,36 +943,314 @@ def _private_download(request: HttpRequest, capability: str) -> HttpResponse:
         )
     filename = _download_basename(original_name or current_key)
     media_type = _safe_download_content_type(content_type, filename)
+
+    # Only retained versions have an immutable identity to validate against.
+    # Legacy current-key downloads still honor plain ranges but never 304.
+    etag: str | None = None
+    size: int | None = None
+    if adapter is not None and retained_version is not None:
+        etag = f'"{retained_version.checksum_sha256}"'
+        size = retained_version.size
+        if _etag_listed(request.headers.get("If-None-Match"), etag):
+            _inspect_retained_download(adapter, current_key, retained_version)
+            not_modified = HttpResponseNotModified()
+            _set_download_headers(not_modified, filename, etag=etag)
+            return not_modified
+
+    ranges: list[tuple[int, int]] | None = None
+    range_header = request.headers.get("Range")
+    if (
+        request.method == "GET"
+        and range_header is not None
+        and _if_range_matches(request.headers.get("If-Range"), etag)
+    ):
+        if size is None:
+            size = _storage_size(storage, current_key)
+        if size is not None:
+            ranges = _parse_byte_ranges(range_header, size)
+
     if request.method == "HEAD":
         response = HttpResponse(content_type=media_type)
-        if retained_version is not None:
-            size = retained_version.size
-            cast(Any, opened).close()
+        if adapter is not None and retained_version is not None:
+            _inspect_retained_download(adapter, current_key, retained_version)
         else:
-            try:
-                size = storage.size(current_key)
-            except Exception:  # noqa: BLE001 - length is optional for HEAD
-                size = None
-        if isinstance(size, int) and not isinstance(size, bool) and size >= 0:
+            size = _storage_size(storage, current_key)
+        if size is not None:
             response["Content-Length"] = str(size)
+    elif ranges is not None and size is not None:
+        if not ranges:
+            if adapter is not None and retained_version is not None:
+                _inspect_retained_download(adapter, current_key, retained_version)
+            response = HttpResponse(status=416, content_type=media_type)
+            response["Content-Range"] = f"bytes */{size}"
+        else:
+            response = _range_response(
+                _open_download_ranges(adapter, storage, current_key, retained_version),
+                ranges,
+                size=size,
+                media_type=media_type,
+            )
     else:
-        if opened is None:
-            try:
-                opened = storage.open(current_key, "rb")
-            except Exception as exc:
-                raise _DownloadUnavailable from exc
+        opened = _open_whole_download(adapter, storage, current_key, retained_version)
         try:
             response = cast(
                 HttpResponse,
                 FileResponse(cast(Any, opened), content_type=media_type),
             )
         except Exception:
-            cast(Any, opened).close()
+            opened.close()
             raise
-    _set_download_headers(response, filename)
+    response["Accept-Ranges"] = "bytes"
+    _set_download_headers(response, filename, etag=etag)
     return response
 
 
+def _inspect_retained_download(
+    adapter: UploadAdapter,
+    key: str,
+    version: ObjectVersion,
+) -> None:
+    try:
+        adapter.inspect_download(key, version)
+    except Exception as exc:
+        raise _DownloadUnavailable from exc
+
+
+def _storage_size(storage: Any, key: str) -> int | None:
+    try:
+        size = storage.size(key)
+    except Exception:  # noqa: BLE001 - length is optional for legacy files
+        return None
+    if isinstance(size, int) and not isinstance(size, bool) and size >= 0:
+        return size
+    return None
+
+
+def _open_whole_download(
+    adapter: UploadAdapter | None,
+    storage: Any,
+    key: str,
+    version: ObjectVersion | None,
+) -> IO[bytes]:
+    opened: object
+    try:
+        if adapter is not None and version is not None:
+            opened = adapter.open_download(key, version)
+        else:
+            opened = storage.open(key, "rb")
+    except Exception as exc:
+        raise _DownloadUnavailable from exc
+    if not callable(getattr(opened, "read", None)) or not callable(
+        getattr(opened, "close", None)
+    ):
+        raise _DownloadUnavailable
+    return cast(IO[bytes], opened)
+
+
+def _open_download_ranges(
+    adapter: UploadAdapter | None,
+    storage: Any,
+    key: str,
+    version: ObjectVersion | None,
+) -> _DownloadRanges:
+    if version is not None and isinstance(adapter, RangedDownloadAdapter):
+        return _DownloadRanges(partial(adapter.open_download_range, key, version))
+    # Adapters without ranged reads verify the whole object once; every range
+    # then seeks within that verified handle.
+    return _DownloadRanges(
+        whole=_open_whole_download(adapter, storage, key, version),
+    )
+
+
+class _DownloadRanges:
+    """Open inclusive byte ranges of one download and close what it opened."""
+
+    def __init__(
+        self,
+        open_range: Callable[..., IO[bytes]] | None = None,
+        *,
+        whole: IO[bytes] | None = None,
+    ) -> None:
+        self._open_range = open_range
+        self._whole = whole
+        self._current: IO[bytes] | None = None
+
+    def open(self, start: int, end: int) -> IO[bytes]:
+        if self._whole is not None:
+            self._whole.seek(start)
+            return self._whole
+        if self._open_range is None:
+            raise _DownloadUnavailable
+        self._close_current()
+        self._current = self._open_range(start=start, end=end)
+        return self._current
+
+    def close(self) -> None:
+        self._close_current()
+        whole, self._whole = self._whole, None
+        if whole is not None:
+            whole.close()
+
+    def _close_current(self) -> None:
+        current, self._current = self._current, None
+        if current is not None:
+            current.close()
+
+
+class _RangeStream:
+    """Stream byte-range parts and close the download when iteration ends."""
+
+    def __init__(
+        self,
+        ranges: _DownloadRanges,
+        parts: list[tuple[bytes, int, int]],
+        trailer: bytes = b"",
+    ) -> None:
+        self._ranges = ranges
+        self._parts = parts
+        self._trailer = trailer
+        # Open the first part eagerly so storage failures become a 404 rather
+        # than a truncated 206 after the headers were sent.
+        try:
+            _header, start, end = parts[0]
+            self._first: IO[bytes] | None = ranges.open(start, end)
+        except Exception:
+            ranges.close()
+            raise
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            for header, start, end in self._parts:
+                opened = self._first
+                if opened is None:
+                    opened = self._ranges.open(start, end)
+                self._first = None
+                if header:
+                    yield header
+                remaining = end - start + 1
+                while remaining > 0:
+                    chunk = opened.read(min(_STREAM_CHUNK_BYTES, remaining))
+                    if not isinstance(chunk, bytes) or not chunk:
+                        raise UploadStorageChangedError
+                    remaining -= len(chunk)
+                    yield chunk
+            if self._trailer:
+                yield self._trailer
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self._ranges.close()
+
+
+def _range_response(
+    ranges: _DownloadRanges,
+    byte_ranges: list[tuple[int, int]],
+    *,
+    size: int,
+    media_type: str,
+) -> HttpResponse:
+    if len(byte_ranges) == 1:
+        start, end = byte_ranges[0]
+        response = StreamingHttpResponse(
+            _RangeStream(ranges, [(b"", start, end)]),
+            status=206,
+            content_type=media_type,
+        )
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Length"] = str(end - start + 1)
+        return cast(HttpResponse, response)
+    boundary = secrets.token_hex(16)
+    parts = [
+        (
+            (
+                f"\r\n--{boundary}\r\nContent-Type: {media_type}\r\n"
+                f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n"
+            ).encode("ascii"),
+            start,
+            end,
+        )
+        for start, end in byte_ranges
+    ]
+    trailer = f"\r\n--{boundary}--\r\n".encode("ascii")
+    response = StreamingHttpResponse(
+        _RangeStream(ranges, parts, trailer),
+        status=206,
+        content_type=f"multipart/byteranges; boundary={boundary}",
+    )
+    response["Content-Length"] = str(
+        sum(len(header) + end - start + 1 for header, start, end in parts)
+        + len(trailer)
+    )
+    return cast(HttpResponse, response)
+
+
+def _parse_byte_ranges(value: str, size: int) -> list[tuple[int, int]] | None:
+    """
+    Parse a ``Range`` header into sorted, coalesced inclusive byte ranges.
+
+    Returns ``None`` when the header should be ignored (other units, malformed
+    specs, or more ranges than ``_MAX_DOWNLOAD_RANGES`` after coalescing) and
+    an empty list when no range is satisfiable for ``size`` bytes.
+    """
+    unit, separator, specs = value.partition("=")
+    if not separator or unit.strip().lower() != "bytes":
+        return None
+    items = [item for item in (spec.strip() for spec in specs.split(",")) if item]
+    if not items or len(items) > _MAX_DOWNLOAD_RANGE_SPECS:
+        return None
+    requested: list[tuple[int, int]] = []
+    for item in items:
+        match = _BYTE_RANGE_SPEC.fullmatch(item)
+        if match is None:
+            return None
+        first, last = match.group("first"), match.group("last")
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+            if last and end < start:
+                return None
+        elif last:
+            suffix = int(last)
+            if suffix == 0:
+                continue
+            start, end = max(size - suffix, 0), size - 1
+        else:
+            return None
+        if start < size:
+            requested.append((start, min(end, size - 1)))
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(requested):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    if len(merged) > _MAX_DOWNLOAD_RANGES:
+        return None
+    return merged
+
+
+def _etag_listed(value: str | None, etag: str) -> bool:
+    """Return whether ``If-None-Match`` matches ``etag`` (weak comparison)."""
+    if not value:
+        return False
+    candidates = parse_etags(value)
+    return "*" in candidates or any(
+        candidate.removeprefix("W/") == etag for candidate in candidates
+    )
+
+
+def _if_range_matches(value: str | None, etag: str | None) -> bool:
+    """Return whether a ``Range`` header may apply under ``If-Range``.
+
+    Only a strong match against the retained ETag qualifies. HTTP dates are
+    never accepted because no ``Last-Modified`` validator is sent.
+    """
+    if value is None:
+        return True
+    return etag is not None and value.strip() == etag
+
+
 def _download_metadata(
     *,
     manager_name: str,
@@ -1014,7 +1301,12 @@ def _safe_download_content_type(value: str | None, filename: str) -> str:
     )
 
 
-def _set_download_headers(response: HttpResponse, filename: str) -> None:
+def _set_download_headers(
+    response: HttpResponse,
+    filename: str,
+    *,
+    etag: str | None = None,
+) -> None:
     fallback = (
         "".join(
             character if 32 <= ord(character) < 127 else "_" for character in filename
@@ -1028,5 +1320,11 @@ def _set_download_headers(response: HttpResponse, filename: str) -> None:
     )
     response["X-Content-Type-Options"] = "nosniff"
     response["Referrer-Policy"] = "no-referrer"
-    response["Cache-Control"] = "private, no-store"
+    if etag is None:
+        response["Cache-Control"] = "private, no-store"
+    else:
+        # Retained versions are immutable, so clients may keep a private copy
+        # but must revalidate the capability before every reuse.
+        response["ETag"] = etag
+        response["Cache-Control"] = "private, no-cache"
     response["Content-Security-Policy"] = "sandbox"
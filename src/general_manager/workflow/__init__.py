@@ -36,6 +36,7 @@ from general_manager.workflow.event_registry import (
     configure_event_registry_from_settings,
     get_event_registry,
     publish_sync,
+    workflow_event_batch,
 )
 from general_manager.workflow.events import (
     manager_created_event,
@@ -84,4 +85,5 @@ __all__ = [
     "manager_deleted_event",
     "manager_updated_event",
     "publish_sync",
+    "workflow_event_batch",
 ]
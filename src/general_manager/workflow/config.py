@@ -130,6 +130,18 @@ def workflow_outbox_process_chunk_size(
     )
 
 
+def workflow_outbox_route_concurrency(
+    django_settings: SettingsLike = settings,
+) -> int:
+    """Return how many outbox rows one batch routes at once, clamped to at least 1."""
+    return _bounded_int(
+        django_settings,
+        "WORKFLOW_OUTBOX_ROUTE_CONCURRENCY",
+        default=1,
+        minimum=1,
+    )
+
+
 def workflow_outbox_claim_ttl_seconds(django_settings: SettingsLike = settings) -> int:
     """Return outbox claim lease TTL, clamped to at least 1 second."""
     return _bounded_int(
@@ -170,6 +182,23 @@ def workflow_dead_letter_enabled(django_settings: SettingsLike = settings) -> bo
     )
 
 
+def workflow_signal_bridge_skip_unrouted(
+    django_settings: SettingsLike = settings,
+) -> bool:
+    """Return whether the signal bridge skips mutations no handler routes.
+
+    The check runs against the registry of the publishing process, so it is
+    only safe when every process that saves managers registers the same
+    handlers as the workers. Values are coerced with `bool(...)` and default
+    to `False`.
+    """
+    return bool(
+        _config_or_setting(
+            django_settings, "WORKFLOW_SIGNAL_BRIDGE_SKIP_UNROUTED", False
+        )
+    )
+
+
 def workflow_delivery_running_timeout_seconds(
     django_settings: SettingsLike = settings,
 ) -> int:
@@ -180,3 +209,96 @@ def workflow_delivery_running_timeout_seconds(
         default=300,
         minimum=1,
     )
+
+
+def workflow_outbox_dispatcher_enabled(
+    django_settings: SettingsLike = settings,
+) -> bool:
+    """Return whether a long-running dispatcher drains the outbox.
+
+    When enabled, async publishes stop enqueuing a `publish_outbox_batch` task
+    per commit and notify the dispatcher instead. Values are coerced with
+    `bool(...)` and default to `False`.
+    """
+    return bool(
+        _config_or_setting(django_settings, "WORKFLOW_OUTBOX_DISPATCHER", False)
+    )
+
+
+def workflow_outbox_notify_channel(django_settings: SettingsLike = settings) -> str:
+    """Return the PostgreSQL `LISTEN`/`NOTIFY` channel for outbox wake-ups."""
+    value = _config_or_setting(
+        django_settings,
+        "WORKFLOW_OUTBOX_NOTIFY_CHANNEL",
+        "general_manager_workflow_outbox",
+    )
+    return str(value).strip() or "general_manager_workflow_outbox"
+
+
+def workflow_dispatcher_min_poll_ms(django_settings: SettingsLike = settings) -> int:
+    """Return the dispatcher's first idle poll delay, clamped to at least 1 ms."""
+    return _bounded_int(
+        django_settings, "WORKFLOW_DISPATCHER_MIN_POLL_MS", default=10, minimum=1
+    )
+
+
+def workflow_dispatcher_max_poll_ms(django_settings: SettingsLike = settings) -> int:
+    """Return the dispatcher's longest idle wait, clamped to at least 1 ms."""
+    return _bounded_int(
+        django_settings, "WORKFLOW_DISPATCHER_MAX_POLL_MS", default=2000, minimum=1
+    )
+
+
+def workflow_retention_enabled(django_settings: SettingsLike = settings) -> bool:
+    """Return whether Celery Beat runs the workflow retention sweep.
+
+    Values are coerced with `bool(...)` and default to `False`. The sweep itself
+    can always be run with the `workflow_purge_history` command.
+    """
+    return bool(
+        _config_or_setting(django_settings, "WORKFLOW_RETENTION_ENABLED", False)
+    )
+
+
+def workflow_retention_processed_days(django_settings: SettingsLike = settings) -> int:
+    """Return how long processed outbox history is kept, at least 1 day."""
+    return _bounded_int(
+        django_settings, "WORKFLOW_RETENTION_PROCESSED_DAYS", default=7, minimum=1
+    )
+
+
+def workflow_retention_dead_letter_days(
+    django_settings: SettingsLike = settings,
+) -> int:
+    """Return how long dead-letter outbox history is kept; `0` keeps it forever."""
+    return _bounded_int(
+        django_settings, "WORKFLOW_RETENTION_DEAD_LETTER_DAYS", default=30, minimum=0
+    )
+
+
+def workflow_retention_batch_size(django_settings: SettingsLike = settings) -> int:
+    """Return how many events one retention chunk removes, at least 1."""
+    return _bounded_int(
+        django_settings, "WORKFLOW_RETENTION_BATCH_SIZE", default=1000, minimum=1
+    )
+
+
+def workflow_retention_max_batches(django_settings: SettingsLike = settings) -> int:
+    """Return how many chunks one retention sweep may remove, at least 1."""
+    return _bounded_int(
+        django_settings, "WORKFLOW_RETENTION_MAX_BATCHES", default=50, minimum=1
+    )
+
+
+def workflow_retention_interval_seconds(
+    django_settings: SettingsLike = settings,
+) -> int:
+    """Return the Celery Beat interval of the retention sweep, at least 1 second."""
+    return _bounded_int(
+        django_settings, "WORKFLOW_RETENTION_INTERVAL_SECONDS", default=3600, minimum=1
+    )
+
+
+def workflow_retention_archiver(django_settings: SettingsLike = settings) -> object:
+    """Return the configured `WORKFLOW_RETENTION_ARCHIVER` callable or import path."""
+    return _config_or_setting(django_settings, "WORKFLOW_RETENTION_ARCHIVER", None)
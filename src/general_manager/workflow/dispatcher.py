@@ -0,0 +1,232 @@
+"""Long-running workflow outbox dispatcher with push wake-ups."""
+
+from __future__ import annotations
+
+import re
+from importlib.metadata import PackageNotFoundError, version
+from select import select
+from threading import Event
+from typing import Protocol, cast
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+from general_manager.logging import get_logger
+from general_manager.workflow.config import (
+    workflow_dispatcher_max_poll_ms,
+    workflow_dispatcher_min_poll_ms,
+    workflow_outbox_notify_channel,
+    workflow_outbox_process_chunk_size,
+)
+from general_manager.workflow.event_registry import (
+    DatabaseEventRegistry,
+    get_event_registry,
+)
+from general_manager.workflow.tasks import route_outbox_claims_batch
+from general_manager.workflow.telemetry import set_outbox_snapshot
+
+logger = get_logger("workflow.dispatcher")
+
+
+class _Psycopg2Connection(Protocol):
+    notifies: list[object]
+
+    def fileno(self) -> int: ...
+
+    def poll(self) -> None: ...
+
+
+def _psycopg_notifies_accepts_timeout() -> bool:
+    """Return whether psycopg 3's `Connection.notifies()` takes a timeout (3.2+)."""
+    try:
+        installed = version("psycopg")
+    except PackageNotFoundError:
+        return False
+    match = re.match(r"(\d+)\.(\d+)", installed)
+    return match is not None and (int(match[1]), int(match[2])) >= (3, 2)
+
+
+class _OutboxListener:
+    """
+    Block on PostgreSQL `LISTEN` notifications for the outbox channel.
+
+    Supports psycopg 3.2+ (`Connection.notifies()` with a timeout) and psycopg2
+    (`select()` on the socket, then `poll()`). The listening connection must be
+    in autocommit mode, which is Django's default outside `atomic()` blocks.
+    When Django replaces the underlying connection, `LISTEN` is issued again
+    on the new one.
+    """
+
+    def __init__(self, connection: BaseDatabaseWrapper, channel: str) -> None:
+        self._connection = connection
+        self._channel = channel
+        self._pending = False
+        self._raw: object | None = None
+        self._listen()
+
+    def _listen(self) -> None:
+        connection = self._connection
+        connection.ensure_connection()
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {connection.ops.quote_name(self._channel)}")
+        raw = connection.connection
+        add_handler = getattr(raw, "add_notify_handler", None)
+        if callable(add_handler):
+            # psycopg 3 hands notifications received during other queries to
+            # handlers only, so record them for the next wait.
+            add_handler(self._on_notify)
+        self._raw = raw
+
+    def _on_notify(self, _notification: object) -> None:
+        self._pending = True
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Return whether a notification arrived within `timeout` seconds.
+
+        Also returns `True` right after re-issuing `LISTEN` on a new connection,
+        so the caller drains rows that may have been announced in between.
+        """
+        raw = self._connection.connection
+        if raw is not self._raw:
+            # A reconnect dropped the old session's LISTEN, and rows committed
+            # in between were announced to nobody.
+            self._listen()
+            self._pending = False
+            return True
+        if self._pending:
+            self._pending = False
+            return True
+        notifies = getattr(raw, "notifies", None)
+        if callable(notifies):
+            received = list(notifies(timeout=timeout, stop_after=1))
+            self._pending = False
+            return bool(received)
+        psycopg2_connection = cast(_Psycopg2Connection, raw)
+        if psycopg2_connection.notifies:
+            psycopg2_connection.notifies.clear()
+            return True
+        readable, _, _ = select([psycopg2_connection], [], [], timeout)
+        if not readable:
+            return False
+        psycopg2_connection.poll()
+        received_any = bool(psycopg2_connection.notifies)
+        psycopg2_connection.notifies.clear()
+        return received_any
+
+
+class OutboxDispatcher:
+    """
+    Drain the workflow outbox continuously in the current process.
+
+    Each wake-up claims and routes batches of `WORKFLOW_OUTBOX_PROCESS_CHUNK_SIZE`
+    rows inline until no row is due. On PostgreSQL the idle loop blocks on
+    `LISTEN` for the `WORKFLOW_OUTBOX_NOTIFY_CHANNEL` channel, which
+    `DatabaseEventRegistry` notifies on commit when `WORKFLOW_OUTBOX_DISPATCHER`
+    is enabled, and re-polls at least every `WORKFLOW_DISPATCHER_MAX_POLL_MS` so
+    retry backoffs and expired claims are still picked up. Other databases, and
+    PostgreSQL with psycopg 3 older than 3.2, poll with a delay that starts at `WORKFLOW_DISPATCHER_MIN_POLL_MS`, doubles on
+    every empty poll up to the maximum, and resets as soon as rows are found.
+
+    Outbox snapshot telemetry is refreshed whenever the loop goes idle after
+    routing rows. Routing runs in this process, so no Celery message is sent
+    per batch.
+    """
+
+    def __init__(
+        self,
+        *,
+        using: str = DEFAULT_DB_ALIAS,
+        min_poll_seconds: float | None = None,
+        max_poll_seconds: float | None = None,
+    ) -> None:
+        self.using = using
+        self.min_poll_seconds = (
+            workflow_dispatcher_min_poll_ms() / 1000.0
+            if min_poll_seconds is None
+            else min_poll_seconds
+        )
+        self.max_poll_seconds = max(
+            self.min_poll_seconds,
+            workflow_dispatcher_max_poll_ms() / 1000.0
+            if max_poll_seconds is None
+            else max_poll_seconds,
+        )
+
+    def drain(self) -> int:
+        """
+        Claim and route outbox batches until no row is due.
+
+        Returns:
+            int: Number of rows claimed. `0` when the active registry is not a
+            `DatabaseEventRegistry`.
+        """
+        registry = get_event_registry()
+        if not isinstance(registry, DatabaseEventRegistry):
+            return 0
+        batch_size = workflow_outbox_process_chunk_size()
+        claimed = 0
+        while True:
+            claims = registry.claim_outbox_batch(batch_size=batch_size)
+            if not claims:
+                return claimed
+            route_outbox_claims_batch(claims)
+            claimed += len(claims)
+
+    def run(self, stop: Event | None = None) -> None:
+        """
+        Drain and wait until `stop` is set.
+
+        Exceptions from claiming or telemetry propagate and end the loop;
+        per-row routing failures are isolated by `route_outbox_claims_batch()`.
+        """
+        stop = stop if stop is not None else Event()
+        listener = self._listener()
+        delay = self.min_poll_seconds
+        refresh_snapshot = True
+        while not stop.is_set():
+            if self.drain():
+                delay = self.min_poll_seconds
+                refresh_snapshot = True
+                continue
+            if refresh_snapshot:
+                self._record_snapshot()
+                refresh_snapshot = False
+            if listener is not None:
+                listener.wait(self.max_poll_seconds)
+                continue
+            stop.wait(delay)
+            delay = min(delay * 2, self.max_poll_seconds)
+
+    def _listener(self) -> _OutboxListener | None:
+        connection = connections[self.using]
+        if connection.vendor != "postgresql":
+            return None
+        channel = workflow_outbox_notify_channel()
+        connection.ensure_connection()
+        notifies = getattr(connection.connection, "notifies", None)
+        if callable(notifies) and not _psycopg_notifies_accepts_timeout():
+            logger.warning(
+                "workflow outbox dispatcher polling without LISTEN",
+                context={
+                    "database_alias": self.using,
+                    "reason": "psycopg 3.2+ is required to wait for notifications",
+                },
+            )
+            return None
+        logger.info(
+            "workflow outbox dispatcher listening",
+            context={"channel": channel, "database_alias": self.using},
+        )
+        return _OutboxListener(connection, channel)
+
+    @staticmethod
+    def _record_snapshot() -> None:
+        registry = get_event_registry()
+        if not isinstance(registry, DatabaseEventRegistry):
+            return
+        pending_count, oldest_age = registry.outbox_snapshot()
+        set_outbox_snapshot(
+            pending_count=pending_count,
+            oldest_pending_age_seconds=oldest_age,
+        )
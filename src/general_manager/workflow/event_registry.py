@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from hashlib import sha1
 from time import perf_counter
 from collections import deque
-from collections.abc import Callable, Mapping
-from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from threading import Lock, local
 from traceback import format_exc
 from typing import TYPE_CHECKING, Protocol, cast, runtime_checkable
 from uuid import uuid4
 
-from django.db import IntegrityError, models, transaction
+from django.db import IntegrityError, connections, models, transaction
 from django.db.models import Min
 from django.utils.module_loading import import_string
 
@@ -25,6 +29,9 @@ from general_manager.workflow.config import (
     workflow_mode,
     workflow_outbox_batch_size,
     workflow_outbox_claim_ttl_seconds,
+    workflow_outbox_dispatcher_enabled,
+    workflow_outbox_notify_channel,
+    workflow_outbox_route_concurrency,
     workflow_max_retries,
     workflow_retry_backoff_seconds,
 )
@@ -37,7 +44,7 @@ from general_manager.workflow.telemetry import (
 )
 
 if TYPE_CHECKING:
-    from general_manager.workflow.models import WorkflowEventRecord
+    from general_manager.workflow.models import WorkflowEventRecord, WorkflowOutbox
 
 
 type WorkflowEventPayload = Mapping[str, object]
@@ -119,6 +126,24 @@ class _RoutingOutcome:
     had_applicable_handlers: bool
 
 
+@dataclass
+class _AttemptState:
+    """Last known state of a delivery-attempt row within one outbox batch."""
+
+    pk: int
+    status: str
+    attempts: int
+    updated_at: datetime
+
+
+@dataclass
+class _DeliveryBatch:
+    """Event primary keys and delivery attempts preloaded for a claimed batch."""
+
+    event_pks: dict[str, int]
+    attempts: dict[str, _AttemptState]
+
+
 @dataclass(frozen=True)
 class _EventHandlerRegistration:
     event_key: str
@@ -131,6 +156,227 @@ class _EventHandlerRegistration:
     dead_letter_handler: DeadLetterHandler | None = None
 
 
+@dataclass(eq=False)
+class _PendingWake:
+    """One outbox wake-up awaiting its own source-commit callback."""
+
+    sequence: int
+    registry: DatabaseEventRegistry
+    savepoints: frozenset[str] = frozenset()
+    confirmed: bool = False
+
+
+class _WakeCollector:
+    """Coalesce commit-confirmed outbox wake-ups for one thread and alias.
+
+    Every write keeps its own ``on_commit`` callback, so Django still drops
+    wake-ups requested inside a rolled-back savepoint. Callbacks run in
+    registration order; a callback enqueues one drain per registry for
+    everything confirmed so far unless a later pending wake-up is known to
+    survive the commit. A later wake-up survives when all savepoints it was
+    requested in also enclose a confirmed one; wake-ups under other savepoints
+    may have been discarded, so they never hold back the drain.
+    """
+
+    def __init__(self, database_alias: str) -> None:
+        """Start an empty collector for one database alias."""
+        self.database_alias = database_alias
+        self._pending: dict[int, _PendingWake] = {}
+        self._next_sequence = 0
+
+    def add(
+        self,
+        registry: DatabaseEventRegistry,
+        *,
+        savepoints: frozenset[str] = frozenset(),
+    ) -> _PendingWake:
+        """Retain one wake-up until its transaction commits."""
+        self._next_sequence += 1
+        pending = _PendingWake(
+            sequence=self._next_sequence,
+            registry=registry,
+            savepoints=savepoints,
+        )
+        self._pending[pending.sequence] = pending
+        return pending
+
+    def release(self, savepoints: frozenset[str]) -> None:
+        """Stop tracking savepoints that were released into their parent."""
+        for retained in self._pending.values():
+            if not retained.confirmed:
+                retained.savepoints -= savepoints
+
+    def confirm(self, pending: _PendingWake) -> None:
+        """Record one committed wake-up and drain once no later one is pending."""
+        if self._pending.get(pending.sequence) is not pending:
+            # A nested commit inside another commit hook already swept this
+            # wake-up as stale; its rows are committed, so drain for it alone.
+            pending.confirmed = True
+            _enqueue_confirmed_wakes((pending,))
+            return
+        pending.confirmed = True
+        later_pending: list[_PendingWake] = []
+        for sequence, retained in tuple(self._pending.items()):
+            if retained.confirmed:
+                continue
+            if sequence < pending.sequence:
+                # Earlier callbacks always run first, so this wake-up was
+                # discarded by a savepoint or transaction rollback.
+                del self._pending[sequence]
+            else:
+                later_pending.append(retained)
+        confirmed = tuple(
+            retained for retained in self._pending.values() if retained.confirmed
+        )
+        released = frozenset().union(*(retained.savepoints for retained in confirmed))
+        if any(later.savepoints <= released for later in later_pending):
+            # That callback is still queued and will drain for this write too.
+            return
+        for retained in confirmed:
+            del self._pending[retained.sequence]
+        _enqueue_confirmed_wakes(confirmed)
+
+
+def _enqueue_confirmed_wakes(wakes: tuple[_PendingWake, ...]) -> None:
+    """Enqueue one outbox drain per registry for committed wake-ups."""
+    registries = {id(wake.registry): wake.registry for wake in wakes}
+    for registry in registries.values():
+        registry._enqueue_publish_task()
+
+
+_BULK_PUBLISH_CHUNK_SIZE = 500
+_wake_collectors = local()
+
+
+def _wake_collector(database_alias: str) -> _WakeCollector:
+    """Return this thread's wake-up collector for an alias, creating it lazily."""
+    collectors: dict[str, _WakeCollector] | None = getattr(
+        _wake_collectors, "by_alias", None
+    )
+    if collectors is None:
+        collectors = {}
+        _wake_collectors.by_alias = collectors
+    collector = collectors.get(database_alias)
+    if collector is None:
+        collector = _WakeCollector(database_alias)
+        collectors[database_alias] = collector
+    return collector
+
+
+def release_publish_savepoints(database_alias: str, savepoints: frozenset[str]) -> None:
+    """
+    Record that `savepoints` on `database_alias` were released, not rolled back.
+
+    Outbox wake-ups requested inside a released savepoint commit with its
+    parent, so they can share one drain with later writes at the parent level.
+    """
+    collectors: dict[str, _WakeCollector] | None = getattr(
+        _wake_collectors, "by_alias", None
+    )
+    collector = collectors.get(database_alias) if collectors is not None else None
+    if collector is not None:
+        collector.release(savepoints)
+
+
+def _active_savepoints(database_alias: str) -> frozenset[str]:
+    """Return the savepoints a callback registered now would be discarded with."""
+    savepoint_ids = transaction.get_connection(database_alias).savepoint_ids
+    return frozenset(sid for sid in savepoint_ids if sid is not None)
+
+
+@dataclass(eq=False)
+class EventBatch:
+    """Async publishes buffered at one savepoint level of a transaction."""
+
+    database_alias: str
+    savepoints: frozenset[str]
+    events: list[tuple[DatabaseEventRegistry, WorkflowEvent]] = field(
+        default_factory=list
+    )
+
+
+_active_event_batches: ContextVar[tuple[EventBatch, ...]] = ContextVar(
+    "general_manager_workflow_event_batches", default=()
+)
+
+
+def _current_event_batch(database_alias: str) -> EventBatch | None:
+    for batch in reversed(_active_event_batches.get()):
+        if batch.database_alias == database_alias:
+            return batch
+    return None
+
+
+def event_batch_active(database_alias: str) -> bool:
+    """Return whether async publishes on `database_alias` are being buffered."""
+    return _current_event_batch(database_alias) is not None
+
+
+def open_event_batch(database_alias: str) -> EventBatch:
+    """
+    Start buffering async publishes made at the current savepoint level.
+
+    Call this inside the atomic block whose events should be bulk inserted and
+    pair it with `flush_event_batch()` before the block exits and
+    `close_event_batch()` afterwards. Publishes made in a deeper savepoint are
+    written immediately, so a savepoint rollback still discards them.
+    """
+    batch = EventBatch(
+        database_alias=database_alias,
+        savepoints=_active_savepoints(database_alias),
+    )
+    _active_event_batches.set((*_active_event_batches.get(), batch))
+    return batch
+
+
+def flush_event_batch(batch: EventBatch) -> None:
+    """Bulk insert the events buffered in `batch` in the current transaction."""
+    events, batch.events = batch.events, []
+    _write_publishes(events, using=batch.database_alias)
+
+
+def close_event_batch(
+    batch: EventBatch,
+) -> list[tuple[DatabaseEventRegistry, WorkflowEvent]]:
+    """Stop buffering into `batch` and return the events it has not flushed."""
+    _active_event_batches.set(
+        tuple(active for active in _active_event_batches.get() if active is not batch)
+    )
+    events, batch.events = batch.events, []
+    return events
+
+
+def publish_buffered_events(
+    events: Sequence[tuple[DatabaseEventRegistry, WorkflowEvent]],
+    *,
+    using: str,
+) -> None:
+    """
+    Hand events of a released savepoint to the enclosing batch or write them.
+
+    Events join an active batch when the current savepoint level is the one
+    the batch was opened at; otherwise they are inserted right away.
+    """
+    parent = _current_event_batch(using)
+    if parent is not None and parent.savepoints == _active_savepoints(using):
+        parent.events.extend(events)
+        return
+    _write_publishes(events, using=using)
+
+
+def _write_publishes(
+    events: Sequence[tuple[DatabaseEventRegistry, WorkflowEvent]], *, using: str
+) -> None:
+    """Bulk insert buffered events and wake the outbox once per registry."""
+    by_registry: dict[int, tuple[DatabaseEventRegistry, list[WorkflowEvent]]] = {}
+    for registry, event in events:
+        _, grouped = by_registry.setdefault(id(registry), (registry, []))
+        grouped.append(event)
+    for registry, grouped in by_registry.values():
+        if registry._persist_events(grouped):
+            registry._wake_outbox(using=using)
+
+
 def _callable_path(value: object) -> str:
     bound_self = getattr(value, "__self__", None)
     bound_func = getattr(value, "__func__", None)
@@ -240,6 +486,8 @@ class _RoutingMixin:
     def __init__(self) -> None:
         self._handlers_by_type: dict[str, list[_EventHandlerRegistration]] = {}
         self._handlers_by_name: dict[str, list[_EventHandlerRegistration]] = {}
+        self._routed_types: frozenset[str] = frozenset()
+        self._routed_names: frozenset[str] = frozenset()
         self._lock = Lock()
 
     def register(
@@ -283,6 +531,20 @@ class _RoutingMixin:
             ):
                 return
             bucket.append(registration)
+            self._routed_types = frozenset(self._handlers_by_type)
+            self._routed_names = frozenset(self._handlers_by_name)
+
+    def has_routes(self, event_type: str, event_name: str | None = None) -> bool:
+        """
+        Return whether any handler is registered for `event_type` or `event_name`.
+
+        The answer comes from route-key sets rebuilt on every new registration,
+        so callers can skip building events nobody subscribes to without taking
+        the registry lock. `when` predicates are not evaluated.
+        """
+        return event_type in self._routed_types or (event_name or "") in (
+            self._routed_names
+        )
 
     def _get_entries(
         self, event: WorkflowEvent
@@ -327,7 +589,13 @@ class _RoutingMixin:
                 return False
         return False
 
-    def _route_event(self, event: WorkflowEvent) -> _RoutingOutcome:
+    def _route_event(
+        self,
+        event: WorkflowEvent,
+        *,
+        attempt_handler: Callable[[WorkflowEvent, _EventHandlerRegistration, int], bool]
+        | None = None,
+    ) -> _RoutingOutcome:
         handled = False
         had_applicable_handlers = False
         for entry in self._get_entries(event):
@@ -341,7 +609,9 @@ class _RoutingMixin:
                 continue
             had_applicable_handlers = True
             if self._run_handler_with_retry(
-                event, entry, attempt_handler=self._attempt_handler
+                event,
+                entry,
+                attempt_handler=attempt_handler or self._attempt_handler,
             ):
                 handled = True
         return _RoutingOutcome(
@@ -449,14 +719,36 @@ class InMemoryEventRegistry(_RoutingMixin):
         super()._send_to_dead_letter(event, exc, entry)
 
 
+def _ordering_key(payload: object, metadata: object) -> str | None:
+    """
+    Return the key whose outbox rows must be routed in claim order.
+
+    An explicit `metadata["ordering_key"]` wins; otherwise manager events are
+    ordered per `payload["manager"]` and `payload["identification"]`. Events
+    without either have no key and may be routed in any order.
+    """
+    if isinstance(metadata, Mapping) and metadata.get("ordering_key") is not None:
+        return str(metadata["ordering_key"])
+    if not isinstance(payload, Mapping):
+        return None
+    manager = payload.get("manager")
+    identification = payload.get("identification")
+    if manager is None or identification is None:
+        return None
+    return f"{manager}:{json.dumps(identification, sort_keys=True, default=str)}"
+
+
 class DatabaseEventRegistry(_RoutingMixin):
     """
     DB-backed event registry for production event durability.
 
-    `publish()` persists a `WorkflowEventRecord` and `WorkflowOutbox` row. In
-    async mode it schedules outbox processing after commit and returns `False`
-    because handlers have not run yet; otherwise it processes the outbox row
-    synchronously. Duplicate `event_id` values are suppressed by the event
+    `publish()` persists a `WorkflowEventRecord` and `WorkflowOutbox` row in
+    the caller's transaction. In async mode it returns `False` because
+    handlers have not run yet and schedules outbox processing after commit;
+    a transaction enqueues one drain however many events it writes. Async
+    publishes inside `workflow_event_batch()` or a manager mutation are
+    buffered and written with bulk inserts before that atomic block exits.
+    Otherwise it processes the outbox row synchronously. Duplicate `event_id` values are suppressed by the event
     record uniqueness constraint; duplicate `publish()` calls return `False`
     without creating or routing a new outbox row. Database registries do not have a
     registry-level dead-letter handler; use registration-level handlers for
@@ -482,24 +774,17 @@ class DatabaseEventRegistry(_RoutingMixin):
         return self._route_event(event).handled
 
     def publish(self, event: WorkflowEvent) -> bool:
-        from general_manager.workflow.models import WorkflowEventRecord, WorkflowOutbox
-
-        try:
-            with transaction.atomic():
-                event_record = WorkflowEventRecord.objects.create(
-                    event_id=event.event_id,
-                    event_type=event.event_type,
-                    event_name=event.event_name,
-                    source=event.source,
-                    occurred_at=event.occurred_at,
-                    payload=dict(event.payload),
-                    metadata=dict(event.metadata),
-                )
-                outbox = WorkflowOutbox.objects.create(event=event_record)
-        except IntegrityError:
+        if workflow_async_enabled():
+            alias = transaction.get_connection().alias
+            batch = _current_event_batch(alias)
+            if batch is not None and batch.savepoints == _active_savepoints(alias):
+                batch.events.append((self, event))
+                return False
+        outbox = self._persist_event(event)
+        if outbox is None:
             return False
         if workflow_async_enabled():
-            transaction.on_commit(self._enqueue_publish_task)
+            self._wake_outbox()
             return False
         return self.process_outbox_entry(int(outbox.pk))
 
@@ -662,6 +947,337 @@ class DatabaseEventRegistry(_RoutingMixin):
         )
         return outcome.handled
 
+    def process_outbox_batch(self, claims: Sequence[tuple[int, str]]) -> int:
+        """
+        Route a claimed outbox batch with set-based bookkeeping.
+
+        Behaves like calling `process_outbox_entry(outbox_id, claim_token=...)`
+        for every claim in order, but loads the outbox rows and their events in
+        one query, preloads every delivery attempt of those events in one query,
+        and marks successfully routed rows processed with one update. The rows
+        are read without a lock: the claim token guards ownership while routing,
+        and it is checked again under a row lock before any row is finalized.
+        Each handler attempt then costs one write to start it and one to record
+        its outcome. Failed rows are finalized individually so retry backoff
+        and dead-lettering stay unchanged. Exceptions from one row are logged
+        and do not stop later rows. With `WORKFLOW_OUTBOX_ROUTE_CONCURRENCY`
+        above 1, rows are routed on worker threads while rows sharing an
+        ordering key keep their claim order; see `_route_owned_rows()`.
+
+        Returns:
+            int: Number of rows whose routing completed at least one handler.
+        """
+        from general_manager.workflow.models import (
+            WorkflowDeliveryAttempt,
+            WorkflowOutbox,
+        )
+
+        ordered: list[tuple[int, str]] = []
+        for claim in claims:
+            try:
+                outbox_id, claim_token = claim
+                ordered.append((int(outbox_id), str(claim_token)))
+            except (TypeError, ValueError):
+                logger.exception(
+                    "workflow outbox batch item failed",
+                    context={"claim": repr(claim)},
+                )
+        if not ordered:
+            return 0
+        started = perf_counter()
+        rows = {
+            int(row.pk): row
+            for row in WorkflowOutbox.objects.select_related("event").filter(
+                id__in=[outbox_id for outbox_id, _ in ordered]
+            )
+        }
+        owned: list[tuple[WorkflowOutbox, str]] = []
+        for outbox_id, claim_token in ordered:
+            row = rows.get(outbox_id)
+            if row is None or row.status == WorkflowOutbox.STATUS_PROCESSED:
+                continue
+            if (
+                row.status != WorkflowOutbox.STATUS_CLAIMED
+                or row.claim_token != claim_token
+            ):
+                logger.info(
+                    "workflow outbox ownership check failed",
+                    context={
+                        "outbox_id": outbox_id,
+                        "claim_token": claim_token,
+                        "actual_claim_token": row.claim_token,
+                        "status": row.status,
+                        "event_id": row.event.event_id,
+                    },
+                )
+                continue
+            owned.append((row, claim_token))
+        event_pks = {row.event.event_id: int(row.event.pk) for row, _ in owned}
+        batch = _DeliveryBatch(
+            event_pks=event_pks,
+            attempts={
+                attempt.idempotency_key: _AttemptState(
+                    pk=int(attempt.pk),
+                    status=attempt.status,
+                    attempts=attempt.attempts,
+                    updated_at=attempt.updated_at,
+                )
+                for attempt in WorkflowDeliveryAttempt.objects.filter(
+                    event_id__in=event_pks.values()
+                ).only("idempotency_key", "status", "attempts", "updated_at")
+            },
+        )
+
+        def attempt_handler(
+            event: WorkflowEvent, entry: _EventHandlerRegistration, attempt: int
+        ) -> bool:
+            return self._attempt_handler_in_batch(batch, event, entry, attempt)
+
+        routed = self._route_owned_rows(owned, attempt_handler)
+        finalized = self._finalize_outbox_batch_processed(routed, started=started)
+        return sum(finalized.values())
+
+    def _route_owned_rows(
+        self,
+        owned: Sequence[tuple[WorkflowOutbox, str]],
+        attempt_handler: Callable[
+            [WorkflowEvent, _EventHandlerRegistration, int], bool
+        ],
+    ) -> dict[int, tuple[str, bool]]:
+        """
+        Route the owned rows of a batch, concurrently when configured.
+
+        Rows sharing an ordering key form one lane that is routed in claim
+        order; rows without a key get a lane each. A lane stops at the first
+        row that fails or is deferred, and its later rows are released unrouted
+        so they are not delivered before that row's retry. Up to
+        `WORKFLOW_OUTBOX_ROUTE_CONCURRENCY` worker threads take lanes from a
+        shared queue and close their database connections when the queue is
+        empty. Inside an atomic block the lanes run inline, because worker
+        threads could not see the block's uncommitted rows.
+
+        Returns:
+            dict[int, tuple[str, bool]]: Claim token and handled flag per
+            outbox id that still needs to be marked processed.
+        """
+        lanes: dict[object, list[tuple[WorkflowOutbox, str]]] = {}
+        for row, claim_token in owned:
+            key = _ordering_key(row.event.payload, row.event.metadata)
+            lanes.setdefault(key or row.pk, []).append((row, claim_token))
+        pending = deque(lanes.values())
+        workers = min(workflow_outbox_route_concurrency(), len(pending))
+        concurrent = workers > 1 and not transaction.get_connection().in_atomic_block
+        routed: dict[int, tuple[str, bool]] = {}
+        stopped: dict[int, list[tuple[WorkflowOutbox, str]]] = {}
+
+        def work() -> None:
+            try:
+                while True:
+                    try:
+                        lane = pending.popleft()
+                    except IndexError:
+                        return
+                    for index, (row, claim_token) in enumerate(lane):
+                        try:
+                            handled = self._route_claimed_row(
+                                row, claim_token, attempt_handler
+                            )
+                        except Exception:
+                            logger.exception(
+                                "workflow outbox batch item failed",
+                                context={"outbox_id": row.pk},
+                            )
+                            handled = None
+                        if handled is None:
+                            if index + 1 < len(lane):
+                                stopped[int(row.pk)] = lane[index + 1 :]
+                            break
+                        routed[int(row.pk)] = (claim_token, handled)
+            finally:
+                if concurrent:
+                    connections.close_all()
+
+        if not concurrent:
+            work()
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="workflow-outbox"
+            ) as executor:
+                for future in [executor.submit(work) for _ in range(workers)]:
+                    future.result()
+        for blocking_id, remaining in stopped.items():
+            self._release_outbox_claims(blocking_id, remaining)
+        return routed
+
+    def _release_outbox_claims(
+        self, blocking_id: int, claims: Sequence[tuple[WorkflowOutbox, str]]
+    ) -> None:
+        """
+        Return the unrouted claims of a stopped lane to pending.
+
+        The rows become due no earlier than the row that stopped the lane, so
+        the next claim picks that row up first and the lane keeps its order.
+        Rows whose claim was taken over in the meantime are left alone.
+        """
+        from general_manager.workflow.models import WorkflowOutbox
+
+        now = datetime.now(UTC)
+        available_at = now
+        head = (
+            WorkflowOutbox.objects.filter(id=blocking_id)
+            .values("status", "available_at", "claimed_at")
+            .first()
+        )
+        if head is not None:
+            available_at = max(available_at, head["available_at"])
+            if (
+                head["status"] == WorkflowOutbox.STATUS_CLAIMED
+                and head["claimed_at"] is not None
+            ):
+                available_at = max(
+                    available_at,
+                    head["claimed_at"]
+                    + timedelta(seconds=workflow_outbox_claim_ttl_seconds()),
+                )
+        for row, claim_token in claims:
+            WorkflowOutbox.objects.filter(
+                id=row.pk,
+                status=WorkflowOutbox.STATUS_CLAIMED,
+                claim_token=claim_token,
+            ).update(
+                status=WorkflowOutbox.STATUS_PENDING,
+                claim_token=None,
+                claimed_at=None,
+                available_at=available_at,
+                updated_at=now,
+            )
+        logger.info(
+            "workflow outbox lane stopped",
+            context={
+                "outbox_id": blocking_id,
+                "released_outbox_ids": [int(row.pk) for row, _ in claims],
+            },
+        )
+
+    def _route_claimed_row(
+        self,
+        row: WorkflowOutbox,
+        claim_token: str,
+        attempt_handler: Callable[
+            [WorkflowEvent, _EventHandlerRegistration, int], bool
+        ],
+    ) -> bool | None:
+        """
+        Route one owned row of a batch.
+
+        Returns `None` when the row was finalized as failed or left for another
+        worker, otherwise whether a handler completed. Rows that return a bool
+        still need to be marked processed.
+        """
+        from general_manager.workflow.models import WorkflowOutbox
+
+        started = perf_counter()
+        outbox_id = int(row.pk)
+        event = WorkflowEvent(
+            event_id=row.event.event_id,
+            event_type=row.event.event_type,
+            event_name=row.event.event_name,
+            payload=row.event.payload,
+            source=row.event.source,
+            occurred_at=row.event.occurred_at,
+            metadata=row.event.metadata,
+        )
+        try:
+            outcome = self._route_event(event, attempt_handler=attempt_handler)
+        except _DeliveryInProgressError as exc:
+            logger.info(
+                "workflow delivery suppressed due to in-progress attempt",
+                context={
+                    "event_id": event.event_id,
+                    "outbox_id": outbox_id,
+                    "claim_token": claim_token,
+                    "attempt_id": exc.attempt_id,
+                },
+            )
+            observe_outbox_process_duration(
+                status=WorkflowOutbox.STATUS_CLAIMED,
+                duration_seconds=perf_counter() - started,
+            )
+            return None
+        except Exception as exc:
+            logger.exception(
+                "workflow outbox processing failed",
+                context={
+                    "event_id": event.event_id,
+                    "outbox_id": outbox_id,
+                    "claim_token": claim_token,
+                },
+            )
+            error = str(exc)
+        else:
+            if not outcome.had_applicable_handlers or outcome.handled:
+                return outcome.handled
+            logger.warning(
+                "workflow handlers did not complete successfully",
+                context={
+                    "event_id": event.event_id,
+                    "outbox_id": outbox_id,
+                    "claim_token": claim_token,
+                },
+            )
+            error = "Workflow event handler did not complete successfully."
+        status = self._finalize_outbox_failure(
+            outbox_id=outbox_id,
+            claim_token=claim_token,
+            was_claimed=True,
+            error=error,
+        )
+        observe_outbox_process_duration(
+            status=status,
+            duration_seconds=perf_counter() - started,
+        )
+        return None
+
+    def _finalize_outbox_batch_processed(
+        self,
+        routed: Mapping[int, tuple[str, bool]],
+        *,
+        started: float,
+    ) -> dict[int, bool]:
+        """
+        Mark routed rows processed when their claim is still owned.
+
+        Returns the `handled` flag of every row that was finalized.
+        """
+        from general_manager.workflow.models import WorkflowOutbox
+
+        if not routed:
+            return {}
+        with transaction.atomic():
+            still_owned = {
+                outbox_id
+                for outbox_id, claim_token in WorkflowOutbox.objects.select_for_update()
+                .filter(id__in=routed, status=WorkflowOutbox.STATUS_CLAIMED)
+                .values_list("id", "claim_token")
+                if routed[outbox_id][0] == claim_token
+            }
+            WorkflowOutbox.objects.filter(id__in=still_owned).update(
+                status=WorkflowOutbox.STATUS_PROCESSED,
+                last_error=None,
+                claim_token=None,
+                claimed_at=None,
+                updated_at=datetime.now(UTC),
+            )
+        duration = perf_counter() - started
+        for outbox_id in routed:
+            if outbox_id in still_owned:
+                increment_outbox_status(WorkflowOutbox.STATUS_PROCESSED)
+                status = WorkflowOutbox.STATUS_PROCESSED
+            else:
+                status = WorkflowOutbox.STATUS_FAILED
+            observe_outbox_process_duration(status=status, duration_seconds=duration)
+        return {outbox_id: routed[outbox_id][1] for outbox_id in still_owned}
+
     def claim_outbox_batch(
         self, *, batch_size: int | None = None
     ) -> list[tuple[int, str]]:
@@ -699,7 +1315,7 @@ class DatabaseEventRegistry(_RoutingMixin):
                         )
                     ),
                 )
-                .order_by("available_at")[:size]
+                .order_by("available_at", "id")[:size]
             )
             if not rows:
                 return []
@@ -713,23 +1329,94 @@ class DatabaseEventRegistry(_RoutingMixin):
             observe_outbox_claim_batch(len(claims))
             return claims
 
-    def _save_event(self, event: WorkflowEvent) -> WorkflowEventRecord | None:
+    @staticmethod
+    def _event_record(event: WorkflowEvent) -> WorkflowEventRecord:
         from general_manager.workflow.models import WorkflowEventRecord
 
+        return WorkflowEventRecord(
+            event_id=event.event_id,
+            event_type=event.event_type,
+            event_name=event.event_name,
+            source=event.source,
+            occurred_at=event.occurred_at,
+            payload=dict(event.payload),
+            metadata=dict(event.metadata),
+        )
+
+    def _save_event(self, event: WorkflowEvent) -> WorkflowEventRecord | None:
         try:
             with transaction.atomic():
-                return WorkflowEventRecord.objects.create(
-                    event_id=event.event_id,
-                    event_type=event.event_type,
-                    event_name=event.event_name,
-                    source=event.source,
-                    occurred_at=event.occurred_at,
-                    payload=dict(event.payload),
-                    metadata=dict(event.metadata),
-                )
+                record = self._event_record(event)
+                record.save(force_insert=True)
+                return record
         except IntegrityError:
             return None
 
+    def _persist_event(self, event: WorkflowEvent) -> WorkflowOutbox | None:
+        """Insert the event record and its outbox row, or `None` for duplicates."""
+        from general_manager.workflow.models import WorkflowOutbox
+
+        try:
+            with transaction.atomic():
+                record = self._event_record(event)
+                record.save(force_insert=True)
+                return WorkflowOutbox.objects.create(event=record)
+        except IntegrityError:
+            return None
+
+    def _persist_events(self, events: Sequence[WorkflowEvent]) -> int:
+        """
+        Insert event records and outbox rows with bulk inserts.
+
+        Events whose `event_id` already exists, or repeats earlier in
+        `events`, are skipped. A chunk that still hits the uniqueness
+        constraint, for example because a concurrent transaction inserted the
+        same id, is retried event by event with duplicate suppression.
+
+        Returns:
+            int: Number of newly created outbox rows.
+        """
+        from general_manager.workflow.models import WorkflowEventRecord, WorkflowOutbox
+
+        unique: dict[str, WorkflowEvent] = {}
+        for event in events:
+            unique.setdefault(event.event_id, event)
+        pending = list(unique.values())
+        created = 0
+        for start in range(0, len(pending), _BULK_PUBLISH_CHUNK_SIZE):
+            chunk = pending[start : start + _BULK_PUBLISH_CHUNK_SIZE]
+            existing = set(
+                WorkflowEventRecord.objects.filter(
+                    event_id__in=[event.event_id for event in chunk]
+                ).values_list("event_id", flat=True)
+            )
+            new_events = [event for event in chunk if event.event_id not in existing]
+            if not new_events:
+                continue
+            try:
+                with transaction.atomic():
+                    records = WorkflowEventRecord.objects.bulk_create(
+                        [self._event_record(event) for event in new_events]
+                    )
+                    if any(record.pk is None for record in records):
+                        ids = dict(
+                            WorkflowEventRecord.objects.filter(
+                                event_id__in=[record.event_id for record in records]
+                            ).values_list("event_id", "pk")
+                        )
+                        for record in records:
+                            record.pk = ids[record.event_id]
+                    WorkflowOutbox.objects.bulk_create(
+                        [WorkflowOutbox(event=record) for record in records]
+                    )
+            except IntegrityError:
+                created += sum(
+                    self._persist_event(event) is not None for event in new_events
+                )
+                continue
+            created += len(records)
+        return created
+
     def _attempt_handler(
         self,
         event: WorkflowEvent,
@@ -761,55 +1448,217 @@ class DatabaseEventRegistry(_RoutingMixin):
             )
             if attempt_record.status == WorkflowDeliveryAttempt.STATUS_COMPLETED:
                 return True
-            running_ttl = timedelta(seconds=workflow_delivery_running_timeout_seconds())
-            stale_before = datetime.now(UTC) - running_ttl
-            if (
-                attempt_record.status == WorkflowDeliveryAttempt.STATUS_RUNNING
-                and attempt_record.updated_at > stale_before
-            ):
-                increment_duplicate_suppression()
-                logger.info(
-                    "workflow delivery attempt already running",
-                    context={
-                        "event_id": event.event_id,
-                        "registration_id": entry.registration_id,
-                        "idempotency_key": idempotency_key,
-                        "attempt_id": attempt_record.pk,
-                    },
-                )
-                raise _DeliveryInProgressError(attempt_record.pk)
+            self._raise_if_running(
+                event,
+                entry,
+                attempt_id=int(attempt_record.pk),
+                status=attempt_record.status,
+                updated_at=attempt_record.updated_at,
+            )
             attempt_record.status = WorkflowDeliveryAttempt.STATUS_RUNNING
             attempt_record.attempts = max(attempt_record.attempts, attempt)
             attempt_record.save(update_fields=["status", "attempts", "updated_at"])
             increment_delivery_attempt(status=WorkflowDeliveryAttempt.STATUS_RUNNING)
+        _status, _finished, error = self._run_attempt(
+            event, entry, attempt, attempt_id=int(attempt_record.pk)
+        )
+        if error is not None:
+            raise error
+        return True
+
+    def _attempt_handler_in_batch(
+        self,
+        batch: _DeliveryBatch,
+        event: WorkflowEvent,
+        entry: _EventHandlerRegistration,
+        attempt: int,
+    ) -> bool:
+        """
+        Run one handler attempt using the attempt rows preloaded for the batch.
+
+        A missing attempt row is inserted directly as running and a known row is
+        moved to running with a compare-and-set on its status and `updated_at`,
+        so no row lock or re-read is needed. Losing either race to another
+        worker falls back to the locking `_attempt_handler()` path, which keeps
+        the idempotency and stale-running guarantees.
+        """
+        from general_manager.workflow.models import WorkflowDeliveryAttempt
+
+        event_pk = batch.event_pks.get(event.event_id)
+        if event_pk is None:
+            return self._attempt_handler(event, entry, attempt)
+        idempotency_key = f"{event.event_id}:{entry.registration_id}"
+        state = batch.attempts.get(idempotency_key)
+        now = datetime.now(UTC)
+        if state is None:
+            # Under autocommit a failed insert leaves nothing to roll back, so
+            # only an enclosing transaction needs the savepoint.
+            guard = (
+                transaction.atomic()
+                if transaction.get_connection().in_atomic_block
+                else nullcontext()
+            )
+            try:
+                with guard:
+                    attempt_record = WorkflowDeliveryAttempt.objects.create(
+                        event_id=event_pk,
+                        handler_registration_id=entry.registration_id,
+                        idempotency_key=idempotency_key,
+                        status=WorkflowDeliveryAttempt.STATUS_RUNNING,
+                        attempts=attempt,
+                    )
+            except IntegrityError:
+                return self._attempt_handler(event, entry, attempt)
+            state = _AttemptState(
+                pk=int(attempt_record.pk),
+                status=WorkflowDeliveryAttempt.STATUS_RUNNING,
+                attempts=attempt,
+                updated_at=attempt_record.updated_at,
+            )
+        else:
+            if state.status == WorkflowDeliveryAttempt.STATUS_COMPLETED:
+                return True
+            self._raise_if_running(
+                event,
+                entry,
+                attempt_id=state.pk,
+                status=state.status,
+                updated_at=state.updated_at,
+            )
+            attempts = max(state.attempts, attempt)
+            claimed = WorkflowDeliveryAttempt.objects.filter(
+                pk=state.pk, status=state.status, updated_at=state.updated_at
+            ).update(
+                status=WorkflowDeliveryAttempt.STATUS_RUNNING,
+                attempts=attempts,
+                updated_at=now,
+            )
+            if not claimed:
+                del batch.attempts[idempotency_key]
+                return self._attempt_handler(event, entry, attempt)
+            state = _AttemptState(
+                pk=state.pk,
+                status=WorkflowDeliveryAttempt.STATUS_RUNNING,
+                attempts=attempts,
+                updated_at=now,
+            )
+        batch.attempts[idempotency_key] = state
+        increment_delivery_attempt(status=WorkflowDeliveryAttempt.STATUS_RUNNING)
+        state.status, state.updated_at, error = self._run_attempt(
+            event, entry, attempt, attempt_id=state.pk
+        )
+        if error is not None:
+            raise error
+        return True
+
+    @staticmethod
+    def _raise_if_running(
+        event: WorkflowEvent,
+        entry: _EventHandlerRegistration,
+        *,
+        attempt_id: int,
+        status: str,
+        updated_at: datetime,
+    ) -> None:
+        """Raise when another worker's attempt is running and not yet stale."""
+        from general_manager.workflow.models import WorkflowDeliveryAttempt
+
+        if status != WorkflowDeliveryAttempt.STATUS_RUNNING:
+            return
+        running_ttl = timedelta(seconds=workflow_delivery_running_timeout_seconds())
+        if updated_at <= datetime.now(UTC) - running_ttl:
+            return
+        increment_duplicate_suppression()
+        logger.info(
+            "workflow delivery attempt already running",
+            context={
+                "event_id": event.event_id,
+                "registration_id": entry.registration_id,
+                "idempotency_key": f"{event.event_id}:{entry.registration_id}",
+                "attempt_id": attempt_id,
+            },
+        )
+        raise _DeliveryInProgressError(attempt_id)
+
+    @staticmethod
+    def _run_attempt(
+        event: WorkflowEvent,
+        entry: _EventHandlerRegistration,
+        attempt: int,
+        *,
+        attempt_id: int,
+    ) -> tuple[str, datetime, Exception | None]:
+        """
+        Call the handler for a running attempt row and record its outcome.
+
+        Returns the final status and `updated_at` of the attempt row, plus the
+        handler exception for the caller to re-raise when the handler failed.
+        """
+        from general_manager.workflow.models import WorkflowDeliveryAttempt
+
         try:
             entry.handler(event)
-        except Exception as exc:
+        except Exception as exc:  # noqa: BLE001 - returned for the caller to raise
             status = (
                 WorkflowDeliveryAttempt.STATUS_DEAD_LETTER
                 if attempt > entry.retries and workflow_dead_letter_enabled()
                 else WorkflowDeliveryAttempt.STATUS_FAILED
             )
+            finished = datetime.now(UTC)
             WorkflowDeliveryAttempt.objects.filter(
-                pk=attempt_record.pk,
+                pk=attempt_id,
                 status=WorkflowDeliveryAttempt.STATUS_RUNNING,
             ).update(
                 status=status,
                 last_error=str(exc),
                 last_traceback=format_exc(),
+                updated_at=finished,
             )
             increment_delivery_attempt(status=status)
-            raise
+            return status, finished, exc
+        finished = datetime.now(UTC)
         WorkflowDeliveryAttempt.objects.filter(
-            pk=attempt_record.pk,
+            pk=attempt_id,
             status=WorkflowDeliveryAttempt.STATUS_RUNNING,
         ).update(
             status=WorkflowDeliveryAttempt.STATUS_COMPLETED,
             last_error=None,
             last_traceback=None,
+            updated_at=finished,
         )
         increment_delivery_attempt(status=WorkflowDeliveryAttempt.STATUS_COMPLETED)
-        return True
+        return WorkflowDeliveryAttempt.STATUS_COMPLETED, finished, None
+
+    def _wake_outbox(self, using: str | None = None) -> None:
+        """
+        Signal that new outbox rows become visible when the transaction commits.
+
+        With `WORKFLOW_OUTBOX_DISPATCHER` enabled, PostgreSQL databases receive a
+        transactional `pg_notify` for the dispatcher's `LISTEN` loop and other
+        databases rely on its polling; no task is enqueued. Otherwise one
+        `publish_outbox_batch` task is enqueued per commit.
+        """
+        connection = transaction.get_connection(using)
+        if not workflow_outbox_dispatcher_enabled():
+            if not connection.in_atomic_block:
+                self._enqueue_publish_task()
+                return
+            collector = _wake_collector(connection.alias)
+            pending = collector.add(
+                self, savepoints=_active_savepoints(connection.alias)
+            )
+            transaction.on_commit(
+                lambda: collector.confirm(pending), using=connection.alias
+            )
+            return
+        if connection.vendor != "postgresql":
+            return
+        with connection.cursor() as cursor:
+            # PostgreSQL delivers on commit and folds identical notifications
+            # sent within one transaction.
+            cursor.execute(
+                "SELECT pg_notify(%s, '')", [workflow_outbox_notify_channel()]
+            )
 
     @staticmethod
     def _enqueue_publish_task() -> None:
@@ -1067,6 +1916,30 @@ def get_event_registry() -> EventRegistry:
     return _event_registry
 
 
+@contextmanager
+def workflow_event_batch(*, using: str | None = None) -> Iterator[None]:
+    """
+    Run a block in one transaction and bulk insert its async publishes.
+
+    The block runs inside `transaction.atomic(using=using)`. While it is active
+    and `WORKFLOW_ASYNC` is enabled, database registries buffer events
+    published at the block's level, including those of manager mutations made
+    directly inside it, instead of inserting two rows per event. When the
+    block exits normally the buffer is written with bulk inserts, still inside
+    the transaction, so events commit atomically with the data changes that
+    produced them. If the block raises, the buffer is discarded together with
+    the transaction. Events published inside a nested `atomic()` block are
+    written immediately so a savepoint rollback still discards them.
+    """
+    with transaction.atomic(using=using):
+        batch = open_event_batch(transaction.get_connection(using).alias)
+        try:
+            yield
+            flush_event_batch(batch)
+        finally:
+            close_event_batch(batch)
+
+
 def publish_sync(event: WorkflowEvent) -> bool:
     """
     Publish an event synchronously against the configured registry.
@@ -101,6 +101,10 @@ class WorkflowOutbox(models.Model):
                 fields=["status", "available_at", "id"],
                 name="workflow_ou_status__a5f7dc_idx",
             ),
+            models.Index(
+                fields=["status", "updated_at"],
+                name="general_man_status_e94dcb_idx",
+            ),
             models.Index(
                 fields=["claim_token"],
                 name="general_man_claim_t_78fd22_idx",
@@ -0,0 +1,228 @@
+"""Bounded retention sweeps for finished workflow outbox history."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils.module_loading import import_string
+
+from general_manager.logging import get_logger
+from general_manager.workflow.config import (
+    workflow_retention_archiver,
+    workflow_retention_batch_size,
+    workflow_retention_dead_letter_days,
+    workflow_retention_max_batches,
+    workflow_retention_processed_days,
+)
+from general_manager.workflow.models import (
+    WorkflowDeliveryAttempt,
+    WorkflowEventRecord,
+    WorkflowOutbox,
+)
+
+logger = get_logger("workflow.retention")
+
+WorkflowRetentionArchiver = Callable[[Sequence[WorkflowEventRecord]], None]
+
+_ROUTABLE_STATUSES = (
+    WorkflowOutbox.STATUS_PENDING,
+    WorkflowOutbox.STATUS_CLAIMED,
+    WorkflowOutbox.STATUS_FAILED,
+)
+
+
+class InvalidWorkflowRetentionOptionError(ValueError):
+    """Raised when a retention sweep bound is not a positive integer."""
+
+    def __init__(self, name: str) -> None:
+        """Build the stable option validation message."""
+        super().__init__(f"{name} must be a positive integer.")
+
+
+class InvalidWorkflowRetentionArchiverError(TypeError):
+    """Raised when `WORKFLOW_RETENTION_ARCHIVER` does not resolve to a callable."""
+
+    def __init__(self) -> None:
+        """Build the stable archiver validation message."""
+        super().__init__(
+            "WORKFLOW_RETENTION_ARCHIVER must be a callable or an import path to one."
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowRetentionResult:
+    """
+    Rows removed by one retention sweep.
+
+    `complete` is `False` when the sweep stopped at its batch limit while
+    eligible rows may remain; the next sweep continues where it stopped.
+    """
+
+    events: int = 0
+    outbox_rows: int = 0
+    delivery_attempts: int = 0
+    batches: int = 0
+    complete: bool = True
+
+
+def purge_workflow_history(
+    *,
+    batch_size: int | None = None,
+    max_batches: int | None = None,
+    archiver: WorkflowRetentionArchiver | None = None,
+    now: datetime | None = None,
+    using: str = DEFAULT_DB_ALIAS,
+) -> WorkflowRetentionResult:
+    """
+    Delete finished workflow events older than the configured retention.
+
+    An event is eligible when its outbox row has been processed for longer
+    than `WORKFLOW_RETENTION_PROCESSED_DAYS`, or dead-lettered for longer than
+    `WORKFLOW_RETENTION_DEAD_LETTER_DAYS` (`0` keeps dead letters). Events
+    recorded by `publish_sync()` without an outbox row expire with the
+    processed retention. Pending, claimed, and failed rows are never touched.
+
+    Each chunk runs in its own transaction: it selects up to `batch_size`
+    event ids by walking the `(status, updated_at)` outbox index oldest first,
+    skipping rows locked by other workers, passes the events to `archiver`
+    when one is given or configured with `WORKFLOW_RETENTION_ARCHIVER`, and
+    deletes the events together with their outbox rows and delivery attempts.
+    At most `max_batches` chunks run per sweep, so one call stays short and
+    never holds locks on more than one chunk.
+
+    Raises:
+        InvalidWorkflowRetentionOptionError: If `batch_size` or `max_batches`
+            is not positive.
+        InvalidWorkflowRetentionArchiverError: If the configured archiver does
+            not resolve to a callable.
+        Exception: Archiver and database errors propagate; the failing chunk
+            is rolled back and earlier chunks stay deleted.
+    """
+    size = _positive(batch_size, workflow_retention_batch_size, "batch_size")
+    batch_limit = _positive(max_batches, workflow_retention_max_batches, "max_batches")
+    archive = archiver if archiver is not None else _configured_archiver()
+    now = now or datetime.now(UTC)
+    processed_before = now - timedelta(days=workflow_retention_processed_days())
+    selectors: list[Callable[[int], list[int]]] = [
+        lambda limit: _terminal_event_ids(
+            WorkflowOutbox.STATUS_PROCESSED, processed_before, limit, using
+        ),
+    ]
+    dead_letter_days = workflow_retention_dead_letter_days()
+    if dead_letter_days > 0:
+        dead_letter_before = now - timedelta(days=dead_letter_days)
+        selectors.append(
+            lambda limit: _terminal_event_ids(
+                WorkflowOutbox.STATUS_DEAD_LETTER, dead_letter_before, limit, using
+            )
+        )
+    selectors.append(lambda limit: _unrouted_event_ids(processed_before, limit, using))
+
+    counts = {"events": 0, "outbox_rows": 0, "delivery_attempts": 0}
+    batches = 0
+    complete = True
+    for select in selectors:
+        while True:
+            if batches >= batch_limit:
+                complete = False
+                break
+            selected = _purge_chunk(select, size, archive, using, counts)
+            if selected == 0:
+                break
+            batches += 1
+            if selected < size:
+                break
+        if not complete:
+            break
+    result = WorkflowRetentionResult(batches=batches, complete=complete, **counts)
+    logger.info(
+        "workflow retention sweep finished",
+        context={
+            "events": result.events,
+            "outbox_rows": result.outbox_rows,
+            "delivery_attempts": result.delivery_attempts,
+            "batches": result.batches,
+            "complete": result.complete,
+            "database_alias": using,
+        },
+    )
+    return result
+
+
+def _purge_chunk(
+    select: Callable[[int], list[int]],
+    size: int,
+    archive: WorkflowRetentionArchiver | None,
+    using: str,
+    counts: dict[str, int],
+) -> int:
+    """Delete one chunk of eligible events and return how many were selected."""
+    with transaction.atomic(using=using):
+        event_ids = select(size)
+        if not event_ids:
+            return 0
+        if archive is not None:
+            archive(
+                list(
+                    WorkflowEventRecord.objects.using(using)
+                    .filter(pk__in=event_ids)
+                    .prefetch_related("outbox_entries", "delivery_attempts")
+                    .order_by("pk")
+                )
+            )
+        # Only the primary keys are needed to cascade; skip loading payloads.
+        _, deleted = (
+            WorkflowEventRecord.objects.using(using)
+            .filter(pk__in=event_ids)
+            .only("pk")
+            .delete()
+        )
+    counts["events"] += deleted.get(WorkflowEventRecord._meta.label, 0)
+    counts["outbox_rows"] += deleted.get(WorkflowOutbox._meta.label, 0)
+    counts["delivery_attempts"] += deleted.get(WorkflowDeliveryAttempt._meta.label, 0)
+    return len(event_ids)
+
+
+def _terminal_event_ids(
+    status: str, before: datetime, limit: int, using: str
+) -> list[int]:
+    """Return the oldest events whose outbox rows sat in `status` since `before`."""
+    return list(
+        WorkflowOutbox.objects.using(using)
+        .select_for_update(skip_locked=True)
+        .filter(status=status, updated_at__lt=before)
+        # Keep events that still have a routable outbox row.
+        .exclude(event__outbox_entries__status__in=_ROUTABLE_STATUSES)
+        .order_by("updated_at", "id")
+        .values_list("event_id", flat=True)[:limit]
+    )
+
+
+def _unrouted_event_ids(before: datetime, limit: int, using: str) -> list[int]:
+    """Return the oldest events recorded without an outbox row before `before`."""
+    return list(
+        WorkflowEventRecord.objects.using(using)
+        .filter(created_at__lt=before, outbox_entries__isnull=True)
+        .order_by("created_at", "id")
+        .values_list("pk", flat=True)[:limit]
+    )
+
+
+def _positive(value: int | None, default: Callable[[], int], name: str) -> int:
+    resolved = default() if value is None else value
+    if isinstance(resolved, bool) or not isinstance(resolved, int) or resolved < 1:
+        raise InvalidWorkflowRetentionOptionError(name)
+    return resolved
+
+
+def _configured_archiver() -> WorkflowRetentionArchiver | None:
+    configured = workflow_retention_archiver()
+    if configured is None:
+        return None
+    resolved = import_string(configured) if isinstance(configured, str) else configured
+    if not callable(resolved):
+        raise InvalidWorkflowRetentionArchiverError()
+    return resolved  # type: ignore[no-any-return]
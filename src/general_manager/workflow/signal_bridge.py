@@ -7,15 +7,32 @@ from datetime import datetime
 from time import perf_counter
 from typing import TypedDict, cast
 
-from django.db import DEFAULT_DB_ALIAS
+from django.db import DEFAULT_DB_ALIAS, transaction
 
-from general_manager.cache.data_change_context import record_data_change_phase
-from general_manager.cache.signals import post_data_change
+from general_manager.cache.data_change_context import (
+    DataChangeTransactionContext,
+    record_data_change_phase,
+)
+from general_manager.cache.signals import (
+    data_change_transaction_finished,
+    data_change_transaction_finishing,
+    data_change_transaction_started,
+    post_data_change,
+)
+from general_manager.logging import get_logger
 from general_manager.manager.general_manager import GeneralManager
+from general_manager.workflow.config import workflow_signal_bridge_skip_unrouted
 from general_manager.workflow.event_registry import (
     EventRegistry,
+    EventBatch,
     WorkflowEvent,
+    close_event_batch,
+    event_batch_active,
+    flush_event_batch,
     get_event_registry,
+    open_event_batch,
+    publish_buffered_events,
+    release_publish_savepoints,
 )
 from general_manager.workflow.events import (
     manager_created_event,
@@ -26,6 +43,11 @@ from general_manager.workflow.events import (
 _SETTINGS_KEY = "GENERAL_MANAGER"
 _WORKFLOW_SIGNAL_BRIDGE_KEY = "WORKFLOW_SIGNAL_BRIDGE"
 _DISPATCH_UID = "general_manager_workflow_signal_bridge"
+_SAVEPOINTS_METADATA_KEY = "workflow_savepoints"
+_BATCH_METADATA_KEY = "workflow_event_batch"
+_NESTED_BATCH_METADATA_KEY = "workflow_event_batch_nested"
+
+logger = get_logger("workflow.signal_bridge")
 
 _RESERVED_KEYS = {
     "creator_id",
@@ -36,10 +58,18 @@ _RESERVED_KEYS = {
     "signal",
 }
 
+_ACTION_ROUTES = {
+    "create": ("general_manager.manager.created", "manager_created"),
+    "update": ("general_manager.manager.updated", "manager_updated"),
+    "delete": ("general_manager.manager.deleted", "manager_deleted"),
+}
+
 type SignalPayloadValue = object
 type SignalPayload = Mapping[str, SignalPayloadValue]
 type SignalPayloadDict = dict[str, SignalPayloadValue]
 
+_reported_unrouted_events: set[str] = set()
+
 
 class _CommonEventKwargs(TypedDict):
     manager: str
@@ -51,20 +81,45 @@ class _CommonEventKwargs(TypedDict):
     occurred_at: datetime | None
 
 
-def _resolve_old_value_from_history(
-    instance: GeneralManager, field_name: str
-) -> SignalPayloadValue:
+def _previous_history_row(instance: GeneralManager) -> object | None:
+    """Return the simple-history row preceding the current state, if any."""
     model_instance = getattr(instance._interface, "_instance", None)
     history = getattr(model_instance, "history", None)
     if history is None:
         return None
     try:
-        rows = list(history.order_by("-history_date")[:2])
+        rows: list[object] = list(history.order_by("-history_date")[:2])
     except Exception:  # noqa: BLE001  # pragma: no cover - defensive fallback
         return None
     if len(rows) < 2:
         return None
-    return getattr(rows[1], field_name, None)
+    return rows[1]
+
+
+def _has_subscribers(registry: EventRegistry, action: str | None) -> bool:
+    """Return whether any handler routes the event produced for `action`.
+
+    Registries without a `has_routes()` lookup are treated as subscribing to
+    every event. The first skip of each event type is logged, because handlers
+    registered only in worker processes are invisible here.
+    """
+    routes = _ACTION_ROUTES.get(action or "")
+    if routes is None:
+        return False
+    has_routes = getattr(registry, "has_routes", None)
+    if not callable(has_routes):
+        return True
+    if has_routes(*routes):
+        return True
+    event_type, event_name = routes
+    if event_type not in _reported_unrouted_events:
+        _reported_unrouted_events.add(event_type)
+        logger.warning(
+            "workflow signal bridge skipped an unrouted event; handlers must be "
+            "registered in every process that saves managers",
+            context={"event_type": event_type, "event_name": event_name},
+        )
+    return False
 
 
 def _manager_change_to_event(
@@ -108,9 +163,15 @@ def _manager_change_to_event(
         return manager_created_event(values=relevant_fields, **common_kwargs)
     if action == "update":
         old_values = dict(old_relevant_values or {})
-        for field_name in relevant_fields:
-            if field_name not in old_values or old_values[field_name] is None:
-                history_value = _resolve_old_value_from_history(instance, field_name)
+        missing_fields = [
+            field_name
+            for field_name in relevant_fields
+            if old_values.get(field_name) is None
+        ]
+        previous_row = _previous_history_row(instance) if missing_fields else None
+        if previous_row is not None:
+            for field_name in missing_fields:
+                history_value = getattr(previous_row, field_name, None)
                 if history_value is not None:
                     old_values[field_name] = history_value
         return manager_updated_event(
@@ -134,13 +195,21 @@ def _handle_post_data_change(
     """Publish a workflow event for supported manager mutation signals.
 
     The Django signal sender is ignored. When `instance` is missing, the bridge
-    uses `previous_instance` from the signal kwargs. Exceptions raised by
-    `publish()` propagate to the signal caller.
+    uses `previous_instance` from the signal kwargs. With
+    `WORKFLOW_SIGNAL_BRIDGE_SKIP_UNROUTED` enabled, mutations whose event type
+    and event name have no handler in this process's registry are skipped
+    before the event is built, so they are neither persisted nor routed.
+    Exceptions raised by `publish()` propagate to the signal caller.
     """
     database_alias = cast(str, kwargs.get("database_alias", DEFAULT_DB_ALIAS))
     started = perf_counter()
     try:
         del sender
+        registry = get_event_registry()
+        if workflow_signal_bridge_skip_unrouted() and not _has_subscribers(
+            registry, action
+        ):
+            return
         event_instance = (
             instance if instance is not None else kwargs.get("previous_instance")
         )
@@ -152,17 +221,96 @@ def _handle_post_data_change(
         )
         if event is None:
             return
-        get_event_registry().publish(event)
+        registry.publish(event)
     finally:
         record_data_change_phase("workflow", perf_counter() - started, database_alias)
 
 
+def _handle_data_change_started(
+    sender: object,
+    transaction_context: DataChangeTransactionContext | None = None,
+    database_alias: str = DEFAULT_DB_ALIAS,
+    caller_in_atomic_block: bool = False,
+    **kwargs: SignalPayloadValue,
+) -> None:
+    """Buffer the mutation's async publishes and remember its savepoints."""
+    del sender, kwargs
+    if transaction_context is None:
+        return
+    transaction_context.metadata[_NESTED_BATCH_METADATA_KEY] = event_batch_active(
+        database_alias
+    )
+    transaction_context.metadata[_BATCH_METADATA_KEY] = open_event_batch(database_alias)
+    if caller_in_atomic_block:
+        transaction_context.metadata[_SAVEPOINTS_METADATA_KEY] = frozenset(
+            sid
+            for sid in transaction.get_connection(database_alias).savepoint_ids
+            if sid is not None
+        )
+
+
+def _handle_data_change_finishing(
+    sender: object,
+    transaction_context: DataChangeTransactionContext | None = None,
+    **kwargs: SignalPayloadValue,
+) -> None:
+    """Bulk insert the mutation's events before its atomic block exits.
+
+    Inside an enclosing `workflow_event_batch()` the events are kept until the
+    mutation's savepoint is released and then join that batch instead.
+    """
+    del sender, kwargs
+    if transaction_context is None:
+        return
+    batch = transaction_context.metadata.get(_BATCH_METADATA_KEY)
+    if isinstance(batch, EventBatch) and not transaction_context.metadata.get(
+        _NESTED_BATCH_METADATA_KEY
+    ):
+        flush_event_batch(batch)
+
+
+def _handle_data_change_finished(
+    sender: object,
+    transaction_context: DataChangeTransactionContext | None = None,
+    database_alias: str = DEFAULT_DB_ALIAS,
+    outcome: str | None = None,
+    **kwargs: SignalPayloadValue,
+) -> None:
+    """Hand on the mutation's events and wake-ups once its savepoint is released.
+
+    Events that were not written yet join the enclosing batch. Wake-ups keep
+    the savepoint they were requested in until it is released, so without
+    this each manager mutation inside a caller's transaction would enqueue its
+    own outbox drain.
+    """
+    del sender, kwargs
+    if transaction_context is None:
+        return
+    batch = transaction_context.metadata.pop(_BATCH_METADATA_KEY, None)
+    transaction_context.metadata.pop(_NESTED_BATCH_METADATA_KEY, None)
+    opened = transaction_context.metadata.pop(_SAVEPOINTS_METADATA_KEY, None)
+    if not isinstance(batch, EventBatch):
+        return
+    events = close_event_batch(batch)
+    if outcome != "committed":
+        return
+    if events:
+        publish_buffered_events(events, using=database_alias)
+    if isinstance(opened, frozenset):
+        remaining = set(transaction.get_connection(database_alias).savepoint_ids)
+        release_publish_savepoints(
+            database_alias, frozenset(sid for sid in opened if sid not in remaining)
+        )
+
+
 def connect_workflow_signal_bridge(*, registry: EventRegistry | None = None) -> None:
     """Connect manager mutation signal bridging into workflow events.
 
     If `registry` is provided, it becomes the active global registry before the
-    receiver is connected. The receiver is connected with a stable dispatch uid
-    and `weak=False`, so repeated calls replace the same receiver registration.
+    receivers are connected. The `post_data_change` receiver and the
+    transaction lifecycle receivers that bulk insert each mutation's events
+    and track released savepoints are connected with a stable dispatch uid and
+    `weak=False`, so repeated calls replace the same receiver registrations.
     """
     if registry is not None:
         from general_manager.workflow.event_registry import configure_event_registry
@@ -173,11 +321,29 @@ def connect_workflow_signal_bridge(*, registry: EventRegistry | None = None) ->
         weak=False,
         dispatch_uid=_DISPATCH_UID,
     )
+    data_change_transaction_started.connect(
+        _handle_data_change_started,
+        weak=False,
+        dispatch_uid=_DISPATCH_UID,
+    )
+    data_change_transaction_finishing.connect(
+        _handle_data_change_finishing,
+        weak=False,
+        dispatch_uid=_DISPATCH_UID,
+    )
+    data_change_transaction_finished.connect(
+        _handle_data_change_finished,
+        weak=False,
+        dispatch_uid=_DISPATCH_UID,
+    )
 
 
 def disconnect_workflow_signal_bridge() -> None:
-    """Disconnect the workflow signal bridge receiver by dispatch uid."""
+    """Disconnect the workflow signal bridge receivers by dispatch uid."""
     post_data_change.disconnect(dispatch_uid=_DISPATCH_UID)
+    data_change_transaction_started.disconnect(dispatch_uid=_DISPATCH_UID)
+    data_change_transaction_finishing.disconnect(dispatch_uid=_DISPATCH_UID)
+    data_change_transaction_finished.disconnect(dispatch_uid=_DISPATCH_UID)
 
 
 def workflow_signal_bridge_enabled(django_settings: object) -> bool:
@@ -17,6 +17,8 @@ from general_manager.workflow.config import (
     workflow_beat_max_jitter_seconds,
     workflow_beat_outbox_interval_seconds,
     workflow_outbox_process_chunk_size,
+    workflow_retention_enabled,
+    workflow_retention_interval_seconds,
 )
 from general_manager.workflow.engine import WorkflowExecutionNotFoundError
 from general_manager.workflow.engine import ACTIVE_WORKFLOW_STATES
@@ -96,6 +98,7 @@ except ImportError:  # pragma: no cover - optional dependency boundary
 
 
 WORKFLOW_BEAT_SCHEDULE_KEY = "general_manager.workflow.publish_outbox_batch"
+WORKFLOW_RETENTION_BEAT_SCHEDULE_KEY = "general_manager.workflow.purge_history"
 
 
 def configure_workflow_beat_schedule_from_settings(
@@ -158,6 +161,49 @@ def configure_workflow_beat_schedule_from_settings(
     return True
 
 
+def configure_workflow_retention_beat_schedule_from_settings(
+    django_settings: object = settings,
+) -> bool:
+    """
+    Register the periodic workflow retention sweep in Celery Beat.
+
+    Returns `False` when `WORKFLOW_RETENTION_ENABLED` is off, Celery is not
+    installed, or `current_app` is `None`, leaving any existing entry untouched.
+    Otherwise writes `WORKFLOW_RETENTION_BEAT_SCHEDULE_KEY` with task path
+    `general_manager.workflow.tasks.purge_workflow_history_task`, a float
+    `WORKFLOW_RETENTION_INTERVAL_SECONDS` schedule, no args or kwargs, and
+    `options={"queue": "workflow.events"}`, then returns `True`.
+
+    Exceptions from Celery app configuration access or assignment propagate.
+    """
+    if not workflow_retention_enabled(django_settings):
+        return False
+    if not CELERY_AVAILABLE or current_app is None:
+        logger.warning("workflow retention beat schedule skipped; celery unavailable")
+        return False
+    raw_schedule = getattr(current_app.conf, "beat_schedule", {}) or {}
+    schedule: dict[str, object] = (
+        dict(cast(Mapping[str, object], raw_schedule))
+        if isinstance(raw_schedule, Mapping)
+        else {}
+    )
+    interval_seconds = float(workflow_retention_interval_seconds(django_settings))
+    schedule[WORKFLOW_RETENTION_BEAT_SCHEDULE_KEY] = {
+        "task": "general_manager.workflow.tasks.purge_workflow_history_task",
+        "schedule": interval_seconds,
+        "options": {"queue": "workflow.events"},
+    }
+    current_app.conf.beat_schedule = schedule
+    logger.info(
+        "workflow retention beat schedule configured",
+        context={
+            "schedule_key": WORKFLOW_RETENTION_BEAT_SCHEDULE_KEY,
+            "interval_seconds": interval_seconds,
+        },
+    )
+    return True
+
+
 @shared_task(queue="workflow.events")
 def publish_outbox_batch() -> int:
     """
@@ -239,11 +285,19 @@ def route_outbox_claims_batch(claims: list[tuple[int, str]]) -> int:
         Exceptions from individual rows are logged and do not stop later rows in
         the same batch.
 
+    With a `DatabaseEventRegistry`, the batch is routed by
+    `process_outbox_batch()`, which loads rows, events, and delivery attempts
+    with set-based queries. Other registries route each claim through
+    `route_outbox_event()`.
+
     The public contract expects a concrete list of `(int, str)` pairs. Malformed
     claim entries raise normal Python unpacking/type errors inside that entry,
     are logged, and are then skipped by the batch loop. Duplicate claim entries
     are processed in list order and rely on per-row registry ownership checks.
     """
+    registry = get_event_registry()
+    if isinstance(registry, DatabaseEventRegistry):
+        return registry.process_outbox_batch(claims)
     routed = 0
     for outbox_id, claim_token in claims:
         try:
@@ -257,6 +311,26 @@ def route_outbox_claims_batch(claims: list[tuple[int, str]]) -> int:
     return routed
 
 
+@shared_task(queue="workflow.events")
+def purge_workflow_history_task() -> dict[str, int]:
+    """
+    Run one bounded workflow retention sweep.
+
+    Returns the `events`, `outbox_rows`, `delivery_attempts`, and `batches`
+    counts of `purge_workflow_history()`, whose settings bound the sweep.
+    Exceptions from the sweep propagate to the caller or Celery worker.
+    """
+    from general_manager.workflow.retention import purge_workflow_history
+
+    result = purge_workflow_history()
+    return {
+        "events": result.events,
+        "outbox_rows": result.outbox_rows,
+        "delivery_attempts": result.delivery_attempts,
+        "batches": result.batches,
+    }
+
+
 def _resolve_handler(handler_path: str) -> object:
     """Resolve an import path to a workflow execution handler object."""
     return import_string(handler_path)
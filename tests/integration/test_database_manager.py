@@ -682,6 +682,36 @@ class DatabaseIntegrationTest(GeneralManagerTransactionTestCase):
         self.assertEqual(manager._interface._instance.get_deferred_fields(), set())
         self.assertEqual(manager.name, "Alice")
 
+    def test_loaded_field_rows_load_remaining_columns_on_access(self):
+        projected = self.TestHuman.all().with_loaded_fields(["country"])
+        bucket = projected.filter(id=self.test_human1.identification["id"])
+
+        manager = next(iter(bucket))
+
+        self.assertIn("name", manager._interface._instance.get_deferred_fields())
+        with self.assertNumQueries(1):
+            self.assertEqual(manager.name, "Alice")
+        self.assertNotIn("name", manager._interface._instance.get_deferred_fields())
+
+    def test_with_loaded_fields_selects_requested_columns(self):
+        bucket = self.TestHuman.all()
+
+        projected = bucket.with_loaded_fields(["name"])
+
+        self.assertEqual(
+            projected._data.query.deferred_loading,
+            (frozenset({"id", "name"}), False),
+        )
+        self.assertEqual(
+            [manager.name for manager in projected],
+            [manager.name for manager in bucket],
+        )
+
+    def test_with_loaded_fields_keeps_buckets_with_unknown_fields(self):
+        bucket = self.TestHuman.all()
+
+        self.assertIs(bucket.with_loaded_fields(["name", "missing"]), bucket)
+
     def test_soft_delete_behavior(self):
         """
         Verify that soft-deleted TestFamily instances are excluded from default queries but retrievable when including inactive records.
@@ -29,6 +29,7 @@ from general_manager.manager.general_manager import GeneralManager
 from general_manager.uploads.adapters import (
     ExactPublicDownloadAdapter,
     ProxyUploadAdapter,
+    RangedDownloadAdapter,
     UploadAdapter,
     UploadInstructions,
 )
@@ -169,6 +170,7 @@ def test_public_api_exports_upload_policy_and_adapter_registration() -> None:
     assert callable(api.register_upload_adapter)
     assert api.UploadAdapter is UploadAdapter
     assert api.ExactPublicDownloadAdapter is ExactPublicDownloadAdapter
+    assert api.RangedDownloadAdapter is RangedDownloadAdapter
     assert api.UploadObjectMissingError is UploadObjectMissingError
 
     class CustomStorage(FileSystemStorage):
@@ -3,7 +3,10 @@ from typing import ClassVar
 from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
-from django.db.models import CharField, DateField, ForeignKey, CASCADE
+from django.db import connection
+from django.db.models import CASCADE, CharField, DateField, ForeignKey, TextField
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils.crypto import get_random_string
 from general_manager.api.property import graph_ql_property
 from general_manager.manager.general_manager import GeneralManager
@@ -12,6 +15,7 @@ from general_manager.measurement.measurement_field import MeasurementField
 from general_manager.permission.manager_based_permission import (
     AdditiveManagerPermission,
 )
+from general_manager.permission.permission_checks import register_permission
 from general_manager.utils.testing import (
     GeneralManagerTransactionTestCase,
 )
@@ -953,6 +957,92 @@ class TestGraphQLQueryBasedOnReadHardening(GeneralManagerTransactionTestCase):
         self.assertEqual(matching, [])
 
 
+class TestGraphQLQueryBatchedBasedOnPermissions(GeneralManagerTransactionTestCase):
+    @classmethod
+    def setUpClass(cls):
+        class BatchedProject(GeneralManager):
+            class Interface(DatabaseInterface):
+                name = CharField(max_length=100)
+
+            class Permission(AdditiveManagerPermission):
+                __read__: ClassVar[list[str]] = ["isAuthenticated"]
+
+        class BatchedOrder(GeneralManager):
+            class Interface(DatabaseInterface):
+                title = CharField(max_length=100)
+                project = ForeignKey(
+                    "general_manager.BatchedProject",
+                    on_delete=CASCADE,
+                )
+
+            class Permission(AdditiveManagerPermission):
+                __based_on__: ClassVar[str] = "project"
+                __read__: ClassVar[list[str]] = ["public"]
+
+        cls.general_manager_classes = [BatchedProject, BatchedOrder]
+        cls.batched_project = BatchedProject
+        cls.batched_order = BatchedOrder
+
+    def setUp(self):
+        super().setUp()
+        password = get_random_string(12)
+        get_user_model().objects.create_user(
+            username="batched-based-on-user",
+            password=password,
+        )
+        self.client.login(username="batched-based-on-user", password=password)
+        projects = [
+            self.batched_project.Factory.create(name=f"Project {number}")
+            for number in range(4)
+        ]
+        for number in range(20):
+            self.batched_order.Factory.create(
+                title=f"Order {number}",
+                project=projects[number % len(projects)],
+            )
+
+    def test_list_query_evaluates_each_based_on_target_once(self):
+        query = """
+        query {
+            batchedOrderList {
+                items {
+                    title
+                }
+            }
+        }
+        """
+        project_permission = self.batched_project.Permission
+
+        project_table = self.batched_project.Interface._model._meta.db_table
+
+        with (
+            patch.object(
+                project_permission,
+                "__init__",
+                autospec=True,
+                side_effect=project_permission.__init__,
+            ) as construct,
+            CaptureQueriesContext(connection) as queries,
+        ):
+            response = self.query(query)
+
+        self.assertResponseNoErrors(response)
+        items = response.json()["data"]["batchedOrderList"]["items"]
+        self.assertEqual(len(items), 20)
+        targets = [
+            call.kwargs["instance"]
+            for call in construct.call_args_list
+            if not isinstance(call.kwargs["instance"], type)
+        ]
+        self.assertEqual(sorted(target.id for target in targets), [1, 2, 3, 4])
+        project_queries = [
+            query
+            for query in queries.captured_queries
+            if f'FROM "{project_table}"' in query["sql"]
+        ]
+        self.assertEqual(len(project_queries), 1)
+
+
 class TestGraphQLIncludeInactiveValidation(GeneralManagerTransactionTestCase):
     @classmethod
     def setUpClass(cls):
@@ -996,3 +1086,138 @@ class TestGraphQLIncludeInactiveValidation(GeneralManagerTransactionTestCase):
         self.assertTrue(errors)
         self.assertIn("Unknown argument", errors[0].get("message", ""))
         self.assertIn("includeInactive", errors[0].get("message", ""))
+
+
+@register_permission("projectionTitleNotSecret")
+def _projection_title_not_secret(instance, _user, _config):
+    return instance.title != "secret"
+
+
+class TestGraphQLQueryFieldProjection(GeneralManagerTransactionTestCase):
+    @classmethod
+    def setUpClass(cls):
+        class WideOwner(GeneralManager):
+            class Interface(DatabaseInterface):
+                name = CharField(max_length=100)
+
+        class WideDocument(GeneralManager):
+            class Interface(DatabaseInterface):
+                title = CharField(max_length=100)
+                body = TextField()
+                budget = MeasurementField("EUR")
+                owner = ForeignKey("general_manager.WideOwner", on_delete=CASCADE)
+
+            @graph_ql_property
+            def body_length(self) -> int:
+                return len(self.body)
+
+        class GuardedDocument(GeneralManager):
+            class Interface(DatabaseInterface):
+                title = CharField(max_length=100)
+                body = TextField()
+
+            class Permission(AdditiveManagerPermission):
+                __read__: ClassVar[list[str]] = ["projectionTitleNotSecret"]
+
+        cls.general_manager_classes = [WideOwner, WideDocument, GuardedDocument]
+        cls.wide_owner = WideOwner
+        cls.wide_document = WideDocument
+        cls.guarded_document = GuardedDocument
+
+    def setUp(self):
+        super().setUp()
+        password = get_random_string(12)
+        get_user_model().objects.create_user(
+            username="projection-user",
+            password=password,
+        )
+        self.client.login(username="projection-user", password=password)
+        owner = self.wide_owner.Factory.create(name="Owner")
+        for number in range(3):
+            self.wide_document.Factory.create(
+                title=f"Document {number}",
+                body="x" * 1000,
+                owner=owner,
+            )
+        self.table = self.wide_document.Interface._model._meta.db_table
+
+    def _list_queries(self, query):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.query(query)
+        self.assertResponseNoErrors(response)
+        return response.json()["data"]["wideDocumentList"]["items"], [
+            captured["sql"]
+            for captured in queries.captured_queries
+            if f'FROM "{self.table}"' in captured["sql"]
+            and "COUNT(" not in captured["sql"]
+        ]
+
+    def test_projection_is_disabled_by_default(self):
+        _items, queries = self._list_queries(
+            "query { wideDocumentList { items { title } } }"
+        )
+
+        self.assertEqual(len(queries), 1)
+        self.assertIn('"body"', queries[0])
+
+    @override_settings(GENERAL_MANAGER={"GRAPHQL_FIELD_PROJECTION_ENABLED": True})
+    def test_list_query_selects_only_requested_columns(self):
+        items, queries = self._list_queries(
+            """
+            query {
+                wideDocumentList {
+                    items { id title budget { value unit } owner { name } }
+                }
+            }
+            """
+        )
+
+        self.assertEqual(len(items), 3)
+        self.assertEqual(items[0]["owner"], {"name": "Owner"})
+        self.assertEqual(len(queries), 1)
+        self.assertIn('"title"', queries[0])
+        self.assertIn('"budget_value"', queries[0])
+        self.assertIn('"owner_id"', queries[0])
+        self.assertNotIn('"body"', queries[0])
+
+    @override_settings(GENERAL_MANAGER={"GRAPHQL_FIELD_PROJECTION_ENABLED": True})
+    def test_properties_keep_loading_every_column(self):
+        items, queries = self._list_queries(
+            "query { wideDocumentList { items { title bodyLength } } }"
+        )
+
+        self.assertEqual([item["bodyLength"] for item in items], [1000] * 3)
+        self.assertEqual(len(queries), 1)
+        self.assertIn('"body"', queries[0])
+
+    def test_projection_can_be_disabled(self):
+        with self.settings(GENERAL_MANAGER={"GRAPHQL_FIELD_PROJECTION_ENABLED": False}):
+            _items, queries = self._list_queries(
+                "query { wideDocumentList { items { title } } }"
+            )
+
+        self.assertEqual(len(queries), 1)
+        self.assertIn('"body"', queries[0])
+
+    @override_settings(GENERAL_MANAGER={"GRAPHQL_FIELD_PROJECTION_ENABLED": True})
+    def test_row_level_read_permissions_keep_loading_every_column(self):
+        for number in range(5):
+            self.guarded_document.Factory.create(
+                title="secret" if number == 0 else f"Document {number}",
+                body="x" * 10,
+            )
+        table = self.guarded_document.Interface._model._meta.db_table
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.query("query { guardedDocumentList { items { body } } }")
+        self.assertResponseNoErrors(response)
+        row_queries = [
+            captured["sql"]
+            for captured in queries.captured_queries
+            if f'FROM "{table}"' in captured["sql"] and "COUNT(" not in captured["sql"]
+        ]
+
+        items = response.json()["data"]["guardedDocumentList"]["items"]
+        self.assertEqual(len(items), 4)
+        self.assertLessEqual(len(row_queries), 3)
+        self.assertTrue(all('"title"' in sql for sql in row_queries))
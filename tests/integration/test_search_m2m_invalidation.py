@@ -319,7 +319,7 @@ class SearchM2MInvalidationIntegrationTests(TransactionTestCase):
         ]
 
     def test_set_clear_false_and_true_leave_fresh_final_owner(self) -> None:
-        """Django set variants may duplicate work but both cover final state."""
+        """Each set variant coalesces its m2m events and covers final state."""
         relation = self.auto_owner_a.sources
         relation.add(self.source_a)
 
@@ -331,7 +331,7 @@ class SearchM2MInvalidationIntegrationTests(TransactionTestCase):
 
         assert relation.filter(pk=self.source_a.pk).exists()
         assert not relation.filter(pk=self.source_b.pk).exists()
-        assert dispatch.call_count >= 3
+        assert dispatch.call_count == 2
         assert all(
             call.args[2] == ({"id": self.auto_owner_a.pk},)
             for call in dispatch.call_args_list
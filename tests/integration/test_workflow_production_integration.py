@@ -5,8 +5,10 @@ from typing import ClassVar
 from unittest.mock import patch
 
 from django.core.management import call_command
+from django.db import connection, transaction
 from django.db.models import CharField
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from general_manager.interface import DatabaseInterface
 from general_manager.manager.general_manager import GeneralManager
@@ -18,6 +20,7 @@ from general_manager.workflow.event_registry import (
     InMemoryEventRegistry,
     WorkflowEvent,
     configure_event_registry,
+    workflow_event_batch,
 )
 from general_manager.workflow.models import (
     WorkflowDeliveryAttempt,
@@ -80,6 +83,15 @@ class WorkflowProductionIntegrationTests(GeneralManagerTransactionTestCase):
     def _on_manager_updated(self, event: WorkflowEvent) -> None:
         self.handled_events.append(event.event_id)
 
+    def _create_projects(self, count: int) -> list[GeneralManager]:
+        with patch("general_manager.workflow.tasks.publish_outbox_batch.delay"):
+            return [
+                self.Project.create(
+                    name=f"Prod {index}", status="draft", ignore_permission=True
+                )
+                for index in range(count)
+            ]
+
     def test_signal_bridge_persists_event_and_outbox_in_async_mode(self) -> None:
         with patch(
             "general_manager.workflow.tasks.publish_outbox_batch.delay"
@@ -105,6 +117,72 @@ class WorkflowProductionIntegrationTests(GeneralManagerTransactionTestCase):
             == 2
         )
 
+    @override_settings(
+        GENERAL_MANAGER={
+            "WORKFLOW_MODE": "production",
+            "WORKFLOW_ASYNC": True,
+            "WORKFLOW_SIGNAL_BRIDGE": True,
+            "WORKFLOW_SIGNAL_BRIDGE_SKIP_UNROUTED": True,
+        }
+    )
+    def test_signal_bridge_can_skip_unrouted_events(self) -> None:
+        with patch("general_manager.workflow.tasks.publish_outbox_batch.delay"):
+            project = self.Project.create(
+                name="Prod Alpha",
+                status="draft",
+                ignore_permission=True,
+            )
+            project.update(status="active", ignore_permission=True)
+
+        # Only updates are routed, so the create event is never stored.
+        update_event = WorkflowEventRecord.objects.get()
+        assert update_event.event_type == "general_manager.manager.updated"
+        assert WorkflowOutbox.objects.count() == 1
+
+    def test_signal_bridge_writes_events_inside_the_source_transaction(self) -> None:
+        projects = self._create_projects(3)
+        created = WorkflowOutbox.objects.count()
+
+        with patch(
+            "general_manager.workflow.tasks.publish_outbox_batch.delay"
+        ) as delay:
+            with transaction.atomic():
+                for project in projects:
+                    project.update(status="active", ignore_permission=True)
+                assert WorkflowEventRecord.objects.count() == created + 3
+                delay.assert_not_called()
+
+        assert delay.call_count == 1
+        assert WorkflowOutbox.objects.count() == created + 3
+
+    def test_event_batch_bulk_inserts_signal_bridge_events(self) -> None:
+        projects = self._create_projects(3)
+        created = WorkflowOutbox.objects.count()
+        event_table = WorkflowEventRecord._meta.db_table
+        outbox_table = WorkflowOutbox._meta.db_table
+
+        with (
+            patch("general_manager.workflow.tasks.publish_outbox_batch.delay") as delay,
+            CaptureQueriesContext(connection) as queries,
+            workflow_event_batch(),
+        ):
+            for project in projects:
+                project.update(status="active", ignore_permission=True)
+            assert WorkflowEventRecord.objects.count() == created
+
+        inserts = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("INSERT")
+            and (
+                f'"{event_table}"' in query["sql"]
+                or f'"{outbox_table}"' in query["sql"]
+            )
+        ]
+        assert len(inserts) == 2
+        assert delay.call_count == 1
+        assert WorkflowOutbox.objects.count() == created + 3
+
     def test_drain_outbox_routes_event_and_marks_processed(self) -> None:
         with patch("general_manager.workflow.tasks.publish_outbox_batch.delay"):
             project = self.Project.create(
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from typing import Any, ClassVar
 
+from django.db import connection
 from django.db.models import CharField
+from django.test.utils import CaptureQueriesContext
 
 from general_manager.cache.signals import post_data_change
 from general_manager.interface import DatabaseInterface
@@ -218,3 +220,30 @@ class WorkflowSignalIntegrationTests(GeneralManagerTransactionTestCase):
         assert len(deleted_events) == 1
         assert current_identification != identification_before
         assert deleted_events[0].payload["identification"] == current_identification
+
+    def test_manager_update_resolves_old_values_with_one_history_query(
+        self,
+    ) -> None:
+        updated_events: list[WorkflowEvent] = []
+        self.event_registry.register(
+            "general_manager.manager.updated",
+            handler=updated_events.append,
+        )
+        project = self.Project.create(
+            name="Epsilon",
+            status="draft",
+            ignore_permission=True,
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            project.update(name="Zeta", status="review", ignore_permission=True)
+
+        history_queries = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("SELECT") and "history_date" in query["sql"]
+        ]
+        assert len(history_queries) == 1
+        changes = updated_events[0].payload["changes"]
+        assert changes["name"] == {"old": "Epsilon", "new": "Zeta"}
+        assert changes["status"] == {"old": "draft", "new": "review"}
@@ -0,0 +1,130 @@
+"""Operation-count regression tests for request-scoped GraphQL read checks."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import ClassVar
+
+from django.contrib.auth.models import AnonymousUser
+from graphql import OperationType
+
+from general_manager.api.graphql_resolvers import resolve_with_read_permission
+from general_manager.permission.manager_based_permission import (
+    AdditiveManagerPermission,
+)
+from general_manager.permission.permission_checks import (
+    PermissionFilterDecision,
+    permission_functions,
+    register_permission,
+)
+
+ROWS = 500
+FIELDS = tuple(f"field_{number}" for number in range(20))
+
+
+class _Counters:
+    constructions = 0
+    user_only_methods = 0
+    row_methods = 0
+
+
+def _user_only_filter(_user: object, _config: list[str]) -> PermissionFilterDecision:
+    return PermissionFilterDecision.ALLOW_ALL
+
+
+def _row_filter(_user: object, _config: list[str]) -> dict[str, dict[str, object]]:
+    return {"filter": {"owner": "me"}}
+
+
+class _ListPermission(AdditiveManagerPermission):
+    __read__: ClassVar[list[str]] = ["perfUserOnly"]
+    field_0: ClassVar[dict[str, list[str]]] = {"read": ["perfRow"]}
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        _Counters.constructions += 1
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+
+
+class _UserOnlyPermission(AdditiveManagerPermission):
+    __read__: ClassVar[list[str]] = ["perfUserOnly"]
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        _Counters.constructions += 1
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+
+
+class _Row:
+    Permission: type[AdditiveManagerPermission] = _ListPermission
+
+    def __init__(self, number: int) -> None:
+        self.number = number
+
+
+class _UserOnlyRow(_Row):
+    Permission = _UserOnlyPermission
+
+
+def _resolve_page(operation: OperationType, row_class: type[_Row]) -> None:
+    info = SimpleNamespace(
+        operation=SimpleNamespace(operation=operation),
+        context=SimpleNamespace(user=AnonymousUser()),
+    )
+    rows = [row_class(number) for number in range(ROWS)]
+    for row in rows:
+        for field_name in FIELDS:
+            resolve_with_read_permission(
+                row,  # type: ignore[arg-type]
+                info,  # type: ignore[arg-type]
+                field_name,
+                lambda: None,
+            )
+
+
+def _measure(
+    operation: OperationType,
+    row_class: type[_Row] = _Row,
+) -> tuple[int, int, int]:
+    _Counters.constructions = 0
+    _Counters.user_only_methods = 0
+    _Counters.row_methods = 0
+    registry = permission_functions.copy()
+    try:
+
+        @register_permission("perfUserOnly", permission_filter=_user_only_filter)
+        def _user_only(_instance: object, _user: object, _config: list[str]) -> bool:
+            _Counters.user_only_methods += 1
+            return True
+
+        @register_permission("perfRow", permission_filter=_row_filter)
+        def _row(_instance: object, _user: object, _config: list[str]) -> bool:
+            _Counters.row_methods += 1
+            return True
+
+        _resolve_page(operation, row_class)
+    finally:
+        permission_functions.clear()
+        permission_functions.update(registry)
+    return (
+        _Counters.constructions,
+        _Counters.user_only_methods,
+        _Counters.row_methods,
+    )
+
+
+def test_query_list_page_builds_one_evaluator_per_row() -> None:
+    """A 500x20 query page constructs 500 evaluators instead of 10,000."""
+    uncached = _measure(OperationType.MUTATION)
+    cached = _measure(OperationType.QUERY)
+
+    assert uncached == (ROWS * len(FIELDS), ROWS * len(FIELDS), ROWS)
+    assert cached == (ROWS, 0, ROWS)
+    assert cached[0] * 10 <= uncached[0]
+
+
+def test_user_only_read_rules_compile_to_one_field_mask() -> None:
+    """User-only rules build one evaluator for the mask, not one per row."""
+    uncached = _measure(OperationType.MUTATION, _UserOnlyRow)
+    cached = _measure(OperationType.QUERY, _UserOnlyRow)
+
+    assert uncached == (ROWS * len(FIELDS), ROWS * len(FIELDS), 0)
+    assert cached == (1, 0, 0)
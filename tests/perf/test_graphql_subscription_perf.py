@@ -0,0 +1,61 @@
+"""Operation-count regression tests for shared subscription hydration."""
+
+from __future__ import annotations
+
+import asyncio
+
+from general_manager.api.graphql import GraphQL
+from general_manager.api.graphql_subscriptions import (
+    new_event_id,
+    shared_subscription_hydration,
+)
+
+SUBSCRIBERS = 300
+OBJECTS = 3
+
+
+class _Counters:
+    constructions = 0
+
+
+class _DashboardManager:
+    def __init__(self, number: int) -> None:
+        _Counters.constructions += 1
+        self.number = number
+
+
+async def _deliver_event(*, stamped: bool) -> None:
+    event_ids = {
+        object_id: new_event_id() if stamped else None for object_id in range(OBJECTS)
+    }
+    await asyncio.gather(
+        *(
+            GraphQL._hydrate_subscription_item(
+                _DashboardManager,  # type: ignore[arg-type]
+                {"number": object_id},
+                event_ids[object_id],
+                {"total"},
+            )
+            for object_id in range(OBJECTS)
+            for _subscriber in range(SUBSCRIBERS)
+        )
+    )
+
+
+def _measure(*, stamped: bool) -> int:
+    _Counters.constructions = 0
+    shared_subscription_hydration.clear()
+    try:
+        asyncio.run(_deliver_event(stamped=stamped))
+    finally:
+        shared_subscription_hydration.clear()
+    return _Counters.constructions
+
+
+def test_subscription_hydration_scales_with_objects_not_connections() -> None:
+    """300 subscribers per object hydrate each object once per event."""
+    unshared = _measure(stamped=False)
+    shared = _measure(stamped=True)
+
+    assert unshared == OBJECTS * SUBSCRIBERS
+    assert shared == OBJECTS
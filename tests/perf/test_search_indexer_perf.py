@@ -0,0 +1,42 @@
+"""Operation-count regression tests for the search indexer write path."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+
+from general_manager.apps import GeneralmanagerConfig
+from general_manager.search import indexer as indexer_module
+from general_manager.search.backend import SearchDocument
+from general_manager.search.backends.dev import DevSearchBackend
+from general_manager.search.indexer import SearchIndexer
+from tests.perf.support import Counter
+from tests.unit.test_search_indexer import Project
+
+
+class _CountingBackend(DevSearchBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.ensure_calls = Counter()
+        self.upsert_calls = Counter()
+
+    def ensure_index(self, index_name: str, settings: Mapping[str, object]) -> None:
+        self.ensure_calls.increment()
+        super().ensure_index(index_name, settings)
+
+    def upsert(self, index_name: str, documents: Sequence[SearchDocument]) -> None:
+        self.upsert_calls.increment()
+        super().upsert(index_name, documents)
+
+
+def test_write_path_applies_index_settings_once_per_schema() -> None:
+    """Saving many instances sends index settings once, not once per save."""
+    GeneralmanagerConfig.initialize_general_manager_classes([Project], [Project])
+    indexer_module.clear_applied_index_settings()
+    backend = _CountingBackend()
+    indexer = SearchIndexer(backend)
+
+    for iteration in range(500):
+        indexer.index_instance(Project(id=1 + iteration % 2))
+
+    assert backend.upsert_calls.value == 500
+    assert backend.ensure_calls.value == 1
@@ -59,6 +59,41 @@ def test_scheduler_operation_count_scales_with_unique_targets_per_batch() -> Non
     assert sum(len(call.args[2]) for call in dispatch_batch.call_args_list) == 1000
 
 
+def test_transaction_dispatch_count_scales_with_distinct_targets() -> None:
+    """Repeated saves in one transaction collapse into chunked batch tasks."""
+    callbacks: list[object] = []
+
+    with (
+        patch("general_manager.search.invalidation.get_setting", return_value=100),
+        patch(
+            "general_manager.search.invalidation.transaction.on_commit",
+            side_effect=lambda callback, **_kwargs: callbacks.append(callback),
+        ),
+        patch(
+            "general_manager.search.invalidation.mark_search_index_dirty",
+            return_value=None,
+        ),
+        patch(
+            "general_manager.search.invalidation.dispatch_index_manager_batch",
+            return_value=100,
+        ) as dispatch_batch,
+    ):
+        for save in range(2000):
+            schedule_search_invalidation_work(
+                SearchScheduledWork(
+                    upserts=SearchInvalidationPlan(
+                        targets=(scheduled_target(Owner, save % 250),)
+                    )
+                ),
+                source_database_alias="default",
+            )
+        for callback in callbacks:
+            callback()  # type: ignore[operator]
+
+    assert dispatch_batch.call_count == 3
+    assert sum(len(call.args[2]) for call in dispatch_batch.call_args_list) == 250
+
+
 def test_resolver_overflow_consumes_only_limit_plus_one_targets() -> None:
     """Overflow detection remains bounded to one item beyond the event cap."""
     yielded = 0
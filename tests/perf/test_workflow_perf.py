@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import os
+from time import perf_counter
 from unittest.mock import patch
 
 import pytest
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from general_manager.workflow.event_registry import DatabaseEventRegistry, WorkflowEvent
-from general_manager.workflow.models import WorkflowOutbox
+from general_manager.workflow.models import WorkflowDeliveryAttempt, WorkflowOutbox
 
 
 @pytest.mark.perf
@@ -48,3 +52,54 @@ def test_workflow_outbox_batch_claim_perf_smoke() -> None:
         WorkflowOutbox.objects.filter(status=WorkflowOutbox.STATUS_PROCESSED).count()
         == total_events
     )
+
+
+@pytest.mark.perf
+@pytest.mark.django_db(transaction=True)
+@override_settings(
+    GENERAL_MANAGER={"WORKFLOW_MODE": "production", "WORKFLOW_ASYNC": True}
+)
+def test_workflow_outbox_batch_bookkeeping_is_set_based() -> None:
+    registry = DatabaseEventRegistry()
+    registry.register("invoice.created", handler=lambda _event: None)
+    registry.register("invoice.created", handler=lambda _event: None, retries=1)
+    handlers = 2
+    total_events = 200
+    batch_size = 50
+    with patch.object(
+        DatabaseEventRegistry, "_enqueue_publish_task", return_value=None
+    ):
+        for idx in range(total_events):
+            registry.publish(
+                WorkflowEvent(
+                    event_id=f"evt-batch-perf-{idx}",
+                    event_type="invoice.created",
+                    payload={"invoice_id": idx},
+                )
+            )
+
+    def drain() -> int:
+        routed = 0
+        while claims := registry.claim_outbox_batch(batch_size=batch_size):
+            routed += registry.process_outbox_batch(claims)
+        return routed
+
+    with CaptureQueriesContext(connection) as queries:
+        started = perf_counter()
+        routed = drain()
+        elapsed = perf_counter() - started
+
+    assert routed == total_events
+    assert (
+        WorkflowDeliveryAttempt.objects.filter(
+            status=WorkflowDeliveryAttempt.STATUS_COMPLETED
+        ).count()
+        == total_events * handlers
+    )
+    # One write to start and one to finish each handler attempt; claiming,
+    # loading, and finalizing cost a fixed number of statements per batch.
+    batches = total_events // batch_size + 1
+    assert len(queries.captured_queries) <= (2 * total_events * handlers + 12 * batches)
+    if os.environ.get("GENERAL_MANAGER_RECORD_PERF") == "1":
+        rows_per_second = total_events / max(elapsed, 1e-9)
+        print(f"PERF_OBSERVATION WORKFLOW_OUTBOX_ROWS_PER_SECOND={rows_per_second:.0f}")
@@ -251,6 +251,12 @@ class AppsUtilitiesTests(SimpleTestCase):
                                     "configure_beat_schedule"
                                 ),
                             ),
+                            patch(
+                                "general_manager.apps.configure_workflow_retention_beat_schedule_from_settings",
+                                side_effect=lambda *_args, **_kwargs: call_order.append(
+                                    "configure_retention_beat_schedule"
+                                ),
+                            ),
                             patch(
                                 "general_manager.apps.configure_search_reconcile_beat_schedule_from_settings",
                                 side_effect=lambda *_args, **_kwargs: call_order.append(
@@ -281,6 +287,7 @@ class AppsUtilitiesTests(SimpleTestCase):
             "configure_event_registry",
             "configure_signal_bridge",
             "configure_beat_schedule",
+            "configure_retention_beat_schedule",
             "configure_search_reconcile_beat_schedule",
             "configure_graphql_warmup_beat_schedule",
         ]
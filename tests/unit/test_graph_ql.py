@@ -2746,6 +2746,7 @@ class GraphQLTests(TestCase):
         """
         mock_instance = MagicMock()
         mock_qs = MagicMock()
+        mock_qs.with_loaded_fields.return_value = mock_qs
         mock_instance.abc_list = mock_qs
         resolver = GraphQL._create_resolver("abc_list", GeneralManager)
         with (
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import unittest
+from time import perf_counter
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import graphene
+from django.test import SimpleTestCase, override_settings
+from graphql import build_schema, parse
+
+from general_manager.api import graphql_view as view_module
+from general_manager.api.graphql_cost import (
+    QueryCostAnalyzer,
+    analyze_query_cost,
+)
+from general_manager.api.graphql_view import GeneralManagerGraphQLView
+
+SDL = """
+type Query {
+  projectList(page: Int, pageSize: Int, filter: ProjectFilter): ProjectPage!
+  project(id: ID!): Project
+}
+
+input ProjectFilter { id: ID, id_In: [ID], name: String }
+
+type ProjectPage { items: [Project!]!, pageInfo: PageInfo! }
+type PageInfo { totalCount: Int! }
+
+type Project {
+  name: String
+  lead: Project
+  taskList(page: Int, pageSize: Int): TaskPage!
+}
+
+type TaskPage { items: [Task!]! }
+type Task { title: String }
+"""
+
+
+class QueryCostAnalyzerTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.schema = build_schema(SDL)
+
+    def _cost(self, query: str, **kwargs: object) -> int | None:
+        variables = kwargs.pop("variables", None)
+        return QueryCostAnalyzer(
+            self.schema,
+            parse(query),
+            variables,  # type: ignore[arg-type]
+            **kwargs,  # type: ignore[arg-type]
+        ).operation_cost(None)
+
+    def test_page_size_multiplies_nested_selections(self) -> None:
+        query = """
+        {
+          projectList(pageSize: 20) {
+            items { name taskList(pageSize: 5) { items { title } } }
+          }
+        }
+        """
+
+        # projectList + items + 20 * (name + taskList + items + 5 * title)
+        self.assertEqual(self._cost(query), 2 + 20 * (3 + 5))
+
+    def test_unpaginated_lists_use_default_size_or_row_counts(self) -> None:
+        query = "{ projectList { items { name } } }"
+
+        self.assertEqual(self._cost(query, default_list_size=50), 2 + 50)
+        self.assertEqual(
+            self._cost(query, row_count={"Project": 7}.get),
+            2 + 7,
+        )
+
+    def test_page_without_page_size_uses_resolver_default(self) -> None:
+        self.assertEqual(self._cost("{ projectList(page: 3) { items { name } } }"), 12)
+
+    def test_identifier_filters_bound_fan_out(self) -> None:
+        self.assertEqual(
+            self._cost('{ projectList(filter: {id: "1"}) { items { name } } }'),
+            3,
+        )
+        self.assertEqual(
+            self._cost(
+                "query Q($ids: [ID]) "
+                "{ projectList(filter: {id_In: $ids}) { items { name } } }",
+                variables={"ids": ["1", "2", "3"]},
+            ),
+            5,
+        )
+
+    def test_fragments_are_expanded_and_introspection_is_free(self) -> None:
+        query = """
+        query { projectList(pageSize: 2) { items { ...Fields __typename } } }
+        fragment Fields on Project { name }
+        """
+
+        self.assertEqual(self._cost(query), 4)
+
+    def test_fragment_spread_again_under_a_later_sibling_is_counted(self) -> None:
+        query = """
+        query { project(id: "1") { ...Named lead { ...Named } } }
+        fragment Named on Project { name }
+        """
+
+        # project + name + lead + lead.name
+        self.assertEqual(self._cost(query), 4)
+
+    def test_repeated_spreads_in_one_selection_set_are_counted_once(self) -> None:
+        depth = 20
+        fragments = "\n".join(
+            f"fragment F{index} on Project "
+            f"{{ lead {{ ...F{index + 1} ...F{index + 1} }} }}"
+            for index in range(1, depth)
+        )
+        query = f"""
+        query {{ project(id: "1") {{ ...F1 ...F1 }} }}
+        {fragments}
+        fragment F{depth} on Project {{ name }}
+        """
+
+        started = perf_counter()
+        cost = self._cost(query)
+
+        self.assertLess(perf_counter() - started, 1.0)
+        # project + one lead per nested fragment + the final name
+        self.assertEqual(cost, 1 + depth)
+
+    def test_nested_fragments_are_analyzed_once_per_type(self) -> None:
+        depth = 20
+        fragments = "\n".join(
+            f"fragment F{index} on Project "
+            f"{{ a: lead {{ ...F{index + 1} }} b: lead {{ ...F{index + 1} }} }}"
+            for index in range(1, depth)
+        )
+        query = f"""
+        query {{ project(id: "1") {{ ...F1 }} }}
+        {fragments}
+        fragment F{depth} on Project {{ name }}
+        """
+
+        started = perf_counter()
+        cost = self._cost(query)
+
+        self.assertLess(perf_counter() - started, 1.0)
+        # Each level resolves two leads, each with the next level below it.
+        self.assertEqual(cost, 1 + 3 * 2 ** (depth - 1) - 2)
+
+    def test_estimator_failures_fall_back_to_default_size(self) -> None:
+        def failing(_type_name: str) -> int:
+            raise RuntimeError
+
+        self.assertEqual(
+            self._cost("{ projectList { items { name } } }", row_count=failing),
+            2 + 100,
+        )
+
+    def test_analysis_is_disabled_without_a_limit(self) -> None:
+        document = parse("{ projectList { items { name } } }")
+
+        self.assertIsNone(analyze_query_cost(self.schema, document, None, None))
+        with override_settings(GENERAL_MANAGER={"GRAPHQL_QUERY_COST_LIMIT": 10}):
+            query_cost = analyze_query_cost(self.schema, document, None, None)
+
+        assert query_cost is not None
+        self.assertTrue(query_cost.exceeded)
+        self.assertEqual(query_cost.as_extension(), {"requested": 102, "maximum": 10})
+
+
+class _Query(graphene.ObjectType):
+    ping = graphene.String()
+
+    @staticmethod
+    def resolve_ping(_root: object, _info: object) -> str:
+        return "pong"
+
+
+class QueryCostViewTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.view = GeneralManagerGraphQLView(schema=graphene.Schema(query=_Query))
+        self.view.json_encode = lambda _request, payload, **_kwargs: payload
+
+    def _post(self, query: str, limit: int) -> tuple[object, int]:
+        with override_settings(GENERAL_MANAGER={"GRAPHQL_QUERY_COST_LIMIT": limit}):
+            return self.view.get_response(
+                SimpleNamespace(GET={}, method="POST"),
+                {"query": query, "operationName": "Ping"},
+            )
+
+    def test_costed_responses_report_the_estimate(self) -> None:
+        payload, status = self._post("query Ping { ping }", limit=5)
+
+        self.assertEqual(status, 200)
+        self.assertEqual(
+            payload,
+            {
+                "data": {"ping": "pong"},
+                "extensions": {"cost": {"requested": 1, "maximum": 5}},
+            },
+        )
+
+    def test_over_budget_operations_are_rejected_before_execution(self) -> None:
+        backend = SimpleNamespace(rejections=[])
+        backend.record_query_cost_rejection = (
+            lambda **labels: backend.rejections.append(labels)
+        )
+        with (
+            patch.object(self.view, "execute_graphql_request") as execute,
+            patch.object(view_module, "graphql_metrics_enabled", return_value=True),
+            patch.object(
+                view_module, "get_graphql_metrics_backend", return_value=backend
+            ),
+            patch.object(view_module.GeneralManagerGraphQLView, "_record_metrics"),
+        ):
+            payload, status = self._post(
+                "query Ping { ping second: ping third: ping }", limit=2
+            )
+
+        execute.assert_not_called()
+        self.assertEqual(status, 400)
+        error = payload["errors"][0]
+        self.assertEqual(error["extensions"]["code"], "QUERY_COST_EXCEEDED")
+        self.assertEqual(error["extensions"]["cost"], {"requested": 3, "maximum": 2})
+        self.assertEqual(backend.rejections, [{"operation_name": "Ping"}])
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+from graphql import build_schema
+
+from general_manager.api import graphql_documents
+from general_manager.api.graphql_documents import GraphQLDocumentCache
+
+SDL = "type Query { ping: String, pong: Int }"
+
+
+class GraphQLDocumentCacheTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.cache = GraphQLDocumentCache()
+        self.schema = build_schema(SDL)
+
+    def test_repeated_queries_reuse_the_parsed_document(self) -> None:
+        first = self.cache.parse("{ ping }")
+
+        self.assertIs(self.cache.parse("{ ping }"), first)
+        self.assertIsNot(self.cache.parse("{ pong }"), first)
+
+    def test_successful_validation_runs_once_per_query_and_schema(self) -> None:
+        document = self.cache.parse("{ ping }")
+        with patch.object(
+            graphql_documents, "validate", wraps=graphql_documents.validate
+        ) as validate:
+            for _ in range(3):
+                self.assertEqual(
+                    self.cache.validate(self.schema, "{ ping }", document), []
+                )
+            self.cache.validate(build_schema(SDL), "{ ping }", document)
+
+        self.assertEqual(validate.call_count, 2)
+
+    def test_validation_rules_and_limits_are_part_of_the_key(self) -> None:
+        document = self.cache.parse("{ ping }")
+        with patch.object(
+            graphql_documents, "validate", wraps=graphql_documents.validate
+        ) as validate:
+            self.cache.validate(self.schema, "{ ping }", document)
+            self.cache.validate(self.schema, "{ ping }", document, [], None)
+            self.cache.validate(self.schema, "{ ping }", document, None, 5)
+
+        self.assertEqual(validate.call_count, 3)
+
+    def test_failed_validation_is_not_remembered(self) -> None:
+        document = self.cache.parse("{ missing }")
+        with patch.object(
+            graphql_documents, "validate", wraps=graphql_documents.validate
+        ) as validate:
+            first = self.cache.validate(self.schema, "{ missing }", document)
+            second = self.cache.validate(self.schema, "{ missing }", document)
+
+        self.assertEqual(validate.call_count, 2)
+        self.assertTrue(first)
+        self.assertTrue(second)
+        self.assertIsNot(first[0], second[0])
+
+    @override_settings(GENERAL_MANAGER={"GRAPHQL_DOCUMENT_CACHE_SIZE": 1})
+    def test_least_recently_used_documents_are_evicted(self) -> None:
+        ping = self.cache.parse("{ ping }")
+        self.cache.parse("{ pong }")
+
+        self.assertIsNot(self.cache.parse("{ ping }"), ping)
+
+    @override_settings(GENERAL_MANAGER={"GRAPHQL_DOCUMENT_CACHE_SIZE": 0})
+    def test_zero_size_disables_caching(self) -> None:
+        document = self.cache.parse("{ ping }")
+        with patch.object(
+            graphql_documents, "validate", wraps=graphql_documents.validate
+        ) as validate:
+            self.cache.validate(self.schema, "{ ping }", document)
+            self.cache.validate(self.schema, "{ ping }", document)
+
+        self.assertIsNot(self.cache.parse("{ ping }"), document)
+        self.assertEqual(validate.call_count, 2)
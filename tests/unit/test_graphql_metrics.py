@@ -134,6 +134,7 @@ class RecordingResolverBackend:
 class RecordingPrometheusMetric:
     def __init__(self) -> None:
         self.inc_count = 0
+        self.inc_amounts: list[float] = []
         self.observations: list[float] = []
         self.label_calls: list[dict[str, str]] = []
 
@@ -141,8 +142,9 @@ class RecordingPrometheusMetric:
         self.label_calls.append(label_values)
         return self
 
-    def inc(self) -> None:
+    def inc(self, amount: float = 1) -> None:
         self.inc_count += 1
+        self.inc_amounts.append(amount)
 
     def observe(self, value: float) -> None:
         self.observations.append(value)
@@ -266,6 +268,79 @@ def test_prometheus_backend_clamps_negative_and_nonfinite_durations(
     assert resolver_duration.observations == [0.0, 0.0]
 
 
+def test_prometheus_backend_records_search_cache_outcomes(monkeypatch) -> None:
+    cache_counter = RecordingPrometheusMetric()
+    cache_saved = RecordingPrometheusMetric()
+    monkeypatch.setattr(PrometheusGraphQLMetricsBackend, "_initialized", True)
+    monkeypatch.setattr(
+        PrometheusGraphQLMetricsBackend,
+        "_search_cache_counter",
+        cache_counter,
+        raising=False,
+    )
+    monkeypatch.setattr(
+        PrometheusGraphQLMetricsBackend,
+        "_search_cache_saved",
+        cache_saved,
+        raising=False,
+    )
+
+    backend = PrometheusGraphQLMetricsBackend()
+    backend.record_search_cache(index_name="global", outcome="miss", saved_seconds=0)
+    backend.record_search_cache(index_name="global", outcome="hit", saved_seconds=0.25)
+
+    assert cache_counter.label_calls == [
+        {"index_name": "global", "outcome": "miss"},
+        {"index_name": "global", "outcome": "hit"},
+    ]
+    assert cache_saved.label_calls == [{"index_name": "global"}]
+    assert cache_saved.inc_amounts == [0.25]
+
+
+def test_prometheus_backend_records_query_cache_outcomes(monkeypatch) -> None:
+    cache_counter = RecordingPrometheusMetric()
+    cache_duration = RecordingPrometheusMetric()
+    monkeypatch.setattr(PrometheusGraphQLMetricsBackend, "_initialized", True)
+    monkeypatch.setattr(
+        PrometheusGraphQLMetricsBackend,
+        "_query_cache_counter",
+        cache_counter,
+        raising=False,
+    )
+    monkeypatch.setattr(
+        PrometheusGraphQLMetricsBackend,
+        "_query_cache_duration",
+        cache_duration,
+        raising=False,
+    )
+
+    backend = PrometheusGraphQLMetricsBackend()
+    backend.record_query_cache(operation_name="dash", outcome="miss", duration=0.5)
+    backend.record_query_cache(operation_name="dash", outcome="hit", duration=-1.0)
+
+    assert cache_counter.label_calls == [
+        {"operation_name": "dash", "outcome": "miss"},
+        {"operation_name": "dash", "outcome": "hit"},
+    ]
+    assert cache_duration.observations == [0.5, 0.0]
+
+
+def test_prometheus_backend_counts_query_cost_rejections(monkeypatch) -> None:
+    rejections = RecordingPrometheusMetric()
+    monkeypatch.setattr(PrometheusGraphQLMetricsBackend, "_initialized", True)
+    monkeypatch.setattr(
+        PrometheusGraphQLMetricsBackend,
+        "_query_cost_rejections",
+        rejections,
+        raising=False,
+    )
+
+    PrometheusGraphQLMetricsBackend().record_query_cost_rejection(operation_name="dash")
+
+    assert rejections.label_calls == [{"operation_name": "dash"}]
+    assert rejections.inc_count == 1
+
+
 def test_resolve_operation_type_invalid_query() -> None:
     assert resolve_operation_type("query {", None) == "unknown"
 
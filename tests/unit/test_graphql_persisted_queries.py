@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import graphene
+from django.core.cache import cache as django_cache
+from django.test import SimpleTestCase, override_settings
+
+from general_manager.api import graphql_documents
+from general_manager.api.graphql_errors import PublicGraphQLError
+from general_manager.api.graphql_persisted_queries import (
+    graphql_request_extensions,
+    persisted_query_hash,
+    resolve_persisted_query,
+)
+from general_manager.api.graphql_view import GeneralManagerGraphQLView
+
+QUERY = "query Ping { ping }"
+QUERY_HASH = persisted_query_hash(QUERY)
+
+
+def _extensions(query_hash: str = QUERY_HASH) -> dict[str, object]:
+    return {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+
+
+@override_settings(GENERAL_MANAGER={"GRAPHQL_PERSISTED_QUERIES_ENABLED": True})
+class PersistedQueryResolutionTests(SimpleTestCase):
+    def setUp(self) -> None:
+        django_cache.clear()
+
+    def tearDown(self) -> None:
+        django_cache.clear()
+
+    def _code(self, error: PublicGraphQLError) -> object:
+        return (error.extensions or {}).get("code")
+
+    def test_requests_without_extension_are_unchanged(self) -> None:
+        self.assertEqual(resolve_persisted_query(QUERY, None), QUERY)
+        self.assertIsNone(resolve_persisted_query(None, {"tracing": True}))
+
+    def test_unknown_hash_asks_client_for_full_text(self) -> None:
+        with self.assertRaises(PublicGraphQLError) as context:
+            resolve_persisted_query(None, _extensions())
+
+        self.assertEqual(self._code(context.exception), "PERSISTED_QUERY_NOT_FOUND")
+
+    def test_registered_query_is_resolved_by_hash(self) -> None:
+        self.assertEqual(resolve_persisted_query(QUERY, _extensions()), QUERY)
+
+        self.assertEqual(resolve_persisted_query(None, _extensions()), QUERY)
+
+    def test_mismatched_hash_is_rejected_and_not_registered(self) -> None:
+        wrong = persisted_query_hash("query Other { ping }")
+        with self.assertRaises(PublicGraphQLError) as context:
+            resolve_persisted_query(QUERY, _extensions(wrong))
+
+        self.assertEqual(self._code(context.exception), "BAD_USER_INPUT")
+        with self.assertRaises(PublicGraphQLError):
+            resolve_persisted_query(None, _extensions(wrong))
+
+    def test_malformed_extension_is_rejected(self) -> None:
+        for extensions in (
+            {"persistedQuery": "abc"},
+            {"persistedQuery": {"version": 2, "sha256Hash": QUERY_HASH}},
+            {"persistedQuery": {"version": 1}},
+        ):
+            with self.assertRaises(PublicGraphQLError):
+                resolve_persisted_query(None, extensions)
+
+    def test_configured_query_map_serves_unregistered_hashes(self) -> None:
+        with override_settings(
+            GENERAL_MANAGER={
+                "GRAPHQL_PERSISTED_QUERIES_ENABLED": True,
+                "GRAPHQL_PERSISTED_QUERY_MAP": {QUERY_HASH: QUERY},
+            }
+        ):
+            self.assertEqual(resolve_persisted_query(None, _extensions()), QUERY)
+
+    @override_settings(GENERAL_MANAGER={})
+    def test_disabled_hash_only_requests_report_not_supported(self) -> None:
+        self.assertEqual(resolve_persisted_query(QUERY, _extensions()), QUERY)
+        with self.assertRaises(PublicGraphQLError) as context:
+            resolve_persisted_query(None, _extensions())
+
+        self.assertEqual(self._code(context.exception), "PERSISTED_QUERY_NOT_SUPPORTED")
+
+    def test_extensions_are_read_from_body_or_query_string(self) -> None:
+        post = SimpleNamespace(GET={})
+        get = SimpleNamespace(GET={"extensions": json.dumps(_extensions())})
+
+        self.assertEqual(
+            graphql_request_extensions(post, {"extensions": _extensions()}),
+            _extensions(),
+        )
+        self.assertEqual(graphql_request_extensions(get, {}), _extensions())
+        with self.assertRaises(PublicGraphQLError):
+            graphql_request_extensions(SimpleNamespace(GET={"extensions": "{"}), {})
+
+
+class _Query(graphene.ObjectType):
+    ping = graphene.String()
+
+    @staticmethod
+    def resolve_ping(_root: object, _info: object) -> str:
+        return "pong"
+
+
+class PersistedQueryViewTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.enterContext(
+            override_settings(
+                GENERAL_MANAGER={"GRAPHQL_PERSISTED_QUERIES_ENABLED": True}
+            )
+        )
+        django_cache.clear()
+        self.view = GeneralManagerGraphQLView(schema=graphene.Schema(query=_Query))
+        self.view.json_encode = lambda _request, payload, **_kwargs: payload
+
+    def tearDown(self) -> None:
+        django_cache.clear()
+
+    def _post(self, data: dict[str, object]) -> tuple[object, int]:
+        return self.view.get_response(SimpleNamespace(GET={}, method="POST"), data)
+
+    def test_hash_only_request_executes_registered_query(self) -> None:
+        missing, missing_status = self._post({"extensions": _extensions()})
+        self._post({"query": QUERY, "extensions": _extensions()})
+        payload, status = self._post({"extensions": _extensions()})
+
+        self.assertEqual(missing_status, 400)
+        self.assertEqual(
+            missing["errors"][0]["extensions"]["code"], "PERSISTED_QUERY_NOT_FOUND"
+        )
+        self.assertEqual((payload, status), ({"data": {"ping": "pong"}}, 200))
+
+    def test_repeated_requests_validate_once(self) -> None:
+        graphql_documents.graphql_document_cache.clear()
+        with patch.object(
+            graphql_documents, "validate", wraps=graphql_documents.validate
+        ) as validate:
+            for _ in range(3):
+                payload, _status = self._post({"query": QUERY})
+                self.assertEqual(payload, {"data": {"ping": "pong"}})
+
+        self.assertEqual(validate.call_count, 1)
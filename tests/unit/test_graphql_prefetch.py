@@ -12,6 +12,7 @@ from graphql.language.ast import (
 
 from general_manager.api.graphql_prefetch import (
     DependencyCachePrefetchPlan,
+    collect_selected_graphql_field_names,
     collect_selected_graphql_property_names,
     plan_dependency_cache_prefetches,
     prefetch_dependency_cache_hits,
@@ -97,6 +98,31 @@ class GraphQLPrefetchSelectionTests(SimpleTestCase):
 
         self.assertEqual(selected, {"calculated_tax", "budget_used"})
 
+    def test_collects_every_direct_field_under_items(self) -> None:
+        info = _info(
+            """
+            query {
+                taxCalculationList {
+                    items {
+                        __typename
+                        id
+                        total: calculatedTax { value unit }
+                        employee { hiddenCost }
+                        ... on TaxCalculationType { createdAt }
+                    }
+                    pageInfo { totalCount }
+                }
+            }
+            """
+        )
+
+        selected = collect_selected_graphql_field_names(info, root_field="items")
+
+        self.assertEqual(
+            selected,
+            {"id", "calculated_tax", "employee", "created_at"},
+        )
+
     def test_does_not_collect_nested_relation_properties(self) -> None:
         info = _info(
             """
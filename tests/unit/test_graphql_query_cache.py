@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.core.cache import cache as django_cache
+from django.test import SimpleTestCase, override_settings
+from graphql import ExecutionResult, GraphQLError
+
+from general_manager.api import graphql_query_cache
+from general_manager.api.graphql_query_cache import (
+    default_permission_fingerprint,
+    execute_with_query_cache,
+    graphql_query_cache_key,
+    invalidate_graphql_query_cache_permissions,
+)
+from general_manager.cache.cache_tracker import DependencyTracker
+from general_manager.cache.dependency_cache import (
+    DependencyCacheHit,
+    read_dependency_cache_hit,
+)
+from general_manager.cache.dependency_index import invalidate_and_remove_cache_keys
+
+QUERY = "query Dashboard { projects { name } }"
+_MISS = object()
+
+
+def _user(pk: int) -> SimpleNamespace:
+    return SimpleNamespace(pk=pk, is_authenticated=True)
+
+
+class _Executor:
+    def __init__(
+        self,
+        *,
+        errors: list[GraphQLError] | None = None,
+        cacheable: bool = True,
+        extensions: dict[str, object] | None = None,
+    ) -> None:
+        self.calls = 0
+        self.errors = errors
+        self.cacheable = cacheable
+        self.extensions = extensions
+
+    def __call__(self) -> tuple[ExecutionResult, bool]:
+        self.calls += 1
+        DependencyTracker.track("Project", "filter", '{"active": true}')
+        return (
+            ExecutionResult(
+                data={"projects": [{"name": "A"}]},
+                errors=self.errors,
+                extensions=self.extensions,
+            ),
+            self.cacheable,
+        )
+
+
+class GraphQLQueryCacheKeyTests(SimpleTestCase):
+    def test_formatting_and_variable_order_do_not_split_entries(self) -> None:
+        first = graphql_query_cache_key(
+            "query Dashboard {projects{name}}",
+            "Dashboard",
+            {"a": 1, "b": 2},
+            "user:1",
+        )
+        second = graphql_query_cache_key(
+            "# comment\nquery Dashboard {\n  projects { name }\n}",
+            "Dashboard",
+            {"b": 2, "a": 1},
+            "user:1",
+        )
+
+        self.assertIsNotNone(first)
+        self.assertEqual(first, second)
+
+    def test_fingerprint_and_variables_split_entries(self) -> None:
+        base = graphql_query_cache_key(QUERY, None, {"id": 1}, "user:1")
+
+        self.assertNotEqual(
+            base, graphql_query_cache_key(QUERY, None, {"id": 1}, "user:2")
+        )
+        self.assertNotEqual(
+            base, graphql_query_cache_key(QUERY, None, {"id": 2}, "user:1")
+        )
+
+    def test_unparseable_queries_are_not_cached(self) -> None:
+        self.assertIsNone(graphql_query_cache_key("query {", None, None, "user:1"))
+        self.assertIsNone(graphql_query_cache_key(None, None, None, "user:1"))
+
+    def test_default_fingerprint_is_per_user(self) -> None:
+        anonymous = SimpleNamespace(user=SimpleNamespace(is_authenticated=False))
+
+        self.assertEqual(default_permission_fingerprint(anonymous), "anonymous")
+        self.assertEqual(
+            default_permission_fingerprint(SimpleNamespace(user=_user(7))),
+            "user:7",
+        )
+
+
+class GraphQLQueryCacheExecutionTests(SimpleTestCase):
+    def setUp(self) -> None:
+        django_cache.clear()
+        DependencyTracker.reset_thread_local_storage()
+
+    def tearDown(self) -> None:
+        django_cache.clear()
+        DependencyTracker.reset_thread_local_storage()
+
+    def _run(self, executor: _Executor, user_pk: int = 1) -> object:
+        return execute_with_query_cache(
+            request=SimpleNamespace(user=_user(user_pk)),
+            query=QUERY,
+            variables=None,
+            operation_name="Dashboard",
+            execute=executor,
+        )
+
+    def test_identical_requests_are_served_from_cache(self) -> None:
+        executor = _Executor()
+
+        first = self._run(executor)
+        second = self._run(executor)
+        other_user = self._run(executor, user_pk=2)
+
+        self.assertEqual(executor.calls, 2)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(other_user.data, first.data)
+
+    def test_hits_return_the_cached_extensions(self) -> None:
+        executor = _Executor(extensions={"cost": {"requested": 3}})
+
+        self._run(executor)
+        cached = self._run(executor)
+
+        self.assertEqual(executor.calls, 1)
+        self.assertEqual(cached.extensions, {"cost": {"requested": 3}})
+
+    def test_permission_invalidation_drops_user_or_all_entries(self) -> None:
+        executor = _Executor()
+        self._run(executor, user_pk=1)
+        self._run(executor, user_pk=2)
+
+        invalidate_graphql_query_cache_permissions(_user(1))
+        self._run(executor, user_pk=1)
+        self._run(executor, user_pk=2)
+        self.assertEqual(executor.calls, 3)
+
+        invalidate_graphql_query_cache_permissions()
+        self._run(executor, user_pk=1)
+        self._run(executor, user_pk=2)
+        self._run(executor, user_pk=2)
+        self.assertEqual(executor.calls, 5)
+
+    def test_entries_record_dependencies_for_index_invalidation(self) -> None:
+        executor = _Executor()
+        self._run(executor)
+        key = graphql_query_cache_key(QUERY, "Dashboard", None, "user:1")
+
+        hit = read_dependency_cache_hit(django_cache, key, sentinel=_MISS)
+        self.assertIsInstance(hit, DependencyCacheHit)
+        self.assertIn(("Project", "filter", '{"active": true}'), hit.dependencies)
+
+        invalidate_and_remove_cache_keys([key])
+        self._run(executor)
+
+        self.assertEqual(executor.calls, 2)
+
+    def test_error_and_uncacheable_results_are_not_stored(self) -> None:
+        failing = _Executor(errors=[GraphQLError("boom")])
+        uncacheable = _Executor(cacheable=False)
+
+        for executor in (failing, uncacheable):
+            self._run(executor)
+            self._run(executor)
+            self.assertEqual(executor.calls, 2)
+
+    @override_settings(
+        GENERAL_MANAGER={"GRAPHQL_QUERY_CACHE_FINGERPRINT": lambda _request: None}
+    )
+    def test_none_fingerprint_bypasses_cache(self) -> None:
+        executor = _Executor()
+
+        self._run(executor)
+        self._run(executor)
+
+        self.assertEqual(executor.calls, 2)
+
+    def test_outcomes_are_reported_to_metrics_backend(self) -> None:
+        executor = _Executor()
+        with patch.object(graphql_query_cache, "_record_cache_outcome") as record:
+            self._run(executor)
+            self._run(executor)
+
+        self.assertEqual(
+            [call.args[1] for call in record.call_args_list],
+            ["miss", "hit"],
+        )
@@ -13,6 +13,7 @@ import graphene
 from django.contrib.auth import get_user_model
 from django.db import transaction
 from django.db.models import CharField
+from django.test import override_settings
 from django.utils.crypto import get_random_string
 from graphql import parse
 from graphql.language.ast import FragmentDefinitionNode, OperationDefinitionNode
@@ -217,6 +218,47 @@ class TestGraphQLDatabaseSubscriptions(GeneralManagerTransactionTestCase):
         self.assertEqual(update["action"], "update")
         self.assertEqual(update["item"]["name"], "Bob")
 
+    @override_settings(GENERAL_MANAGER={"GRAPHQL_SUBSCRIPTION_SKIP_UNCHANGED": True})
+    def test_detail_subscription_skips_updates_with_unchanged_selection(
+        self,
+    ) -> None:
+        employee = self.Employee.create(name="Alice", creator_id=self.user.id)
+        schema = self._build_schema()
+        context = SimpleNamespace(user=self.user)
+        subscription = """
+            subscription ($id: ID!) {
+                onEmployeeChange(id: $id) {
+                    action
+                    item {
+                        name
+                    }
+                }
+            }
+        """
+
+        async def run_subscription() -> object:
+            generator = await schema.subscribe(
+                subscription,
+                variable_values={"id": employee.id},
+                context_value=context,
+            )
+            try:
+                await generator.__anext__()
+                await asyncio.to_thread(
+                    lambda: employee.update(name="Alice", creator_id=self.user.id)
+                )
+                await asyncio.to_thread(
+                    lambda: employee.update(name="Bob", creator_id=self.user.id)
+                )
+                return await asyncio.wait_for(generator.__anext__(), timeout=1)
+            finally:
+                await generator.aclose()
+
+        event = asyncio.run(run_subscription())
+
+        self.assertIsNone(event.errors)
+        self.assertEqual(event.data["onEmployeeChange"]["item"]["name"], "Bob")
+
     def test_detail_subscription_resolves_orm_backed_field_permission(self) -> None:
         employee = self.Employee.create(name="Field visible", creator_id=self.user.id)
         schema = self._build_schema()
@@ -551,7 +593,7 @@ class TestGraphQLDatabaseSubscriptions(GeneralManagerTransactionTestCase):
                 ) as group_add,
                 patch.object(
                     GraphQL,
-                    "_channel_listener",
+                    "_channel_message_listener",
                     new=AsyncMock(),
                 ) as listener,
             ):
@@ -598,7 +640,7 @@ class TestGraphQLDatabaseSubscriptions(GeneralManagerTransactionTestCase):
                     "group_discard",
                     new=tracking_group_discard,
                 ),
-                patch.object(GraphQL, "_channel_listener") as listener,
+                patch.object(GraphQL, "_channel_message_listener") as listener,
             ):
                 stream = await asyncio.wait_for(
                     subscribe(None, info, id=employee.id),
@@ -638,9 +680,9 @@ class TestGraphQLDatabaseSubscriptions(GeneralManagerTransactionTestCase):
         async def failing_listener(
             _channel_layer: object,
             _channel_name: str,
-            queue: asyncio.Queue[str],
+            queue: asyncio.Queue[dict[str, object]],
         ) -> None:
-            await queue.put("update")
+            await queue.put({"type": "gm.subscription.event", "action": "update"})
             listener_finished.set()
             raise listener_error
 
@@ -665,7 +707,11 @@ class TestGraphQLDatabaseSubscriptions(GeneralManagerTransactionTestCase):
                     "group_discard",
                     new=failing_group_discard,
                 ),
-                patch.object(GraphQL, "_channel_listener", new=failing_listener),
+                patch.object(
+                    GraphQL,
+                    "_channel_message_listener",
+                    new=failing_listener,
+                ),
             ):
                 stream = await subscribe(None, info, id=employee.id)
                 try:
@@ -2094,7 +2140,7 @@ class GraphQLChannelLayerTests(unittest.TestCase):
 
 
 class GraphQLSubscriptionDispatchTests(unittest.IsolatedAsyncioTestCase):
-    """Test sequential subscription event dispatch."""
+    """Test concurrent subscription event dispatch."""
 
     async def test_runtime_errors_log_per_target_and_count_successes(self) -> None:
         """Ordinary send failures do not prevent later target attempts."""
@@ -2146,12 +2192,17 @@ class GraphQLSubscriptionDispatchTests(unittest.IsolatedAsyncioTestCase):
         )
 
     async def test_memory_error_stops_dispatch_immediately(self) -> None:
-        """Memory exhaustion propagates without attempting later targets."""
-        sent: list[str] = []
+        """Memory exhaustion propagates and cancels sends still in flight."""
+        cancelled: list[str] = []
 
         async def group_send(group: str, _message: dict[str, object]) -> None:
-            sent.append(group)
-            raise MemoryError
+            if group == "first":
+                raise MemoryError
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(group)
+                raise
 
         layer = SimpleNamespace(group_send=group_send)
 
@@ -2162,7 +2213,55 @@ class GraphQLSubscriptionDispatchTests(unittest.IsolatedAsyncioTestCase):
                 {"action": "update"},
             )
 
-        self.assertEqual(sent, ["first"])
+        self.assertEqual(cancelled, ["second"])
+
+    async def test_sends_run_concurrently_up_to_the_limit(self) -> None:
+        """Slow groups overlap, but never beyond ``max_concurrency``."""
+        in_flight = 0
+        peak = 0
+
+        async def group_send(_group: str, _message: dict[str, object]) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        layer = SimpleNamespace(group_send=group_send)
+
+        success_count = await graphql_subscriptions.dispatch_subscription_event(
+            layer,  # type: ignore[arg-type]
+            [f"group-{number}" for number in range(10)],
+            {"action": "update"},
+            max_concurrency=4,
+        )
+
+        self.assertEqual(success_count, 10)
+        self.assertEqual(peak, 4)
+
+    async def test_background_sender_delivers_in_submission_order(self) -> None:
+        """The background sender returns at once and keeps event order."""
+        received: list[tuple[str, object]] = []
+        delivered = threading.Event()
+
+        async def group_send(group: str, message: dict[str, object]) -> None:
+            await asyncio.sleep(0)
+            received.append((group, message["action"]))
+            if len(received) == 4:
+                delivered.set()
+
+        layer: Any = SimpleNamespace(group_send=group_send)
+        sender = graphql_subscriptions.BackgroundSubscriptionSender()
+
+        sender.submit(layer, ("row",), {"action": "create"})
+        sender.submit(layer, ("row",), {"action": "update"})
+        sender.submit(layer, ("row", "class"), {"action": "delete"})
+
+        self.assertTrue(await asyncio.to_thread(delivered.wait, 1))
+        self.assertEqual(
+            [action for group, action in received if group == "row"],
+            ["create", "update", "delete"],
+        )
 
 
 class GraphQLGroupNameTests(unittest.TestCase):
@@ -2698,6 +2797,10 @@ class GraphQLHandleDataChangeTests(unittest.TestCase):
                 "general_manager.api.graphql.async_to_sync",
                 side_effect=lambda async_fn: lambda *args: asyncio.run(async_fn(*args)),
             ) as bridge,
+            patch(
+                "general_manager.api.graphql._new_event_id_fn",
+                return_value="event-1",
+            ),
         ):
             GraphQL._publish_data_change(RegisteredManager, "update", {"id": 1})
 
@@ -2718,12 +2821,14 @@ class GraphQLHandleDataChangeTests(unittest.TestCase):
                     "action": "update",
                     "manager": "RegisteredManager",
                     "identification": {"id": 1},
+                    "event_id": "event-1",
                 },
                 {
                     "type": "gm.subscription.event",
                     "action": "update",
                     "manager": "RegisteredManager",
                     "identification": {"id": 1},
+                    "event_id": "event-1",
                 },
             ],
         )
@@ -2797,6 +2902,10 @@ class GraphQLHandleDataChangeTests(unittest.TestCase):
         with (
             patch.object(GraphQL, "_get_channel_layer", return_value=layer),
             patch("general_manager.api.graphql.async_to_sync") as immediate_bridge,
+            patch(
+                "general_manager.api.graphql._new_event_id_fn",
+                return_value="event-1",
+            ),
         ):
             with bulk_data_change_notifications():
                 for _ in range(5):
@@ -2813,6 +2922,7 @@ class GraphQLHandleDataChangeTests(unittest.TestCase):
                         "type": "gm.subscription.event",
                         "action": "refresh",
                         "manager": "RegisteredManager",
+                        "event_id": "event-1",
                     },
                 )
             ],
@@ -2844,6 +2954,10 @@ class GraphQLHandleDataChangeTests(unittest.TestCase):
         with (
             patch.object(GraphQL, "_get_channel_layer", return_value=layer),
             patch("general_manager.api.graphql.async_to_sync") as immediate_bridge,
+            patch(
+                "general_manager.api.graphql._new_event_id_fn",
+                return_value="event-1",
+            ),
         ):
             with bulk_data_change_notifications():
                 GraphQL._publish_data_change(BetaManager, "delete", {"id": 2})
@@ -2860,6 +2974,7 @@ class GraphQLHandleDataChangeTests(unittest.TestCase):
                         "type": "gm.subscription.event",
                         "action": "refresh",
                         "manager": "AlphaManager",
+                        "event_id": "event-1",
                     },
                 ),
                 (
@@ -2868,6 +2983,7 @@ class GraphQLHandleDataChangeTests(unittest.TestCase):
                         "type": "gm.subscription.event",
                         "action": "refresh",
                         "manager": "BetaManager",
+                        "event_id": "event-1",
                     },
                 ),
             ],
@@ -385,6 +385,91 @@ class GraphQLSubscriptionPropertySelectionAdvancedTests(unittest.TestCase):
         self.assertEqual(property_names, set())
 
 
+class SubscriptionSelectionFingerprintTests(unittest.TestCase):
+    """Test selection fingerprints used to skip unchanged subscription events."""
+
+    _build_info = staticmethod(
+        GraphQLSubscriptionPropertySelectionAdvancedTests._build_info
+    )
+
+    def test_leaf_fields_are_collected_through_fragments(self) -> None:
+        """Verify leaf fields under item are collected from every fragment."""
+        info = self._build_info(
+            """
+            subscription {
+                onTestChange(id: "1") {
+                    action
+                    item {
+                        __typename
+                        name
+                        ... on TestManagerType { totalCost }
+                        ...Extra
+                    }
+                }
+            }
+            fragment Extra on TestManagerType { status }
+            """
+        )
+
+        names = graphql_subscriptions.selected_leaf_field_names(
+            info, GraphQL._normalize_graphql_name
+        )
+
+        self.assertEqual(names, frozenset({"name", "total_cost", "status"}))
+
+    def test_nested_or_missing_item_selection_disables_fingerprint(self) -> None:
+        """Verify relation selections and action-only selections return None."""
+        nested = self._build_info(
+            """
+            subscription {
+                onTestChange(id: "1") { item { name owner { name } } }
+            }
+            """
+        )
+        action_only = self._build_info(
+            'subscription { onTestChange(id: "1") { action } }'
+        )
+
+        for info in (nested, action_only):
+            self.assertIsNone(
+                graphql_subscriptions.selected_leaf_field_names(
+                    info, GraphQL._normalize_graphql_name
+                )
+            )
+
+    def test_fingerprint_tracks_values_and_read_permission(self) -> None:
+        """Verify values and field visibility both change the fingerprint."""
+        item = SimpleNamespace(name="Alice", status="open")
+
+        def allow(_instance: object, _field_name: str) -> bool:
+            return True
+
+        def deny_status(_instance: object, field_name: str) -> bool:
+            return field_name != "status"
+
+        fields = {"name", "status"}
+        first = graphql_subscriptions.selection_fingerprint(item, fields, allow)
+        same = graphql_subscriptions.selection_fingerprint(item, fields, allow)
+        hidden = graphql_subscriptions.selection_fingerprint(item, fields, deny_status)
+        item.status = "closed"
+        changed = graphql_subscriptions.selection_fingerprint(item, fields, allow)
+
+        self.assertIsNotNone(first)
+        self.assertEqual(first, same)
+        self.assertNotEqual(first, hidden)
+        self.assertNotEqual(first, changed)
+
+    def test_fingerprint_rejects_non_scalar_values(self) -> None:
+        """Verify unsupported values disable the fingerprint."""
+        item = SimpleNamespace(owner=object())
+
+        self.assertIsNone(
+            graphql_subscriptions.selection_fingerprint(
+                item, {"owner"}, lambda _instance, _name: True
+            )
+        )
+
+
 class GraphQLBuildIdentificationArgumentsEdgeCasesTests(unittest.TestCase):
     """Test edge cases in identification argument building."""
 
@@ -626,6 +711,123 @@ class GraphQLChannelListenerRobustnessTests(unittest.TestCase):
         self.assertEqual(actions, ["valid"])
 
 
+class SharedSubscriptionHydrationTests(unittest.TestCase):
+    """Test per-event hydration sharing across subscribers."""
+
+    def test_concurrent_requests_for_one_key_load_once(self) -> None:
+        """Verify subscribers woken by one event share a single load."""
+        hydration = graphql_subscriptions.SharedSubscriptionHydration()
+        loads: list[int] = []
+        sentinel = MagicMock()
+
+        def load() -> MagicMock:
+            loads.append(1)
+            return sentinel
+
+        async def run() -> list[object]:
+            return await asyncio.gather(
+                *(hydration.hydrate("key", load) for _ in range(10))
+            )
+
+        results = asyncio.run(run())
+
+        self.assertEqual(len(loads), 1)
+        self.assertTrue(all(result is sentinel for result in results))
+
+    def test_load_errors_reach_every_subscriber(self) -> None:
+        """Verify a failed load is re-raised to each waiting subscriber."""
+        hydration = graphql_subscriptions.SharedSubscriptionHydration()
+        error = ValueError("missing row")
+
+        def load() -> None:
+            raise error
+
+        async def run() -> list[object]:
+            return await asyncio.gather(
+                *(hydration.hydrate("key", load) for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        self.assertEqual(asyncio.run(run()), [error, error, error])
+
+    def test_cancelled_subscriber_does_not_cancel_shared_load(self) -> None:
+        """Verify one subscriber leaving does not abort the others' load."""
+        hydration = graphql_subscriptions.SharedSubscriptionHydration()
+        sentinel = MagicMock()
+
+        async def run() -> object:
+            release = asyncio.Event()
+            loop = asyncio.get_running_loop()
+
+            def load() -> MagicMock:
+                asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+                return sentinel
+
+            first = asyncio.create_task(hydration.hydrate("key", load))
+            second = asyncio.create_task(hydration.hydrate("key", load))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            release.set()
+            return await second
+
+        self.assertIs(asyncio.run(run()), sentinel)
+
+    def test_oldest_keys_are_evicted(self) -> None:
+        """Verify only the most recent keys are retained."""
+        hydration = graphql_subscriptions.SharedSubscriptionHydration(max_entries=2)
+        loads: list[str] = []
+
+        async def run() -> None:
+            for key in ("a", "b", "c", "a"):
+                await hydration.hydrate(key, lambda key=key: loads.append(key))
+
+        asyncio.run(run())
+
+        self.assertEqual(loads, ["a", "b", "c", "a"])
+
+    def test_hydration_key_normalizes_identification_and_selection(self) -> None:
+        """Verify equal identifications and selections build equal keys."""
+
+        class TestManager(GeneralManager):
+            pass
+
+        first = graphql_subscriptions.hydration_key(
+            TestManager, {"a": 1, "b": 2}, ["x", "y"], "event"
+        )
+        second = graphql_subscriptions.hydration_key(
+            TestManager, {"b": 2, "a": 1}, {"y", "x"}, "event"
+        )
+        everything = graphql_subscriptions.hydration_key(
+            TestManager, {"a": 1, "b": 2}, None, "event"
+        )
+        nothing = graphql_subscriptions.hydration_key(
+            TestManager, {"a": 1, "b": 2}, [], "event"
+        )
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(everything, nothing)
+
+    def test_unstamped_events_hydrate_per_subscriber(self) -> None:
+        """Verify events without an event id are not shared."""
+        constructed: list[int] = []
+
+        class CountingManager:
+            def __init__(self, id: int) -> None:
+                constructed.append(id)
+
+        async def run() -> None:
+            await asyncio.gather(
+                *(
+                    GraphQL._hydrate_subscription_item(CountingManager, {"id": 1}, None)
+                    for _ in range(3)
+                )
+            )
+
+        asyncio.run(run())
+
+        self.assertEqual(constructed, [1, 1, 1])
+
+
 class GraphQLHandleDataChangeEdgeCasesTests(unittest.TestCase):
     """Test edge cases in data change signal handling."""
 
@@ -648,9 +850,11 @@ class GraphQLHandleDataChangeEdgeCasesTests(unittest.TestCase):
         instance = TestManager()
 
         sent: list[str] = []
+        event_ids: set[object] = set()
 
-        async def group_send(group: str, _message: dict[str, object]) -> None:
+        async def group_send(group: str, message: dict[str, object]) -> None:
             sent.append(group)
+            event_ids.add(message.get("event_id"))
 
         layer = SimpleNamespace(group_send=group_send)
         with (
@@ -662,6 +866,9 @@ class GraphQLHandleDataChangeEdgeCasesTests(unittest.TestCase):
         ):
             GraphQL._publish_data_change(TestManager, "test", {"id": 1})
 
+        self.assertEqual(len(event_ids), 1)
+        self.assertIsInstance(event_ids.pop(), str)
+
         bridge.assert_called_once_with(
             graphql_subscriptions.dispatch_subscription_event
         )
@@ -9,6 +9,7 @@ from general_manager.search.backend import SearchBackendError, SearchDocument
 from general_manager.search.backends import meilisearch as meili_module
 from general_manager.search.backends.meilisearch import (
     MeilisearchBackend,
+    MeilisearchPendingTask,
     MeilisearchTaskFailedError,
     _is_meilisearch_already_exists,
     _is_meilisearch_not_found,
@@ -649,6 +650,225 @@ def test_meilisearch_backend_raises_on_failed_task() -> None:
         )
 
 
+def _pipelined_document(document_id: int) -> SearchDocument:
+    """Build a minimal project document for pipelined-mode tests."""
+    return SearchDocument(
+        id=f'Project:{{"id": {document_id}}}',
+        type="Project",
+        identification={"id": document_id},
+        index="test-index",
+        data={"name": "Alpha"},
+        field_boosts={},
+    )
+
+
+class _BulkTaskClient(_FakeClient):
+    def __init__(self, index: _FakeIndex) -> None:
+        """Track bulk task lookups and configurable task statuses."""
+        super().__init__(index)
+        self.statuses: dict[str, str] = {}
+        self.bulk_lookups: list[list[str]] = []
+
+    def get_tasks(self, parameters: dict[str, object]) -> dict[str, object]:
+        """Return task statuses for the requested UIDs, capped like `/tasks`."""
+        uids = [str(uid) for uid in parameters["uids"]]
+        self.bulk_lookups.append(uids)
+        limit = int(parameters.get("limit", 20))
+        return {
+            "results": [
+                {"uid": int(uid), "status": self.statuses.get(uid, "enqueued")}
+                for uid in uids[:limit]
+            ]
+        }
+
+
+class _NumberedTaskIndex(_FakeIndex):
+    def __init__(self) -> None:
+        """Hand out a new task UID for every document write."""
+        super().__init__()
+        self.next_task_uid = 0
+
+    def add_documents(self, payload: list[dict[str, object]]) -> dict[str, int]:
+        """Record the documents and return the next task UID."""
+        super().add_documents(payload)
+        self.next_task_uid += 1
+        return {"taskUid": self.next_task_uid}
+
+
+def test_meilisearch_backend_pipelined_writes_do_not_wait() -> None:
+    """Track write tasks instead of waiting when pipelined mode is enabled."""
+    index = _FakeIndex()
+    client = _BulkTaskClient(index)
+    backend = MeilisearchBackend(client=client, wait_for_tasks=False)
+
+    backend.ensure_index("test-index", {"searchable_fields": ["name"]})
+    backend.upsert("test-index", [_pipelined_document(1)])
+    backend.delete("test-index", ['Project:{"id": 1}'])
+
+    assert backend.pipelined is True
+    assert client.waited == []
+    assert [task.task_uid for task in backend.pending_tasks()] == [1, 2, 3]
+    assert backend.pending_tasks()[1].types == ("Project",)
+    assert backend.pending_tasks()[2].types == ()
+
+
+def test_meilisearch_backend_drains_pending_tasks_in_bulk() -> None:
+    """Check all tracked tasks with one lookup and report failures once."""
+    index = _FakeIndex()
+    client = _BulkTaskClient(index)
+    backend = MeilisearchBackend(
+        client=client,
+        wait_for_tasks=False,
+        failed_task_handler=None,
+    )
+
+    backend.ensure_index("test-index", {"searchable_fields": ["name"]})
+    backend.upsert("test-index", [_pipelined_document(1)])
+    client.statuses = {"1": "succeeded", "2": "failed"}
+
+    failed = backend.drain_pending_tasks()
+
+    assert client.bulk_lookups == [["1", "2"]]
+    assert [task.task_uid for task in failed] == [2]
+    assert failed[0].index_name == "test-index"
+    assert backend.pending_tasks() == ()
+    assert backend.drain_pending_tasks() == ()
+
+
+def test_meilisearch_backend_drains_more_tasks_than_one_tasks_page() -> None:
+    """Look tracked tasks up in limited chunks so all of them can finish."""
+    client = _BulkTaskClient(_NumberedTaskIndex())
+    backend = MeilisearchBackend(client=client, wait_for_tasks=False)
+
+    for document_id in range(150):
+        backend.upsert("test-index", [_pipelined_document(document_id)])
+    client.statuses = {str(uid): "succeeded" for uid in range(1, 151)}
+
+    assert backend.drain_pending_tasks() == ()
+    assert backend.pending_tasks() == ()
+    assert [len(uids) for uids in client.bulk_lookups] == [100, 50]
+
+
+def test_meilisearch_backend_reports_finished_tasks_to_listeners() -> None:
+    """Tell completion listeners about finished tasks only."""
+    client = _BulkTaskClient(_NumberedTaskIndex())
+    backend = MeilisearchBackend(
+        client=client, wait_for_tasks=False, failed_task_handler=None
+    )
+    finished: list[list[object]] = []
+    backend.add_task_completion_listener(
+        lambda tasks: finished.append([task.task_uid for task in tasks])
+    )
+
+    backend.upsert("test-index", [_pipelined_document(1)])
+    backend.upsert("test-index", [_pipelined_document(2)])
+    client.statuses = {"1": "succeeded"}
+    backend.drain_pending_tasks()
+    client.statuses = {"1": "succeeded", "2": "failed"}
+    backend.drain_pending_tasks()
+
+    assert finished == [[1], [2]]
+
+
+def test_meilisearch_backend_drain_keeps_unfinished_tasks_pending() -> None:
+    """Leave enqueued and processing tasks tracked for a later drain."""
+    index = _FakeIndex()
+    client = _BulkTaskClient(index)
+    backend = MeilisearchBackend(client=client, wait_for_tasks=False)
+
+    backend.upsert("test-index", [_pipelined_document(1)])
+    client.statuses = {"2": "processing"}
+
+    assert backend.drain_pending_tasks() == ()
+    assert [task.task_uid for task in backend.pending_tasks()] == [2]
+
+
+def test_meilisearch_backend_polls_when_pending_limit_is_reached() -> None:
+    """Bound the pending list by polling once the configured limit is hit."""
+    index = _FakeIndex()
+    client = _BulkTaskClient(index)
+    client.statuses = {"2": "failed"}
+    reported: list[MeilisearchPendingTask] = []
+    backend = MeilisearchBackend(
+        client=client,
+        wait_for_tasks=False,
+        max_pending_tasks=1,
+        failed_task_handler=reported.extend,
+    )
+
+    backend.upsert("test-index", [_pipelined_document(1)])
+
+    assert client.bulk_lookups == [["2"]]
+    assert backend.pending_tasks() == ()
+    assert [task.task_uid for task in reported] == [2]
+    assert backend.drain_pending_tasks() == ()
+
+
+def test_meilisearch_backend_checks_pending_tasks_after_interval() -> None:
+    """Check tracked tasks on the next write once the last check is too old."""
+    index = _FakeIndex()
+    client = _BulkTaskClient(index)
+    client.statuses = {"1": "failed"}
+    reported: list[MeilisearchPendingTask] = []
+    backend = MeilisearchBackend(
+        client=client,
+        wait_for_tasks=False,
+        pending_task_check_seconds=0,
+        failed_task_handler=reported.extend,
+    )
+
+    backend.ensure_index("test-index", {"searchable_fields": ["name"]})
+
+    assert client.bulk_lookups == [["1"]]
+    assert [task.task_uid for task in reported] == [1]
+
+
+def test_meilisearch_backend_keeps_bounded_failures_when_handler_raises() -> None:
+    """Keep failures for a later drain, at most max_pending_tasks of them."""
+    index = _FakeIndex()
+    client = _BulkTaskClient(index)
+    client.statuses = {"1": "failed", "2": "failed", "3": "canceled"}
+
+    def unavailable(_failed: object) -> None:
+        raise ConnectionError
+
+    backend = MeilisearchBackend(
+        client=client,
+        wait_for_tasks=False,
+        max_pending_tasks=2,
+        failed_task_handler=unavailable,
+    )
+
+    backend.ensure_index("test-index", {"searchable_fields": ["name"]})
+    backend.upsert("test-index", [_pipelined_document(1)])
+    backend.delete("test-index", ['Project:{"id": 1}'])
+
+    assert [task.task_uid for task in backend.drain_pending_tasks()] == [2, 3]
+    assert backend.pending_tasks() == ()
+    assert backend.drain_pending_tasks() == ()
+
+
+def test_meilisearch_backend_wait_for_pending_tasks() -> None:
+    """Wait for every tracked task and raise after recording failures."""
+    index = _FakeIndex()
+    client = _FailingClient(index)
+    backend = MeilisearchBackend(
+        client=client,
+        wait_for_tasks=False,
+        failed_task_handler=None,
+    )
+
+    backend.upsert("test-index", [_pipelined_document(1)])
+    backend.delete("test-index", ['Project:{"id": 1}'])
+
+    with pytest.raises(MeilisearchTaskFailedError):
+        backend.wait_for_pending_tasks()
+
+    assert client.waited == [2, 3]
+    assert backend.pending_tasks() == ()
+    assert [task.task_uid for task in backend.drain_pending_tasks()] == [2, 3]
+
+
 def test_meilisearch_backend_build_filter_expression_in_lookup() -> None:
     """Build filter expressions for __in lookups."""
     expr = MeilisearchBackend._build_filter_expression(
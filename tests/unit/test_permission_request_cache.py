@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import ClassVar
+from unittest.mock import patch
+
+from django.contrib.auth.models import AnonymousUser
+from django.test import SimpleTestCase
+from graphql import OperationType
+
+from general_manager.api.graphql_resolvers import (
+    check_read_permission,
+    get_request_permission_cache,
+)
+from general_manager.permission.manager_based_permission import (
+    AdditiveManagerPermission,
+    OverrideManagerPermission,
+)
+from general_manager.permission.permission_checks import (
+    PermissionFilterDecision,
+    permission_functions,
+    register_permission,
+)
+from general_manager.permission.request_cache import PermissionRequestCache
+
+
+class _Calls:
+    user_only_filter = 0
+    user_only_method = 0
+    row_filter = 0
+    row_method = 0
+
+
+def _user_only_filter(_user: object, _config: list[str]) -> PermissionFilterDecision:
+    _Calls.user_only_filter += 1
+    return PermissionFilterDecision.ALLOW_ALL
+
+
+def _row_filter(_user: object, _config: list[str]) -> dict[str, dict[str, object]]:
+    _Calls.row_filter += 1
+    return {"filter": {"owner": "me"}}
+
+
+class _CachedPermission(AdditiveManagerPermission):
+    __read__: ClassVar[list[str]] = ["cacheTestUserOnly"]
+    secret: ClassVar[dict[str, list[str]]] = {"read": ["cacheTestRow:me"]}
+
+
+class _Row:
+    Permission = _CachedPermission
+
+    def __init__(self, owner: str) -> None:
+        self.owner = owner
+
+
+def _info(operation: OperationType, context: object | None = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        operation=SimpleNamespace(operation=operation),
+        context=context or SimpleNamespace(user=AnonymousUser()),
+    )
+
+
+class PermissionRequestCacheTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._original_permission_functions = permission_functions.copy()
+
+        @register_permission("cacheTestUserOnly", permission_filter=_user_only_filter)
+        def _user_only(_instance: object, _user: object, _config: list[str]) -> bool:
+            _Calls.user_only_method += 1
+            return True
+
+        @register_permission("cacheTestRow", permission_filter=_row_filter)
+        def _row(instance: object, _user: object, config: list[str]) -> bool:
+            _Calls.row_method += 1
+            return getattr(instance, "owner", None) == config[0]
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        permission_functions.clear()
+        permission_functions.update(cls._original_permission_functions)
+        super().tearDownClass()
+
+    def setUp(self) -> None:
+        _Calls.user_only_filter = 0
+        _Calls.user_only_method = 0
+        _Calls.row_filter = 0
+        _Calls.row_method = 0
+        self.user = AnonymousUser()
+
+    def test_evaluator_is_reused_per_instance_and_user(self) -> None:
+        cache = PermissionRequestCache()
+        first, second = _Row("me"), _Row("me")
+
+        permission = cache.get_permission(_CachedPermission, first, self.user)
+
+        assert cache.get_permission(_CachedPermission, first, self.user) is permission
+        assert cache.get_permission(_CachedPermission, second, self.user) is not (
+            permission
+        )
+        assert cache.get_permission(_CachedPermission, first, AnonymousUser()) is not (
+            permission
+        )
+
+    def test_user_only_fragments_are_decided_once_per_request(self) -> None:
+        cache = PermissionRequestCache()
+        rows = [_Row("me"), _Row("other"), _Row("me")]
+
+        results = [
+            cache.check_permission(
+                _CachedPermission, row, self.user, "read", field_name
+            )
+            for row in rows
+            for field_name in ("name", "status", "secret")
+        ]
+
+        assert results == [True, True, True, True, True, False, True, True, True]
+        assert _Calls.user_only_filter == 1
+        assert _Calls.user_only_method == 0
+        assert _Calls.row_filter == 1
+        assert _Calls.row_method == 3
+
+    def test_uncached_checks_keep_calling_permission_methods(self) -> None:
+        rows = [_Row("me"), _Row("other")]
+
+        for row in rows:
+            permission = _CachedPermission(row, self.user)
+            permission.check_permission("read", "name")
+            permission.check_permission("read", "secret")
+
+        assert _Calls.user_only_filter == 0
+        assert _Calls.user_only_method == 4
+        assert _Calls.row_method == 2
+
+    def test_query_requests_share_one_cache_on_the_context(self) -> None:
+        info = _info(OperationType.QUERY)
+        row = _Row("me")
+
+        cache = get_request_permission_cache(info)
+        assert check_read_permission(row, info, "name")  # type: ignore[arg-type]
+        assert check_read_permission(row, info, "secret")  # type: ignore[arg-type]
+
+        assert isinstance(cache, PermissionRequestCache)
+        assert get_request_permission_cache(info) is cache
+        assert _Calls.user_only_method == 0
+
+    def test_mutations_subscriptions_and_frozen_contexts_are_uncached(self) -> None:
+        assert get_request_permission_cache(_info(OperationType.MUTATION)) is None
+        assert get_request_permission_cache(_info(OperationType.SUBSCRIPTION)) is None
+        assert (
+            get_request_permission_cache(_info(OperationType.QUERY, context=object()))
+            is None
+        )
+
+
+class _OverrideMaskPermission(OverrideManagerPermission):
+    __read__: ClassVar[list[str]] = ["cacheTestRow:me"]
+    public_name: ClassVar[dict[str, list[str]]] = {"read": ["cacheTestUserOnly"]}
+    hidden: ClassVar[dict[str, list[str]]] = {"read": ["isAdmin"]}
+
+
+class _BasedOnMaskPermission(AdditiveManagerPermission):
+    __based_on__ = "parent"
+    __read__: ClassVar[list[str]] = ["cacheTestUserOnly"]
+
+
+class _CustomCheckPermission(AdditiveManagerPermission):
+    __read__: ClassVar[list[str]] = ["cacheTestUserOnly"]
+
+    def check_permission(self, action: str, attribute: str) -> bool:  # type: ignore[override]
+        return attribute != "blocked"
+
+
+class ReadFieldMaskTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._original_permission_functions = permission_functions.copy()
+        register_permission("cacheTestUserOnly", permission_filter=_user_only_filter)(
+            lambda _instance, _user, _config: True
+        )
+        register_permission("cacheTestRow", permission_filter=_row_filter)(
+            lambda instance, _user, config: (
+                getattr(instance, "owner", None) == config[0]
+            )
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        permission_functions.clear()
+        permission_functions.update(cls._original_permission_functions)
+        super().tearDownClass()
+
+    def setUp(self) -> None:
+        self.user = AnonymousUser()
+
+    def test_additive_mask_separates_user_only_and_row_fields(self) -> None:
+        mask = _CachedPermission(_Row("me"), self.user).get_read_field_mask()
+
+        assert mask is not None
+        assert mask.default is True
+        assert mask.decision_for("name") is True
+        assert mask.decision_for("secret") is None
+
+    def test_override_mask_uses_field_rules_instead_of_base(self) -> None:
+        mask = _OverrideMaskPermission(_Row("me"), self.user).get_read_field_mask()
+
+        assert mask is not None
+        assert mask.default is None
+        assert mask.decision_for("public_name") is True
+        assert mask.decision_for("hidden") is False
+
+    def test_describe_permissions_labels_the_compiled_mask(self) -> None:
+        permission = _OverrideMaskPermission(_Row("me"), self.user)
+
+        assert permission.describe_permissions("read", "public_name") == (
+            "cacheTestUserOnly",
+            "read_mask:allow",
+        )
+        assert permission.describe_permissions("read", "hidden")[-1] == (
+            "read_mask:deny"
+        )
+        assert permission.describe_permissions("read", "other")[-1] == (
+            "read_mask:instance"
+        )
+        assert permission.describe_permissions("update", "hidden") == (
+            "isAuthenticated",
+        )
+
+    def test_delegated_or_customized_evaluation_is_not_masked(self) -> None:
+        row = SimpleNamespace(parent=None, owner="me")
+
+        based_on = _BasedOnMaskPermission(row, self.user)
+        custom = _CustomCheckPermission(_Row("me"), self.user)
+
+        assert based_on.get_read_field_mask() is None
+        assert custom.get_read_field_mask() is None
+        assert "read_mask:instance" not in custom.describe_permissions("read", "x")
+
+    def test_request_cache_answers_masked_fields_without_row_evaluators(self) -> None:
+        cache = PermissionRequestCache()
+        rows = [_Row("me"), _Row("other")]
+
+        with patch.object(
+            _OverrideMaskPermission,
+            "__init__",
+            autospec=True,
+            side_effect=_OverrideMaskPermission.__init__,
+        ) as construct:
+            results = [
+                cache.check_permission(
+                    _OverrideMaskPermission, row, self.user, "read", field_name
+                )
+                for row in rows
+                for field_name in ("public_name", "hidden")
+            ]
+            readable = [
+                cache.can_read_instance(_OverrideMaskPermission, row, self.user)
+                for row in rows
+            ]
+
+        assert results == [True, False, True, False]
+        assert readable == [True, False]
+        assert construct.call_count == 2
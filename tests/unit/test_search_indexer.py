@@ -10,6 +10,7 @@ import general_manager.search.indexer as indexer_module
 from general_manager.apps import GeneralmanagerConfig
 from general_manager.manager.general_manager import GeneralManager
 from general_manager.manager.input import Input
+from general_manager.manager.meta import GeneralManagerMeta
 from general_manager.search.backend import SearchDocument
 from general_manager.search.backends.dev import DevSearchBackend
 from general_manager.search.config import IndexConfig
@@ -333,6 +334,97 @@ class SearchIndexerTests(SimpleTestCase):
         assert other_type_id in existing_ids
 
 
+class _NamespacedBackend(DevSearchBackend):
+    settings_cache_namespace = "tests:shared"
+
+
+class SearchIndexSettingsMemoTests(SimpleTestCase):
+    def setUp(self) -> None:
+        """Register the project manager and start from an empty settings memo."""
+        self._original_all_classes = list(GeneralManagerMeta.all_classes)
+        GeneralManagerMeta.all_classes = [Project]
+        GeneralmanagerConfig.initialize_general_manager_classes([Project], [Project])
+        indexer_module.clear_applied_index_settings()
+        indexer_module.django_cache.clear()
+
+    def tearDown(self) -> None:
+        """Restore the global manager registry."""
+        GeneralManagerMeta.all_classes = self._original_all_classes
+
+    def test_repeated_writes_apply_index_settings_once(self) -> None:
+        backend = DevSearchBackend()
+        indexer = SearchIndexer(backend)
+
+        with patch.object(
+            backend, "ensure_index", wraps=backend.ensure_index
+        ) as ensure:
+            indexer.index_instance(Project(id=1))
+            indexer.index_instance_index(Project(id=2), "global")
+            indexer.delete_instance(Project(id=1))
+
+        assert ensure.call_count == 1
+
+    def test_schema_change_reapplies_index_settings(self) -> None:
+        backend = DevSearchBackend()
+        indexer = SearchIndexer(backend)
+        indexer.index_instance(Project(id=1))
+
+        class ChangedSearchConfig:
+            indexes: ClassVar[list[IndexConfig]] = [
+                IndexConfig(name="global", fields=["name", "status"])
+            ]
+
+        with (
+            patch.object(Project, "SearchConfig", ChangedSearchConfig),
+            patch.object(backend, "ensure_index", wraps=backend.ensure_index) as ensure,
+        ):
+            indexer.index_instance(Project(id=1))
+            indexer.index_instance(Project(id=2))
+
+        assert ensure.call_count == 1
+        assert ensure.call_args.args[1]["searchable_fields"] == ("name", "status")
+
+    def test_rebuild_and_force_always_apply_index_settings(self) -> None:
+        backend = DevSearchBackend()
+        indexer = SearchIndexer(backend)
+        indexer.index_instance(Project(id=1))
+
+        with patch.object(
+            backend, "ensure_index", wraps=backend.ensure_index
+        ) as ensure:
+            indexer.reindex_manager_index(Project, "global")
+            assert indexer_module.ensure_search_index(backend, "global") is False
+            assert (
+                indexer_module.ensure_search_index(backend, "global", force=True)
+                is True
+            )
+
+        assert ensure.call_count == 2
+
+    def test_namespaced_backends_share_applied_settings_through_cache(self) -> None:
+        SearchIndexer(_NamespacedBackend()).index_instance(Project(id=1))
+        indexer_module.clear_applied_index_settings()
+        backend = _NamespacedBackend()
+
+        with patch.object(
+            backend, "ensure_index", wraps=backend.ensure_index
+        ) as ensure:
+            SearchIndexer(backend).index_instance(Project(id=2))
+
+        ensure.assert_not_called()
+
+    def test_backends_without_namespace_do_not_share_applied_settings(self) -> None:
+        SearchIndexer(DevSearchBackend()).index_instance(Project(id=1))
+        backend = DevSearchBackend()
+
+        with patch.object(
+            backend, "ensure_index", wraps=backend.ensure_index
+        ) as ensure:
+            SearchIndexer(backend).index_instance(Project(id=2))
+
+        ensure.assert_called_once()
+
+
 def test_indexer_reindex_manager_index_limits_backend_writes() -> None:
     """Reindex only the requested index for multi-index managers."""
     GeneralmanagerConfig.initialize_general_manager_classes(
@@ -1158,6 +1158,181 @@ def test_scheduler_delete_is_a_separate_unit_and_shares_pair_ack() -> None:
     acknowledge.assert_called_once_with(token)
 
 
+def test_scheduler_coalesces_events_committed_in_one_transaction() -> None:
+    """Events sharing a commit dispatch unique identities once per chunk."""
+    callbacks: list[object] = []
+    first_token = dirty_token(Owner, "global", 1)
+    latest_token = dirty_token(Owner, "global", 2)
+
+    with (
+        patch("general_manager.search.invalidation.get_setting", return_value=2),
+        patch(
+            "general_manager.search.invalidation.transaction.on_commit",
+            side_effect=lambda callback, **_kwargs: callbacks.append(callback),
+        ) as on_commit,
+        patch(
+            "general_manager.search.invalidation.mark_search_index_dirty",
+            side_effect=[first_token, latest_token, latest_token],
+        ),
+        patch(
+            "general_manager.search.invalidation.dispatch_index_manager_batch",
+            return_value=2,
+        ) as dispatch_batch,
+        patch(
+            "general_manager.search.invalidation.acknowledge_search_index_dirty"
+        ) as acknowledge,
+    ):
+        for target_ids in ((1, 2), (2, 3), (1,)):
+            schedule_search_invalidation_work(
+                SearchScheduledWork(
+                    upserts=SearchInvalidationPlan(
+                        targets=tuple(
+                            scheduled_target(Owner, target_id)
+                            for target_id in target_ids
+                        )
+                    )
+                ),
+                source_database_alias="default",
+            )
+        assert on_commit.call_count == 3
+        callbacks[0]()  # type: ignore[operator]
+        callbacks[1]()  # type: ignore[operator]
+        dispatch_batch.assert_not_called()
+        callbacks[2]()  # type: ignore[operator]
+
+    owner_path = f"{Owner.__module__}.{Owner.__name__}"
+    assert dispatch_batch.call_args_list == [
+        call(owner_path, "global", ({"id": 1}, {"id": 2})),
+        call(owner_path, "global", ({"id": 3},)),
+    ]
+    acknowledge.assert_called_once_with(latest_token)
+
+
+def test_scheduler_skips_events_discarded_by_savepoint_rollback() -> None:
+    """A callback Django discarded never contributes work to the flush."""
+    callbacks: list[object] = []
+
+    with (
+        patch("general_manager.search.invalidation.get_setting", return_value=100),
+        patch(
+            "general_manager.search.invalidation.transaction.on_commit",
+            side_effect=lambda callback, **_kwargs: callbacks.append(callback),
+        ),
+        patch(
+            "general_manager.search.invalidation.mark_search_index_dirty",
+            return_value=None,
+        ),
+        patch(
+            "general_manager.search.invalidation.dispatch_index_manager_batch",
+            return_value=1,
+        ) as dispatch_batch,
+    ):
+        for target_id in (1, 2, 3):
+            schedule_search_invalidation_work(
+                SearchScheduledWork(
+                    upserts=SearchInvalidationPlan(
+                        targets=(scheduled_target(Owner, target_id),)
+                    )
+                ),
+                source_database_alias="default",
+            )
+        callbacks[0]()  # type: ignore[operator]
+        callbacks[2]()  # type: ignore[operator]
+
+    owner_path = f"{Owner.__module__}.{Owner.__name__}"
+    dispatch_batch.assert_called_once_with(
+        owner_path,
+        "global",
+        ({"id": 1}, {"id": 3}),
+    )
+
+
+def test_scheduler_flushes_when_the_trailing_event_was_rolled_back() -> None:
+    """A trailing event from a rolled-back savepoint never strands the flush."""
+    callbacks: list[object] = []
+
+    with (
+        patch("general_manager.search.invalidation.get_setting", return_value=100),
+        patch(
+            "general_manager.search.invalidation.transaction.on_commit",
+            side_effect=lambda callback, **_kwargs: callbacks.append(callback),
+        ),
+        patch(
+            "general_manager.search.invalidation._active_savepoints",
+            side_effect=[frozenset(), frozenset({"s1"})],
+        ),
+        patch(
+            "general_manager.search.invalidation.mark_search_index_dirty",
+            return_value=None,
+        ),
+        patch(
+            "general_manager.search.invalidation.dispatch_index_manager_batch",
+            return_value=1,
+        ) as dispatch_batch,
+    ):
+        for target_id in (1, 2):
+            schedule_search_invalidation_work(
+                SearchScheduledWork(
+                    upserts=SearchInvalidationPlan(
+                        targets=(scheduled_target(Owner, target_id),)
+                    )
+                ),
+                source_database_alias="default",
+            )
+        # The second event's savepoint rolled back, so Django drops its callback.
+        callbacks[0]()  # type: ignore[operator]
+
+    owner_path = f"{Owner.__module__}.{Owner.__name__}"
+    dispatch_batch.assert_called_once_with(owner_path, "global", ({"id": 1},))
+
+
+def test_scheduler_keeps_upserts_after_earlier_deletes_in_order() -> None:
+    """A recreate after a coalesced delete is dispatched after that delete."""
+    callbacks: list[object] = []
+    events: list[str] = []
+    manager_path = f"{Owner.__module__}.{Owner.__name__}"
+    delete_work = SearchScheduledWork(
+        deletes=(
+            SearchDeleteTarget(
+                manager_class=Owner,
+                manager_path=manager_path,
+                index_name="global",
+                document_id="owner:1",
+            ),
+        )
+    )
+    upsert_work = SearchScheduledWork(
+        upserts=SearchInvalidationPlan(targets=(scheduled_target(Owner, 1),))
+    )
+
+    with (
+        patch("general_manager.search.invalidation.get_setting", return_value=100),
+        patch(
+            "general_manager.search.invalidation.transaction.on_commit",
+            side_effect=lambda callback, **_kwargs: callbacks.append(callback),
+        ),
+        patch(
+            "general_manager.search.invalidation.mark_search_index_dirty",
+            return_value=dirty_token(Owner, "global", 1),
+        ),
+        patch(
+            "general_manager.search.invalidation.dispatch_index_manager_batch",
+            side_effect=lambda *_args: events.append("upsert") or 1,
+        ),
+        patch(
+            "general_manager.search.invalidation.dispatch_delete_documents",
+            side_effect=lambda *_args, **_kwargs: events.append("delete"),
+        ),
+        patch("general_manager.search.invalidation.acknowledge_search_index_dirty"),
+    ):
+        for work in (upsert_work, delete_work, upsert_work):
+            schedule_search_invalidation_work(work, source_database_alias="default")
+        for callback in callbacks:
+            callback()  # type: ignore[operator]
+
+    assert events == ["upsert", "delete", "upsert"]
+
+
 def test_scheduler_invalid_batch_setting_becomes_marker_only_fallback() -> None:
     """Invalid event settings never abort and submit no targeted work."""
     manager_path = f"{Owner.__module__}.{Owner.__name__}"
@@ -716,3 +716,70 @@ class SearchReconcileEngineTests(TestCase):
 
         assert result.claimed == 1
         assert result.reconciled == 1
+
+    def test_drain_marks_pairs_with_failed_backend_tasks_dirty(self) -> None:
+        """Mark pairs dirty when a pipelined backend reports failed tasks."""
+        from general_manager.search.backends.meilisearch import (
+            MeilisearchPendingTask,
+        )
+        from general_manager.search.reconciliation import (
+            drain_search_backend_tasks,
+        )
+
+        ensure_search_index_states()
+        state = SearchIndexState.objects.get()
+        state.clear_dirty(claim_token="", dirty_generation=state.dirty_generation)
+
+        class _Backend:
+            def drain_pending_tasks(self) -> tuple[MeilisearchPendingTask, ...]:
+                return (
+                    MeilisearchPendingTask(7, "global", ("ProjectDoc",)),
+                    MeilisearchPendingTask(8, "global", ("OtherDoc",)),
+                    MeilisearchPendingTask(9, "missing"),
+                )
+
+        marked = drain_search_backend_tasks(_Backend())
+
+        assert marked == 1
+        state.refresh_from_db()
+        assert state.dirty_since is not None
+        assert state.dirty_reason == SEARCH_INDEX_DIRTY_REASON_DATA_CHANGED
+
+    def test_pipelined_backend_marks_failures_dirty_when_observed(self) -> None:
+        """Mark pairs dirty from the process whose write check saw the failure."""
+        from general_manager.search.backends.meilisearch import MeilisearchBackend
+
+        ensure_search_index_states()
+        state = SearchIndexState.objects.get()
+        state.clear_dirty(claim_token="", dirty_generation=state.dirty_generation)
+
+        class _Index:
+            def delete_documents(self, _ids: list[str]) -> dict[str, int]:
+                return {"taskUid": 5}
+
+        class _Client:
+            def get_index(self, _name: str) -> _Index:
+                return _Index()
+
+            def get_tasks(self, _parameters: object) -> dict[str, object]:
+                return {"results": [{"uid": 5, "status": "failed"}]}
+
+        backend = MeilisearchBackend(
+            client=_Client(),  # type: ignore[arg-type]
+            wait_for_tasks=False,
+            max_pending_tasks=1,
+        )
+
+        backend.delete("global", ["ProjectDoc:1"])
+
+        state.refresh_from_db()
+        assert state.dirty_since is not None
+        assert backend.drain_pending_tasks() == ()
+
+    def test_drain_ignores_backends_without_task_tracking(self) -> None:
+        """Return zero for backends that always wait for their writes."""
+        from general_manager.search.reconciliation import (
+            drain_search_backend_tasks,
+        )
+
+        assert drain_search_backend_tasks(object()) == 0
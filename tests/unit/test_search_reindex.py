@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import threading
+import time
+from io import StringIO
+from typing import ClassVar
+from unittest.mock import MagicMock, patch
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from general_manager.management.commands.search_index import (
+    InvalidSearchIndexCommandOptionError,
+)
+from general_manager.manager.general_manager import GeneralManager
+from general_manager.search.backend import SearchBackend, SearchDocument
+from general_manager.search.backends.dev import DevSearchBackend
+from general_manager.search.config import IndexConfig
+from general_manager.search.reindex import (
+    InvalidSearchReindexOptionError,
+    SearchReindexFailedError,
+    enqueue_manager_reindex,
+    reindex_managers,
+)
+from tests.utils.simple_manager_interface import BaseTestInterface
+
+
+class AlphaManager(GeneralManager):
+    Interface = BaseTestInterface
+
+    class SearchConfig:
+        indexes: ClassVar[list[IndexConfig]] = [
+            IndexConfig(name="global", fields=["name"]),
+            IndexConfig(name="alpha", fields=["name"]),
+        ]
+
+
+class BetaManager(GeneralManager):
+    Interface = BaseTestInterface
+
+    class SearchConfig:
+        indexes: ClassVar[list[IndexConfig]] = [
+            IndexConfig(name="global", fields=["name"]),
+        ]
+
+
+class GammaManager(GeneralManager):
+    Interface = BaseTestInterface
+
+    class SearchConfig:
+        indexes: ClassVar[list[IndexConfig]] = [
+            IndexConfig(name="global", fields=["name"]),
+        ]
+
+
+def _document(document_id: str) -> SearchDocument:
+    return SearchDocument(
+        id=document_id,
+        type="Project",
+        identification={"id": document_id},
+        index="global",
+        data={"name": document_id},
+        field_boosts={},
+    )
+
+
+class _WritingIndexer:
+    """Indexer double that upserts a few documents and records concurrency."""
+
+    lock = threading.Lock()
+    active_writes = 0
+    peak_writes = 0
+    threads: ClassVar[set[str]] = set()
+
+    def __init__(self, backend: object) -> None:
+        self.backend = backend
+
+    def reindex_manager(self, manager_class: type[GeneralManager]) -> None:
+        with self.lock:
+            self.threads.add(threading.current_thread().name)
+        for number in range(3):
+            self.backend.upsert(  # type: ignore[attr-defined]
+                "global", [_document(f"{manager_class.__name__}-{number}")]
+            )
+
+
+class _ConcurrencyTrackingBackend(DevSearchBackend):
+    def upsert(self, index_name: str, documents: list[SearchDocument]) -> None:
+        with _WritingIndexer.lock:
+            _WritingIndexer.active_writes += 1
+            _WritingIndexer.peak_writes = max(
+                _WritingIndexer.peak_writes, _WritingIndexer.active_writes
+            )
+        time.sleep(0.01)
+        super().upsert(index_name, documents)
+        with _WritingIndexer.lock:
+            _WritingIndexer.active_writes -= 1
+
+
+class ReindexManagersTests(SimpleTestCase):
+    def setUp(self) -> None:
+        _WritingIndexer.active_writes = 0
+        _WritingIndexer.peak_writes = 0
+        _WritingIndexer.threads = set()
+
+    def test_sequential_rebuild_keeps_manager_order(self) -> None:
+        indexer = MagicMock()
+        progress: list[tuple[str, int, int]] = []
+
+        outcomes = reindex_managers(
+            [AlphaManager, BetaManager],
+            backend=MagicMock(),
+            indexer_factory=lambda _backend: indexer,
+            on_progress=lambda outcome, done, total: progress.append(
+                (outcome.manager_class.__name__, done, total)
+            ),
+        )
+
+        assert [call.args[0] for call in indexer.reindex_manager.call_args_list] == [
+            AlphaManager,
+            BetaManager,
+        ]
+        assert all(outcome.succeeded for outcome in outcomes)
+        assert progress == [("AlphaManager", 1, 2), ("BetaManager", 2, 2)]
+
+    def test_workers_rebuild_managers_on_threads_with_bounded_writes(self) -> None:
+        backend = _ConcurrencyTrackingBackend()
+
+        with patch("general_manager.search.reindex.connections") as connections:
+            outcomes = reindex_managers(
+                [AlphaManager, BetaManager, GammaManager],
+                backend=backend,
+                workers=3,
+                max_concurrent_writes=1,
+                indexer_factory=_WritingIndexer,
+            )
+
+        assert {outcome.manager_class for outcome in outcomes} == {
+            AlphaManager,
+            BetaManager,
+            GammaManager,
+        }
+        assert _WritingIndexer.peak_writes == 1
+        assert all(
+            name.startswith("search-reindex") for name in _WritingIndexer.threads
+        )
+        assert connections.close_all.call_count == 3
+        assert len(backend.search("global", "", limit=20).hits) == 9
+
+    def test_throttled_backend_delegates_reads_outside_the_write_bound(
+        self,
+    ) -> None:
+        backend = DevSearchBackend()
+        backend.upsert("global", [_document("alpha")])
+        throttled: list[SearchBackend] = []
+
+        def indexer_factory(wrapped: SearchBackend) -> MagicMock:
+            throttled.append(wrapped)
+            return MagicMock()
+
+        reindex_managers(
+            [AlphaManager],
+            backend=backend,
+            max_concurrent_writes=1,
+            indexer_factory=indexer_factory,
+        )
+
+        (wrapped,) = throttled
+        assert wrapped is not backend
+        with wrapped._writes:  # type: ignore[attr-defined]
+            assert wrapped.list_document_ids("global") == {"alpha"}
+            assert [hit.id for hit in wrapped.search("global", "alpha").hits] == [
+                "alpha"
+            ]
+
+    def test_failures_are_raised_after_every_manager_ran(self) -> None:
+        indexer = MagicMock()
+        indexer.reindex_manager.side_effect = [RuntimeError("boom"), None, None]
+
+        with self.assertRaises(SearchReindexFailedError) as raised:
+            reindex_managers(
+                [AlphaManager, BetaManager, GammaManager],
+                backend=MagicMock(),
+                indexer_factory=lambda _backend: indexer,
+            )
+
+        assert indexer.reindex_manager.call_count == 3
+        assert "AlphaManager" in str(raised.exception)
+        assert isinstance(raised.exception.__cause__, RuntimeError)
+        assert [outcome.succeeded for outcome in raised.exception.outcomes] == [
+            False,
+            True,
+            True,
+        ]
+
+    def test_invalid_bounds_are_rejected(self) -> None:
+        for options in ({"workers": 0}, {"max_concurrent_writes": -1}):
+            with self.subTest(options=options):
+                with self.assertRaises(InvalidSearchReindexOptionError):
+                    reindex_managers([], backend=MagicMock(), **options)
+
+
+class EnqueueManagerReindexTests(SimpleTestCase):
+    def test_identities_are_dispatched_in_chunks_per_index(self) -> None:
+        instances = [MagicMock(identification={"id": number}) for number in range(5)]
+
+        with (
+            patch.object(AlphaManager, "all", return_value=instances),
+            patch(
+                "general_manager.search.async_tasks.dispatch_index_manager_batch"
+            ) as dispatch,
+        ):
+            outcomes = enqueue_manager_reindex([AlphaManager], chunk_size=2)
+
+        dispatched = [
+            (call.args[1], [item["id"] for item in call.args[2]])
+            for call in dispatch.call_args_list
+        ]
+        assert dispatched == [
+            ("global", [0, 1]),
+            ("global", [2, 3]),
+            ("global", [4]),
+            ("alpha", [0, 1]),
+            ("alpha", [2, 3]),
+            ("alpha", [4]),
+        ]
+        assert dispatch.call_args.args[0].endswith(".AlphaManager")
+        assert outcomes[0].batches == 6
+
+    def test_invalid_chunk_size_is_rejected(self) -> None:
+        with self.assertRaises(InvalidSearchReindexOptionError):
+            enqueue_manager_reindex([AlphaManager], chunk_size=0)
+
+
+@patch("general_manager.management.commands.search_index.get_index_names")
+@patch("general_manager.management.commands.search_index.iter_searchable_managers")
+@patch("general_manager.management.commands.search_index.get_search_backend")
+class SearchIndexCommandReindexTests(SimpleTestCase):
+    def test_workers_option_bounds_reindex(
+        self, mock_backend, mock_iter, mock_get_index_names
+    ) -> None:
+        mock_get_index_names.return_value = {"global"}
+        mock_iter.return_value = [AlphaManager, BetaManager]
+        mock_backend.return_value = MagicMock()
+        stdout = StringIO()
+
+        with patch(
+            "general_manager.management.commands.search_index.reindex_managers"
+        ) as reindex:
+            call_command(
+                "search_index",
+                "--reindex",
+                "--workers",
+                "2",
+                "--max-concurrent-writes",
+                "1",
+                stdout=stdout,
+            )
+
+        assert reindex.call_args.args[0] == [AlphaManager, BetaManager]
+        assert reindex.call_args.kwargs["workers"] == 2
+        assert reindex.call_args.kwargs["max_concurrent_writes"] == 1
+
+    def test_progress_lines_are_written_per_manager(
+        self, mock_backend, mock_iter, mock_get_index_names
+    ) -> None:
+        mock_get_index_names.return_value = {"global"}
+        mock_iter.return_value = [AlphaManager, BetaManager]
+        mock_backend.return_value = MagicMock()
+        stdout = StringIO()
+
+        with patch("general_manager.management.commands.search_index.SearchIndexer"):
+            call_command("search_index", "--reindex", stdout=stdout)
+
+        lines = stdout.getvalue().splitlines()
+        assert lines[0].startswith("[1/2] AlphaManager reindexed in ")
+        assert lines[1].startswith("[2/2] BetaManager reindexed in ")
+
+    def test_celery_option_enqueues_batches(
+        self, mock_backend, mock_iter, mock_get_index_names
+    ) -> None:
+        mock_get_index_names.return_value = {"global"}
+        mock_iter.return_value = [BetaManager]
+        mock_backend.return_value = MagicMock()
+
+        with patch(
+            "general_manager.management.commands.search_index.enqueue_manager_reindex"
+        ) as enqueue:
+            call_command(
+                "search_index",
+                "--reindex",
+                "--celery",
+                "--chunk-size",
+                "50",
+                stdout=StringIO(),
+            )
+
+        assert enqueue.call_args.args[0] == [BetaManager]
+        assert enqueue.call_args.kwargs["chunk_size"] == 50
+
+    def test_non_positive_workers_are_rejected(
+        self, mock_backend, mock_iter, mock_get_index_names
+    ) -> None:
+        with self.assertRaises(InvalidSearchIndexCommandOptionError):
+            call_command("search_index", "--reindex", "--workers", "0")
+        mock_backend.assert_not_called()
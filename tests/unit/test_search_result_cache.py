@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from general_manager.search.backend import SearchBackend, SearchDocument, SearchResult
+from general_manager.search.backend_registry import (
+    configure_search_backend,
+    configure_search_backend_from_settings,
+    get_search_backend,
+)
+from general_manager.search.backends.dev import DevSearchBackend
+from general_manager.search.result_cache import CachedSearchBackend
+
+
+def _document(
+    document_id: str, name: str, index_name: str = "global"
+) -> SearchDocument:
+    return SearchDocument(
+        id=document_id,
+        type="Project",
+        identification={"id": int(document_id)},
+        index=index_name,
+        data={"name": name},
+        field_boosts={},
+    )
+
+
+class _PipelinedBackend(DevSearchBackend):
+    """Dev backend that applies writes only when their task completes."""
+
+    pipelined = True
+    settings_cache_namespace = "tests:pipelined-server"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._queued: list[tuple[str, list[SearchDocument]]] = []
+        self._listeners: list[Callable[[Sequence[object]], object]] = []
+
+    def upsert(self, index_name: str, documents: Sequence[SearchDocument]) -> None:
+        self._queued.append((index_name, list(documents)))
+
+    def pending_tasks(self) -> tuple[SimpleNamespace, ...]:
+        return tuple(SimpleNamespace(index_name=name) for name, _ in self._queued)
+
+    def add_task_completion_listener(
+        self, listener: Callable[[Sequence[object]], object]
+    ) -> None:
+        self._listeners.append(listener)
+
+    def complete_tasks(self) -> None:
+        finished = self.pending_tasks()
+        for index_name, documents in self._queued:
+            super().upsert(index_name, documents)
+        self._queued.clear()
+        for listener in self._listeners:
+            listener(finished)
+
+
+class _ServerView:
+    """Search-only view of a backend, as another process would have it."""
+
+    settings_cache_namespace = _PipelinedBackend.settings_cache_namespace
+
+    def __init__(self, backend: DevSearchBackend) -> None:
+        self._backend = backend
+
+    def search(self, *args: Any, **kwargs: Any) -> SearchResult:
+        return self._backend.search(*args, **kwargs)
+
+
+class _SharedBackend(DevSearchBackend):
+    settings_cache_namespace = "tests:shared-server"
+
+
+class _UnnamespacedBackend(DevSearchBackend):
+    settings_cache_namespace = None
+
+
+class CachedSearchBackendTests(SimpleTestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.inner = DevSearchBackend()
+        self.inner.upsert("global", [_document("1", "Alpha"), _document("2", "Beta")])
+        self.inner.upsert("other", [_document("3", "Alpha", "other")])
+        self.backend = CachedSearchBackend(self.inner, timeout=60)
+
+    def test_identical_request_is_served_from_cache(self) -> None:
+        with patch.object(self.inner, "search", wraps=self.inner.search) as search:
+            first = self.backend.search("global", "alpha", limit=5)
+            second = self.backend.search("global", "alpha", limit=5)
+
+        assert search.call_count == 1
+        assert [hit.identification for hit in second.hits] == [{"id": 1}]
+        assert second.total == first.total
+        assert second.raw is None
+
+    def test_distinct_filters_and_pages_use_separate_entries(self) -> None:
+        with patch.object(self.inner, "search", wraps=self.inner.search) as search:
+            self.backend.search("global", "", filters={"name": "Alpha"})
+            self.backend.search("global", "", filters={"name": "Beta"})
+            self.backend.search("global", "", filters={"name": "Beta"}, offset=1)
+
+        assert search.call_count == 3
+
+    def test_writes_invalidate_only_their_index(self) -> None:
+        self.backend.search("global", "alpha")
+        self.backend.search("other", "alpha")
+
+        self.backend.upsert("global", [_document("4", "Alpha Two")])
+        with patch.object(self.inner, "search", wraps=self.inner.search) as search:
+            refreshed = self.backend.search("global", "alpha")
+            self.backend.search("other", "alpha")
+
+        assert search.call_count == 1
+        assert {hit.id for hit in refreshed.hits} == {"1", "4"}
+
+        self.backend.delete("global", ["4"])
+        assert {hit.id for hit in self.backend.search("global", "alpha").hits} == {"1"}
+
+    def test_pipelined_writes_invalidate_when_their_tasks_finish(self) -> None:
+        inner = _PipelinedBackend()
+        inner.upsert("global", [_document("1", "Alpha")])
+        inner.complete_tasks()
+        writer = CachedSearchBackend(inner, timeout=60)
+        # Another process searching the same server; it tracks no tasks.
+        reader = CachedSearchBackend(
+            cast(SearchBackend, _ServerView(inner)), timeout=60
+        )
+
+        writer.upsert("global", [_document("2", "Alpha Two")])
+        with patch.object(inner, "search", wraps=inner.search) as search:
+            writer.search("global", "alpha")
+            writer.search("global", "alpha")
+            assert search.call_count == 2
+            during = reader.search("global", "alpha")
+            reader.search("global", "alpha")
+            assert search.call_count == 3
+            inner.complete_tasks()
+            after = reader.search("global", "alpha")
+
+        assert {hit.id for hit in during.hits} == {"1"}
+        assert {hit.id for hit in after.hits} == {"1", "2"}
+        assert search.call_count == 4
+
+    def test_pipelined_backends_without_completion_reports_are_not_cached(
+        self,
+    ) -> None:
+        class _Untracked(_SharedBackend):
+            pipelined = True
+
+        inner = _Untracked()
+        inner.upsert("global", [_document("1", "Alpha")])
+        backend = CachedSearchBackend(inner, timeout=60)
+
+        with patch.object(inner, "search", wraps=inner.search) as search:
+            backend.search("global", "alpha")
+            backend.search("global", "alpha")
+
+        assert backend.caching is False
+        assert search.call_count == 2
+
+    def test_cache_outcomes_are_forwarded_to_metrics_backend(self) -> None:
+        metrics = Mock()
+        with patch(
+            "general_manager.metrics.graphql.get_graphql_metrics_backend",
+            return_value=metrics,
+        ):
+            self.backend.search("global", "alpha")
+            self.backend.search("global", "alpha")
+
+        outcomes = [
+            call.kwargs["outcome"]
+            for call in metrics.record_search_cache.call_args_list
+        ]
+        assert outcomes == ["miss", "hit"]
+        assert metrics.record_search_cache.call_args.kwargs["index_name"] == "global"
+        assert metrics.record_search_cache.call_args.kwargs["saved_seconds"] >= 0
+
+    def test_cache_failures_fall_back_to_backend(self) -> None:
+        with patch(
+            "general_manager.search.result_cache.django_cache.get",
+            side_effect=RuntimeError("cache down"),
+        ):
+            result = self.backend.search("global", "alpha")
+
+        assert [hit.id for hit in result.hits] == ["1"]
+
+    def test_writes_in_another_process_invalidate_shared_namespace(self) -> None:
+        worker = CachedSearchBackend(_SharedBackend(), timeout=60)
+        web_inner = _SharedBackend()
+        web = CachedSearchBackend(web_inner, timeout=60)
+        web.search("global", "alpha")
+
+        worker.upsert("global", [_document("5", "Alpha Five")])
+        with patch.object(web_inner, "search", wraps=web_inner.search) as search:
+            web.search("global", "alpha")
+
+        assert search.call_count == 1
+
+    def test_backends_without_namespace_are_not_cached(self) -> None:
+        inner = _UnnamespacedBackend()
+        inner.upsert("global", [_document("1", "Alpha")])
+        backend = CachedSearchBackend(inner, timeout=60)
+
+        with patch.object(inner, "search", wraps=inner.search) as search:
+            backend.search("global", "alpha")
+            result = backend.search("global", "alpha")
+
+        assert backend.caching is False
+        assert search.call_count == 2
+        assert [hit.id for hit in result.hits] == ["1"]
+
+
+class ResultCacheRegistryTests(SimpleTestCase):
+    def tearDown(self) -> None:
+        configure_search_backend(None)
+
+    @override_settings(
+        GENERAL_MANAGER={
+            "SEARCH_BACKEND": DevSearchBackend,
+            "SEARCH_RESULT_CACHE_ENABLED": True,
+        }
+    )
+    def test_enabled_setting_wraps_configured_backend(self) -> None:
+        from django.conf import settings
+
+        configure_search_backend_from_settings(settings)
+
+        backend = get_search_backend()
+        assert isinstance(backend, CachedSearchBackend)
+        assert isinstance(backend.backend, DevSearchBackend)
+
+    @override_settings(GENERAL_MANAGER={"SEARCH_BACKEND": DevSearchBackend})
+    def test_cache_is_disabled_by_default(self) -> None:
+        from django.conf import settings
+
+        configure_search_backend_from_settings(settings)
+
+        assert isinstance(get_search_backend(), DevSearchBackend)
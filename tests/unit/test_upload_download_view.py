@@ -338,3 +338,148 @@ def test_retained_capability_rejects_same_key_byte_replacement(
     assert response.status_code == 404
     assert head_response.status_code == 404
     assert b"replacement" not in response.content
+
+
+def _retained_capability(row: DownloadRecord) -> tuple[str, str]:
+    adapter = ProxyUploadAdapter(_STORAGE)
+    version = adapter.inspect_staged(row.file.name)
+    intent = UploadIntent.objects.create(
+        user=None,
+        token_digest="2" * 64,
+        manager_name=DownloadManager.__name__,
+        field_name="file",
+        operation=UploadOperation.CREATE.value,
+        target_id=None,
+        final_target_pk=str(row.pk),
+        adapter_id=adapter.adapter_id,
+        adapter_version=str(adapter.adapter_version),
+        storage_fingerprint=adapter.storage_fingerprint(),
+        staging_key="gm-staging/tests/ranged",
+        final_key=row.file.name,
+        original_filename="display image.svg",
+        declared_size=version.size,
+        declared_content_type="image/svg+xml",
+        declared_checksum_sha256=version.checksum_sha256,
+        verified_size=version.size,
+        verified_content_type="image/svg+xml",
+        verified_checksum_sha256=version.checksum_sha256,
+        object_version=asdict(version),
+        final_object_version=asdict(version),
+        state=UploadIntentState.CONSUMED.value,
+        expires_at=timezone.now() + timedelta(minutes=5),
+        consumed_at=timezone.now(),
+    )
+    capability = issue_local_download_capability(
+        manager_name=DownloadManager.__name__,
+        object_id=str(row.pk),
+        field_name="file",
+        current_key=row.file.name,
+        expires_in=60,
+        intent_id=intent.id,
+    )
+    return capability.url, f'"{version.checksum_sha256}"'
+
+
+@override_settings(ROOT_URLCONF="tests.test_urls", GENERAL_MANAGER=_SETTINGS)
+@pytest.mark.django_db
+def test_private_download_serves_single_and_multipart_byte_ranges(
+    client: Client,
+    stored_file: DownloadRecord,
+) -> None:
+    add_file_upload_urls()
+    url = _url(stored_file)
+
+    single = client.get(url, headers={"Range": "bytes=1-3"})
+    multiple = client.get(url, headers={"Range": "bytes=0-0, -2, 1-1"})
+
+    assert single.status_code == 206
+    assert single["Content-Range"] == "bytes 1-3/11"
+    assert single["Content-Length"] == "3"
+    assert single["Accept-Ranges"] == "bytes"
+    assert single["Cache-Control"] == "private, no-store"
+    assert b"".join(single.streaming_content) == b"svg"
+    assert multiple.status_code == 206
+    content_type, boundary = multiple["Content-Type"].split("; boundary=")
+    assert content_type == "multipart/byteranges"
+    body = b"".join(multiple.streaming_content)
+    assert int(multiple["Content-Length"]) == len(body)
+    assert body == (
+        f"\r\n--{boundary}\r\nContent-Type: image/svg+xml\r\n"
+        "Content-Range: bytes 0-1/11\r\n\r\n<s"
+        f"\r\n--{boundary}\r\nContent-Type: image/svg+xml\r\n"
+        "Content-Range: bytes 9-10/11\r\n\r\ng>"
+        f"\r\n--{boundary}--\r\n"
+    ).encode("ascii")
+
+
+@override_settings(ROOT_URLCONF="tests.test_urls", GENERAL_MANAGER=_SETTINGS)
+@pytest.mark.django_db
+def test_private_download_rejects_unsatisfiable_and_ignores_malformed_ranges(
+    client: Client,
+    stored_file: DownloadRecord,
+) -> None:
+    add_file_upload_urls()
+    url = _url(stored_file)
+
+    unsatisfiable = client.get(url, headers={"Range": "bytes=20-"})
+    malformed = client.get(url, headers={"Range": "bytes=3-1"})
+
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable["Content-Range"] == "bytes */11"
+    assert unsatisfiable["X-Content-Type-Options"] == "nosniff"
+    assert malformed.status_code == 200
+    assert b"".join(malformed.streaming_content) == b"<svg></svg>"
+
+
+@override_settings(ROOT_URLCONF="tests.test_urls", GENERAL_MANAGER=_SETTINGS)
+@pytest.mark.django_db
+def test_retained_download_validates_etag_preconditions(
+    client: Client,
+    stored_file: DownloadRecord,
+) -> None:
+    add_file_upload_urls()
+    url, etag = _retained_capability(stored_file)
+
+    full = client.get(url)
+    not_modified = client.get(url, headers={"If-None-Match": f"W/{etag}"})
+    ranged = client.get(url, headers={"Range": "bytes=-4", "If-Range": etag})
+    stale_range = client.get(url, headers={"Range": "bytes=-4", "If-Range": '"old"'})
+
+    assert full.status_code == 200
+    assert full["ETag"] == etag
+    assert full["Cache-Control"] == "private, no-cache"
+    assert full["Accept-Ranges"] == "bytes"
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified["ETag"] == etag
+    assert ranged.status_code == 206
+    assert ranged["Content-Range"] == "bytes 7-10/11"
+    assert b"".join(ranged.streaming_content) == b"svg>"
+    assert stale_range.status_code == 200
+    assert b"".join(stale_range.streaming_content) == b"<svg></svg>"
+
+    with open(_STORAGE.path(stored_file.file.name), "wb") as replaced:
+        replaced.write(b"<svg>new</svg>")
+
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 404
+    assert client.get(url, headers={"Range": "bytes=0-1"}).status_code == 404
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("bytes=0-4,2-8", [(0, 8)]),
+        ("bytes=-3, 5-9", [(5, 9), (97, 99)]),
+        ("bytes=-0", []),
+        ("items=0-1", None),
+        ("bytes=x-1", None),
+        (",".join(["bytes=0-0", *(f"{n * 2}-{n * 2}" for n in range(1, 17))]), None),
+    ],
+)
+def test_byte_range_parser_coalesces_and_bounds_ranges(
+    header: str,
+    expected: list[tuple[int, int]] | None,
+) -> None:
+    from general_manager.uploads.views import _parse_byte_ranges
+
+    assert _parse_byte_ranges(header, 100) == expected
@@ -5,7 +5,7 @@ import hashlib
 from io import BytesIO
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any, Callable, ClassVar
+from typing import Any, Callable, ClassVar, Iterator
 import tomllib
 from uuid import UUID
 
@@ -16,6 +16,7 @@ from general_manager.uploads.adapters import (
     ClaimedObject,
     ProxyUploadAdapter,
     PublicUploadUrlUnsupportedError,
+    RangedDownloadAdapter,
     UploadAdapterRegistry,
 )
 from general_manager.uploads import finalization
@@ -57,11 +58,13 @@ class FakeS3Client:
         versioning: bool = True,
         conditional_copy: bool = True,
         conditional_put: bool = True,
+        conditional_multipart: bool = False,
         signature_version: object = "s3v4",
     ) -> None:
         self.versioning = versioning
         self.objects: dict[tuple[str, str | None], dict[str, Any]] = {}
         self.copy_calls: list[dict[str, Any]] = []
+        self.part_copy_calls: list[dict[str, Any]] = []
         self.put_calls: list[dict[str, Any]] = []
         self.delete_calls: list[dict[str, Any]] = []
         self.head_calls: list[dict[str, Any]] = []
@@ -70,6 +73,9 @@ class FakeS3Client:
         self.operation_errors: dict[str, Exception] = {}
         self.body_factory: Callable[[bytes], object] = BytesIO
         self.put_version_counter = 0
+        self.multipart_uploads: dict[str, dict[str, Any]] = {}
+        self.aborted_uploads: list[str] = []
+        self.multipart_counter = 0
 
         def operation_model(name: str) -> SimpleNamespace:
             members: dict[str, object] = {}
@@ -77,6 +83,8 @@ class FakeS3Client:
                 members["IfNoneMatch"] = object()
             if conditional_put and name == "PutObject":
                 members["IfNoneMatch"] = object()
+            if conditional_multipart and name == "CompleteMultipartUpload":
+                members["IfNoneMatch"] = object()
             if name in {"GetObject", "DeleteObject"}:
                 members["IfMatch"] = object()
             return SimpleNamespace(input_shape=SimpleNamespace(members=members))
@@ -128,6 +136,14 @@ class FakeS3Client:
         value = self._lookup_object(**kwargs)
         if kwargs.get("IfMatch") is not None and kwargs["IfMatch"] != value["ETag"]:
             raise PreconditionError
+        if "Range" in kwargs:
+            start, end = (int(part) for part in kwargs["Range"][6:].split("-"))
+            payload = value["Body"][start : end + 1]
+            return {
+                "Body": self.body_factory(payload),
+                "ContentLength": len(payload),
+                "ContentRange": f"bytes {start}-{end}/{len(value['Body'])}",
+            }
         return {"Body": self.body_factory(value["Body"])}
 
     def put_object(self, **kwargs: Any) -> dict[str, Any]:
@@ -160,6 +176,63 @@ class FakeS3Client:
             "ChecksumSHA256": checksum,
         }
 
+    def create_multipart_upload(self, **kwargs: Any) -> dict[str, Any]:
+        self._fail_if("create_multipart")
+        assert kwargs["ChecksumAlgorithm"] == "SHA256"
+        self.multipart_counter += 1
+        upload_id = f"upload-{self.multipart_counter}"
+        self.multipart_uploads[upload_id] = {"request": dict(kwargs), "parts": {}}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, **kwargs: Any) -> dict[str, Any]:
+        self._fail_if("upload_part")
+        payload = kwargs["Body"]
+        checksum = base64.b64encode(hashlib.sha256(payload).digest()).decode("ascii")
+        assert kwargs["ChecksumSHA256"] == checksum
+        etag = f'"{hashlib.md5(payload, usedforsecurity=False).hexdigest()}"'
+        upload = self.multipart_uploads[kwargs["UploadId"]]
+        upload["parts"][kwargs["PartNumber"]] = (etag, payload)
+        return {"ETag": etag, "ChecksumSHA256": checksum}
+
+    def complete_multipart_upload(self, **kwargs: Any) -> dict[str, Any]:
+        self._fail_if("complete_multipart")
+        assert kwargs["IfNoneMatch"] == "*"
+        upload = self.multipart_uploads.pop(kwargs["UploadId"])
+        key = kwargs["Key"]
+        if any(object_key == key for object_key, _version in self.objects):
+            raise PreconditionError
+        listed = kwargs["MultipartUpload"]["Parts"]
+        assert [part["PartNumber"] for part in listed] == sorted(upload["parts"])
+        assert all(
+            upload["parts"][part["PartNumber"]][0] == part["ETag"] for part in listed
+        )
+        payload = b"".join(
+            upload["parts"][number][1] for number in sorted(upload["parts"])
+        )
+        composite = hashlib.sha256(
+            b"".join(
+                hashlib.sha256(upload["parts"][number][1]).digest()
+                for number in sorted(upload["parts"])
+            )
+        ).digest()
+        request = upload["request"]
+        self.objects[(key, None)] = {
+            "VersionId": None,
+            "ETag": f'"multipart-{len(listed)}"',
+            "ChecksumSHA256": (
+                f"{base64.b64encode(composite).decode('ascii')}-{len(listed)}"
+            ),
+            "ContentLength": len(payload),
+            "ContentType": request.get("ContentType"),
+            "Metadata": dict(request.get("Metadata", {})),
+            "Body": payload,
+        }
+        return {"ETag": f'"multipart-{len(listed)}"'}
+
+    def abort_multipart_upload(self, **kwargs: Any) -> None:
+        self.aborted_uploads.append(kwargs["UploadId"])
+        self.multipart_uploads.pop(kwargs["UploadId"], None)
+
     def copy_object(self, **kwargs: Any) -> dict[str, Any]:
         self._fail_if("copy")
         self.copy_calls.append(dict(kwargs))
@@ -173,18 +246,38 @@ class FakeS3Client:
         )
         if kwargs["CopySourceIfMatch"] != value["ETag"]:
             raise PreconditionError
-        source_checksum = base64.b64decode(value["ChecksumSHA256"]).hex()
-        assert kwargs["Metadata"]["gm-checksum-sha256"] == source_checksum
-        assert not any(key == kwargs["Key"] for key, _version in self.objects)
+        if any(key == kwargs["Key"] for key, _version in self.objects):
+            raise PreconditionError
+        digest = hashlib.sha256(value["Body"]).digest()
+        assert kwargs["Metadata"]["gm-checksum-sha256"] == digest.hex()
         destination_version = "final-version" if self.versioning else None
         destination = (kwargs["Key"], destination_version)
         self.objects[destination] = {
             **value,
             "VersionId": destination_version,
+            "ChecksumSHA256": base64.b64encode(digest).decode("ascii"),
             "Metadata": dict(kwargs["Metadata"]),
         }
         return {"VersionId": destination_version, "CopyObjectResult": {}}
 
+    def upload_part_copy(self, **kwargs: Any) -> dict[str, Any]:
+        self._fail_if("upload_part_copy")
+        self.part_copy_calls.append(dict(kwargs))
+        source = kwargs["CopySource"]
+        value = self._lookup_object(
+            Key=source["Key"],
+            VersionId=source.get("VersionId"),
+        )
+        if kwargs["CopySourceIfMatch"] != value["ETag"]:
+            raise PreconditionError
+        start, end = (int(bound) for bound in kwargs["CopySourceRange"][6:].split("-"))
+        payload = value["Body"][start : end + 1]
+        checksum = base64.b64encode(hashlib.sha256(payload).digest()).decode("ascii")
+        etag = f'"{hashlib.md5(payload, usedforsecurity=False).hexdigest()}"'
+        upload = self.multipart_uploads[kwargs["UploadId"]]
+        upload["parts"][kwargs["PartNumber"]] = (etag, payload)
+        return {"CopyPartResult": {"ETag": etag, "ChecksumSHA256": checksum}}
+
     def delete_object(self, **kwargs: Any) -> None:
         self._fail_if("delete")
         self.delete_calls.append(dict(kwargs))
@@ -1665,6 +1758,242 @@ def test_s3_proxy_detects_stage_metadata_changed_after_write(
         )
 
 
+def _multipart_proxy(client: FakeS3Client) -> S3ProxyUploadAdapter:
+    adapter = S3ProxyUploadAdapter(FakeS3Storage(client))
+    adapter._multipart_part_bytes = 4
+    adapter._multipart_concurrency = 2
+    adapter._copy_part_bytes = 8
+    return adapter
+
+
+def test_s3_proxy_streams_large_uploads_as_conditional_multipart() -> None:
+    client = FakeS3Client(versioning=False, conditional_multipart=True)
+    adapter = _multipart_proxy(client)
+    payload = b"0123456789abcdefghij-tail"
+
+    version = adapter.save_stage(
+        "gm-staging/large.bin",
+        [payload[:3], payload[3:11], payload[11:]],
+        content_type="text/plain",
+        checksum_sha256=hashlib.sha256(payload).hexdigest(),
+        size=len(payload),
+    )
+
+    assert client.put_calls == []
+    assert client.multipart_uploads == {}
+    assert client.aborted_uploads == []
+    stored = client.objects[("gm-staging/large.bin", None)]
+    assert stored["Body"] == payload
+    assert stored["ChecksumSHA256"].endswith("-7")
+    assert stored["Metadata"]["gm-checksum-sha256"] == version.checksum_sha256
+    assert version.checksum_sha256 == hashlib.sha256(payload).hexdigest()
+    assert version.size == len(payload)
+    assert adapter.inspect_staged("gm-staging/large.bin") == version
+    with adapter.open_stage("gm-staging/large.bin", version) as opened:
+        assert opened.read() == payload
+
+    small = adapter.save_stage(
+        "gm-staging/small.bin",
+        [b"tiny"],
+        content_type="text/plain",
+        checksum_sha256=hashlib.sha256(b"tiny").hexdigest(),
+        size=4,
+    )
+    assert len(client.put_calls) == 1
+    assert small.size == 4
+
+
+def test_s3_proxy_multipart_aborts_on_mismatch_part_failure_and_stream_errors() -> None:
+    client = FakeS3Client(versioning=False, conditional_multipart=True)
+    adapter = _multipart_proxy(client)
+    payload = b"0123456789"
+
+    with pytest.raises(UploadChecksumMismatchError):
+        adapter.save_stage(
+            "gm-staging/mismatch.bin",
+            [payload],
+            content_type="text/plain",
+            checksum_sha256="0" * 64,
+            size=len(payload),
+        )
+    with pytest.raises(UploadStorageError):
+        adapter.save_stage(
+            "gm-staging/short.bin",
+            [payload],
+            content_type="text/plain",
+            checksum_sha256=hashlib.sha256(payload).hexdigest(),
+            size=len(payload) + 1,
+        )
+
+    def interrupted() -> Iterator[bytes]:
+        yield payload
+        raise ConnectionResetError
+
+    with pytest.raises(ConnectionResetError):
+        adapter.save_stage(
+            "gm-staging/interrupted.bin",
+            interrupted(),
+            content_type="text/plain",
+            checksum_sha256=hashlib.sha256(payload).hexdigest(),
+            size=len(payload) * 2,
+        )
+    client.fail_operations.add("upload_part")
+    with pytest.raises(UploadStorageError):
+        adapter.save_stage(
+            "gm-staging/failed-part.bin",
+            [payload],
+            content_type="text/plain",
+            checksum_sha256=hashlib.sha256(payload).hexdigest(),
+            size=len(payload),
+        )
+
+    assert client.aborted_uploads == ["upload-1", "upload-2", "upload-3", "upload-4"]
+    assert client.multipart_uploads == {}
+    assert client.objects == {}
+
+
+def test_s3_proxy_multipart_completion_conflicts_are_not_overwritten() -> None:
+    client = FakeS3Client(versioning=False, conditional_multipart=True)
+    adapter = _multipart_proxy(client)
+    adapter.save_stage("gm-staging/taken.bin", [b"other"], content_type="text/plain")
+    payload = b"0123456789"
+
+    with pytest.raises(UploadTransferConflictError):
+        adapter.save_stage(
+            "gm-staging/taken.bin",
+            [payload],
+            content_type="text/plain",
+            checksum_sha256=hashlib.sha256(payload).hexdigest(),
+            size=len(payload),
+        )
+
+    assert client.aborted_uploads == ["upload-1"]
+    assert client.objects[("gm-staging/taken.bin", None)]["Body"] == b"other"
+
+
+def test_s3_proxy_materializes_with_conditional_server_side_copy() -> None:
+    client = FakeS3Client(versioning=False)
+    adapter = S3ProxyUploadAdapter(FakeS3Storage(client))
+    payload = b"copied without the application"
+    version = adapter.save_stage(
+        "gm-staging/copied.bin",
+        [payload],
+        content_type="text/plain",
+    )
+    intent_id = UUID("9c90741f-72ce-4f34-886c-297bc019db16")
+
+    assert (
+        adapter.materialize(
+            "gm-staging/copied.bin",
+            version,
+            "files/copied.bin",
+            intent_id=intent_id,
+        )
+        == "files/copied.bin"
+    )
+
+    assert len(client.put_calls) == 1
+    (copy_call,) = client.copy_calls
+    assert copy_call["CopySource"] == {
+        "Bucket": "uploads",
+        "Key": "gm-staging/copied.bin",
+    }
+    assert copy_call["CopySourceIfMatch"] == version.etag
+    assert copy_call["IfNoneMatch"] == "*"
+    assert copy_call["MetadataDirective"] == "REPLACE"
+    assert copy_call["Metadata"]["gm-intent-id"] == str(intent_id)
+    assert client.objects[("files/copied.bin", None)]["Body"] == payload
+
+
+def test_s3_proxy_materializes_large_stages_with_conditional_part_copies() -> None:
+    client = FakeS3Client(
+        versioning=False,
+        conditional_copy=False,
+        conditional_multipart=True,
+    )
+    adapter = _multipart_proxy(client)
+    payload = b"0123456789abcdefghij-tail"
+    version = adapter.save_stage(
+        "gm-staging/large-copy.bin",
+        [payload],
+        content_type="text/plain",
+        checksum_sha256=hashlib.sha256(payload).hexdigest(),
+        size=len(payload),
+    )
+    intent_id = UUID("9c90741f-72ce-4f34-886c-297bc019db16")
+
+    assert (
+        adapter.materialize(
+            "gm-staging/large-copy.bin",
+            version,
+            "files/large-copy.bin",
+            intent_id=intent_id,
+        )
+        == "files/large-copy.bin"
+    )
+
+    assert client.put_calls == []
+    assert client.copy_calls == []
+    assert {
+        call["PartNumber"]: call["CopySourceRange"] for call in client.part_copy_calls
+    } == {1: "bytes=0-7", 2: "bytes=8-15", 3: "bytes=16-23", 4: "bytes=24-24"}
+    assert all(
+        call["CopySourceIfMatch"] == version.etag for call in client.part_copy_calls
+    )
+    final = client.objects[("files/large-copy.bin", None)]
+    assert final["Body"] == payload
+    assert final["ChecksumSHA256"].endswith("-4")
+    assert final["Metadata"]["gm-intent-id"] == str(intent_id)
+    # A retry recognizes the composite-checksum destination as its own.
+    retried = adapter.materialize(
+        "gm-staging/large-copy.bin",
+        version,
+        "files/large-copy.bin",
+        intent_id=intent_id,
+    )
+    assert retried == "files/large-copy.bin"
+
+
+def test_s3_proxy_part_copies_abort_on_source_changes_and_failures() -> None:
+    client = FakeS3Client(
+        versioning=False,
+        conditional_copy=False,
+        conditional_multipart=True,
+    )
+    adapter = _multipart_proxy(client)
+    payload = b"0123456789abcdefghij"
+    version = adapter.save_stage(
+        "gm-staging/changing.bin",
+        [payload],
+        content_type="text/plain",
+        checksum_sha256=hashlib.sha256(payload).hexdigest(),
+        size=len(payload),
+    )
+    intent_id = UUID("9c90741f-72ce-4f34-886c-297bc019db16")
+
+    client.fail_operations.add("upload_part_copy")
+    with pytest.raises(UploadStorageError):
+        adapter.materialize(
+            "gm-staging/changing.bin",
+            version,
+            "files/failed-copy.bin",
+            intent_id=intent_id,
+        )
+    client.fail_operations.clear()
+    client.objects[("gm-staging/changing.bin", None)]["ETag"] = '"replaced"'
+    with pytest.raises(UploadStorageChangedError):
+        adapter.materialize(
+            "gm-staging/changing.bin",
+            version,
+            "files/changed-copy.bin",
+            intent_id=intent_id,
+        )
+
+    assert client.aborted_uploads == ["upload-2", "upload-3"]
+    assert client.multipart_uploads == {}
+    assert list(client.objects) == [("gm-staging/changing.bin", None)]
+
+
 def test_s3_proxy_materialization_retries_matching_destination() -> None:
     client = FakeS3Client(versioning=False)
     adapter = S3ProxyUploadAdapter(FakeS3Storage(client))
@@ -1721,7 +2050,7 @@ def test_s3_proxy_materialization_normalizes_write_races(
     error: Exception,
     expected_exception: type[Exception] | None,
 ) -> None:
-    client = FakeS3Client(versioning=False)
+    client = FakeS3Client(versioning=False, conditional_copy=False)
     adapter = S3ProxyUploadAdapter(FakeS3Storage(client))
     stage_key = "gm-staging/materialize-race.bin"
     final_key = "files/materialize-race.bin"
@@ -1764,7 +2093,7 @@ def test_s3_proxy_materialization_normalizes_write_races(
 def test_s3_proxy_detects_destination_changed_after_materialization(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    client = FakeS3Client(versioning=False)
+    client = FakeS3Client(versioning=False, conditional_copy=False)
     adapter = S3ProxyUploadAdapter(FakeS3Storage(client))
     stage_key = "gm-staging/changed-final.bin"
     final_key = "files/changed-final.bin"
@@ -1847,6 +2176,61 @@ def test_s3_proxy_download_inspection_binds_the_claimed_object() -> None:
         adapter.inspect_staged(key)
 
 
+def test_s3_proxy_download_ranges_are_conditional_on_the_retained_etag() -> None:
+    client = FakeS3Client(versioning=False)
+    adapter = S3ProxyUploadAdapter(FakeS3Storage(client))
+    key = "files/range.bin"
+    version = adapter.save_stage(key, [b"0123456789"], content_type="text/plain")
+
+    assert isinstance(adapter, RangedDownloadAdapter)
+    with adapter.open_download_range(key, version, start=2, end=5) as opened:
+        assert opened.read() == b"2345"
+    with pytest.raises(UploadStorageError):
+        adapter.open_download_range(key, version, start=4, end=10)
+
+    changed = ObjectVersion(
+        version_id=None,
+        etag='"changed"',
+        checksum_sha256=version.checksum_sha256,
+        size=version.size,
+    )
+    with pytest.raises(UploadStorageChangedError):
+        adapter.open_download_range(key, changed, start=0, end=1)
+    shorter = ObjectVersion(
+        version_id=None,
+        etag=version.etag,
+        checksum_sha256=version.checksum_sha256,
+        size=version.size + 1,
+    )
+    with pytest.raises(UploadStorageChangedError):
+        adapter.open_download_range(key, shorter, start=0, end=1)
+
+
+def test_s3_direct_download_ranges_read_only_the_exact_version() -> None:
+    client = FakeS3Client()
+    expected = _stage(client)
+    adapter = S3UploadAdapter(FakeS3Storage(client))
+
+    opened = adapter.open_download_range(
+        "gm-staging/intent.bin", expected, start=10, end=15
+    )
+
+    assert isinstance(adapter, RangedDownloadAdapter)
+    assert opened.read() == b"staged"
+    with pytest.raises(UploadBackendUnsupportedError):
+        adapter.open_download_range(
+            "gm-staging/intent.bin",
+            ObjectVersion(
+                version_id=None,
+                etag=expected.etag,
+                checksum_sha256=expected.checksum_sha256,
+                size=expected.size,
+            ),
+            start=0,
+            end=1,
+        )
+
+
 def test_s3_proxy_materialized_inspection_and_deletion_require_intent_identity() -> (
     None
 ):
@@ -9,12 +9,25 @@ from general_manager.workflow.config import (
     workflow_beat_outbox_interval_seconds,
     workflow_dead_letter_enabled,
     workflow_delivery_running_timeout_seconds,
+    workflow_dispatcher_max_poll_ms,
+    workflow_dispatcher_min_poll_ms,
     workflow_max_retries,
     workflow_mode,
     workflow_outbox_batch_size,
     workflow_outbox_claim_ttl_seconds,
+    workflow_outbox_dispatcher_enabled,
+    workflow_outbox_notify_channel,
     workflow_outbox_process_chunk_size,
+    workflow_outbox_route_concurrency,
+    workflow_retention_archiver,
+    workflow_retention_batch_size,
+    workflow_retention_dead_letter_days,
+    workflow_retention_enabled,
+    workflow_retention_interval_seconds,
+    workflow_retention_max_batches,
+    workflow_retention_processed_days,
     workflow_retry_backoff_seconds,
+    workflow_signal_bridge_skip_unrouted,
 )
 
 
@@ -140,3 +153,85 @@ def test_workflow_config_ignores_non_mapping_general_manager() -> None:
 
     assert workflow_mode(django_settings) == "local"
     assert workflow_outbox_batch_size(django_settings) == 7
+
+
+def test_workflow_dispatcher_settings_defaults_and_overrides() -> None:
+    defaults = SimpleNamespace(GENERAL_MANAGER={})
+    configured = SimpleNamespace(
+        GENERAL_MANAGER={
+            "WORKFLOW_OUTBOX_DISPATCHER": 1,
+            "WORKFLOW_OUTBOX_NOTIFY_CHANNEL": " outbox_ready ",
+            "WORKFLOW_DISPATCHER_MIN_POLL_MS": 0,
+            "WORKFLOW_DISPATCHER_MAX_POLL_MS": "500",
+        }
+    )
+
+    assert workflow_outbox_dispatcher_enabled(defaults) is False
+    assert workflow_outbox_notify_channel(defaults) == (
+        "general_manager_workflow_outbox"
+    )
+    assert workflow_dispatcher_min_poll_ms(defaults) == 10
+    assert workflow_dispatcher_max_poll_ms(defaults) == 2000
+    assert workflow_outbox_dispatcher_enabled(configured) is True
+    assert workflow_outbox_notify_channel(configured) == "outbox_ready"
+    assert workflow_dispatcher_min_poll_ms(configured) == 1
+    assert workflow_dispatcher_max_poll_ms(configured) == 500
+
+
+def test_outbox_route_concurrency_defaults_to_sequential_and_clamps() -> None:
+    assert workflow_outbox_route_concurrency(SimpleNamespace(GENERAL_MANAGER={})) == 1
+    assert (
+        workflow_outbox_route_concurrency(
+            SimpleNamespace(GENERAL_MANAGER={"WORKFLOW_OUTBOX_ROUTE_CONCURRENCY": "4"})
+        )
+        == 4
+    )
+    assert (
+        workflow_outbox_route_concurrency(
+            SimpleNamespace(WORKFLOW_OUTBOX_ROUTE_CONCURRENCY=0)
+        )
+        == 1
+    )
+
+
+def test_retention_settings_default_to_an_opt_in_weekly_sweep() -> None:
+    defaults = SimpleNamespace(GENERAL_MANAGER={})
+    configured = SimpleNamespace(
+        GENERAL_MANAGER={
+            "WORKFLOW_RETENTION_ENABLED": 1,
+            "WORKFLOW_RETENTION_PROCESSED_DAYS": 0,
+            "WORKFLOW_RETENTION_DEAD_LETTER_DAYS": -5,
+            "WORKFLOW_RETENTION_BATCH_SIZE": "250",
+            "WORKFLOW_RETENTION_MAX_BATCHES": "bad",
+            "WORKFLOW_RETENTION_ARCHIVER": "app.archive.events",
+        },
+        WORKFLOW_RETENTION_INTERVAL_SECONDS=600,
+    )
+
+    assert workflow_retention_enabled(defaults) is False
+    assert workflow_retention_processed_days(defaults) == 7
+    assert workflow_retention_dead_letter_days(defaults) == 30
+    assert workflow_retention_batch_size(defaults) == 1000
+    assert workflow_retention_max_batches(defaults) == 50
+    assert workflow_retention_interval_seconds(defaults) == 3600
+    assert workflow_retention_archiver(defaults) is None
+    assert workflow_retention_enabled(configured) is True
+    assert workflow_retention_processed_days(configured) == 1
+    assert workflow_retention_dead_letter_days(configured) == 0
+    assert workflow_retention_batch_size(configured) == 250
+    assert workflow_retention_max_batches(configured) == 50
+    assert workflow_retention_interval_seconds(configured) == 600
+    assert workflow_retention_archiver(configured) == "app.archive.events"
+
+
+def test_workflow_signal_bridge_skip_unrouted_is_opt_in() -> None:
+    assert workflow_signal_bridge_skip_unrouted(SimpleNamespace()) is False
+    assert (
+        workflow_signal_bridge_skip_unrouted(
+            SimpleNamespace(
+                GENERAL_MANAGER={"WORKFLOW_SIGNAL_BRIDGE_SKIP_UNROUTED": 1},
+                WORKFLOW_SIGNAL_BRIDGE_SKIP_UNROUTED=False,
+            )
+        )
+        is True
+    )
@@ -0,0 +1,186 @@
+"""Tests for the continuous workflow outbox dispatcher."""
+
+from __future__ import annotations
+
+from io import StringIO
+from threading import Event
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from general_manager.workflow.dispatcher import OutboxDispatcher, _OutboxListener
+from general_manager.workflow.event_registry import (
+    DatabaseEventRegistry,
+    InMemoryEventRegistry,
+    WorkflowEvent,
+    configure_event_registry,
+)
+from general_manager.workflow.models import WorkflowOutbox
+
+DISPATCHER_SETTINGS = {
+    "WORKFLOW_MODE": "production",
+    "WORKFLOW_ASYNC": True,
+    "WORKFLOW_OUTBOX_DISPATCHER": True,
+    "WORKFLOW_OUTBOX_PROCESS_CHUNK_SIZE": 2,
+}
+
+
+class _RecordingStop(Event):
+    """Stop event that records idle waits and stops after `limit` of them."""
+
+    def __init__(self, limit: int) -> None:
+        super().__init__()
+        self.limit = limit
+        self.waits: list[float] = []
+
+    def wait(self, timeout: float | None = None) -> bool:
+        self.waits.append(timeout or 0.0)
+        if len(self.waits) >= self.limit:
+            self.set()
+        return self.is_set()
+
+
+class OutboxDispatcherTests(TestCase):
+    def tearDown(self) -> None:
+        configure_event_registry(InMemoryEventRegistry())
+        super().tearDown()
+
+    @override_settings(GENERAL_MANAGER=DISPATCHER_SETTINGS)
+    def test_dispatcher_mode_routes_without_enqueuing_tasks(self) -> None:
+        handled: list[str] = []
+        registry = DatabaseEventRegistry()
+        registry.register(
+            "invoice.created", handler=lambda event: handled.append(event.event_id)
+        )
+        configure_event_registry(registry)
+        with (
+            patch.object(DatabaseEventRegistry, "_enqueue_publish_task") as enqueue,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            for index in range(3):
+                registry.publish(
+                    WorkflowEvent(
+                        event_id=f"evt-dispatch-{index}",
+                        event_type="invoice.created",
+                        payload={},
+                    )
+                )
+
+        claimed = OutboxDispatcher().drain()
+
+        enqueue.assert_not_called()
+        assert claimed == 3
+        assert sorted(handled) == [f"evt-dispatch-{index}" for index in range(3)]
+        assert not WorkflowOutbox.objects.exclude(
+            status=WorkflowOutbox.STATUS_PROCESSED
+        ).exists()
+
+    @override_settings(GENERAL_MANAGER=DISPATCHER_SETTINGS)
+    def test_run_backs_off_while_idle_and_resets_after_work(self) -> None:
+        dispatcher = OutboxDispatcher(min_poll_seconds=0.01, max_poll_seconds=0.05)
+        stop = _RecordingStop(limit=6)
+        with (
+            patch.object(
+                dispatcher, "drain", side_effect=[0, 0, 0, 0, 2, 0, 0]
+            ) as drain,
+            patch.object(OutboxDispatcher, "_record_snapshot") as snapshot,
+        ):
+            dispatcher.run(stop)
+
+        assert drain.call_count == 7
+        assert stop.waits == [0.01, 0.02, 0.04, 0.05, 0.01, 0.02]
+        assert snapshot.call_count == 2
+
+    @override_settings(GENERAL_MANAGER=DISPATCHER_SETTINGS)
+    def test_publish_notifies_listeners_on_postgresql(self) -> None:
+        cursor = MagicMock()
+        connection = SimpleNamespace(vendor="postgresql", cursor=lambda: cursor)
+        with patch(
+            "general_manager.workflow.event_registry.transaction.get_connection",
+            return_value=connection,
+        ):
+            DatabaseEventRegistry()._wake_outbox()
+
+        cursor.__enter__.return_value.execute.assert_called_once_with(
+            "SELECT pg_notify(%s, '')", ["general_manager_workflow_outbox"]
+        )
+
+    def test_listener_uses_psycopg3_notifications(self) -> None:
+        handlers: list[object] = []
+        raw = SimpleNamespace(
+            add_notify_handler=handlers.append,
+            notifies=MagicMock(side_effect=[iter([]), iter(["note"])]),
+        )
+        cursor = MagicMock()
+        connection = SimpleNamespace(
+            ensure_connection=lambda: None,
+            cursor=lambda: cursor,
+            ops=SimpleNamespace(quote_name=lambda name: f'"{name}"'),
+            connection=raw,
+        )
+
+        listener = _OutboxListener(connection, "outbox")  # type: ignore[arg-type]
+
+        cursor.__enter__.return_value.execute.assert_called_once_with('LISTEN "outbox"')
+        assert listener.wait(0.5) is False
+        assert listener.wait(0.5) is True
+        raw.notifies.assert_called_with(timeout=0.5, stop_after=1)
+        handlers[0](object())
+        assert listener.wait(0.5) is True
+        assert raw.notifies.call_count == 2
+
+    def test_listener_listens_again_after_reconnect(self) -> None:
+        first_raw = SimpleNamespace(notifies=MagicMock(return_value=iter([])))
+        second_raw = SimpleNamespace(notifies=MagicMock(return_value=iter([])))
+        cursor = MagicMock()
+        connection = SimpleNamespace(
+            ensure_connection=lambda: None,
+            cursor=lambda: cursor,
+            ops=SimpleNamespace(quote_name=lambda name: f'"{name}"'),
+            connection=first_raw,
+        )
+        listener = _OutboxListener(connection, "outbox")  # type: ignore[arg-type]
+
+        connection.connection = second_raw
+
+        assert listener.wait(0.5) is True
+        assert cursor.__enter__.return_value.execute.call_count == 2
+        first_raw.notifies.assert_not_called()
+        assert listener.wait(0.5) is False
+        second_raw.notifies.assert_called_once_with(timeout=0.5, stop_after=1)
+
+    def test_dispatcher_polls_with_psycopg3_before_notify_timeouts(self) -> None:
+        raw = SimpleNamespace(notifies=MagicMock())
+        cursor = MagicMock()
+        connection = SimpleNamespace(
+            vendor="postgresql",
+            ensure_connection=lambda: None,
+            cursor=lambda: cursor,
+            connection=raw,
+        )
+        with (
+            patch(
+                "general_manager.workflow.dispatcher.connections",
+                {"default": connection},
+            ),
+            patch(
+                "general_manager.workflow.dispatcher.version",
+                return_value="3.1.18",
+            ),
+        ):
+            listener = OutboxDispatcher()._listener()
+
+        assert listener is None
+        cursor.__enter__.return_value.execute.assert_not_called()
+
+    def test_command_runs_until_interrupted(self) -> None:
+        stdout = StringIO()
+        with patch.object(
+            OutboxDispatcher, "run", side_effect=KeyboardInterrupt
+        ) as run:
+            call_command("workflow_outbox_dispatcher", stdout=stdout)
+
+        run.assert_called_once_with()
+        assert "Workflow outbox dispatcher stopped." in stdout.getvalue()
@@ -10,6 +10,7 @@ from django.core.management.base import CommandError
 from django.test import SimpleTestCase, TestCase
 
 from general_manager.workflow.models import WorkflowEventRecord, WorkflowOutbox
+from general_manager.workflow.retention import WorkflowRetentionResult
 
 
 class WorkflowDrainOutboxCommandTests(SimpleTestCase):
@@ -101,3 +102,36 @@ class WorkflowReplayDeadLettersCommandTests(TestCase):
         call_command("workflow_replay_dead_letters", limit=10, stdout=stdout)
 
         self.assertIn("No dead-letter outbox rows found.", stdout.getvalue())
+
+
+class WorkflowPurgeHistoryCommandTests(SimpleTestCase):
+    """Verify the workflow retention command."""
+
+    def test_purge_history_repeats_until_complete_and_prints_totals(self) -> None:
+        stdout = StringIO()
+        with patch(
+            "general_manager.management.commands.workflow_purge_history."
+            "purge_workflow_history",
+            side_effect=[
+                WorkflowRetentionResult(4, 4, 8, 2, complete=False),
+                WorkflowRetentionResult(1, 1, 2, 1, complete=True),
+            ],
+        ) as purge:
+            call_command(
+                "workflow_purge_history",
+                "--batch-size=2",
+                "--max-batches=2",
+                "--until-complete",
+                stdout=stdout,
+            )
+
+        assert purge.call_count == 2
+        purge.assert_called_with(batch_size=2, max_batches=2, using="default")
+        self.assertIn(
+            "events=5 outbox_rows=5 delivery_attempts=10 batches=3 complete=True",
+            stdout.getvalue(),
+        )
+
+    def test_purge_history_rejects_non_positive_batch_size(self) -> None:
+        with self.assertRaisesRegex(CommandError, "batch_size must be a positive"):
+            call_command("workflow_purge_history", "--batch-size=0")
@@ -32,6 +32,7 @@ class WorkflowModelIndexTests(SimpleTestCase):
                 ("status", "available_at"): "general_man_status_180bed_idx",
                 ("status", "claimed_at"): "workflow_ou_status__8b7f7b_idx",
                 ("status", "available_at", "id"): "workflow_ou_status__a5f7dc_idx",
+                ("status", "updated_at"): "general_man_status_e94dcb_idx",
                 ("claim_token",): "general_man_claim_t_78fd22_idx",
                 ("created_at",): "general_man_created_073f4b_idx",
             },
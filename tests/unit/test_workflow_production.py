@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from contextlib import suppress
 from datetime import UTC, datetime, timedelta
+from threading import Barrier, current_thread
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import patch
 
 import pytest
 from django.conf import settings
+from django.db import connection, transaction
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 
 from general_manager.workflow.backends.celery import CeleryWorkflowEngine
 from general_manager.workflow.engine import (
@@ -23,6 +30,8 @@ from general_manager.workflow.event_registry import (
     configure_event_registry,
     configure_event_registry_from_settings,
     get_event_registry,
+    release_publish_savepoints,
+    workflow_event_batch,
 )
 from general_manager.workflow.models import (
     WorkflowDeliveryAttempt,
@@ -371,6 +380,171 @@ class WorkflowProductionRegistryTests(TestCase):
 
         assert calls == ["called"]
 
+    @override_settings(
+        GENERAL_MANAGER={"WORKFLOW_MODE": "production", "WORKFLOW_ASYNC": True}
+    )
+    def test_async_publishes_share_one_outbox_wakeup_per_commit(self) -> None:
+        registry = DatabaseEventRegistry()
+        with (
+            patch.object(DatabaseEventRegistry, "_enqueue_publish_task") as enqueue,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            for index in range(3):
+                assert (
+                    registry.publish(
+                        WorkflowEvent(
+                            event_id=f"evt-wakeup-{index}",
+                            event_type="invoice.created",
+                            payload={},
+                        )
+                    )
+                    is False
+                )
+
+        enqueue.assert_called_once_with()
+        assert WorkflowOutbox.objects.count() == 3
+
+    @override_settings(
+        GENERAL_MANAGER={"WORKFLOW_MODE": "production", "WORKFLOW_ASYNC": True}
+    )
+    def test_async_publishes_are_written_before_commit(self) -> None:
+        registry = DatabaseEventRegistry()
+        with (
+            patch.object(DatabaseEventRegistry, "_enqueue_publish_task") as enqueue,
+            self.captureOnCommitCallbacks(execute=False) as callbacks,
+        ):
+            registry.publish(
+                WorkflowEvent(event_id="evt-durable", event_type="a", payload={})
+            )
+            assert WorkflowOutbox.objects.filter(event__event_id="evt-durable").exists()
+
+        enqueue.assert_not_called()
+        assert len(callbacks) == 1
+
+    @override_settings(
+        GENERAL_MANAGER={"WORKFLOW_MODE": "production", "WORKFLOW_ASYNC": True}
+    )
+    def test_event_batch_bulk_inserts_events_at_block_exit(self) -> None:
+        registry = DatabaseEventRegistry()
+        events = [
+            WorkflowEvent(
+                event_id=f"evt-batch-{index}",
+                event_type="invoice.created",
+                payload={"invoice_id": index},
+            )
+            for index in range(5)
+        ]
+        with (
+            patch.object(DatabaseEventRegistry, "_enqueue_publish_task") as enqueue,
+            self.captureOnCommitCallbacks(execute=True),
+            CaptureQueriesContext(connection) as queries,
+        ):
+            with workflow_event_batch():
+                for event in events:
+                    assert registry.publish(event) is False
+                assert not WorkflowEventRecord.objects.exists()
+            assert WorkflowOutbox.objects.count() == len(events)
+            enqueue.assert_not_called()
+
+        inserts = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("INSERT")
+        ]
+        assert len(inserts) == 2
+        enqueue.assert_called_once_with()
+        assert sorted(
+            WorkflowOutbox.objects.values_list("event__event_id", flat=True)
+        ) == sorted(event.event_id for event in events)
+
+    @override_settings(
+        GENERAL_MANAGER={"WORKFLOW_MODE": "production", "WORKFLOW_ASYNC": True}
+    )
+    def test_event_batch_skips_duplicate_event_ids(self) -> None:
+        registry = DatabaseEventRegistry()
+        existing = WorkflowEvent(
+            event_id="evt-batch-existing", event_type="invoice.created", payload={}
+        )
+        fresh = WorkflowEvent(
+            event_id="evt-batch-fresh", event_type="invoice.created", payload={}
+        )
+        with patch.object(DatabaseEventRegistry, "_enqueue_publish_task"):
+            registry.publish(existing)
+            with workflow_event_batch():
+                registry.publish(existing)
+                registry.publish(fresh)
+                registry.publish(fresh)
+
+        assert WorkflowEventRecord.objects.count() == 2
+        assert (
+            WorkflowOutbox.objects.filter(event__event_id=fresh.event_id).count() == 1
+        )
+
+    @override_settings(
+        GENERAL_MANAGER={"WORKFLOW_MODE": "production", "WORKFLOW_ASYNC": True}
+    )
+    def test_event_batch_drops_events_from_rolled_back_savepoints(self) -> None:
+        registry = DatabaseEventRegistry()
+        with patch.object(DatabaseEventRegistry, "_enqueue_publish_task"):
+            with workflow_event_batch():
+                registry.publish(
+                    WorkflowEvent(event_id="evt-batch-kept", event_type="a", payload={})
+                )
+                with suppress(RuntimeError), transaction.atomic():
+                    registry.publish(
+                        WorkflowEvent(
+                            event_id="evt-batch-lost", event_type="a", payload={}
+                        )
+                    )
+                    raise RuntimeError
+
+        assert list(WorkflowEventRecord.objects.values_list("event_id", flat=True)) == [
+            "evt-batch-kept"
+        ]
+
+    @override_settings(
+        GENERAL_MANAGER={"WORKFLOW_MODE": "production", "WORKFLOW_ASYNC": True}
+    )
+    def test_event_batch_discards_buffer_when_block_raises(self) -> None:
+        registry = DatabaseEventRegistry()
+        with (
+            patch.object(DatabaseEventRegistry, "_enqueue_publish_task") as enqueue,
+            self.captureOnCommitCallbacks(execute=True),
+            pytest.raises(RuntimeError),
+            workflow_event_batch(),
+        ):
+            registry.publish(
+                WorkflowEvent(event_id="evt-batch-err", event_type="a", payload={})
+            )
+            raise RuntimeError
+
+        enqueue.assert_not_called()
+        assert not WorkflowEventRecord.objects.exists()
+
+    @override_settings(
+        GENERAL_MANAGER={"WORKFLOW_MODE": "production", "WORKFLOW_ASYNC": True}
+    )
+    def test_wakeups_from_released_savepoints_share_one_drain(self) -> None:
+        registry = DatabaseEventRegistry()
+        with (
+            patch.object(DatabaseEventRegistry, "_enqueue_publish_task") as enqueue,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            for index in range(3):
+                with transaction.atomic():
+                    savepoints = frozenset(
+                        sid for sid in connection.savepoint_ids if sid is not None
+                    )
+                    registry.publish(
+                        WorkflowEvent(
+                            event_id=f"evt-released-{index}", event_type="a", payload={}
+                        )
+                    )
+                release_publish_savepoints(connection.alias, savepoints)
+
+        enqueue.assert_called_once_with()
+        assert WorkflowOutbox.objects.count() == 3
+
     @override_settings(
         GENERAL_MANAGER={"WORKFLOW_MODE": "production", "WORKFLOW_ASYNC": False}
     )
@@ -496,6 +670,265 @@ class WorkflowProductionRegistryTests(TestCase):
         )
         assert handled == ["evt-finalize-fail"]
 
+    @override_settings(
+        GENERAL_MANAGER={"WORKFLOW_MODE": "production", "WORKFLOW_ASYNC": True}
+    )
+    def test_process_outbox_batch_loads_rows_and_attempts_once(self) -> None:
+        handled: list[str] = []
+
+        def notify(event: WorkflowEvent) -> None:
+            handled.append(event.event_id)
+
+        def audit(event: WorkflowEvent) -> None:
+            handled.append(f"audit:{event.event_id}")
+
+        registry = DatabaseEventRegistry()
+        registry.register("invoice.created", handler=notify)
+        registry.register("invoice.created", handler=audit)
+        for index in range(3):
+            registry.publish(
+                WorkflowEvent(
+                    event_id=f"evt-batch-{index}",
+                    event_type="invoice.created",
+                    payload={},
+                )
+            )
+        claims = registry.claim_outbox_batch()
+        assert len(claims) == 3
+
+        with CaptureQueriesContext(connection) as queries:
+            assert registry.process_outbox_batch(claims) == 3
+
+        selects = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].lstrip().upper().startswith("SELECT")
+        ]
+        assert len(selects) == 3
+        assert len(handled) == 6
+        assert not WorkflowOutbox.objects.exclude(
+            status=WorkflowOutbox.STATUS_PROCESSED
+        ).exists()
+        assert (
+            WorkflowDeliveryAttempt.objects.filter(
+                status=WorkflowDeliveryAttempt.STATUS_COMPLETED, attempts=1
+            ).count()
+            == 6
+        )
+
+    @override_settings(
+        GENERAL_MANAGER={"WORKFLOW_MODE": "production", "WORKFLOW_ASYNC": True}
+    )
+    def test_process_outbox_batch_skips_completed_and_fresh_running_attempts(
+        self,
+    ) -> None:
+        handled: list[str] = []
+        registry = DatabaseEventRegistry()
+        registry.register(
+            "invoice.created", handler=lambda event: handled.append(event.event_id)
+        )
+        for event_id in ("evt-batch-done", "evt-batch-running"):
+            registry.publish(
+                WorkflowEvent(
+                    event_id=event_id, event_type="invoice.created", payload={}
+                )
+            )
+        registration_id = registry._get_entries(
+            WorkflowEvent(event_id="probe", event_type="invoice.created", payload={})
+        )[0].registration_id
+        for event_id, status in (
+            ("evt-batch-done", WorkflowDeliveryAttempt.STATUS_COMPLETED),
+            ("evt-batch-running", WorkflowDeliveryAttempt.STATUS_RUNNING),
+        ):
+            WorkflowDeliveryAttempt.objects.create(
+                event=WorkflowEventRecord.objects.get(event_id=event_id),
+                handler_registration_id=registration_id,
+                idempotency_key=f"{event_id}:{registration_id}",
+                status=status,
+                attempts=1,
+            )
+        WorkflowDeliveryAttempt.objects.update(updated_at=datetime.now(UTC))
+        claims = registry.claim_outbox_batch()
+
+        assert registry.process_outbox_batch(claims) == 1
+
+        assert handled == []
+        statuses = dict(WorkflowOutbox.objects.values_list("event__event_id", "status"))
+        assert statuses == {
+            "evt-batch-done": WorkflowOutbox.STATUS_PROCESSED,
+            "evt-batch-running": WorkflowOutbox.STATUS_CLAIMED,
+        }
+
+    @override_settings(
+        GENERAL_MANAGER={"WORKFLOW_MODE": "production", "WORKFLOW_ASYNC": True}
+    )
+    def test_process_outbox_batch_isolates_failures_and_foreign_claims(
+        self,
+    ) -> None:
+        def handler(event: WorkflowEvent) -> None:
+            if event.event_id == "evt-batch-fail":
+                raise RuntimeError("boom")
+
+        registry = DatabaseEventRegistry()
+        registry.register("invoice.created", handler=handler)
+        for event_id in ("evt-batch-fail", "evt-batch-ok", "evt-batch-foreign"):
+            registry.publish(
+                WorkflowEvent(
+                    event_id=event_id, event_type="invoice.created", payload={}
+                )
+            )
+        claims = registry.claim_outbox_batch()
+        tokens = {
+            WorkflowOutbox.objects.get(pk=outbox_id).event.event_id: outbox_id
+            for outbox_id, _ in claims
+        }
+        claims = [
+            (
+                outbox_id,
+                "stale-token" if outbox_id == tokens["evt-batch-foreign"] else token,
+            )
+            for outbox_id, token in claims
+        ]
+
+        assert registry.process_outbox_batch(claims) == 1
+
+        rows = {
+            row.event.event_id: row
+            for row in WorkflowOutbox.objects.select_related("event")
+        }
+        assert rows["evt-batch-ok"].status == WorkflowOutbox.STATUS_PROCESSED
+        assert rows["evt-batch-fail"].status == WorkflowOutbox.STATUS_FAILED
+        assert rows["evt-batch-fail"].attempts == 1
+        assert rows["evt-batch-foreign"].status == WorkflowOutbox.STATUS_CLAIMED
+        assert (
+            WorkflowDeliveryAttempt.objects.get(event__event_id="evt-batch-fail").status
+            == WorkflowDeliveryAttempt.STATUS_DEAD_LETTER
+        )
+
+    @override_settings(
+        GENERAL_MANAGER={
+            "WORKFLOW_MODE": "production",
+            "WORKFLOW_ASYNC": True,
+            "WORKFLOW_DEAD_LETTER_ENABLED": False,
+        }
+    )
+    def test_process_outbox_batch_releases_lane_after_failed_row(self) -> None:
+        delivered: list[str] = []
+
+        def handler(event: WorkflowEvent) -> None:
+            if event.event_id == "evt-lane-1":
+                raise RuntimeError("boom")
+            delivered.append(event.event_id)
+
+        registry = DatabaseEventRegistry()
+        registry.register("invoice.created", handler=handler)
+        for index in range(1, 4):
+            registry.publish(
+                WorkflowEvent(
+                    event_id=f"evt-lane-{index}",
+                    event_type="invoice.created",
+                    payload={},
+                    metadata={"ordering_key": "invoice-1"},
+                )
+            )
+
+        assert registry.process_outbox_batch(registry.claim_outbox_batch()) == 0
+
+        assert delivered == []
+        rows = {
+            row.event.event_id: row
+            for row in WorkflowOutbox.objects.select_related("event")
+        }
+        failed = rows["evt-lane-1"]
+        assert failed.status == WorkflowOutbox.STATUS_FAILED
+        for event_id in ("evt-lane-2", "evt-lane-3"):
+            released = rows[event_id]
+            assert released.status == WorkflowOutbox.STATUS_PENDING
+            assert released.claim_token is None
+            assert released.attempts == 0
+            assert released.available_at >= failed.available_at
+        assert registry.claim_outbox_batch() == []
+
+    @override_settings(
+        GENERAL_MANAGER={
+            "WORKFLOW_MODE": "production",
+            "WORKFLOW_OUTBOX_ROUTE_CONCURRENCY": 3,
+        }
+    )
+    def test_route_owned_rows_runs_lanes_concurrently_in_key_order(self) -> None:
+        def row(pk: int, payload: Mapping[str, object], **metadata: object) -> Any:
+            return SimpleNamespace(
+                pk=pk, event=SimpleNamespace(payload=payload, metadata=metadata)
+            )
+
+        project_1 = {"manager": "Project", "identification": {"id": 1}}
+        rows = [
+            row(1, project_1),
+            row(2, project_1),
+            row(3, {"manager": "Project", "identification": {"id": 2}}),
+            row(4, project_1),
+            row(5, {}, ordering_key="tenant-a"),
+            row(6, {}),
+        ]
+        lane_heads = Barrier(3, timeout=5)
+        routed_order: list[int] = []
+        threads: set[str] = set()
+
+        def route(outbox_row: SimpleNamespace, _token: str, _handler: object) -> bool:
+            threads.add(current_thread().name)
+            if outbox_row.pk in {1, 3, 5}:
+                lane_heads.wait()
+            routed_order.append(outbox_row.pk)
+            if outbox_row.pk == 2:
+                raise RuntimeError("boom")
+            return True
+
+        registry = DatabaseEventRegistry()
+        with (
+            patch.object(registry, "_route_claimed_row", side_effect=route),
+            patch(
+                "general_manager.workflow.event_registry.transaction.get_connection",
+                return_value=SimpleNamespace(in_atomic_block=False),
+            ),
+        ):
+            routed = registry._route_owned_rows(
+                [(outbox_row, "token") for outbox_row in rows],
+                lambda *_args: True,
+            )
+
+        assert sorted(routed) == [1, 3, 5, 6]
+        project_1_order = [pk for pk in routed_order if pk in {1, 2, 4}]
+        assert project_1_order == [1, 2]
+        assert 4 not in routed_order
+        assert len(threads) == 3
+        assert current_thread().name not in threads
+
+    @override_settings(
+        GENERAL_MANAGER={
+            "WORKFLOW_MODE": "production",
+            "WORKFLOW_ASYNC": True,
+            "WORKFLOW_OUTBOX_ROUTE_CONCURRENCY": 4,
+        }
+    )
+    def test_process_outbox_batch_routes_inline_inside_atomic_block(self) -> None:
+        threads: list[str] = []
+        registry = DatabaseEventRegistry()
+        registry.register(
+            "invoice.created",
+            handler=lambda _event: threads.append(current_thread().name),
+        )
+        for index in range(3):
+            registry.publish(
+                WorkflowEvent(
+                    event_id=f"evt-inline-{index}",
+                    event_type="invoice.created",
+                    payload={},
+                )
+            )
+
+        assert registry.process_outbox_batch(registry.claim_outbox_batch()) == 3
+        assert threads == [current_thread().name] * 3
+
 
 class WorkflowProductionEngineTests(TestCase):
     @override_settings(
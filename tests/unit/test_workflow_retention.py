@@ -0,0 +1,172 @@
+"""Tests for bounded workflow outbox retention sweeps."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from general_manager.workflow.models import (
+    WorkflowDeliveryAttempt,
+    WorkflowEventRecord,
+    WorkflowOutbox,
+)
+from general_manager.workflow.retention import (
+    InvalidWorkflowRetentionArchiverError,
+    InvalidWorkflowRetentionOptionError,
+    purge_workflow_history,
+)
+
+RETENTION_SETTINGS = {
+    "WORKFLOW_RETENTION_PROCESSED_DAYS": 7,
+    "WORKFLOW_RETENTION_DEAD_LETTER_DAYS": 30,
+}
+
+
+def _event(event_id: str, status: str | None, *, age_days: int) -> WorkflowEventRecord:
+    """Create an event whose outbox row last changed `age_days` ago."""
+    event = WorkflowEventRecord.objects.create(
+        event_id=event_id, event_type="invoice.created", payload={"big": "x" * 64}
+    )
+    changed_at = datetime.now(UTC) - timedelta(days=age_days)
+    WorkflowEventRecord.objects.filter(pk=event.pk).update(created_at=changed_at)
+    if status is not None:
+        outbox = WorkflowOutbox.objects.create(event=event, status=status)
+        WorkflowOutbox.objects.filter(pk=outbox.pk).update(updated_at=changed_at)
+    WorkflowDeliveryAttempt.objects.create(
+        event=event,
+        handler_registration_id="handler",
+        idempotency_key=f"{event_id}:handler",
+        status=WorkflowDeliveryAttempt.STATUS_COMPLETED,
+    )
+    return event
+
+
+def _remaining() -> set[str]:
+    return set(WorkflowEventRecord.objects.values_list("event_id", flat=True))
+
+
+@override_settings(GENERAL_MANAGER=RETENTION_SETTINGS)
+class WorkflowRetentionTests(TestCase):
+    def test_purge_removes_only_finished_history_past_retention(self) -> None:
+        _event("old-processed", WorkflowOutbox.STATUS_PROCESSED, age_days=8)
+        _event("new-processed", WorkflowOutbox.STATUS_PROCESSED, age_days=6)
+        _event("old-dead-letter", WorkflowOutbox.STATUS_DEAD_LETTER, age_days=31)
+        _event("new-dead-letter", WorkflowOutbox.STATUS_DEAD_LETTER, age_days=8)
+        _event("old-pending", WorkflowOutbox.STATUS_PENDING, age_days=90)
+        _event("old-failed", WorkflowOutbox.STATUS_FAILED, age_days=90)
+        _event("old-claimed", WorkflowOutbox.STATUS_CLAIMED, age_days=90)
+        _event("old-sync", None, age_days=8)
+        _event("new-sync", None, age_days=1)
+
+        result = purge_workflow_history()
+
+        assert (result.events, result.outbox_rows, result.delivery_attempts) == (
+            3,
+            2,
+            3,
+        )
+        assert result.complete is True
+        assert _remaining() == {
+            "new-processed",
+            "new-dead-letter",
+            "old-pending",
+            "old-failed",
+            "old-claimed",
+            "new-sync",
+        }
+        assert WorkflowDeliveryAttempt.objects.count() == 6
+
+    def test_purge_keeps_events_that_still_have_a_routable_outbox_row(self) -> None:
+        event = _event("replayed", WorkflowOutbox.STATUS_DEAD_LETTER, age_days=40)
+        WorkflowOutbox.objects.create(event=event, status=WorkflowOutbox.STATUS_PENDING)
+
+        result = purge_workflow_history()
+
+        assert result.events == 0
+        assert _remaining() == {"replayed"}
+
+    @override_settings(
+        GENERAL_MANAGER={**RETENTION_SETTINGS, "WORKFLOW_RETENTION_DEAD_LETTER_DAYS": 0}
+    )
+    def test_zero_dead_letter_retention_keeps_dead_letters(self) -> None:
+        _event("ancient-dead-letter", WorkflowOutbox.STATUS_DEAD_LETTER, age_days=900)
+
+        assert purge_workflow_history().events == 0
+        assert _remaining() == {"ancient-dead-letter"}
+
+    def test_purge_stops_at_batch_limit_and_resumes_oldest_first(self) -> None:
+        for age in range(10, 15):
+            _event(f"processed-{age}", WorkflowOutbox.STATUS_PROCESSED, age_days=age)
+
+        first = purge_workflow_history(batch_size=2, max_batches=2)
+
+        assert (first.events, first.batches, first.complete) == (4, 2, False)
+        assert _remaining() == {"processed-10"}
+        second = purge_workflow_history(batch_size=2, max_batches=2)
+        assert (second.events, second.complete) == (1, True)
+        assert _remaining() == set()
+
+    def test_purge_deletes_without_loading_event_payloads(self) -> None:
+        for index in range(3):
+            _event(f"processed-{index}", WorkflowOutbox.STATUS_PROCESSED, age_days=9)
+
+        with CaptureQueriesContext(connection) as queries:
+            purge_workflow_history(batch_size=10)
+
+        payload_reads = [
+            query["sql"]
+            for query in queries.captured_queries
+            if '"payload"' in query["sql"] and query["sql"].startswith("SELECT")
+        ]
+        assert payload_reads == []
+        assert _remaining() == set()
+
+    def test_archiver_sees_each_chunk_before_it_is_deleted(self) -> None:
+        _event("processed-a", WorkflowOutbox.STATUS_PROCESSED, age_days=9)
+        _event("processed-b", WorkflowOutbox.STATUS_PROCESSED, age_days=8)
+        archived: list[list[tuple[str, int, int]]] = []
+
+        def archive(events: Sequence[WorkflowEventRecord]) -> None:
+            archived.append(
+                [
+                    (
+                        event.event_id,
+                        len(event.outbox_entries.all()),
+                        len(event.delivery_attempts.all()),
+                    )
+                    for event in events
+                ]
+            )
+
+        purge_workflow_history(batch_size=1, archiver=archive)
+
+        assert archived == [[("processed-a", 1, 1)], [("processed-b", 1, 1)]]
+
+    def test_archiver_failure_rolls_back_its_chunk(self) -> None:
+        _event("processed-a", WorkflowOutbox.STATUS_PROCESSED, age_days=9)
+
+        def archive(_events: Sequence[WorkflowEventRecord]) -> None:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            purge_workflow_history(archiver=archive)
+
+        assert _remaining() == {"processed-a"}
+
+    @override_settings(
+        GENERAL_MANAGER={**RETENTION_SETTINGS, "WORKFLOW_RETENTION_ARCHIVER": 42}
+    )
+    def test_configured_archiver_must_be_callable(self) -> None:
+        with pytest.raises(InvalidWorkflowRetentionArchiverError):
+            purge_workflow_history()
+
+    def test_non_positive_bounds_are_rejected(self) -> None:
+        with pytest.raises(InvalidWorkflowRetentionOptionError, match="batch_size"):
+            purge_workflow_history(batch_size=0)
+        with pytest.raises(InvalidWorkflowRetentionOptionError, match="max_batches"):
+            purge_workflow_history(max_batches=-1)
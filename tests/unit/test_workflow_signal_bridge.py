@@ -4,7 +4,9 @@ from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
+from django.test import override_settings
 
+from general_manager.workflow import signal_bridge
 from general_manager.workflow.event_registry import InMemoryEventRegistry
 from general_manager.workflow.signal_bridge import (
     _handle_post_data_change,
@@ -38,8 +40,14 @@ def test_post_change_records_bounded_workflow_latency() -> None:
 
 def test_post_change_records_workflow_latency_without_suppressing_exceptions() -> None:
     failure = RuntimeError("event conversion failed")
+    registry = InMemoryEventRegistry()
+    registry.register("manager_updated", handler=lambda _event: None)
 
     with (
+        patch(
+            "general_manager.workflow.signal_bridge.get_event_registry",
+            return_value=registry,
+        ),
         patch(
             "general_manager.workflow.signal_bridge.perf_counter",
             side_effect=(50.0, 50.5),
@@ -64,6 +72,64 @@ def test_post_change_records_workflow_latency_without_suppressing_exceptions() -
     record_phase.assert_called_once_with("workflow", 0.5, "analytics")
 
 
+def test_post_change_publishes_unrouted_events_by_default() -> None:
+    registry = InMemoryEventRegistry()
+    with (
+        patch(
+            "general_manager.workflow.signal_bridge.get_event_registry",
+            return_value=registry,
+        ),
+        patch(
+            "general_manager.workflow.signal_bridge._manager_change_to_event",
+        ) as convert,
+        patch.object(registry, "publish") as publish,
+    ):
+        _handle_post_data_change(sender=object(), instance=object(), action="update")
+
+    publish.assert_called_once_with(convert.return_value)
+
+
+@override_settings(GENERAL_MANAGER={"WORKFLOW_SIGNAL_BRIDGE_SKIP_UNROUTED": True})
+def test_post_change_skips_events_without_routes_when_enabled() -> None:
+    registry = InMemoryEventRegistry()
+    with (
+        patch(
+            "general_manager.workflow.signal_bridge.get_event_registry",
+            return_value=registry,
+        ),
+        patch(
+            "general_manager.workflow.signal_bridge._manager_change_to_event",
+        ) as convert,
+        patch.object(registry, "publish") as publish,
+        patch.object(signal_bridge, "_reported_unrouted_events", set()),
+        patch.object(signal_bridge.logger, "warning") as warning,
+    ):
+        _handle_post_data_change(sender=object(), instance=object(), action="update")
+        _handle_post_data_change(sender=object(), instance=object(), action="update")
+        registry.register("general_manager.manager.deleted", handler=print)
+        _handle_post_data_change(sender=object(), instance=object(), action="update")
+        _handle_post_data_change(sender=object(), instance=object(), action="delete")
+
+    convert.assert_called_once()
+    assert convert.call_args.kwargs["action"] == "delete"
+    publish.assert_called_once_with(convert.return_value)
+    warning.assert_called_once()
+    assert warning.call_args.kwargs["context"] == {
+        "event_type": "general_manager.manager.updated",
+        "event_name": "manager_updated",
+    }
+
+
+def test_registry_route_lookup_tracks_registrations() -> None:
+    registry = InMemoryEventRegistry()
+    assert not registry.has_routes("general_manager.manager.updated", "x")
+
+    registry.register("manager_updated", handler=print)
+
+    assert registry.has_routes("general_manager.manager.created", "manager_updated")
+    assert not registry.has_routes("general_manager.manager.created", "x")
+
+
 def test_workflow_signal_bridge_enabled_prefers_nested_setting() -> None:
     django_settings = SimpleNamespace(
         GENERAL_MANAGER={"WORKFLOW_SIGNAL_BRIDGE": 0},
@@ -7,7 +7,9 @@ from django.test import SimpleTestCase, override_settings
 
 from general_manager.workflow.tasks import (
     WORKFLOW_BEAT_SCHEDULE_KEY,
+    WORKFLOW_RETENTION_BEAT_SCHEDULE_KEY,
     configure_workflow_beat_schedule_from_settings,
+    configure_workflow_retention_beat_schedule_from_settings,
     publish_outbox_batch,
     route_outbox_claims_batch,
 )
@@ -55,6 +57,42 @@ class WorkflowBeatScheduleTests(SimpleTestCase):
             configure_workflow_beat_schedule_from_settings()
         assert len(fake_conf.beat_schedule) == 1
 
+    @override_settings(
+        GENERAL_MANAGER={
+            "WORKFLOW_RETENTION_ENABLED": True,
+            "WORKFLOW_RETENTION_INTERVAL_SECONDS": 900,
+        }
+    )
+    def test_configure_retention_beat_schedule_registers_task(self) -> None:
+        fake_conf = SimpleNamespace(beat_schedule={"existing": {}})
+        fake_app = SimpleNamespace(conf=fake_conf)
+        with (
+            patch("general_manager.workflow.tasks.CELERY_AVAILABLE", True),
+            patch("general_manager.workflow.tasks.current_app", fake_app),
+        ):
+            configured = configure_workflow_retention_beat_schedule_from_settings()
+        assert configured is True
+        entry = fake_conf.beat_schedule[WORKFLOW_RETENTION_BEAT_SCHEDULE_KEY]
+        assert (
+            entry["task"]
+            == "general_manager.workflow.tasks.purge_workflow_history_task"
+        )
+        assert entry["schedule"] == 900.0
+        assert "existing" in fake_conf.beat_schedule
+
+    @override_settings(GENERAL_MANAGER={"WORKFLOW_MODE": "production"})
+    def test_retention_beat_schedule_is_opt_in(self) -> None:
+        fake_conf = SimpleNamespace(beat_schedule={})
+        with (
+            patch("general_manager.workflow.tasks.CELERY_AVAILABLE", True),
+            patch(
+                "general_manager.workflow.tasks.current_app",
+                SimpleNamespace(conf=fake_conf),
+            ),
+        ):
+            assert configure_workflow_retention_beat_schedule_from_settings() is False
+        assert fake_conf.beat_schedule == {}
+
 
 class WorkflowBatchTaskTests(SimpleTestCase):
     def test_route_outbox_claims_batch_isolates_item_failures(self) -> None: